@@ -42,15 +42,15 @@ from app.agents.estratega import AgentEstratega
 from app.agents.ux_writer import AgentUXWriter
 from app.agents.coach import AgentCoach
 from app.agents.dashboard_writer import dashboard_writer_agent
+from app.dashboard_output import load_dashboard_json
 
 
 # ── Blacklist: claves de pura visualización UI, sin valor analítico para LLMs ─
 UI_ONLY_KEYS = frozenset({
-    'shot_zones_heatmap',      # 21.4 KB — grid de coords XY crudas para Chart.js heatmap
+    'shot_zones_heatmap',      #  ~9 KB — grids KDE uint8/base64 por palo para el heatmap
     'dispersion_by_club',      # 11.8 KB — scatter plots crudos por palo (Chart.js)
     'metadata',                #  3.6 KB — versión, timestamps, config del generador
     'generated_at',            #  0.0 KB — timestamp de generación
-    'scoring_zones_by_course', #  0.0 KB — datos vacíos de zonas por campo
 })
 # Total filtrado: ~36.8 KB = 34.5% del JSON. Ratio señal/ruido sube de ~65% a ~100%.
 
@@ -124,8 +124,7 @@ async def data_loader_node(state: AgentState) -> AgentState:
         for json_path in json_paths:
             if json_path.exists():
                 logger.info(f"[Orchestrator] Loading from: {json_path}")
-                with open(json_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                data = load_dashboard_json(json_path)
                 break
 
         if not data:
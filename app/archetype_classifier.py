@@ -47,7 +47,10 @@ Versión: 1.0.0
 
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Dict
-from app.scoring_engine import ScoringResult, Zone
+
+import numpy as np
+
+from app.scoring_engine import DIMENSIONS, ScoringResult, Zone, _round_many
 
 
 # ══════════════════════════════════════════════════════════════
@@ -542,6 +545,68 @@ ARCHETYPES: Dict[str, Archetype] = {
 }
 
 
+# ══════════════════════════════════════════════════════════════
+# GRAFO DE ARQUETIPOS (precalculado al importar)
+# ══════════════════════════════════════════════════════════════
+# La taxonomía es estática: la similitud entre arquetipos y los destinos
+# de evolución no dependen del jugador, así que se calculan una vez.
+
+ARCHETYPE_IDS: Tuple[str, ...] = tuple(ARCHETYPES)
+_ARCHETYPE_INDEX = {aid: i for i, aid in enumerate(ARCHETYPE_IDS)}
+_DIM_INDEX = {dim: i for i, dim in enumerate(DIMENSIONS)}
+
+
+def _strength_similarity(a: Archetype, b: Archetype) -> float:
+    """Solapamiento de defining_strengths (Jaccard, 2 decimales)."""
+    overlap = len(set(a.defining_strengths) & set(b.defining_strengths))
+    total = len(set(a.defining_strengths) | set(b.defining_strengths)) or 1
+    return round(overlap / total, 2)
+
+
+def _is_related(current_id: str, aid: str) -> bool:
+    """Evolución posible (en cualquier sentido) o misma familia."""
+    current = ARCHETYPES[current_id]
+    return aid in current.can_evolve_to or aid in current.evolved_from or aid[0] == current_id[0]
+
+
+# ARCHETYPE_SIMILARITY[i, j]: similitud entre ARCHETYPE_IDS[i] y [j]
+ARCHETYPE_SIMILARITY = np.array([
+    [_strength_similarity(ARCHETYPES[a], ARCHETYPES[b]) for b in ARCHETYPE_IDS]
+    for a in ARCHETYPE_IDS
+])
+ARCHETYPE_SIMILARITY.flags.writeable = False
+
+
+def _similar_top2(current_id: str) -> Tuple[Tuple[str, str, float], ...]:
+    i = _ARCHETYPE_INDEX[current_id]
+    candidates = [
+        (aid, ARCHETYPES[aid].name_es, float(ARCHETYPE_SIMILARITY[i, j]))
+        for j, aid in enumerate(ARCHETYPE_IDS)
+        if aid != current_id and _is_related(current_id, aid)
+    ]
+    # Ordenar por similaridad (estable) y quedarse con los 2 primeros
+    candidates.sort(key=lambda x: x[2], reverse=True)
+    return tuple(candidates[:2])
+
+
+# Arquetipos similares de cada arquetipo (top 2)
+SIMILAR_ARCHETYPES: Dict[str, Tuple[Tuple[str, str, float], ...]] = {
+    aid: _similar_top2(aid) for aid in ARCHETYPE_IDS
+}
+
+# Grafo de evolución: arquetipo → [(destino, índices de sus defining_strengths)]
+EVOLUTION_GRAPH: Dict[str, Tuple[Tuple[str, Tuple[int, ...]], ...]] = {
+    aid: tuple(
+        (target_id, tuple(_DIM_INDEX[dim] for dim in ARCHETYPES[target_id].defining_strengths))
+        for target_id in arch.can_evolve_to
+    )
+    for aid, arch in ARCHETYPES.items()
+}
+
+# Umbral para considerar alcanzable un destino de evolución (al menos DEVELOPING)
+_EVOLUTION_MIN_SCORE = 4.0
+
+
 # ══════════════════════════════════════════════════════════════
 # CLASSIFIER
 # ══════════════════════════════════════════════════════════════
@@ -620,6 +685,54 @@ class ArchetypeClassifier:
             personalized_insight_es=insight,
         )
 
+    def classify_many(self, scores, player_hcp=None, overall=None) -> "ArchetypeBatch":
+        """
+        classify() para muchos vectores de scores en una sola llamada (vectorizado).
+
+        Mismo arquetipo, fit score, fortaleza/gap principal y evolución que
+        classify() fila a fila; los arquetipos similares y el insight salen
+        de ArchetypeBatch.result(i).
+
+        Args:
+            scores: ScoringBatch de ScoringEngine.score_many, o matriz (n, 8)
+                    de scores en el orden de DIMENSIONS
+            player_hcp: HCP escalar o por fila (solo con matriz)
+            overall: overall_score por fila (solo con matriz)
+
+        Returns:
+            ArchetypeBatch con un valor por fila en cada array
+        """
+        if hasattr(scores, "score_matrix"):
+            matrix = scores.score_matrix()
+            player_hcp, overall = scores.player_hcp, scores.overall_score
+        else:
+            matrix = np.asarray(scores, dtype=np.float64)
+            if player_hcp is None or overall is None:
+                raise ValueError("classify_many con matriz de scores necesita player_hcp y overall")
+        if matrix.ndim != 2 or matrix.shape[1] != len(DIMENSIONS):
+            raise ValueError(f"Matriz de scores con forma {matrix.shape}, se esperaba (n, {len(DIMENSIONS)})")
+        n = len(matrix)
+        hcp = np.broadcast_to(np.asarray(player_hcp, dtype=np.float64), (n,)).copy()
+        overall = np.broadcast_to(np.asarray(overall, dtype=np.float64), (n,))
+
+        codes = _decision_tree_many(matrix, overall, hcp)
+
+        # Fortaleza = primer máximo; gap = último mínimo (igual que el sort estable)
+        rows = np.arange(n)
+        strength = matrix.argmax(axis=1)
+        gap = matrix.shape[1] - 1 - matrix[:, ::-1].argmin(axis=1)
+
+        return ArchetypeBatch(
+            codes=codes,
+            fit_scores=_round_many(_fit_many(matrix, codes), 2),
+            primary_strength=strength,
+            primary_strength_val=_round_many(matrix[rows, strength], 2),
+            primary_gap=gap,
+            primary_gap_val=_round_many(matrix[rows, gap], 2),
+            evolution=_evolution_many(matrix, codes),
+            player_hcp=hcp,
+        )
+
     def _decision_tree(
         self,
         scores: dict,
@@ -775,39 +888,11 @@ class ArchetypeClassifier:
         Usado en UI para mostrar "También podrías ser..." o
         "Eres un híbrido de X e Y".
         
-        Método: distancia euclidiana en el espacio de scores
-        comparando con los arquetipos can_evolve_to del actual.
+        Método: solapamiento de defining_strengths con los arquetipos
+        relacionados (evolución posible o misma familia). No depende de
+        los scores: sale de SIMILAR_ARCHETYPES, precalculado al importar.
         """
-        current = ARCHETYPES[current_id]
-        candidates = []
-
-        for aid, arch in ARCHETYPES.items():
-            if aid == current_id:
-                continue
-
-            # Solo incluir si es evolución posible o familia cercana
-            is_related = (
-                aid in current.can_evolve_to
-                or aid in current.evolved_from
-                or aid[0] == current_id[0]  # misma familia
-            )
-            if not is_related:
-                continue
-
-            # Similaridad basada en solapamiento de defining_strengths
-            overlap = len(
-                set(arch.defining_strengths) & set(current.defining_strengths)
-            )
-            total = len(
-                set(arch.defining_strengths) | set(current.defining_strengths)
-            ) or 1
-            similarity = overlap / total
-
-            candidates.append((aid, arch.name_es, round(similarity, 2)))
-
-        # Ordenar por similaridad y devolver top 2
-        candidates.sort(key=lambda x: x[2], reverse=True)
-        return candidates[:2]
+        return list(SIMILAR_ARCHETYPES[current_id])
 
     def _get_evolution_target(
         self, archetype: Archetype, scores: dict, hcp: float
@@ -816,25 +901,20 @@ class ArchetypeClassifier:
         Determina el arquetipo objetivo más probable para este jugador.
         
         Selecciona el primer can_evolve_to que tiene sentido según
-        el HCP actual y el patrón de scores.
+        el HCP actual y el patrón de scores (EVOLUTION_GRAPH).
         """
-        if not archetype.can_evolve_to:
+        targets = EVOLUTION_GRAPH[archetype.id]
+        if not targets:
             return None
 
-        # Buscar el arquetipo de evolución más cercano en perfil
-        for target_id in archetype.can_evolve_to:
-            target = ARCHETYPES[target_id]
-            # El target es válido si sus defining_strengths son áreas
-            # que el jugador ya tiene en DEVELOPING o superior
-            applicable = all(
-                scores.get(dim, 0) >= 4.0  # Al menos en desarrollo
-                for dim in target.defining_strengths
-            )
-            if applicable:
-                return (target_id, target.name_es)
+        # El target es válido si sus defining_strengths son áreas
+        # que el jugador ya tiene en DEVELOPING o superior
+        for target_id, dims in targets:
+            if all(scores.get(DIMENSIONS[d], 0) >= _EVOLUTION_MIN_SCORE for d in dims):
+                return (target_id, ARCHETYPES[target_id].name_es)
 
         # Si ninguno es perfectamente aplicable, devolver el primero
-        first = archetype.can_evolve_to[0]
+        first = targets[0][0]
         return (first, ARCHETYPES[first].name_es)
 
     def _generate_insight(
@@ -853,48 +933,220 @@ class ArchetypeClassifier:
         Es el único punto "semi-dinámico" del clasificador — pero sigue siendo
         determinista (mismo input → mismo output).
         """
-        dim_names_es = {
-            "long_game":   "juego largo",
-            "mid_game":    "hierros medios",
-            "short_game":  "juego corto",
-            "putting":     "putting",
-            "consistency": "consistencia",
-            "mental":      "juego mental",
-            "power":       "potencia",
-            "accuracy":    "precisión",
-        }
-
-        strength_name_es = dim_names_es.get(strength_name, strength_name)
-        gap_name_es = dim_names_es.get(gap_name, gap_name)
-
-        # Determinar zona de la fortaleza y el gap para fraseado
-        strength_zone = result.scores_as_dict()
-        if strength_val >= 8.5:
-            strength_qualifier = "de élite absoluta"
-        elif strength_val >= 7.0:
-            strength_qualifier = "muy por encima de tu HCP"
-        else:
-            strength_qualifier = "sólido para tu nivel"
-
-        if gap_val <= 3.5:
-            gap_qualifier = "claramente por debajo de tu potencial"
-        elif gap_val <= 4.5:
-            gap_qualifier = "el área con más margen de mejora"
-        else:
-            gap_qualifier = "un área con recorrido de mejora"
-
-        insight = (
-            f"Eres '{archetype.name_es}' con un {strength_name_es} "
-            f"{strength_qualifier} ({strength_val:.1f}/10) que define tu identidad "
-            f"en el campo. "
-            f"Tu {gap_name_es} es {gap_qualifier} ({gap_val:.1f}/10) y concentra "
-            f"el mayor ROI de mejora en tu caso específico. "
-            f"Con HCP {result.player_hcp:.1f}, el camino más directo hacia tu siguiente "
-            f"nivel es trabajar el {gap_name_es} mientras consolidas tu ventaja "
-            f"en {strength_name_es}."
+        return _personalized_insight(
+            archetype, strength_name, strength_val, gap_name, gap_val, result.player_hcp
         )
 
-        return insight
+
+_DIM_NAMES_ES = {
+    "long_game":   "juego largo",
+    "mid_game":    "hierros medios",
+    "short_game":  "juego corto",
+    "putting":     "putting",
+    "consistency": "consistencia",
+    "mental":      "juego mental",
+    "power":       "potencia",
+    "accuracy":    "precisión",
+}
+
+
+def _personalized_insight(
+    archetype: Archetype,
+    strength_name: str,
+    strength_val: float,
+    gap_name: str,
+    gap_val: float,
+    player_hcp: float,
+) -> str:
+    """Texto del insight (común a classify y classify_many)."""
+    strength_name_es = _DIM_NAMES_ES.get(strength_name, strength_name)
+    gap_name_es = _DIM_NAMES_ES.get(gap_name, gap_name)
+
+    # Fraseado según la zona de la fortaleza y el gap
+    if strength_val >= 8.5:
+        strength_qualifier = "de élite absoluta"
+    elif strength_val >= 7.0:
+        strength_qualifier = "muy por encima de tu HCP"
+    else:
+        strength_qualifier = "sólido para tu nivel"
+
+    if gap_val <= 3.5:
+        gap_qualifier = "claramente por debajo de tu potencial"
+    elif gap_val <= 4.5:
+        gap_qualifier = "el área con más margen de mejora"
+    else:
+        gap_qualifier = "un área con recorrido de mejora"
+
+    return (
+        f"Eres '{archetype.name_es}' con un {strength_name_es} "
+        f"{strength_qualifier} ({strength_val:.1f}/10) que define tu identidad "
+        f"en el campo. "
+        f"Tu {gap_name_es} es {gap_qualifier} ({gap_val:.1f}/10) y concentra "
+        f"el mayor ROI de mejora en tu caso específico. "
+        f"Con HCP {player_hcp:.1f}, el camino más directo hacia tu siguiente "
+        f"nivel es trabajar el {gap_name_es} mientras consolidas tu ventaja "
+        f"en {strength_name_es}."
+    )
+
+
+# ══════════════════════════════════════════════════════════════
+# CLASIFICACIÓN EN LOTE (classify_many)
+# ══════════════════════════════════════════════════════════════
+# Las mismas reglas que _decision_tree / _calculate_fit como máscaras
+# booleanas sobre la matriz (n, 8) de scores, evaluadas en el mismo orden
+# (la primera regla que se cumple gana).
+
+# (umbral, puntos) de _calculate_fit, en orden de evaluación
+_FIT_STRENGTH_STEPS = ((ArchetypeClassifier.ELITE_THRESHOLD, 1.0),
+                       (ArchetypeClassifier.STRONG_THRESHOLD, 0.7),
+                       (5.0, 0.4))
+_FIT_GAP_STEPS = ((ArchetypeClassifier.GAP_THRESHOLD, 0.5),
+                  (ArchetypeClassifier.STRONG_THRESHOLD, 0.3))
+
+
+def _decision_tree_many(s: np.ndarray, overall: np.ndarray, hcp: np.ndarray) -> np.ndarray:
+    """Índice en ARCHETYPE_IDS por fila (= _decision_tree fila a fila)."""
+    c = ArchetypeClassifier
+    elite = s >= c.ELITE_THRESHOLD
+    strong = (s >= c.STRONG_THRESHOLD) & (s < c.ELITE_THRESHOLD)
+    gap = s <= c.GAP_THRESHOLD
+    critical = s <= c.CRITICAL_THRESHOLD
+    n_elite, n_strong = elite.sum(axis=1), strong.sum(axis=1)
+    n_gap, n_critical = gap.sum(axis=1), critical.sum(axis=1)
+
+    d = _DIM_INDEX
+    lg, mg, sg, pt = d["long_game"], d["mid_game"], d["short_game"], d["putting"]
+    cs, mt, pw, ac = d["consistency"], d["mental"], d["power"], d["accuracy"]
+    power = s[:, pw]
+
+    rules = [
+        # Rama A
+        (elite[:, pw] & (gap[:, ac] | gap[:, cs]), "A1"),
+        (elite[:, pw] & (elite[:, lg] | strong[:, mg]), "A2"),
+        (elite[:, pw], "A3"),
+        (elite[:, lg], "A2"),
+        # Rama B
+        (elite[:, sg] & elite[:, pt], "B3"),
+        (elite[:, sg] & (gap[:, lg] | gap[:, pw]), "B1"),
+        (elite[:, sg], "B3"),
+        (elite[:, pt], "B2"),
+        (strong[:, sg] & strong[:, pt] & ~gap[:, lg] & ~gap[:, mg], "B3"),
+        # Rama C
+        (elite[:, mt] & elite[:, cs] & (strong[:, pt] | elite[:, pt]), "C2"),
+        (elite[:, mt] & elite[:, cs], "C1"),
+        (elite[:, mt], "C1"),
+        (elite[:, cs] & (n_gap == 0) & (n_critical == 0), "C3"),
+        (elite[:, cs], "C1"),
+        # Rama D
+        ((n_elite >= 3) | ((n_elite >= 2) & (n_strong >= 2)), "D3"),
+        ((overall >= 7.0) & (n_critical == 0), "D3"),
+        ((power >= 6.0) & (overall < 5.0), "D2"),
+        ((hcp <= 20) & (n_critical == 0) & (overall >= 5.0), "C3"),
+        ((n_gap >= 3) | (hcp >= 28), "D1"),
+        ((power >= 5.5) & (n_gap >= 2), "D2"),
+    ]
+    return np.select(
+        [mask for mask, _ in rules],
+        [_ARCHETYPE_INDEX[aid] for _, aid in rules],
+        _ARCHETYPE_INDEX["D1"],
+    )
+
+
+def _fit_many(s: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """_calculate_fit por fila para el arquetipo asignado (sin redondear)."""
+    fit = np.empty(len(s))
+    for code in np.unique(codes).tolist():
+        rows = codes == code
+        arch = ARCHETYPES[ARCHETYPE_IDS[code]]
+        points = np.zeros(int(rows.sum()))
+        max_points = 0.0
+        for dim in arch.defining_strengths:
+            max_points += 1.0
+            v = s[rows, _DIM_INDEX[dim]]
+            points = points + np.select([v >= t for t, _ in _FIT_STRENGTH_STEPS],
+                                        [p for _, p in _FIT_STRENGTH_STEPS], 0.0)
+        for dim in arch.defining_gaps:
+            max_points += 0.5
+            v = s[rows, _DIM_INDEX[dim]]
+            points = points + np.select([v <= t for t, _ in _FIT_GAP_STEPS],
+                                        [p for _, p in _FIT_GAP_STEPS], 0.0)
+        fit[rows] = points / max_points if max_points else 0.75
+    return fit
+
+
+def _evolution_many(s: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Índice del destino de evolución por fila (-1 si no hay ninguno)."""
+    out = np.full(len(s), -1, dtype=np.int64)
+    for code in np.unique(codes).tolist():
+        targets = EVOLUTION_GRAPH[ARCHETYPE_IDS[code]]
+        if not targets:
+            continue
+        rows = np.flatnonzero(codes == code)
+        choice = np.full(len(rows), _ARCHETYPE_INDEX[targets[0][0]])
+        # Recorrido inverso: el primer destino aplicable es el que queda
+        for target_id, dims in reversed(targets):
+            applicable = (s[np.ix_(rows, dims)] >= _EVOLUTION_MIN_SCORE).all(axis=1)
+            choice[applicable] = _ARCHETYPE_INDEX[target_id]
+        out[rows] = choice
+    return out
+
+
+@dataclass
+class ArchetypeBatch:
+    """
+    Resultado de ArchetypeClassifier.classify_many: fila i = classify() del
+    ScoringResult i. Arrays de índices en ARCHETYPE_IDS / DIMENSIONS; el
+    ArchetypeResult completo (con insight) se construye con result(i).
+    """
+    codes:                np.ndarray   # índice en ARCHETYPE_IDS
+    fit_scores:           np.ndarray
+    primary_strength:     np.ndarray   # índice en DIMENSIONS
+    primary_strength_val: np.ndarray
+    primary_gap:          np.ndarray   # índice en DIMENSIONS
+    primary_gap_val:      np.ndarray
+    evolution:            np.ndarray   # índice en ARCHETYPE_IDS, -1 = ninguno
+    player_hcp:           np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def ids(self) -> np.ndarray:
+        """ID de arquetipo por fila (p.ej. "B1")."""
+        return np.asarray(ARCHETYPE_IDS, dtype=object)[self.codes]
+
+    def archetype(self, i: int) -> Archetype:
+        return ARCHETYPES[ARCHETYPE_IDS[self.codes[i]]]
+
+    def strength_dim(self, i: int) -> str:
+        return DIMENSIONS[self.primary_strength[i]]
+
+    def gap_dim(self, i: int) -> str:
+        return DIMENSIONS[self.primary_gap[i]]
+
+    def result(self, i: int) -> ArchetypeResult:
+        """ArchetypeResult de la fila i (idéntico al de classify())."""
+        archetype = self.archetype(i)
+        strength_val = float(self.primary_strength_val[i])
+        gap_val = float(self.primary_gap_val[i])
+        evolution = int(self.evolution[i])
+        return ArchetypeResult(
+            archetype=archetype,
+            fit_score=float(self.fit_scores[i]),
+            primary_strength_dim=self.strength_dim(i),
+            primary_strength_val=strength_val,
+            primary_gap_dim=self.gap_dim(i),
+            primary_gap_val=gap_val,
+            similar_archetypes=list(SIMILAR_ARCHETYPES[archetype.id]),
+            evolution_target=(
+                (ARCHETYPE_IDS[evolution], ARCHETYPES[ARCHETYPE_IDS[evolution]].name_es)
+                if evolution >= 0 else None
+            ),
+            personalized_insight_es=_personalized_insight(
+                archetype, self.strength_dim(i), strength_val,
+                self.gap_dim(i), gap_val, float(self.player_hcp[i]),
+            ),
+        )
 
 
 # ══════════════════════════════════════════════════════════════
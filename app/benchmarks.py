@@ -0,0 +1,314 @@
+"""
+AlvGolf — Benchmarks
+====================
+Registro central de benchmarks por HCP.
+
+Cada tabla {hcp: valor} se precalcula una sola vez (al importar) como una
+curva densa sobre HCP 0–54 con resolución 0.1 (541 puntos), interpolando
+linealmente entre niveles:
+
+  - benchmark(nombre, hcp):        O(1), un índice en el array denso
+  - benchmark_many(nombre, hcps):  vectorizado (ScoringEngine.score_many)
+
+Un HCP fuera de la rejilla (más de un decimal, < 0 o > 54) se interpola con
+la misma aritmética que la curva densa, así que el valor no depende del
+camino. En un nivel exacto de la tabla se devuelve el valor de la tabla.
+
+Tablas registradas ('<tabla>.<métrica>' o '<métrica>'):
+  - scoring_engine: driver.*, iron7.*, pw.*, sg.* y las de una sola
+    métrica (fir, gir, putts, ...)
+  - generador: club_carry.<palo> (PGA / HCP 15 / HCP 23),
+    gauges.* (Tab 1) y strokes_per_round.* (strokes gained vs HCP 15)
+
+El nivel 0 es la referencia PGA Tour / scratch de cada tabla (PGA_LEVEL).
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+import hashlib
+import json
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Mapping
+
+import numpy as np
+
+
+HCP_MIN = 0.0
+HCP_MAX = 54.0
+STEPS_PER_HCP = 10           # resolución 0.1
+PGA_LEVEL = 0
+
+HCP_GRID = np.arange(int(HCP_MAX * STEPS_PER_HCP) + 1) / STEPS_PER_HCP
+
+
+# ══════════════════════════════════════════════════════════════
+# TABLAS — SCORING ENGINE
+# ══════════════════════════════════════════════════════════════
+
+# Estructura de benchmarks por nivel de HCP.
+# Fuentes: PGA Tour ShotLink, USGA/WHS datos publicados, 
+# Broadie "Every Shot Counts" (2014), DeNunzio research (2016-2020).
+#
+# Formato: { hcp_max: { metric: (min_value, max_value) } }
+# donde el rango representa el intervalo "normal" para ese nivel.
+
+DRIVER_BENCHMARKS = {
+    # (ball_speed_kmh, carry_m, lateral_std_m, smash_factor)
+     0: {"ball_speed": 267, "carry": 257, "lateral_std": 5.5,  "smash_factor": 1.49},
+     5: {"ball_speed": 240, "carry": 228, "lateral_std": 7.0,  "smash_factor": 1.47},
+    10: {"ball_speed": 232, "carry": 218, "lateral_std": 9.0,  "smash_factor": 1.45},
+    15: {"ball_speed": 225, "carry": 210, "lateral_std": 10.5, "smash_factor": 1.43},
+    20: {"ball_speed": 215, "carry": 198, "lateral_std": 13.0, "smash_factor": 1.41},
+    25: {"ball_speed": 210, "carry": 190, "lateral_std": 15.5, "smash_factor": 1.39},
+    30: {"ball_speed": 200, "carry": 178, "lateral_std": 19.0, "smash_factor": 1.36},
+    36: {"ball_speed": 188, "carry": 162, "lateral_std": 23.0, "smash_factor": 1.32},
+}
+
+IRON7_BENCHMARKS = {
+    # (ball_speed_kmh, carry_m, lateral_std_m)
+     0: {"ball_speed": 177, "carry": 160, "lateral_std": 3.5},
+     5: {"ball_speed": 165, "carry": 150, "lateral_std": 5.0},
+    10: {"ball_speed": 158, "carry": 142, "lateral_std": 7.0},
+    15: {"ball_speed": 153, "carry": 135, "lateral_std": 8.5},
+    20: {"ball_speed": 147, "carry": 128, "lateral_std": 11.0},
+    25: {"ball_speed": 143, "carry": 122, "lateral_std": 13.5},
+    30: {"ball_speed": 136, "carry": 113, "lateral_std": 17.0},
+    36: {"ball_speed": 128, "carry": 103, "lateral_std": 21.0},
+}
+
+PW_BENCHMARKS = {
+    # (carry_m, lateral_std_m, spin_rpm)
+     0: {"carry": 125, "lateral_std": 2.5,  "spin": 9500},
+     5: {"carry": 118, "lateral_std": 3.5,  "spin": 8500},
+    10: {"carry": 112, "lateral_std": 5.0,  "spin": 7800},
+    15: {"carry": 105, "lateral_std": 6.5,  "spin": 7000},
+    20: {"carry": 98,  "lateral_std": 9.0,  "spin": 6200},
+    25: {"carry": 93,  "lateral_std": 11.5, "spin": 5600},
+    30: {"carry": 86,  "lateral_std": 14.0, "spin": 5000},
+    36: {"carry": 78,  "lateral_std": 18.0, "spin": 4300},
+}
+
+# Benchmarks de scoring en campo (Strokes Gained vs scratch)
+# Fuente: Broadie & Feit (2012), adaptado a rangos HCP RFEG
+SG_BENCHMARKS = {
+    # SG esperado por categoría para llegar a scoring de scratch (0)
+    # Valores negativos = golpes perdidos vs scratch
+     0: {"sg_ott": 0.0,   "sg_app": 0.0,   "sg_arg": 0.0,   "sg_putt": 0.0},
+     5: {"sg_ott": -0.3,  "sg_app": -0.4,  "sg_arg": -0.3,  "sg_putt": -0.2},
+    10: {"sg_ott": -0.6,  "sg_app": -0.9,  "sg_arg": -0.6,  "sg_putt": -0.4},
+    15: {"sg_ott": -1.0,  "sg_app": -1.6,  "sg_arg": -0.9,  "sg_putt": -0.6},
+    20: {"sg_ott": -1.5,  "sg_app": -2.3,  "sg_arg": -1.3,  "sg_putt": -0.8},
+    25: {"sg_ott": -2.1,  "sg_app": -3.0,  "sg_arg": -1.7,  "sg_putt": -1.0},
+    30: {"sg_ott": -2.8,  "sg_app": -3.8,  "sg_arg": -2.2,  "sg_putt": -1.3},
+    36: {"sg_ott": -3.8,  "sg_app": -5.0,  "sg_arg": -3.0,  "sg_putt": -1.7},
+}
+
+# Benchmarks de una sola métrica por HCP
+FIR_BENCHMARKS            = {0: 60, 10: 50, 20: 42, 30: 34, 36: 28}
+IRON_SF_BENCHMARKS        = {0: 1.37, 10: 1.35, 15: 1.33, 20: 1.31, 25: 1.29, 30: 1.26, 36: 1.23}
+SCRAMBLING_BENCHMARKS     = {0: 58, 10: 45, 15: 38, 20: 30, 25: 23, 30: 18, 36: 13}
+PUTTS_BENCHMARKS          = {0: 28.2, 10: 31.5, 15: 32.8, 20: 33.8, 25: 35.2, 30: 36.5, 36: 38.5}
+THREE_PUTT_BENCHMARKS     = {0: 2.5, 10: 8.0, 15: 11.0, 20: 14.0, 25: 18.0, 30: 22.0, 36: 28.0}
+SCORE_CV_BENCHMARKS       = {0: 3.0, 10: 6.0, 15: 8.0, 20: 10.0, 25: 12.5, 30: 15.0, 36: 19.0}
+CARRY_CV_BENCHMARKS       = {0: 2.0, 10: 4.0, 15: 5.0, 20: 6.5, 25: 8.0, 30: 10.0, 36: 13.0}
+BOUNCE_BACK_BENCHMARKS    = {0: 33, 10: 22, 15: 18, 20: 15, 25: 12, 30: 9, 36: 6}
+F9_B9_DELTA_BENCHMARKS    = {0: 0.8, 10: 2.0, 15: 2.5, 20: 3.2, 25: 4.0, 30: 5.2, 36: 7.0}
+PAR3_BENCHMARKS           = {0: 0.0, 10: 0.5, 15: 0.8, 20: 1.1, 25: 1.4, 30: 1.8, 36: 2.3}
+EXPLOSION_BENCHMARKS      = {0: 0.5, 10: 3.0, 15: 5.0, 20: 7.0, 25: 9.5, 30: 12.0, 36: 16.0}
+CLUB_SPEED_BENCHMARKS     = {0: 179, 5: 165, 10: 155, 15: 150, 20: 143, 25: 138, 30: 133, 36: 125}
+CLUB_SPEED_7I_BENCHMARKS  = {0: 136, 10: 124, 15: 118, 20: 113, 25: 108, 30: 103, 36: 97}
+FACE_TO_PATH_BENCHMARKS   = {0: 1.0, 5: 2.0, 10: 2.8, 15: 3.5, 20: 4.5, 25: 5.5, 30: 7.0, 36: 9.0}
+GIR_BENCHMARKS            = {0: 66, 5: 52, 10: 40, 15: 32, 20: 25, 25: 18, 30: 13, 36: 8}
+
+# ══════════════════════════════════════════════════════════════
+# TABLAS — GENERADOR DEL DASHBOARD
+# ══════════════════════════════════════════════════════════════
+
+# Carry medio por palo (m): PGA Tour (nivel 0), HCP 15 y HCP 23
+CLUB_CARRY_BENCHMARKS = {
+    'Driver': {0: 280, 15: 225, 23: 200},
+    '3W':     {0: 255, 15: 210, 23: 185},
+    'Hybrid': {0: 225, 15: 190, 23: 170},
+    '5i':     {0: 195, 15: 170, 23: 155},
+    '6i':     {0: 185, 15: 160, 23: 145},
+    '7i':     {0: 170, 15: 150, 23: 135},
+    '8i':     {0: 160, 15: 140, 23: 125},
+    '9i':     {0: 145, 15: 130, 23: 115},
+    'PW':     {0: 130, 15: 120, 23: 105},
+    'GW':     {0: 110, 15: 100, 23: 90},
+    'SW':     {0: 90,  15: 80,  23: 70},
+}
+
+# Gauges de percentil (Tab 1)
+GAUGE_BENCHMARKS = {
+    'wedge_carry': {23: 85.0},     # m, media PW / GW 52 / SW 58 típica HCP 23
+    'ball_speed':  {0: 273.0},     # km/h driver, PGA Tour promedio
+    'score_cv':    {23: 0.18},     # CV de scores típico HCP 23
+}
+
+# Golpes por ronda por categoría (strokes gained vs HCP 15)
+STROKES_PER_ROUND_BENCHMARKS = {
+    'off_the_tee':      {15: 30.0},
+    'approach':         {15: 25.0},
+    'short_game':       {15: 21.0},
+    'putting':          {15: 31.0},
+    'around_the_green': {15: 9.5},
+    'tee_to_green':     {15: 55.0},
+}
+
+
+# ══════════════════════════════════════════════════════════════
+# INTERPOLACIÓN
+# ══════════════════════════════════════════════════════════════
+
+def interpolate(hcp: float, levels: List[float], values: List[float]) -> float:
+    """
+    Interpola linealmente el benchmark para el HCP exacto del jugador.
+
+    Ejemplo: HCP 23 → interpola entre HCP 20 y HCP 25. Por debajo del
+    primer nivel o por encima del último se usa el valor del extremo.
+    """
+    if hcp <= levels[0]:
+        return values[0]
+    if not hcp < levels[-1]:
+        return values[-1]
+    i = bisect_left(levels, hcp) - 1
+    lo, hi = levels[i], levels[i + 1]
+    t = (hcp - lo) / (hi - lo)  # factor de interpolación 0-1
+    return values[i] * (1 - t) + values[i + 1] * t
+
+
+def interpolate_many(hcp, levels: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """interpolate() sobre un array de HCPs (bracket [lo, hi] con lo < hcp <= hi)."""
+    hcp = np.asarray(hcp, dtype=np.float64)
+    if len(levels) == 1:
+        return np.full(hcp.shape, values[0])
+    i = np.clip(np.searchsorted(levels, hcp, side="left") - 1, 0, len(levels) - 2)
+    lo, hi = levels[i], levels[i + 1]
+    t = (hcp - lo) / (hi - lo)
+    out = values[i] * (1 - t) + values[i + 1] * t
+    out = np.where(hcp <= levels[0], values[0], out)
+    # NaN cae al último nivel
+    return np.where((hcp <= levels[0]) | (hcp < levels[-1]), out, values[-1])
+
+
+# ══════════════════════════════════════════════════════════════
+# REGISTRO
+# ══════════════════════════════════════════════════════════════
+
+class BenchmarkCurve:
+    """Una tabla {hcp: valor} precalculada sobre HCP_GRID."""
+
+    def __init__(self, name: str, table: Mapping[float, float]):
+        self.name = name
+        self.table = dict(sorted(table.items()))
+        self.levels = np.array(list(self.table), dtype=np.float64)
+        self.values = np.array(list(self.table.values()), dtype=np.float64)
+        self._levels, self._values = list(self.table), list(self.table.values())
+        self.dense = interpolate_many(HCP_GRID, self.levels, self.values)
+        self.dense.flags.writeable = False
+
+    @property
+    def pga(self) -> float:
+        """Valor en el primer nivel (PGA Tour / scratch)."""
+        return next(iter(self.table.values()))
+
+    def __call__(self, hcp: float) -> float:
+        """Benchmark para un HCP (O(1) en la rejilla de 0.1)."""
+        if hcp in self.table:
+            return self.table[hcp]
+        if HCP_MIN <= hcp <= HCP_MAX:
+            idx = round(hcp * STEPS_PER_HCP)
+            if idx / STEPS_PER_HCP == hcp:
+                return float(self.dense[idx])
+        return interpolate(hcp, self._levels, self._values)
+
+    def many(self, hcp) -> np.ndarray:
+        """Benchmark para un array de HCPs."""
+        hcp = np.asarray(hcp, dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            idx = np.rint(hcp * STEPS_PER_HCP)
+            on_grid = (idx >= 0) & (idx < len(HCP_GRID)) & (idx / STEPS_PER_HCP == hcp)
+        out = self.dense[np.where(on_grid, idx, 0).astype(np.int64)]
+        if not on_grid.all():
+            off = ~on_grid
+            out[off] = interpolate_many(hcp[off], self.levels, self.values)
+        return out
+
+    def __repr__(self) -> str:
+        return f"BenchmarkCurve({self.name!r}, levels={list(self.table)})"
+
+
+class BenchmarkRegistry:
+    """Curvas de benchmark por nombre."""
+
+    def __init__(self):
+        self._curves: Dict[str, BenchmarkCurve] = {}
+
+    def register(self, name: str, table: Mapping[float, float]) -> BenchmarkCurve:
+        if name in self._curves:
+            raise ValueError(f"Benchmark '{name}' ya registrado")
+        curve = BenchmarkCurve(name, table)
+        self._curves[name] = curve
+        return curve
+
+    def register_by_level(self, prefix: str, tables: Mapping[float, Mapping[str, float]]):
+        """{hcp: {métrica: valor}} → una curva '<prefix>.<métrica>' por métrica."""
+        metrics = next(iter(tables.values()))
+        for metric in metrics:
+            self.register(f"{prefix}.{metric}", {hcp: row[metric] for hcp, row in tables.items()})
+
+    def register_by_metric(self, prefix: str, tables: Mapping[str, Mapping[float, float]]):
+        """{métrica: {hcp: valor}} → una curva '<prefix>.<métrica>' por métrica."""
+        for metric, table in tables.items():
+            self.register(f"{prefix}.{metric}", table)
+
+    def __getitem__(self, name: str) -> BenchmarkCurve:
+        try:
+            return self._curves[name]
+        except KeyError:
+            raise KeyError(f"Benchmark desconocido: '{name}'") from None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._curves
+
+    def names(self, prefix: str = "") -> Iterable[str]:
+        return [name for name in self._curves if name.startswith(prefix)]
+
+    def digest(self) -> str:
+        """sha256 de todas las tablas (invalida la caché de secciones si cambian)."""
+        tables = {name: [[hcp, value] for hcp, value in curve.table.items()]
+                  for name, curve in self._curves.items()}
+        return hashlib.sha256(json.dumps(tables, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+REGISTRY = BenchmarkRegistry()
+REGISTRY.register_by_level("driver", DRIVER_BENCHMARKS)
+REGISTRY.register_by_level("iron7", IRON7_BENCHMARKS)
+REGISTRY.register_by_level("pw", PW_BENCHMARKS)
+REGISTRY.register_by_level("sg", SG_BENCHMARKS)
+for _name, _table in (
+    ("fir", FIR_BENCHMARKS), ("iron_sf", IRON_SF_BENCHMARKS),
+    ("scrambling", SCRAMBLING_BENCHMARKS), ("putts", PUTTS_BENCHMARKS),
+    ("three_putt", THREE_PUTT_BENCHMARKS), ("score_cv", SCORE_CV_BENCHMARKS),
+    ("carry_cv", CARRY_CV_BENCHMARKS), ("bounce_back", BOUNCE_BACK_BENCHMARKS),
+    ("f9_b9_delta", F9_B9_DELTA_BENCHMARKS), ("par3", PAR3_BENCHMARKS),
+    ("explosion", EXPLOSION_BENCHMARKS), ("club_speed", CLUB_SPEED_BENCHMARKS),
+    ("club_speed_7i", CLUB_SPEED_7I_BENCHMARKS), ("face_to_path", FACE_TO_PATH_BENCHMARKS),
+    ("gir", GIR_BENCHMARKS),
+):
+    REGISTRY.register(_name, _table)
+REGISTRY.register_by_metric("club_carry", CLUB_CARRY_BENCHMARKS)
+REGISTRY.register_by_metric("gauges", GAUGE_BENCHMARKS)
+REGISTRY.register_by_metric("strokes_per_round", STROKES_PER_ROUND_BENCHMARKS)
+
+
+def benchmark(name: str, hcp: float) -> float:
+    """Benchmark `name` para un HCP (p.ej. benchmark('driver.carry', 23.2))."""
+    return REGISTRY[name](hcp)
+
+
+def benchmark_many(name: str, hcp) -> np.ndarray:
+    """Benchmark `name` para un array de HCPs."""
+    return REGISTRY[name].many(hcp)
@@ -0,0 +1,180 @@
+"""
+AlvGolf — Columnar Schema v2
+=============================
+Codificación columnar (opt-in) de los arrays grandes de dashboard_data.
+
+Schema v1 (por defecto): arrays de objetos pequeños, con las claves
+repetidas en cada fila:
+
+    [{"f": "2024-04-01", "p": "PW", "c": 90.2}, {"f": "2024-04-01", ...}, ...]
+
+Schema v2: un objeto de columnas por array
+
+    {"_length": 3000,
+     "_columns": {
+        "f": {"start": "2024-04-01", "delta_days": [0, 0, 1, ...]},   fechas → deltas
+        "p": {"dict": ["PW", "5i", ...], "codes": [0, 1, 0, ...]},    strings → diccionario
+        "c": [90.2, 131.2, ...]                                       resto → tal cual
+     }}
+
+Solo se codifican los arrays de ENCODED_PATHS cuyas filas tienen todas las
+mismas claves en el mismo orden (así decodificar es exacto); el resto queda
+en v1. metadata.schema_version indica la versión escrita.
+
+Lectores:
+  - decode_dashboard(data): v2 → v1 completo (load_dashboard_json lo aplica)
+  - rows(value):            filas de un array en cualquiera de los dos schemas
+                            (para consumidores que reciben el dict en memoria)
+
+El equivalente JS está en dashboard_dynamic.html / dashboard_loader.js
+(decodeColumnarDashboard).
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+import re
+from datetime import date, timedelta
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+
+SCHEMA_V1 = 1
+SCHEMA_V2 = 2
+SCHEMA_VERSIONS = (SCHEMA_V1, SCHEMA_V2)
+
+# Rutas de arrays a codificar ('*' = cada clave de ese nivel)
+ENCODED_PATHS: Tuple[Tuple[str, ...], ...] = (
+    ('flightscope_shots_timeline',),
+    ('score_history', 'rounds'),
+    ('dispersion_by_club', '*', '*'),
+    ('momentum_indicators',),
+)
+
+# Por debajo de esto la cabecera de columnas no compensa
+MIN_ROWS = 8
+
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
+# ══════════════════════════════════════════════════════════════
+# COLUMNAS
+# ══════════════════════════════════════════════════════════════
+
+def _encode_column(values: list):
+    """Columna → fechas delta, diccionario de strings o lista tal cual."""
+    if values and all(isinstance(v, str) for v in values):
+        if all(_DATE_RE.match(v) for v in values):
+            days = np.array(values, dtype='datetime64[D]').astype(np.int64)
+            deltas = np.diff(days, prepend=days[0])
+            return {'start': values[0], 'delta_days': deltas.tolist()}
+        levels, codes = np.unique(np.array(values, dtype=object), return_inverse=True)
+        if len(levels) * 2 <= len(values):
+            # Diccionario en orden de primera aparición
+            first = np.full(len(levels), len(values))
+            np.minimum.at(first, codes, np.arange(len(values)))
+            order = np.argsort(first, kind='stable')
+            remap = np.empty_like(order)
+            remap[order] = np.arange(len(order))
+            return {'dict': levels[order].tolist(), 'codes': remap[codes].tolist()}
+    return values
+
+
+def _decode_column(column) -> list:
+    if isinstance(column, list):
+        return column
+    if 'delta_days' in column:
+        start = date.fromisoformat(column['start'])
+        offsets = np.cumsum(column['delta_days']).tolist()
+        return [(start + timedelta(days=d)).isoformat() for d in offsets]
+    if 'codes' in column:
+        levels = column['dict']
+        return [levels[c] for c in column['codes']]
+    raise ValueError(f"Columna v2 desconocida: {sorted(column)}")
+
+
+def is_columnar(value) -> bool:
+    return isinstance(value, dict) and '_columns' in value
+
+
+def encode_rows(rows: list):
+    """Lista de dicts homogéneos → bloque columnar (o la lista sin cambios)."""
+    if not isinstance(rows, list) or len(rows) < MIN_ROWS:
+        return rows
+    if not all(isinstance(r, dict) for r in rows):
+        return rows
+    keys = list(rows[0])
+    if any(list(r) != keys for r in rows):
+        return rows
+    return {
+        '_length': len(rows),
+        '_columns': {k: _encode_column([r[k] for r in rows]) for k in keys},
+    }
+
+
+def decode_rows(block: dict) -> List[dict]:
+    """Bloque columnar → lista de dicts (mismo orden de claves que v1)."""
+    names = list(block['_columns'])
+    columns = [_decode_column(block['_columns'][k]) for k in names]
+    if any(len(c) != block['_length'] for c in columns):
+        raise ValueError("Bloque columnar corrupto: columnas de distinta longitud")
+    return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+def rows(value) -> list:
+    """Filas de un array de dashboard_data, esté en v1 o en v2."""
+    if is_columnar(value):
+        return decode_rows(value)
+    return value if value is not None else []
+
+
+# ══════════════════════════════════════════════════════════════
+# DASHBOARD
+# ══════════════════════════════════════════════════════════════
+
+def _transform(node, path: Iterable[str], fn):
+    """Copia de `node` con fn aplicada a los valores en `path` (copia solo lo tocado)."""
+    path = tuple(path)
+    if not path:
+        return fn(node)
+    if not isinstance(node, dict):
+        return node
+    head, rest = path[0], path[1:]
+    keys = list(node) if head == '*' else [head]
+    if not any(k in node for k in keys):
+        return node
+    out = dict(node)
+    for key in keys:
+        if key in out:
+            out[key] = _transform(out[key], rest, fn)
+    return out
+
+
+def encode_dashboard(data: dict, version: int = SCHEMA_V2) -> dict:
+    """dashboard_data en el schema pedido (copia superficial; data no se modifica).
+
+    v1 no lleva metadata.schema_version (es el formato histórico).
+    """
+    if version not in SCHEMA_VERSIONS:
+        raise ValueError(f"schema_version {version} no soportado (válidos: {SCHEMA_VERSIONS})")
+    out = dict(data)
+    if version == SCHEMA_V1:
+        return out
+    for path in ENCODED_PATHS:
+        out = _transform(out, path, encode_rows)
+    if isinstance(out.get('metadata'), dict):
+        out['metadata'] = {**out['metadata'], 'schema_version': version}
+    return out
+
+
+def decode_dashboard(data: dict) -> dict:
+    """dashboard_data v2 → v1, tal y como lo escribe el schema por defecto."""
+    metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+    if metadata.get('schema_version', SCHEMA_V1) == SCHEMA_V1:
+        return data
+    out = dict(data)
+    for path in ENCODED_PATHS:
+        out = _transform(out, path, lambda v: decode_rows(v) if is_columnar(v) else v)
+    out['metadata'] = {k: v for k, v in metadata.items() if k != 'schema_version'}
+    return out
@@ -0,0 +1,235 @@
+"""
+AlvGolf — Dashboard Output
+===========================
+Etapa de salida de dashboard_data.json:
+
+  - serialización rápida con orjson (fallback a json de la stdlib),
+    en modo legible (indent=2) o compacto. NaN / ±inf se escriben como
+    null en los dos caminos (JSON válido para JSON.parse del navegador;
+    json.dump escribía NaN)
+  - hermanos precomprimidos .json.gz y .json.br, para que el hosting
+    estático y la API sirvan bytes ya comprimidos
+  - escritura atómica (temp file en el mismo directorio + os.replace) de
+    cada fichero: un lector nunca ve un JSON a medio escribir
+  - content hash (sha256 del contenido canónico, sin timestamps) en
+    metadata.content_hash → ETag / detección de cambios
+
+brotli es opcional: si no está instalado no se escribe .br (y se borra un
+.br antiguo para no servir contenido desfasado).
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from app.columnar import decode_dashboard
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+ENCODINGS = ('gzip', 'br')
+SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# orjson escribe NaN / ±inf como null; si una versión dejara de hacerlo,
+# se sanea con _finite igual que en el fallback json (mismo JSON en ambos)
+_ORJSON_NAN_IS_NULL = orjson is not None and orjson.dumps(
+    [float('nan'), float('inf'), np.float64('nan')], option=orjson.OPT_SERIALIZE_NUMPY
+) == b'[null,null,null]'
+
+# Claves que no forman parte del contenido (cambian en cada ejecución)
+_VOLATILE_KEYS = ('generated_at',)
+_VOLATILE_METADATA = ('content_hash', 'partial_refresh', 'snapshot_version')
+
+
+def _default(obj):
+    """Tipos que ni orjson ni json serializan por sí mismos."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Tipo no serializable: {type(obj).__name__}")
+
+
+def _finite(obj):
+    """Copia de obj con NaN / ±inf → None (lo que orjson hace de serie)."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        return _finite(obj.tolist())
+    if isinstance(obj, np.generic):
+        return _finite(obj.item())
+    return obj
+
+
+# ══════════════════════════════════════════════════════════════
+# SERIALIZACIÓN
+# ══════════════════════════════════════════════════════════════
+
+def dumps(data, compact: bool = False, sort_keys: bool = False) -> bytes:
+    """dashboard_data → bytes UTF-8 (indent=2 o compacto).
+
+    NaN / ±inf → null en ambos caminos: orjson lo hace de serie (comprobado
+    al importar, _ORJSON_NAN_IS_NULL) y para json se sanean antes con _finite.
+    Los floats pueden diferir en formato entre caminos (orjson: 0.00001,
+    1e16; json: 1e-05, 1e+16), no en valor.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if not _ORJSON_NAN_IS_NULL:
+            data = _finite(data)
+        return orjson.dumps(data, default=_default, option=option)
+
+    text = json.dumps(_finite(data), ensure_ascii=False, default=_default, sort_keys=sort_keys,
+                      allow_nan=False,
+                      indent=None if compact else 2,
+                      separators=(',', ':') if compact else None)
+    return text.encode('utf-8')
+
+
+def loads(payload):
+    """bytes / str JSON → objeto Python."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def load_dashboard_json(path, decode: bool = True) -> dict:
+    """Lee un dashboard_data.json (parser rápido si está orjson).
+
+    Con decode=True un JSON en schema v2 (columnar) se devuelve en v1.
+    """
+    with open(path, 'rb') as f:
+        data = loads(f.read())
+    return decode_dashboard(data) if decode else data
+
+
+def content_hash(data: dict) -> str:
+    """sha256 del contenido canónico (claves ordenadas, compacto, sin timestamps)."""
+    content = {k: v for k, v in data.items() if k not in _VOLATILE_KEYS}
+    metadata = content.get('metadata')
+    if isinstance(metadata, dict):
+        content['metadata'] = {k: v for k, v in metadata.items() if k not in _VOLATILE_METADATA}
+    return 'sha256:' + hashlib.sha256(dumps(content, compact=True, sort_keys=True)).hexdigest()
+
+
+# ══════════════════════════════════════════════════════════════
+# ESCRITURA
+# ══════════════════════════════════════════════════════════════
+
+def compress(payload: bytes, encoding: str) -> Optional[bytes]:
+    """Payload comprimido (None si el codec no está disponible)."""
+    if encoding == 'gzip':
+        # mtime=0: mismos bytes para el mismo contenido
+        return gzip.compress(payload, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == 'br':
+        return brotli.compress(payload, quality=BROTLI_QUALITY) if brotli is not None else None
+    raise ValueError(f"Encoding desconocido: {encoding}")
+
+
+def atomic_write(path: Path, payload: bytes):
+    """Escritura atómica: temp file en el mismo directorio + os.replace."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=path.suffix + '.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.chmod(tmp, 0o644)   # mkstemp crea 0600; el JSON lo sirve otro proceso
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def sibling_path(path: Path, encoding: str) -> Path:
+    """dashboard_data.json → dashboard_data.json.gz / .json.br"""
+    return path.with_name(path.name + SUFFIXES[encoding])
+
+
+def write_encoded(path, payload: bytes, encodings: Iterable[str] = ENCODINGS) -> Dict[str, int]:
+    """Escribe `payload` en `path` y sus hermanos comprimidos (todo atómico).
+
+    Los hermanos se escriben DESPUÉS del JSON: mientras tanto son más
+    antiguos que él y negotiate() sirve el JSON sin comprimir.
+
+    Returns:
+        Tamaño en bytes de cada fichero escrito ({'json', 'gzip', 'br'})
+    """
+    path = Path(path)
+    atomic_write(path, payload)
+    sizes = {'json': len(payload)}
+    for encoding in ENCODINGS:
+        target = sibling_path(path, encoding)
+        body = compress(payload, encoding) if encoding in encodings else None
+        if body is None:
+            if target.exists():
+                target.unlink()
+                logger.debug(f"{target.name} desfasado eliminado")
+            continue
+        atomic_write(target, body)
+        sizes[encoding] = len(body)
+    return sizes
+
+
+def write_dashboard_json(path, data: dict, compact: bool = False,
+                         encodings: Iterable[str] = ENCODINGS) -> Dict[str, int]:
+    """Serializa `data` y escribe el JSON y sus hermanos comprimidos.
+
+    Añade metadata.content_hash a `data` (si tiene metadata) antes de
+    serializar.
+
+    Returns:
+        Tamaño en bytes de cada fichero escrito ({'json', 'gzip', 'br'})
+    """
+    digest = content_hash(data)
+    if isinstance(data.get('metadata'), dict):
+        data['metadata']['content_hash'] = digest
+    return write_encoded(path, dumps(data, compact=compact), encodings)
+
+
+# ══════════════════════════════════════════════════════════════
+# LECTURA (servir precomprimido)
+# ══════════════════════════════════════════════════════════════
+
+def negotiate(path, accept_encoding: str = '') -> Tuple[Path, Optional[str]]:
+    """Fichero a servir según Accept-Encoding: (.br | .gz | JSON, content-encoding).
+
+    Solo se elige un hermano si existe y no es más antiguo que el JSON.
+    """
+    path = Path(path)
+    accepted = {token.split(';')[0].strip().lower() for token in accept_encoding.split(',')}
+    json_mtime = path.stat().st_mtime_ns if path.exists() else 0
+    for encoding in ('br', 'gzip'):
+        target = sibling_path(path, encoding)
+        if encoding in accepted and target.exists() and target.stat().st_mtime_ns >= json_mtime:
+            return target, encoding
+    return path, None
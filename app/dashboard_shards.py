@@ -0,0 +1,152 @@
+"""
+AlvGolf — Dashboard Shards
+===========================
+dashboard_data.json partido en un shard por tab + un manifest pequeño
+para carga diferida en el dashboard:
+
+    output/dashboard_manifest.json
+    output/shards/overview.json        (+ .gz / .br)
+    output/shards/evolution.json
+    ...
+    output/shards/shared.json          secciones sin tab declarado
+
+Cada sección declara su tab en SECTIONS (Section.tab). El dashboard pide
+el manifest, carga los shards de `first` (Tab 1) y pinta; el resto se
+descarga después. Una sección nueva sin tab va a 'shared', así que el
+primer render no crece al añadir analítica.
+
+Manifest:
+    {
+      "version": 1,
+      "generated_at": ..., "content_hash": ...,
+      "first": ["overview"],
+      "shards": {nombre: {"url", "keys", "hash", "bytes", "gzip_bytes", "br_bytes"}}
+    }
+
+Coherencia con dashboard_data.json:
+  - output/dashboard_version.json ({"content_hash", "generated_at"}) se
+    escribe en cada ejecución, con o sin shards. Los loaders lo comparan
+    con manifest.content_hash y, si difieren, cargan el JSON completo.
+  - Una ejecución sin --shards borra el manifest y los shards
+    (clear_shards), igual que el anillo de snapshots.
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+from loguru import logger
+
+from app.dashboard_output import dumps, write_encoded
+
+
+MANIFEST_VERSION = 1
+MANIFEST_NAME = 'dashboard_manifest.json'
+VERSION_NAME = 'dashboard_version.json'
+SHARD_DIR = 'shards'
+
+# Ids de los tabs en dashboard_dynamic.html (orden de la barra de tabs)
+TABS = ('overview', 'evolution', 'campos', 'performance', 'deep-analysis', 'strategy')
+FIRST_SHARDS = ('overview',)
+SHARED_SHARD = 'shared'
+
+# Claves que no son secciones: van con el primer render
+FIRST_KEYS = ('generated_at', 'metadata', 'golf_identity', 'identity_timeline')
+
+
+def _remove_encoded(path: Path):
+    """Borra un JSON y sus hermanos .gz / .br."""
+    for target in (path, path.with_name(path.name + '.gz'), path.with_name(path.name + '.br')):
+        target.unlink(missing_ok=True)
+
+
+def shard_layout(data: Mapping, tab_of: Mapping[str, Optional[str]]) -> Dict[str, List[str]]:
+    """{shard: [claves]} en orden de tabs (claves en el orden de `data`)."""
+    layout: Dict[str, List[str]] = {name: [] for name in TABS + (SHARED_SHARD,)}
+    for key in data:
+        if key in FIRST_KEYS:
+            shard = FIRST_SHARDS[0]
+        else:
+            shard = tab_of.get(key) or SHARED_SHARD
+            if shard not in layout:
+                logger.warning(f"Tab desconocido '{shard}' en '{key}': va a '{SHARED_SHARD}'")
+                shard = SHARED_SHARD
+        layout[shard].append(key)
+    return {name: keys for name, keys in layout.items() if keys}
+
+
+def write_shards(output_path, data: dict, tab_of: Mapping[str, Optional[str]]) -> dict:
+    """Escribe los shards (compactos, con .gz / .br) y el manifest junto a output_path.
+
+    El manifest se escribe el último: mientras tanto apunta a los shards
+    anteriores, que siguen en disco hasta que se reemplazan.
+
+    Returns:
+        El manifest escrito
+    """
+    output_dir = Path(output_path).parent
+    shard_dir = output_dir / SHARD_DIR
+    metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+
+    shards = {}
+    for name, keys in shard_layout(data, tab_of).items():
+        payload = dumps({key: data[key] for key in keys}, compact=True)
+        sizes = write_encoded(shard_dir / f"{name}.json", payload)
+        shards[name] = {
+            'url': f"{SHARD_DIR}/{name}.json",
+            'keys': keys,
+            'hash': 'sha256:' + hashlib.sha256(payload).hexdigest(),
+            'bytes': sizes['json'],
+            **{f"{enc}_bytes": sizes[enc] for enc in ('gzip', 'br') if enc in sizes},
+        }
+
+    # Shards de ejecuciones anteriores que ya no existen
+    for stale in shard_dir.glob('*.json'):
+        if stale.stem not in shards:
+            _remove_encoded(stale)
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'generated_at': data.get('generated_at'),
+        'content_hash': metadata.get('content_hash'),
+        'first': [name for name in FIRST_SHARDS if name in shards],
+        'shards': shards,
+    }
+    write_encoded(output_dir / MANIFEST_NAME, dumps(manifest), encodings=())
+    return manifest
+
+
+def write_version(output_path, data: Mapping) -> dict:
+    """Escribe dashboard_version.json con el content_hash del JSON recién escrito.
+
+    Se escribe antes que el manifest: mientras un manifest de otra
+    ejecución siga en disco, su content_hash no coincide y los loaders
+    cargan el JSON completo.
+    """
+    metadata = data.get('metadata') if isinstance(data.get('metadata'), dict) else {}
+    version = {'content_hash': metadata.get('content_hash'), 'generated_at': data.get('generated_at')}
+    write_encoded(Path(output_path).parent / VERSION_NAME, dumps(version), encodings=())
+    return version
+
+
+def clear_shards(output_path) -> bool:
+    """Borra el manifest y los shards (el JSON se escribió sin --shards).
+
+    El manifest se borra primero: sin él los loaders ya no piden shards.
+
+    Returns:
+        True si había algo que borrar
+    """
+    output_dir = Path(output_path).parent
+    manifest = output_dir / MANIFEST_NAME
+    shards = list((output_dir / SHARD_DIR).glob('*.json'))
+    if not manifest.exists() and not shards:
+        return False
+    _remove_encoded(manifest)
+    for shard in shards:
+        _remove_encoded(shard)
+    logger.info(f"Manifest y {len(shards)} shards de una ejecución anterior eliminados")
+    return True
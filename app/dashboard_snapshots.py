@@ -0,0 +1,333 @@
+"""
+AlvGolf — Dashboard Snapshots
+==============================
+Anillo de versiones de dashboard_data + JSON-Patch (RFC 6902) entre
+generaciones consecutivas, para que los consumidores pidan "cambios desde
+la versión N" en vez de volver a descargar y parsear el documento entero:
+
+    output/snapshots/index.json              índice del anillo (latest, versiones)
+    output/snapshots/dashboard_v12.json.gz   snapshot completo de la versión 12
+    output/snapshots/patch_v12.json          patch v11 → v12 (+ .gz / .br)
+
+La versión solo avanza si cambia el contenido (content_hash); se guarda en
+metadata.snapshot_version del JSON escrito. Se conservan las últimas
+RING_SIZE versiones: desde cualquiera de ellas se llega a la última
+aplicando sus patches en orden. Fuera del anillo → recarga completa.
+
+Consumidores:
+  - dashboard (dashboard_dynamic.html / dashboard_loader.js): aplica los
+    patch_v*.json a su caché de localStorage
+  - API (DashboardCache): dashboard_data en memoria actualizado con patches
+  - histórico (app/history.py): compare_dashboard_versions()
+
+Los snapshots y patches están en schema v1 (el de dashboard_data en
+memoria), independientemente de --schema.
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+import gzip
+import shutil
+from pathlib import Path
+from typing import List, Optional
+
+from loguru import logger
+
+from app.dashboard_output import (
+    atomic_write, compress, content_hash, dumps, load_dashboard_json, loads, write_encoded,
+)
+
+
+INDEX_VERSION = 1
+SNAPSHOT_DIR = 'snapshots'
+INDEX_NAME = 'index.json'
+RING_SIZE = 10
+
+
+# ══════════════════════════════════════════════════════════════
+# JSON-PATCH (RFC 6902: add / remove / replace / test)
+# ══════════════════════════════════════════════════════════════
+
+def _escape(token) -> str:
+    return str(token).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token: str) -> str:
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def _diff(old, new, path: str, ops: List[dict]):
+    if type(old) is not type(new):
+        ops.append({'op': 'replace', 'path': path, 'value': new})
+        return
+    if isinstance(new, dict):
+        kept = [k for k in old if k in new]
+        added = [k for k in new if k not in old]
+        if list(new) != kept + added:
+            # Un 'add' añade la clave al final: con otro orden se reemplaza el objeto
+            ops.append({'op': 'replace', 'path': path, 'value': new})
+            return
+        start = len(ops)
+        ops.extend({'op': 'remove', 'path': f"{path}/{_escape(k)}"} for k in old if k not in new)
+        for k in kept:
+            _diff(old[k], new[k], f"{path}/{_escape(k)}", ops)
+        ops.extend({'op': 'add', 'path': f"{path}/{_escape(k)}", 'value': new[k]} for k in added)
+        _collapse(ops, start, path, new)
+    elif isinstance(new, list):
+        start = len(ops)
+        common = min(len(old), len(new))
+        for i in range(common):
+            _diff(old[i], new[i], f"{path}/{i}", ops)
+        # Golpes / rondas nuevos: append al final
+        ops.extend({'op': 'add', 'path': f"{path}/-", 'value': v} for v in new[common:])
+        ops.extend({'op': 'remove', 'path': f"{path}/{i}"} for i in range(len(old) - 1, common - 1, -1))
+        _collapse(ops, start, path, new)
+    elif old != new:
+        ops.append({'op': 'replace', 'path': path, 'value': new})
+
+
+def _collapse(ops: List[dict], start: int, path: str, new):
+    """Si los ops de este nodo pesan más que el nodo nuevo, un solo replace."""
+    if len(ops) - start > 1 and len(dumps(ops[start:], compact=True)) >= len(dumps(new, compact=True)):
+        del ops[start:]
+        ops.append({'op': 'replace', 'path': path, 'value': new})
+
+
+def make_patch(old, new) -> List[dict]:
+    """JSON-Patch que transforma `old` en `new` (ambos ya en tipos JSON)."""
+    ops: List[dict] = []
+    _diff(old, new, '', ops)
+    return ops
+
+
+def apply_patch(doc, ops: List[dict]):
+    """Aplica `ops` sin modificar `doc` (copia solo los contenedores tocados).
+
+    Raises:
+        ValueError: op desconocida, ruta inexistente o 'test' fallido
+    """
+    copied = set()
+
+    def writable(node):
+        if id(node) in copied:
+            return node
+        clone = dict(node) if isinstance(node, dict) else list(node)
+        copied.add(id(clone))
+        return clone
+
+    for op in ops:
+        kind, path = op['op'], op['path']
+        if path == '':
+            if kind == 'test':
+                if doc != op['value']:
+                    raise ValueError("test fallido en ''")
+                continue
+            if kind not in ('add', 'replace'):
+                raise ValueError(f"op '{kind}' no soportada sobre la raíz")
+            doc = op['value']
+            continue
+
+        tokens = [_unescape(t) for t in path.split('/')[1:]]
+        if kind == 'test':
+            node = doc
+            for token in tokens:
+                node = node[int(token)] if isinstance(node, list) else node[token]
+            if node != op['value']:
+                raise ValueError(f"test fallido en {path}")
+            continue
+
+        doc = parent = writable(doc)
+        try:
+            for token in tokens[:-1]:
+                key = int(token) if isinstance(parent, list) else token
+                child = writable(parent[key])
+                parent[key] = child
+                parent = child
+            last = tokens[-1]
+            if isinstance(parent, list):
+                index = len(parent) if last == '-' else int(last)
+                if kind == 'add':
+                    parent.insert(index, op['value'])
+                elif kind == 'replace':
+                    parent[index] = op['value']
+                elif kind == 'remove':
+                    del parent[index]
+                else:
+                    raise ValueError(f"op '{kind}' no soportada")
+            else:
+                if kind in ('add', 'replace'):
+                    if kind == 'replace' and last not in parent:
+                        raise KeyError(last)
+                    parent[last] = op['value']
+                elif kind == 'remove':
+                    del parent[last]
+                else:
+                    raise ValueError(f"op '{kind}' no soportada")
+        except (KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"Ruta inválida en el patch: {path} ({e})") from e
+    return doc
+
+
+# ══════════════════════════════════════════════════════════════
+# ANILLO DE SNAPSHOTS
+# ══════════════════════════════════════════════════════════════
+
+class SnapshotStore:
+    """Anillo de versiones en <output_dir>/snapshots/."""
+
+    def __init__(self, output_dir, ring_size: int = RING_SIZE):
+        self.dir = Path(output_dir) / SNAPSHOT_DIR
+        self.index_path = self.dir / INDEX_NAME
+        self.ring_size = ring_size
+
+    def index(self) -> dict:
+        """{'version', 'latest', 'counter', 'snapshots': [...]}.
+
+        counter = última versión emitida; no retrocede aunque se vacíe el
+        anillo, así una caché con la versión N nunca recibe patches de otra N.
+        """
+        if not self.index_path.exists():
+            return {'version': INDEX_VERSION, 'latest': None, 'counter': 0, 'snapshots': []}
+        return loads(self.index_path.read_bytes())
+
+    @property
+    def latest(self) -> Optional[int]:
+        return self.index()['latest']
+
+    def entry(self, version: int) -> Optional[dict]:
+        return next((e for e in self.index()['snapshots'] if e['version'] == version), None)
+
+    def is_current(self, json_path) -> bool:
+        """¿El índice describe el JSON actual? (escrito después que él)."""
+        json_path = Path(json_path)
+        return (self.index_path.exists() and json_path.exists()
+                and self.index_path.stat().st_mtime_ns >= json_path.stat().st_mtime_ns)
+
+    def next_version(self, data: dict) -> int:
+        """Versión que le toca a `data`: la última si el contenido no cambió."""
+        index = self.index()
+        if index['snapshots'] and index['snapshots'][-1]['content_hash'] == content_hash(data):
+            return index['latest']
+        return index['counter'] + 1
+
+    def load(self, version: int) -> dict:
+        entry = self.entry(version)
+        if entry is None:
+            raise FileNotFoundError(f"Snapshot v{version} fuera del anillo")
+        return loads(gzip.decompress((self.dir / entry['snapshot']).read_bytes()))
+
+    def record(self, data: dict, version: int) -> dict:
+        """Guarda `data` como `version` (+ patch desde la anterior) y recorta el anillo.
+
+        Returns:
+            Entrada del índice de la versión
+        """
+        index = self.index()
+        snapshots = index['snapshots']
+        if snapshots and snapshots[-1]['version'] == version:
+            return snapshots[-1]
+
+        doc = loads(dumps(data, compact=True))   # tipos JSON (numpy → float/int)
+        entry = {
+            'version': version,
+            'generated_at': doc.get('generated_at'),
+            'content_hash': content_hash(doc),
+            'snapshot': f"dashboard_v{version}.json.gz",
+            'patch': None,
+        }
+        atomic_write(self.dir / entry['snapshot'], compress(dumps(doc, compact=True), 'gzip'))
+
+        previous = snapshots[-1] if snapshots else None
+        if previous is not None and previous['version'] == version - 1:
+            base = self.load(previous['version'])
+            patch = make_patch(base, doc)
+            if dumps(apply_patch(base, patch), compact=True) != dumps(doc, compact=True):
+                logger.warning(f"Patch v{previous['version']}→v{version} no reproduce el snapshot: replace completo")
+                patch = [{'op': 'replace', 'path': '', 'value': doc}]
+            entry['patch'] = f"patch_v{version}.json"
+            sizes = write_encoded(self.dir / entry['patch'], dumps(patch, compact=True))
+            entry['patch_ops'] = len(patch)
+            entry['patch_bytes'] = sizes['json']
+
+        snapshots.append(entry)
+        for stale in snapshots[:-self.ring_size]:
+            for name in (stale['snapshot'], stale['patch']):
+                if name:
+                    for path in (self.dir / name, self.dir / f"{name}.gz", self.dir / f"{name}.br"):
+                        path.unlink(missing_ok=True)
+        index['snapshots'] = snapshots[-self.ring_size:]
+        index['latest'] = index['counter'] = version
+        # El índice el último: mientras tanto sigue describiendo el anillo anterior
+        write_encoded(self.index_path, dumps(index), encodings=())
+        return entry
+
+    def clear(self):
+        """Vacía el anillo (el JSON se escribió sin snapshots): los consumidores
+        dejan de aplicar patches y recargan el documento completo."""
+        index = self.index()
+        if not index['snapshots']:
+            return
+        shutil.rmtree(self.dir)
+        write_encoded(self.index_path, dumps({**index, 'latest': None, 'snapshots': []}), encodings=())
+        logger.info(f"Anillo de snapshots vaciado (última versión emitida: v{index['counter']})")
+
+    def changes_since(self, version: int, until: Optional[int] = None) -> Optional[dict]:
+        """Patch acumulado version → until (por defecto la última).
+
+        Returns:
+            {'from', 'to', 'patch'} o None si `version` está fuera del anillo
+        """
+        index = self.index()
+        versions = [e['version'] for e in index['snapshots']]
+        until = index['latest'] if until is None else until
+        if version not in versions or until not in versions or until < version:
+            return None
+        patch = []
+        for entry in index['snapshots']:
+            if version < entry['version'] <= until:
+                if entry['patch'] is None:
+                    return None
+                patch.extend(loads((self.dir / entry['patch']).read_bytes()))
+        return {'from': version, 'to': until, 'patch': patch}
+
+
+# ══════════════════════════════════════════════════════════════
+# CACHÉ EN MEMORIA (API)
+# ══════════════════════════════════════════════════════════════
+
+class DashboardCache:
+    """dashboard_data parseado una vez y actualizado con patches entre versiones.
+
+    get() devuelve siempre un dict nuevo cuando cambia la versión (los
+    patches se aplican sin modificar el anterior), así que quien lo tenga
+    en uso no ve cambios a mitad de petición. No modificar el dict devuelto.
+    """
+
+    def __init__(self, json_path, ring_size: int = RING_SIZE):
+        self.json_path = Path(json_path)
+        self.store = SnapshotStore(self.json_path.parent, ring_size)
+        self.data: Optional[dict] = None
+        self.version: Optional[int] = None
+        self._mtime: Optional[int] = None
+
+    def get(self) -> dict:
+        """dashboard_data actual (FileNotFoundError si no existe el JSON)."""
+        mtime = self.json_path.stat().st_mtime_ns
+        if self.data is not None and mtime == self._mtime:
+            return self.data
+
+        changes = None
+        if self.version is not None and self.store.is_current(self.json_path):
+            changes = self.store.changes_since(self.version)
+        if changes is not None:
+            self.data = apply_patch(self.data, changes['patch'])
+            logger.info(f"dashboard_data v{changes['from']} → v{changes['to']} "
+                        f"({len(changes['patch'])} ops)")
+        else:
+            self.data = load_dashboard_json(self.json_path)
+        metadata = self.data.get('metadata') if isinstance(self.data.get('metadata'), dict) else {}
+        self.version = metadata.get('snapshot_version')
+        self._mtime = mtime
+        return self.data
+
@@ -0,0 +1,326 @@
+"""
+AlvGolf — FlightScope Shot Snapshot
+====================================
+Frame canónico de golpes FlightScope, parseado UNA sola vez por versión
+del workbook y persistido como snapshot columnar (.npz) en disco.
+
+Clave del snapshot: tamaño + mtime + sha256 del workbook.
+  - tamaño y mtime coinciden  → snapshot válido sin re-hashear
+  - mtime distinto, hash igual → snapshot válido (archivo "tocado")
+  - hash distinto             → se re-parsea el Excel y se reescribe
+
+El frame canónico sale de la primera hoja del workbook. Los analizadores
+de Fase 5 leen la hoja MAIN_SHEET: si es la primera (el workbook habitual)
+reciben una vista del frame canónico con los nombres de columna que
+esperan (Fecha, Palo, ...) en lugar de volver a leer el Excel.
+
+Columnas derivadas (se calculan al cargar, no se guardan en el snapshot):
+  lateral_m   desviación lateral en metros con signo (+ derecha, − izquierda)
+  side        'I' / 'C' / 'D' según el signo de lateral_m
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+
+# ── Paths ─────────────────────────────────────────────────────────────────────
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+
+SNAPSHOT_VERSION = 2
+
+# Hoja que leen los analizadores de Fase 5 (el frame canónico es la hoja 0)
+MAIN_SHEET = "TODOS LOS GOLPES"
+
+
+# ── Column layouts ───────────────────────────────────────────────────────────
+
+CANONICAL_COLUMNS = [
+    'fecha', 'palo', 'vuelo_act', 'vuelo_total', 'velocidad_bola',
+    'altura', 'ang_lanzamiento', 'dir_lanzamiento', 'lateral_vuelo',
+]
+
+PHASE5_COLUMNS = [
+    'Fecha', 'Palo', 'VueloAct', 'VueloTotal', 'VelBola',
+    'Altura', 'AngLanz', 'DirLanz', 'LateralVuelo',
+]
+
+DERIVED_COLUMNS = ['lateral_m', 'side']
+
+# "12.3 I", "8 D", "4,5 D", "0 C", -3.2 ...
+_LATERAL_NUMBER = r'(-?\d+(?:[.,]\d+)?)'
+
+# Tipos de celda en columnas object (mezcla de textos "12.3 D" y números)
+_KIND_NAN = 0
+_KIND_STR = 1
+_KIND_NUM = 2
+
+
+# ══════════════════════════════════════════════════════════════
+# FINGERPRINT
+# ══════════════════════════════════════════════════════════════
+
+def _file_sha256(path: Path) -> str:
+    """sha256 del archivo, leído en bloques de 1 MB."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def workbook_fingerprint(path: Path, with_hash: bool = True) -> dict:
+    """Huella del workbook: tamaño, mtime (ns) y opcionalmente sha256."""
+    st = Path(path).stat()
+    fp = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if with_hash:
+        fp["sha256"] = _file_sha256(Path(path))
+    return fp
+
+
+# ══════════════════════════════════════════════════════════════
+# COLUMNAR ENCODING
+# ══════════════════════════════════════════════════════════════
+
+def _encode_frame(df: pd.DataFrame) -> dict:
+    """DataFrame → dict de arrays numpy sin objetos Python (no pickle)."""
+    arrays = {}
+    dtypes = {}
+    for col in df.columns:
+        s = df[col]
+        if pd.api.types.is_datetime64_any_dtype(s):
+            values = s.to_numpy()
+            arrays[f"{col}__i8"] = values.view("i8")
+            dtypes[col] = str(values.dtype)
+        elif pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+            arrays[f"{col}__f8"] = s.to_numpy(dtype="float64", na_value=np.nan)
+            dtypes[col] = str(s.dtype)
+        else:
+            values = s.to_numpy(dtype=object)
+            kinds = np.full(len(values), _KIND_STR, dtype=np.int8)
+            nums = np.zeros(len(values), dtype=np.float64)
+            strs = np.empty(len(values), dtype=object)
+            for i, v in enumerate(values):
+                if v is None or (isinstance(v, float) and np.isnan(v)) or v is pd.NaT:
+                    kinds[i] = _KIND_NAN
+                    strs[i] = ""
+                elif isinstance(v, (int, float, np.integer, np.floating)) and not isinstance(v, bool):
+                    kinds[i] = _KIND_NUM
+                    nums[i] = float(v)
+                    strs[i] = ""
+                else:
+                    strs[i] = str(v)
+            arrays[f"{col}__kind"] = kinds
+            arrays[f"{col}__num"] = nums
+            arrays[f"{col}__str"] = strs.astype(str) if len(strs) else np.array([], dtype="U1")
+            dtypes[col] = "object"
+    return {"arrays": arrays, "dtypes": dtypes}
+
+
+def _decode_frame(npz, columns: list, dtypes: dict) -> pd.DataFrame:
+    """Inverso de _encode_frame."""
+    data = {}
+    for col in columns:
+        kind = dtypes[col]
+        if kind.startswith("datetime64"):
+            data[col] = pd.to_datetime(npz[f"{col}__i8"].view(kind))
+        elif kind == "object":
+            kinds = npz[f"{col}__kind"]
+            out = npz[f"{col}__str"].astype(object)
+            num_mask = kinds == _KIND_NUM
+            if num_mask.any():
+                nums = npz[f"{col}__num"][num_mask]
+                # Enteros vuelven como int (igual que openpyxl)
+                out[num_mask] = [int(n) if float(n).is_integer() else float(n) for n in nums]
+            out[kinds == _KIND_NAN] = np.nan
+            data[col] = out
+        else:
+            values = npz[f"{col}__f8"]
+            try:
+                data[col] = values.astype(kind) if kind != "float64" else values
+            except (TypeError, ValueError):
+                data[col] = values
+    return pd.DataFrame(data, columns=columns)
+
+
+# ══════════════════════════════════════════════════════════════
+# EXCEL PARSE
+# ══════════════════════════════════════════════════════════════
+
+def parse_shot_workbook(workbook_path: Path) -> pd.DataFrame:
+    """Lee la primera hoja del workbook FlightScope y devuelve el frame canónico.
+
+    df.attrs['sheets'] guarda los nombres de las hojas (ver phase5_frame).
+    """
+    excel_file = pd.ExcelFile(workbook_path)
+    df = pd.read_excel(excel_file, sheet_name=0)
+
+    # Renombrar columnas para facilitar el procesamiento
+    df.columns = CANONICAL_COLUMNS
+
+    # Convertir fecha a datetime
+    df['fecha'] = pd.to_datetime(df['fecha'])
+    df.attrs['sheets'] = list(excel_file.sheet_names)
+    return df
+
+
+# ══════════════════════════════════════════════════════════════
+# DERIVED COLUMNS
+# ══════════════════════════════════════════════════════════════
+
+def parse_lateral(values: pd.Series) -> pd.Series:
+    """Desviación lateral FlightScope → metros con signo (vectorizado).
+
+    Convención única: derecha (D) positivo, izquierda (I) negativo, centro
+    (C) cero. Los valores ya numéricos se toman como metros con signo.
+    Celdas vacías o sin número → NaN.
+    """
+    numeric = pd.to_numeric(values, errors='coerce')
+    text = values.astype(str).str.upper()
+
+    magnitude = pd.to_numeric(
+        text.str.extract(_LATERAL_NUMBER, expand=False).str.replace(',', '.', regex=False),
+        errors='coerce',
+    )
+    signed = np.select(
+        [text.str.contains('D', regex=False), text.str.contains('I', regex=False)],
+        [magnitude.abs(), -magnitude.abs()],
+        default=magnitude,
+    )
+
+    is_text = numeric.isna() & values.notna()
+    return pd.Series(np.where(is_text, signed, numeric), index=values.index, dtype='float64')
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Añade lateral_m y side al frame canónico (in place)."""
+    lateral = df['lateral_m'] = parse_lateral(df['lateral_vuelo'])
+    side = np.select([lateral < 0, lateral > 0, lateral == 0], ['I', 'D', 'C'], default=None)
+    df['side'] = pd.Categorical(side, categories=['I', 'C', 'D'])
+    return df
+
+
+# ══════════════════════════════════════════════════════════════
+# SNAPSHOT I/O
+# ══════════════════════════════════════════════════════════════
+
+def snapshot_path_for(workbook_path: Path, cache_dir: Optional[Path] = None) -> Path:
+    """Ruta del snapshot .npz asociado a un workbook."""
+    cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    return cache_dir / f"flightscope_{Path(workbook_path).stem}.npz"
+
+
+def _read_snapshot_meta(snap_path: Path) -> Optional[dict]:
+    if not snap_path.exists():
+        return None
+    try:
+        with np.load(snap_path, allow_pickle=False) as npz:
+            return json.loads(str(npz["__meta__"]))
+    except Exception as e:
+        logger.warning(f"Snapshot ilegible ({snap_path.name}): {e}")
+        return None
+
+
+def _write_snapshot(snap_path: Path, df: pd.DataFrame, fingerprint: dict):
+    """Escritura atómica: temp file en el mismo directorio + os.replace."""
+    snap_path.parent.mkdir(parents=True, exist_ok=True)
+    encoded = _encode_frame(df)
+    meta = {
+        "version": SNAPSHOT_VERSION,
+        "fingerprint": fingerprint,
+        "columns": list(df.columns),
+        "dtypes": encoded["dtypes"],
+        "rows": len(df),
+        "sheets": df.attrs.get("sheets"),
+    }
+    fd, tmp = tempfile.mkstemp(dir=snap_path.parent, suffix=".npz.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, __meta__=np.array(json.dumps(meta)), **encoded["arrays"])
+        os.replace(tmp, snap_path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load_shot_frame(workbook_path, cache_dir: Optional[Path] = None) -> pd.DataFrame:
+    """Frame canónico de golpes, desde snapshot si el workbook no cambió.
+
+    Args:
+        workbook_path: Ruta al Excel de FlightScope
+        cache_dir: Directorio de snapshots (default data/cache/)
+
+    Returns:
+        DataFrame con CANONICAL_COLUMNS ('fecha' ya en datetime64) + DERIVED_COLUMNS;
+        df.attrs['fingerprint'] es la huella del workbook (clave del snapshot)
+    """
+    workbook_path = Path(workbook_path)
+    snap_path = snapshot_path_for(workbook_path, cache_dir)
+
+    quick = workbook_fingerprint(workbook_path, with_hash=False)
+    meta = _read_snapshot_meta(snap_path)
+    fingerprint = None
+
+    if meta and meta.get("version") == SNAPSHOT_VERSION:
+        cached = meta.get("fingerprint", {})
+        hit = cached.get("size") == quick["size"] and cached.get("mtime_ns") == quick["mtime_ns"]
+        if not hit and cached.get("size") == quick["size"]:
+            fingerprint = {**quick, "sha256": _file_sha256(workbook_path)}
+            hit = fingerprint["sha256"] == cached.get("sha256")
+        if hit:
+            try:
+                with np.load(snap_path, allow_pickle=False) as npz:
+                    df = _decode_frame(npz, meta["columns"], meta["dtypes"])
+                df.attrs['sheets'] = meta.get("sheets")
+                df.attrs['fingerprint'] = fingerprint or cached
+                logger.debug(f"Snapshot FlightScope reutilizado: {snap_path.name} ({len(df)} golpes)")
+                if fingerprint and cached.get("mtime_ns") != quick["mtime_ns"]:
+                    # Solo cambió el mtime: refrescar la clave para el próximo fast-path
+                    _write_snapshot(snap_path, df, fingerprint)
+                return add_derived_columns(df)
+            except Exception as e:
+                logger.warning(f"Snapshot FlightScope descartado: {e}")
+
+    df = parse_shot_workbook(workbook_path)
+
+    try:
+        if fingerprint is None:
+            fingerprint = {**quick, "sha256": _file_sha256(workbook_path)}
+        df.attrs['fingerprint'] = fingerprint
+        _write_snapshot(snap_path, df, fingerprint)
+        logger.debug(f"Snapshot FlightScope escrito: {snap_path}")
+    except Exception as e:
+        logger.warning(f"No se pudo escribir snapshot FlightScope: {e}")
+
+    return add_derived_columns(df)
+
+
+def phase5_view(df: pd.DataFrame) -> pd.DataFrame:
+    """Vista del frame canónico con los nombres de columna de Fase 5."""
+    return df[CANONICAL_COLUMNS].rename(columns=dict(zip(CANONICAL_COLUMNS, PHASE5_COLUMNS)))
+
+
+def phase5_frame(workbook_path, df: pd.DataFrame, sheets: Optional[list]) -> pd.DataFrame:
+    """Golpes para los analizadores de Fase 5: la hoja MAIN_SHEET del workbook.
+
+    Si MAIN_SHEET es la primera hoja (la del frame canónico) o no existe, se
+    usa phase5_view(df) sin releer el Excel; si es otra hoja, se lee esa.
+    """
+    if not sheets or sheets[0] == MAIN_SHEET or MAIN_SHEET not in sheets:
+        return phase5_view(df)
+    shots = pd.read_excel(workbook_path, sheet_name=MAIN_SHEET)
+    shots.columns = PHASE5_COLUMNS
+    shots['Fecha'] = pd.to_datetime(shots['Fecha'])
+    return shots
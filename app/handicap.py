@@ -0,0 +1,84 @@
+"""
+AlvGolf — Handicap Engine
+==========================
+Diferenciales de score y Handicap Index rolling (WHS) sobre la RoundsTable.
+
+  differential = (score - course rating) × 113 / slope
+
+se calcula para TODAS las rondas en una operación numpy (CR / slope del
+campo, o los estándar 72 / 113 si el campo no los tiene). El índice se
+mantiene con una ventana ordenada de los últimos 20 diferenciales
+(bisect: insertar el nuevo, quitar el que sale), así que cada ronda cuesta
+O(20) en vez de reordenar la ventana entera — y sale un valor por ronda,
+no solo a fin de mes.
+
+Reglas de "mejores N":
+  - whs_lowest:    tabla WHS 2020 (3 rondas → mejor 1 − 2.0 ... 20 → mejores 8)
+  - legacy_lowest: mejores min(8, n), la estimación histórica del dashboard
+                   (se combina con factor=0.96)
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+from bisect import bisect_left, insort
+from typing import Callable, Tuple
+
+import numpy as np
+
+
+STANDARD_SLOPE = 113
+DEFAULT_COURSE_RATING = 72.0
+WHS_WINDOW = 20
+WHS_BEST = 8
+LEGACY_FACTOR = 0.96
+
+# nº de diferenciales disponibles → (cuántos de los mejores, ajuste)
+_WHS_TABLE = {3: (1, -2.0), 4: (1, -1.0), 5: (1, 0.0), 6: (2, -1.0), 7: (2, 0.0), 8: (2, 0.0)}
+_WHS_TABLE.update({n: (3, 0.0) for n in (9, 10, 11)})
+_WHS_TABLE.update({n: (4, 0.0) for n in (12, 13, 14)})
+_WHS_TABLE.update({n: (5, 0.0) for n in (15, 16)})
+_WHS_TABLE.update({n: (6, 0.0) for n in (17, 18)})
+_WHS_TABLE.update({19: (7, 0.0), 20: (8, 0.0)})
+
+
+def whs_lowest(count: int) -> Tuple[int, float]:
+    """Regla WHS 2020: (mejores a promediar, ajuste). (0, 0) con menos de 3 rondas."""
+    return _WHS_TABLE.get(min(count, WHS_WINDOW), (0, 0.0))
+
+
+def legacy_lowest(count: int) -> Tuple[int, float]:
+    """Mejores min(8, n), sin ajuste."""
+    return min(WHS_BEST, count), 0.0
+
+
+def score_differentials(score, course_rating=DEFAULT_COURSE_RATING, slope=STANDARD_SLOPE) -> np.ndarray:
+    """Diferencial de cada ronda. course_rating / slope: escalar o array por ronda (NaN → estándar)."""
+    score = np.asarray(score, dtype=np.float64)
+    course_rating = np.asarray(course_rating, dtype=np.float64)
+    slope = np.asarray(slope, dtype=np.float64)
+    course_rating = np.where(np.isnan(course_rating), DEFAULT_COURSE_RATING, course_rating)
+    slope = np.where(np.isnan(slope) | (slope <= 0), STANDARD_SLOPE, slope)
+    return (score - course_rating) * STANDARD_SLOPE / slope
+
+
+def rolling_index(differentials, window: int = WHS_WINDOW,
+                  lowest: Callable[[int], Tuple[int, float]] = whs_lowest,
+                  factor: float = 1.0) -> np.ndarray:
+    """Índice tras cada ronda: media de los mejores de los últimos `window` × factor + ajuste.
+
+    Returns:
+        Array float64 alineado con `differentials` (NaN si la regla no da índice)
+    """
+    values = np.asarray(differentials, dtype=np.float64).tolist()
+    out = np.full(len(values), np.nan)
+    window_sorted = []
+
+    for i, diff in enumerate(values):
+        insort(window_sorted, diff)
+        if i >= window:
+            del window_sorted[bisect_left(window_sorted, values[i - window])]
+        k, adjustment = lowest(len(window_sorted))
+        if k:
+            out[i] = (sum(window_sorted[:k]) / k) * factor + adjustment
+    return out
@@ -6,6 +6,9 @@ Supports listing, loading, and comparing analyses across dates.
 
 Directory: output/ai_history/
 Index:     output/ai_history/index.json
+
+Dashboard versions (generate_dashboard_data.py --snapshots) are compared
+from their JSON-Patch in output/snapshots/, without loading both documents.
 """
 
 import json
@@ -14,10 +17,13 @@ from pathlib import Path
 from typing import Optional
 from loguru import logger
 
+from app.dashboard_snapshots import SnapshotStore
+
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
 
 HISTORY_DIR = Path(__file__).parent.parent / "output" / "ai_history"
+SNAPSHOT_OUTPUT_DIR = Path(__file__).parent.parent / "output"
 INDEX_PATH = HISTORY_DIR / "index.json"
 
 
@@ -204,6 +210,33 @@ def compare_analyses(id1: str, id2: str) -> dict:
     return result
 
 
+def compare_dashboard_versions(version_1: int, version_2: Optional[int] = None) -> dict:
+    """
+    Compare two dashboard_data versions from the snapshot ring.
+
+    Args:
+        version_1: Base version
+        version_2: Target version (default: latest)
+
+    Returns:
+        dict with both index entries, the number of patch ops and a
+        section-level diff (sections added/removed/changed)
+    """
+    store = SnapshotStore(SNAPSHOT_OUTPUT_DIR)
+    changes = store.changes_since(version_1, version_2)
+    if changes is None:
+        raise FileNotFoundError(
+            f"Dashboard versions {version_1} → {version_2 or 'latest'} not available in the snapshot ring"
+        )
+
+    return {
+        "entry_1": store.entry(changes["from"]),
+        "entry_2": store.entry(changes["to"]),
+        "patch_ops": len(changes["patch"]),
+        "diff": _diff_patch(changes["patch"]),
+    }
+
+
 def _compute_diff(content1, content2, agent_type: str) -> dict:
     """
     Compute a semantic diff between two analyses.
@@ -253,6 +286,28 @@ def _diff_json(c1: dict, c2: dict) -> dict:
     }
 
 
+def _diff_patch(patch: list) -> dict:
+    """Diff of two dashboard versions — section-level, from the JSON-Patch ops."""
+    added, removed, changed = [], [], {}
+    for op in patch:
+        if op["path"] == "":
+            return {"note": "Whole document replaced"}
+        parts = op["path"].split("/")
+        section = parts[1].replace("~1", "/").replace("~0", "~")
+        if len(parts) == 2 and op["op"] == "add":
+            added.append(section)
+        elif len(parts) == 2 and op["op"] == "remove":
+            removed.append(section)
+        else:
+            changed[section] = changed.get(section, 0) + 1
+
+    return {
+        "sections_added": added,
+        "sections_removed": removed,
+        "sections_changed": [{"section": k, "ops": n} for k, n in changed.items()],
+    }
+
+
 def _diff_text(c1: str, c2: str) -> dict:
     """Diff two text analyses — section headers and length."""
     import re
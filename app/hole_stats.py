@@ -0,0 +1,128 @@
+"""
+AlvGolf — Hole Stats
+=====================
+Analítica hoyo a hoyo de TODOS los campos a la vez sobre la matriz de
+golpes de la RoundsTable (rondas × 18, int8) y el par por hoyo de cada
+campo (fila PAR de la hoja):
+
+  - distribución birdie / par / bogey / doble / triple+ por campo
+    (un solo np.bincount sobre campo × banda)
+  - media de golpes y sobre-par por (campo, hoyo) → ranking de dificultad
+  - splits ida / vuelta (vueltas de 9 completas)
+
+Un hoyo cuenta si tiene golpes (> 0) y el campo tiene par por hoyo.
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+SCORE_BANDS = ('birdies', 'pars', 'bogeys', 'double_bogeys', 'triple_plus')
+FRONT = slice(0, 9)
+BACK = slice(9, 18)
+
+
+def _rate(count, total) -> float:
+    return round(count / total * 100, 1)
+
+
+def _avg_list(values: np.ndarray) -> List[Optional[float]]:
+    return [round(v, 2) if not np.isnan(v) else None for v in values.tolist()]
+
+
+def _nine_split(strokes: np.ndarray, pars: np.ndarray, valid: np.ndarray,
+                course_id: np.ndarray, n_courses: int, nine: slice) -> np.ndarray:
+    """(campos × 3) = [vueltas de 9 completas, suma golpes, suma sobre-par]."""
+    complete = valid[:, nine].all(axis=1)
+    totals = np.zeros((n_courses, 3))
+    np.add.at(totals, course_id[complete], np.column_stack((
+        np.ones(complete.sum()),
+        strokes[complete, nine].sum(axis=1),
+        (strokes[complete, nine] - pars[complete, nine]).sum(axis=1),
+    )))
+    return totals
+
+
+def _nine_summary(row: np.ndarray) -> dict:
+    rounds, strokes, over_par = row.tolist()
+    if rounds == 0:
+        return {'rounds': 0, 'avg_strokes': None, 'avg_over_par': None}
+    return {
+        'rounds': int(rounds),
+        'avg_strokes': round(strokes / rounds, 1),
+        'avg_over_par': round(over_par / rounds, 1),
+    }
+
+
+def course_hole_stats(rounds) -> Dict[str, dict]:
+    """Scoring zones por campo (orden de las hojas; solo campos con hoyos válidos).
+
+    Args:
+        rounds: RoundsTable
+
+    Returns:
+        {campo: {birdies..triple_plus, total_holes, *_rate, front_nine,
+                 back_nine, holes: {par, avg_strokes, avg_over_par},
+                 difficulty_rank}}
+    """
+    n_courses = len(rounds.courses)
+    course_id = rounds.course_id.astype(np.int64)
+    strokes = rounds.strokes.astype(np.int16)
+    pars = rounds.hole_pars().astype(np.int16)
+    valid = (strokes > 0) & (pars > 0)
+
+    # ── Bandas de score (birdie o mejor = 0 ... triple o peor = 4) ──
+    band = np.clip(strokes - pars, -1, 3) + 1
+    cells = (course_id[:, None] * len(SCORE_BANDS) + band)[valid]
+    band_counts = np.bincount(cells, minlength=n_courses * len(SCORE_BANDS)).reshape(n_courses, -1)
+
+    # ── Media por (campo, hoyo) ─────────────────────────────
+    hole_rounds = np.zeros((n_courses, 18))
+    hole_strokes = np.zeros((n_courses, 18))
+    np.add.at(hole_rounds, course_id, valid)
+    np.add.at(hole_strokes, course_id, np.where(valid, strokes, 0))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg_strokes = hole_strokes / hole_rounds
+    avg_over_par = np.where(hole_rounds > 0, avg_strokes - rounds.course_pars, np.nan)
+
+    front = _nine_split(strokes, pars, valid, course_id, n_courses, FRONT)
+    back = _nine_split(strokes, pars, valid, course_id, n_courses, BACK)
+
+    zones = {}
+    for cid, nombre in enumerate(rounds.courses):
+        counts = band_counts[cid]
+        total = int(counts.sum())
+        if total == 0:
+            continue
+
+        birdies, par_count, bogeys, doubles, triples = counts.tolist()
+        # Más difícil primero; hoyos sin datos al final
+        difficulty = np.nan_to_num(avg_over_par[cid], nan=-np.inf)
+        ranking = (np.argsort(-difficulty, kind='stable') + 1).tolist()
+
+        zones[nombre] = {
+            'birdies': birdies,
+            'pars': par_count,
+            'bogeys': bogeys,
+            'double_bogeys': doubles,
+            'triple_plus': triples,
+            'total_holes': total,
+            'birdie_rate': _rate(birdies, total),
+            'par_rate': _rate(par_count, total),
+            'bogey_rate': _rate(bogeys, total),
+            'double_plus_rate': _rate(doubles + triples, total),
+            'front_nine': _nine_summary(front[cid]),
+            'back_nine': _nine_summary(back[cid]),
+            'holes': {
+                'par': rounds.course_pars[cid].tolist(),
+                'avg_strokes': _avg_list(avg_strokes[cid]),
+                'avg_over_par': _avg_list(avg_over_par[cid]),
+            },
+            'difficulty_rank': ranking,
+        }
+    return zones
+
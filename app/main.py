@@ -1,8 +1,10 @@
 """
 AlvGolf Agentic Analytics Engine - FastAPI Application
 
-Main API server with 8 endpoints:
+Main API server with 9 endpoints:
 - GET /                            Health check
+- GET /dashboard-data              dashboard_data.json (precompressed .br / .gz)
+- GET /dashboard-data/changes      JSON-Patch since snapshot version N
 - POST /ingest                     Ingest shots to vector database
 - POST /query                      Query RAG with question
 - POST /analyze                    Full analysis with Multi-Agent System (TIER 2)
@@ -12,13 +14,16 @@ Main API server with 8 endpoints:
 - GET /history                     List saved AI analyses
 - GET /history/{id}                Load specific analysis
 - GET /history/compare/{id1}/{id2} Compare two analyses
+- GET /history/dashboard/{v1}/{v2} Compare two dashboard_data versions
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 import sys
 from datetime import datetime
+from pathlib import Path
 
 from app.config import settings, validate_settings
 from app.models import (
@@ -40,7 +45,9 @@ from app.agents.coach import AgentCoach          # Coach standalone
 from app.agents.analista import AgentAnalista    # Selective
 from app.agents.tecnico import AgentTecnico      # Selective
 from app.agents.estratega import AgentEstratega  # Selective
-from app.history import save_analysis, list_analyses, load_analysis, compare_analyses
+from app.history import save_analysis, list_analyses, load_analysis, compare_analyses, compare_dashboard_versions
+from app.dashboard_output import negotiate
+from app.dashboard_snapshots import DashboardCache, SnapshotStore
 
 
 # ============ Logging Configuration ============
@@ -80,6 +87,13 @@ app.add_middleware(
 )
 
 
+# ============ Dashboard Data Cache ============
+
+# Parsed once; newer generations are applied as JSON-Patch when available
+DASHBOARD_JSON = Path(__file__).parent.parent / "output" / "dashboard_data.json"
+dashboard_cache = DashboardCache(DASHBOARD_JSON)
+
+
 # ============ Startup Event ============
 
 @app.on_event("startup")
@@ -124,6 +138,49 @@ async def health_check():
     )
 
 
+@app.get("/dashboard-data")
+async def get_dashboard_data(accept_encoding: str = Header(default="")):
+    """
+    Serve output/dashboard_data.json as written by generate_dashboard_data.py.
+
+    Uses the precompressed .br / .gz sibling when the client accepts it,
+    so the bytes are sent as-is without compressing per request.
+    """
+    if not DASHBOARD_JSON.exists():
+        raise HTTPException(
+            status_code=404,
+            detail="dashboard_data.json not found. Run generate_dashboard_data.py first."
+        )
+
+    path, encoding = negotiate(DASHBOARD_JSON, accept_encoding)
+    headers = {"Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=path.read_bytes(), media_type="application/json", headers=headers)
+
+
+@app.get("/dashboard-data/changes")
+async def get_dashboard_changes(since: int = Query(..., description="Snapshot version held by the client")):
+    """
+    JSON-Patch (RFC 6902) from snapshot version `since` to the latest one.
+
+    Returns {"from", "to", "patch"}; an empty patch when the client is up to
+    date. 410 Gone when `since` is no longer in the snapshot ring (or the
+    last generation ran without --snapshots): re-fetch /dashboard-data.
+    """
+    store = SnapshotStore(DASHBOARD_JSON.parent)
+    if not store.is_current(DASHBOARD_JSON):
+        raise HTTPException(status_code=410, detail="No snapshots for the current dashboard_data.json")
+
+    changes = store.changes_since(since)
+    if changes is None:
+        raise HTTPException(
+            status_code=410,
+            detail=f"Version {since} is not in the snapshot ring (latest: {store.latest}). Re-fetch /dashboard-data."
+        )
+    return changes
+
+
 @app.post("/ingest", response_model=IngestResponse)
 async def ingest_data(request: IngestRequest):
     """
@@ -273,7 +330,7 @@ async def generate_dashboard_content(request: ContentGenerateRequest):
         from pathlib import Path
         import json
 
-        json_path = Path(__file__).parent.parent / "output" / "dashboard_data.json"
+        json_path = DASHBOARD_JSON
 
         if not json_path.exists():
             raise HTTPException(
@@ -281,8 +338,7 @@ async def generate_dashboard_content(request: ContentGenerateRequest):
                 detail="dashboard_data.json not found. Please run generate_dashboard_data.py first."
             )
 
-        with open(json_path, 'r', encoding='utf-8') as f:
-            dashboard_data = json.load(f)
+        dashboard_data = dashboard_cache.get()
 
         logger.info(f"[Team 3] Loaded dashboard_data.json ({json_path.stat().st_size / 1024:.1f} KB)")
 
@@ -357,7 +413,7 @@ async def generate_coach_report(request: CoachReportRequest):
         from pathlib import Path
         import json
 
-        json_path = Path(__file__).parent.parent / "output" / "dashboard_data.json"
+        json_path = DASHBOARD_JSON
 
         if not json_path.exists():
             raise HTTPException(
@@ -365,8 +421,7 @@ async def generate_coach_report(request: CoachReportRequest):
                 detail="dashboard_data.json not found. Run generate_dashboard_data.py first."
             )
 
-        with open(json_path, "r", encoding="utf-8") as f:
-            dashboard_data = json.load(f)
+        dashboard_data = dashboard_cache.get()
 
         logger.info(f"[Coach] Loaded dashboard_data.json ({json_path.stat().st_size / 1024:.1f} KB)")
 
@@ -437,15 +492,14 @@ async def generate_agent(request: AgentGenerateRequest):
         from pathlib import Path
         import json
 
-        json_path = Path(__file__).parent.parent / "output" / "dashboard_data.json"
+        json_path = DASHBOARD_JSON
         if not json_path.exists():
             raise HTTPException(
                 status_code=404,
                 detail="dashboard_data.json not found. Run generate_dashboard_data.py first."
             )
 
-        with open(json_path, 'r', encoding='utf-8') as f:
-            dashboard_data = json.load(f)
+        dashboard_data = dashboard_cache.get()
 
         # Instantiate and run agent
         agent_class, method_name, output_key = _AGENT_REGISTRY[agent_name]
@@ -536,6 +590,20 @@ async def compare_history(id1: str, id2: str):
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@app.get("/history/dashboard/{version_1}/{version_2}")
+async def compare_dashboard_history(version_1: int, version_2: int):
+    """
+    Compare two dashboard_data versions from the snapshot ring.
+
+    Returns both index entries + the sections added/removed/changed,
+    computed from the JSON-Patch between them.
+    """
+    try:
+        return compare_dashboard_versions(version_1, version_2)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 # ============ Run Server ============
 
 if __name__ == "__main__":
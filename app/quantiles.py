@@ -0,0 +1,227 @@
+"""
+AlvGolf — Quantiles
+====================
+Percentiles agrupados (por palo, por palo × mes...) en una sola pasada, y
+sketches t-digest fusionables para historiales muy grandes.
+
+grouped_quantiles():
+    Un único lexsort por (grupo, valor) y todos los percentiles de todos los
+    grupos por aritmética de índices — mismo resultado que
+    Series.quantile(q) (interpolación 'linear' de numpy) grupo a grupo.
+
+TDigest / SketchStore:
+    Resumen de ~δ/2 centroides por grupo con error relativo pequeño en las
+    colas. Los digests se FUSIONAN (merge): se guarda uno por (palo, mes) y
+    los percentiles de un trimestre o de todo el histórico salen de fusionar
+    los meses, sin volver a leer golpes. Añadir golpes nuevos solo actualiza
+    los digests de sus meses.
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+from typing import Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+DEFAULT_QUANTILES = (0.10, 0.25, 0.50, 0.75, 0.90)
+DEFAULT_COMPRESSION = 200
+# A partir de aquí conviene servir percentiles desde los sketches (aprox.)
+SKETCH_MIN_VALUES = 250_000
+
+
+# ══════════════════════════════════════════════════════════════
+# EXACTOS
+# ══════════════════════════════════════════════════════════════
+
+def _lerp(a: np.ndarray, b: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Interpolación lineal con la misma aritmética que numpy.quantile."""
+    diff = b - a
+    out = a + diff * t
+    return np.where(t >= 0.5, b - diff * (1 - t), out)
+
+
+def grouped_quantiles(values, groups, quantiles: Sequence[float] = DEFAULT_QUANTILES
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Percentiles exactos de `values` por grupo (NaN ignorados).
+
+    Args:
+        values: Array numérico
+        groups: Clave de grupo por fila (cualquier dtype ordenable)
+        quantiles: Cuantiles en [0, 1]
+
+    Returns:
+        (keys, counts, table) — table[i, j] = cuantil j del grupo keys[i]
+    """
+    values = np.asarray(values, dtype=np.float64)
+    groups = np.asarray(groups)
+    keep = ~np.isnan(values)
+    values, groups = values[keep], groups[keep]
+
+    keys, inverse = np.unique(groups, return_inverse=True)
+    order = np.lexsort((values, inverse))
+    sorted_values = values[order]
+    counts = np.bincount(inverse, minlength=len(keys))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    q = np.asarray(quantiles, dtype=np.float64)
+    virtual = (counts[:, None] - 1) * q[None, :]
+    previous = np.floor(virtual)
+    gamma = virtual - previous
+    prev_idx = np.clip(previous.astype(np.int64), 0, np.maximum(counts - 1, 0)[:, None])
+    next_idx = np.minimum(prev_idx + 1, np.maximum(counts - 1, 0)[:, None])
+
+    if len(sorted_values) == 0:
+        return keys, counts, np.empty((0, len(q)))
+    table = _lerp(sorted_values[starts[:, None] + prev_idx], sorted_values[starts[:, None] + next_idx], gamma)
+    return keys, counts, table
+
+
+# ══════════════════════════════════════════════════════════════
+# T-DIGEST
+# ══════════════════════════════════════════════════════════════
+
+def _scale(q: np.ndarray, compression: float) -> np.ndarray:
+    """Función de escala k1: centroides más finos en las colas."""
+    return compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0.0, 1.0) - 1)
+
+
+class TDigest:
+    """t-digest fusionable (centroides media/peso ordenados)."""
+
+    def __init__(self, means=None, weights=None, minimum: float = np.inf,
+                 maximum: float = -np.inf, compression: float = DEFAULT_COMPRESSION):
+        self.means = np.asarray(means if means is not None else [], dtype=np.float64)
+        self.weights = np.asarray(weights if weights is not None else [], dtype=np.float64)
+        self.min = minimum
+        self.max = maximum
+        self.compression = compression
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    @classmethod
+    def from_values(cls, values, compression: float = DEFAULT_COMPRESSION) -> "TDigest":
+        """Digest de un lote de valores (NaN ignorados)."""
+        values = np.sort(np.asarray(values, dtype=np.float64))
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return cls(compression=compression)
+        digest = cls(values, np.ones(values.size), values[0], values[-1], compression)
+        return digest._compress()
+
+    def _compress(self) -> "TDigest":
+        """Agrupa centroides consecutivos dentro de la misma unidad de k."""
+        total = self.weights.sum()
+        if self.means.size <= 1 or total == 0:
+            return self
+        midpoint = (np.cumsum(self.weights) - self.weights / 2) / total
+        cluster = np.floor(_scale(midpoint, self.compression)).astype(np.int64)
+        # Centroides singleton en los extremos: colas exactas
+        cluster[0], cluster[-1] = cluster.min() - 1, cluster.max() + 1
+        _, start = np.unique(cluster, return_index=True)
+        start = np.sort(start)
+        weights = np.add.reduceat(self.weights, start)
+        self.means = np.add.reduceat(self.means * self.weights, start) / weights
+        self.weights = weights
+        return self
+
+    def merge(self, *others: "TDigest") -> "TDigest":
+        """Nuevo digest con los centroides de self y others."""
+        digests = [self, *others]
+        means = np.concatenate([d.means for d in digests])
+        weights = np.concatenate([d.weights for d in digests])
+        order = np.argsort(means, kind='stable')
+        merged = TDigest(means[order], weights[order],
+                         min(d.min for d in digests), max(d.max for d in digests), self.compression)
+        return merged._compress()
+
+    def update(self, values) -> "TDigest":
+        """Digest con `values` añadidos (los ya resumidos no se vuelven a leer)."""
+        return self.merge(TDigest.from_values(values, self.compression))
+
+    def quantile(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> np.ndarray:
+        """Percentiles estimados (interpolación entre centros de centroides)."""
+        q = np.asarray(quantiles, dtype=np.float64)
+        total = self.count
+        if total == 0:
+            return np.full(q.shape, np.nan)
+        # Rango (0..N-1) del centro de cada centroide, con min y max en los extremos
+        centers = np.cumsum(self.weights) - (self.weights + 1) / 2
+        xs = np.concatenate(([0.0], centers, [total - 1]))
+        ys = np.concatenate(([self.min], self.means, [self.max]))
+        return np.interp(q * (total - 1), xs, ys)
+
+    def to_dict(self) -> dict:
+        return {'means': self.means.tolist(), 'weights': self.weights.tolist(),
+                'min': self.min, 'max': self.max, 'compression': self.compression}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TDigest":
+        return cls(data['means'], data['weights'], data['min'], data['max'],
+                   data.get('compression', DEFAULT_COMPRESSION))
+
+
+class SketchStore:
+    """Un TDigest por clave (p.ej. (palo, month_id)), fusionables bajo demanda."""
+
+    def __init__(self, compression: float = DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.digests: Dict[Hashable, TDigest] = {}
+
+    def __len__(self) -> int:
+        return len(self.digests)
+
+    def add(self, values, *keys) -> "SketchStore":
+        """Añade `values` a los digests de sus claves.
+
+        Args:
+            values: Array numérico
+            *keys: Uno o varios arrays alineados con values; la clave de cada
+                valor es la tupla de sus niveles (o el valor si hay un solo array)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.size == 0:
+            return self
+        levels, codes = zip(*(np.unique(np.asarray(k), return_inverse=True) for k in keys))
+        shape = tuple(len(level) for level in levels)
+        cell = np.ravel_multi_index(codes, shape)
+
+        order = np.argsort(cell, kind='stable')
+        cell = cell[order]
+        start = np.flatnonzero(np.concatenate(([True], cell[1:] != cell[:-1])))
+        end = np.append(start[1:], len(cell))
+
+        for s, e in zip(start.tolist(), end.tolist()):
+            idx = np.unravel_index(cell[s], shape)
+            key = tuple(level[i].item() for level, i in zip(levels, idx))
+            key = key[0] if len(key) == 1 else key
+            chunk = TDigest.from_values(values[order[s:e]], self.compression)
+            current = self.digests.get(key)
+            self.digests[key] = current.merge(chunk) if current is not None else chunk
+        return self
+
+    def to_dict(self) -> dict:
+        """Serializable a JSON (claves tupla → listas)."""
+        return {'compression': self.compression,
+                'digests': [[list(k) if isinstance(k, tuple) else k, d.to_dict()]
+                            for k, d in self.digests.items()]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SketchStore":
+        store = cls(data.get('compression', DEFAULT_COMPRESSION))
+        for key, digest in data['digests']:
+            store.digests[tuple(key) if isinstance(key, list) else key] = TDigest.from_dict(digest)
+        return store
+
+    def rollup(self, key_fn: Optional[Callable[[Hashable], Hashable]] = None) -> Dict[Hashable, TDigest]:
+        """Fusiona los digests por key_fn(clave) (p.ej. (palo, mes) → (palo, trimestre)).
+
+        Con key_fn=None fusiona todo bajo la clave None.
+        """
+        groups: Dict[Hashable, list] = {}
+        for key, digest in self.digests.items():
+            groups.setdefault(key_fn(key) if key_fn else None, []).append(digest)
+        return {k: ds[0].merge(*ds[1:]) for k, ds in groups.items()}
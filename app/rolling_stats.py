@@ -0,0 +1,167 @@
+"""
+AlvGolf — Rolling Stats
+========================
+Estadísticas por ventana (media, std, CV, min/max, EWMA) sobre una serie
+ordenada — normalmente los scores de la RoundsTable — a partir de sumas
+prefijo de x y x²:
+
+    sum[start:end]  = S1[end] - S1[start]
+    mean            = sum / n
+    var (ddof=0)    = (n·S2 - S1²) / n²
+
+Cada ventana es un par de índices [start, end) sobre la serie, así que el
+mismo motor sirve para:
+
+  - Windows.trailing(n, 5)         últimas 5 rondas (SMA-5, warm-up expanding)
+  - Windows.calendar(dates, 365)   rondas de los últimos 365 días
+  - Windows.buckets(month_id)      meses / trimestres (grupos contiguos)
+  - Windows.span(start, end)       ventanas arbitrarias (últimas 20, previas 5...)
+
+Con scores enteros las sumas prefijo son int64 exactas: la media coincide
+bit a bit con sum(lista) / len(lista). Todo es O(n) salvo min/max
+(O(Σ longitudes) vía np.minimum.reduceat).
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+# ══════════════════════════════════════════════════════════════
+# VENTANAS
+# ══════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class Windows:
+    """Ventanas [start, end) sobre una serie; keys = id de bucket (si aplica)."""
+
+    start: np.ndarray
+    end: np.ndarray
+    min_periods: int = 1
+    keys: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    @property
+    def count(self) -> np.ndarray:
+        return self.end - self.start
+
+    @property
+    def valid(self) -> np.ndarray:
+        count = self.count
+        return (count >= self.min_periods) & (count > 0)
+
+    @classmethod
+    def trailing(cls, n: int, size: int, min_periods: int = 1) -> "Windows":
+        """Una ventana por fila: las `size` filas hasta ella (incluida)."""
+        end = np.arange(1, n + 1, dtype=np.int64)
+        return cls(np.maximum(end - size, 0), end, min_periods)
+
+    @classmethod
+    def calendar(cls, dates, days: int, min_periods: int = 1) -> "Windows":
+        """Una ventana por fila: filas con fecha en (fecha - days, fecha], hasta ella."""
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        end = np.arange(1, len(dates) + 1, dtype=np.int64)
+        start = np.searchsorted(dates, dates - np.timedelta64(days, 'D'), side='right').astype(np.int64)
+        return cls(start, end, min_periods)
+
+    @classmethod
+    def buckets(cls, ids, min_periods: int = 1) -> "Windows":
+        """Una ventana por grupo de ids iguales consecutivos (serie ordenada por id)."""
+        ids = np.asarray(ids)
+        if ids.size == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return cls(empty, empty, min_periods, ids)
+        bounds = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+        start = np.concatenate(([0], bounds)).astype(np.int64)
+        end = np.concatenate((bounds, [len(ids)])).astype(np.int64)
+        return cls(start, end, min_periods, ids[start])
+
+    @classmethod
+    def span(cls, start, end, min_periods: int = 1) -> "Windows":
+        """Ventanas explícitas (escalares o arrays de índices)."""
+        return cls(np.atleast_1d(np.asarray(start, dtype=np.int64)),
+                   np.atleast_1d(np.asarray(end, dtype=np.int64)), min_periods)
+
+
+# ══════════════════════════════════════════════════════════════
+# ESTADÍSTICAS
+# ══════════════════════════════════════════════════════════════
+
+class RollingStats:
+    """Media / std / CV / min / max por ventana a partir de sumas prefijo."""
+
+    def __init__(self, values):
+        self.values = np.asarray(values)
+        self._exact = np.issubdtype(self.values.dtype, np.integer)
+        if self._exact:
+            v = self.values.astype(np.int64)
+            self._shift = 0
+        else:
+            v = self.values.astype(np.float64)
+            # Desplazar por el primer valor reduce la cancelación en S2 - S1²/n
+            self._shift = float(v[0]) if v.size else 0.0
+            v = v - self._shift
+        self._s1 = np.concatenate(([0], np.cumsum(v)))
+        self._s2 = np.concatenate(([0], np.cumsum(v * v)))
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _sums(self, w: Windows):
+        return self._s1[w.end] - self._s1[w.start], self._s2[w.end] - self._s2[w.start]
+
+    def sum(self, w: Windows) -> np.ndarray:
+        s1, _ = self._sums(w)
+        return np.where(w.valid, s1 + w.count * self._shift, np.nan)
+
+    def mean(self, w: Windows) -> np.ndarray:
+        s1, _ = self._sums(w)
+        n = w.count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(w.valid, s1 / n + self._shift, np.nan)
+
+    def var(self, w: Windows, ddof: int = 0) -> np.ndarray:
+        s1, s2 = self._sums(w)
+        n = w.count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self._exact:
+                var = (n * s2 - s1 * s1) / (n * (n - ddof))
+            else:
+                var = np.maximum(s2 - s1 * s1 / n, 0.0) / (n - ddof)
+        return np.where(w.valid & (n > ddof), var, np.nan)
+
+    def std(self, w: Windows, ddof: int = 0) -> np.ndarray:
+        return np.sqrt(self.var(w, ddof))
+
+    def cv(self, w: Windows, ddof: int = 0) -> np.ndarray:
+        """Coeficiente de variación en % (0 si la media no es positiva)."""
+        mean, std = self.mean(w), self.std(w, ddof)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(mean > 0, std / mean * 100, np.where(w.valid, 0.0, np.nan))
+
+    def _reduce(self, ufunc, w: Windows) -> np.ndarray:
+        out = np.full(len(w), np.nan)
+        valid = w.valid
+        if valid.any() and len(self):
+            values = np.append(self.values.astype(np.float64), np.nan)   # centinela para end == n
+            idx = np.column_stack((w.start[valid], w.end[valid])).ravel()
+            out[valid] = ufunc.reduceat(values, idx)[::2]
+        return out
+
+    def min(self, w: Windows) -> np.ndarray:
+        return self._reduce(np.minimum, w)
+
+    def max(self, w: Windows) -> np.ndarray:
+        return self._reduce(np.maximum, w)
+
+    def ewma(self, span: Optional[float] = None, alpha: Optional[float] = None) -> np.ndarray:
+        """Media móvil exponencial por fila (recursiva: y_t = α·x_t + (1-α)·y_{t-1})."""
+        series = pd.Series(self.values.astype(np.float64))
+        return series.ewm(span=span, alpha=alpha, adjust=False).mean().to_numpy()
@@ -0,0 +1,174 @@
+"""
+AlvGolf — Round Milestones
+===========================
+Motor de hitos en UNA pasada sobre las rondas ordenadas (RoundsTable):
+
+  - running best       mínimo acumulado (np.minimum.accumulate)
+  - personal bests     rondas que mejoran el running best anterior
+  - first crossings    primera ronda bajo 100/90/85/80
+  - rachas             runs de rondas consecutivas que cumplen una máscara
+                       (bajo 90, bajo 85, bajo par + hcp...) vía run-length
+
+Sustituye a los tres recorridos que hacían score_history (con un
+`all(...)` sobre el prefijo por ronda → O(n²)), milestone_achievements y
+scoring_streaks. Todo es O(n) y se calcula una vez por carga de tarjetas.
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+# Umbrales "broke X" (primera ronda estrictamente por debajo)
+BREAK_THRESHOLDS = (100, 90, 85, 80)
+
+# Rachas que generan achievement: (tipo, umbral estricto, longitud mínima)
+STREAK_MILESTONES = (
+    ('consistency_streak', 90, 3),
+    ('elite_streak', 85, 3),
+)
+
+
+@dataclass(frozen=True)
+class Run:
+    """Racha [start, end) de rondas consecutivas que cumplen una condición."""
+
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start
+
+
+def find_runs(mask) -> List[Run]:
+    """Runs de True consecutivos en `mask` (run-length encoding, O(n))."""
+    mask = np.asarray(mask, dtype=bool)
+    if mask.size == 0:
+        return []
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return [Run(int(s), int(e)) for s, e in zip(starts, ends)]
+
+
+class RoundMilestones:
+    """Hitos de todas las rondas, calculados una vez desde la RoundsTable."""
+
+    def __init__(self, rounds):
+        self.rounds = rounds
+        self.score = np.asarray(rounds.score, dtype=np.int64)
+        n = len(self.score)
+
+        self.running_best = np.minimum.accumulate(self.score) if n else np.empty(0, dtype=np.int64)
+        previous_best = np.concatenate(([np.iinfo(np.int64).max], self.running_best[:-1])) if n else self.running_best
+        self.personal_bests = np.flatnonzero(self.score < previous_best)
+
+        # Primer mínimo / primer máximo (mismo desempate que min()/max() sobre la lista)
+        self.best_idx = int(np.argmin(self.score)) if n else None
+        self.worst_idx = int(np.argmax(self.score)) if n else None
+
+        self.first_below: Dict[int, Optional[int]] = {t: self._first_below(t) for t in BREAK_THRESHOLDS}
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+    def _first_below(self, threshold: int) -> Optional[int]:
+        below = np.flatnonzero(self.score < threshold)
+        return int(below[0]) if below.size else None
+
+    # ── Rachas ───────────────────────────────────────────────
+
+    def runs_below(self, threshold) -> List[Run]:
+        """Rachas de rondas con score < threshold (escalar o array por ronda)."""
+        return find_runs(self.score < threshold)
+
+    def runs_at_or_below(self, target) -> List[Run]:
+        """Rachas de rondas con score <= target (escalar o array por ronda)."""
+        return find_runs(self.score <= target)
+
+    def streak_summary(self, runs: List[Run], min_streak: int = 2) -> Dict[str, int]:
+        """{'best', 'total', 'current'} de una lista de rachas.
+
+        best = racha más larga, total = rachas de al menos `min_streak`
+        rondas, current = racha abierta en la última ronda (0 si no hay).
+        """
+        n = len(self)
+        return {
+            'best': max((r.length for r in runs), default=0),
+            'total': sum(1 for r in runs if r.length >= min_streak),
+            'current': runs[-1].length if runs and runs[-1].end == n else 0,
+        }
+
+    # ── Anotaciones ──────────────────────────────────────────
+
+    def round_tags(self) -> List[List[str]]:
+        """Etiquetas por ronda para score_history (mismo orden de etiquetas)."""
+        n = len(self)
+        if n == 0:
+            return []
+        date = self.rounds.date
+        is_best = (self.score == self.score[self.best_idx]) & (date == date[self.best_idx])
+        is_worst = (self.score == self.score[self.worst_idx]) & (date == date[self.worst_idx])
+
+        tags = [[] for _ in range(n)]
+        tags[0].append('first_round')
+        for i in np.flatnonzero(is_best).tolist():
+            tags[i].append('personal_best')
+        for i in np.flatnonzero(is_worst).tolist():
+            tags[i].append('worst_round')
+        tags[-1].append('most_recent')
+        for threshold in (90, 85, 80):
+            idx = self.first_below[threshold]
+            if idx is not None:
+                tags[idx].append(f'broke_{threshold}')
+        return tags
+
+    def achievements(self) -> List[dict]:
+        """Lista cronológica de achievements (broke_X, personal_best, rachas)."""
+        n = len(self)
+        if n == 0:
+            return []
+        dates = self.rounds.date_str
+        events = []     # (ronda, orden dentro de la ronda, milestone)
+
+        def add(idx, order, kind, value, course, description, date=None):
+            events.append((idx, order, {
+                'date': date or dates[idx],
+                'type': kind,
+                'value': int(value),
+                'course': course,
+                'description': description,
+            }))
+
+        for order, threshold in enumerate(BREAK_THRESHOLDS):
+            idx = self.first_below[threshold]
+            if idx is not None:
+                score = int(self.score[idx])
+                add(idx, order, f'broke_{threshold}', score, self.rounds.course_name(idx),
+                    f'Primera vez bajo {threshold} (score: {score})')
+
+        for idx in self.personal_bests.tolist():
+            score = int(self.score[idx])
+            add(idx, len(BREAK_THRESHOLDS), 'personal_best', score, self.rounds.course_name(idx),
+                f'Nuevo personal best: {score}')
+
+        # Rachas: se anotan en la ronda que las corta, o al final si siguen abiertas
+        for order, (kind, threshold, min_length) in enumerate(STREAK_MILESTONES, start=len(BREAK_THRESHOLDS) + 1):
+            for run in self.runs_below(threshold):
+                if run.length < min_length:
+                    continue
+                if run.end < n:
+                    since = f' (desde {dates[run.start]})' if kind == 'consistency_streak' else ''
+                    add(run.end, order, kind, run.length, 'Multiple courses',
+                        f'Racha de {run.length} rondas consecutivas bajo {threshold}{since}')
+                else:
+                    add(n, order, kind, run.length, 'Multiple courses',
+                        f'Racha actual de {run.length} rondas bajo {threshold}', date=dates[-1])
+
+        events.sort(key=lambda e: (e[0], e[1]))
+        return [milestone for _, _, milestone in events]
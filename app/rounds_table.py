@@ -0,0 +1,168 @@
+"""
+AlvGolf — RoundsTable
+======================
+Tabla columnar de TODAS las rondas (todos los campos), ordenada por fecha
+y construida UNA sola vez tras cargar las tarjetas.
+
+Sustituye al patrón repetido en el generador de "recopilar rondas de
+tarjetas_data → ordenar → re-parsear fechas". Cada columna es un array
+numpy alineado por fila (una fila = una ronda):
+
+  date          datetime64[D]
+  score         total_ronda (int64)
+  differential  diferencia_par (float64, NaN si no hay par)
+  par/slope/vc  del campo (float64, NaN si faltan)
+  course_id     índice en `courses`
+  month_id      year*12 + (month-1)   → bucket mensual
+  quarter_id    year*4 + (quarter-1)  → bucket trimestral
+  seq           orden original de inserción (campo, ronda) para desempates
+  strokes       golpes hoyo a hoyo, matriz (rondas × 18) int8, 0 = sin dato
+
+y por campo `course_pars` (campos × 18, int8): par de cada hoyo, 0 si la
+hoja no trae la fila de PAR por hoyo.
+
+El orden por fecha es estable: empates de fecha conservan el orden de
+inserción, igual que `list.sort(key=fecha)` sobre la lista original.
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+
+N_HOLES = 18
+
+
+def _as_float(value) -> float:
+    return float(value) if value is not None else np.nan
+
+
+@dataclass
+class RoundsTable:
+    """Rondas de todos los campos en arrays alineados, orden cronológico."""
+
+    courses:      List[str]     # course_id → nombre del campo
+    course_meta:  List[dict]    # course_id → metadatos (vc, slope, par_total...)
+    rondas:       List[dict]    # dict original de cada ronda (hoyo a hoyo)
+    date_str:     List[str]     # 'YYYY-MM-DD'
+    date:         np.ndarray    # datetime64[D]
+    score:        np.ndarray    # int64
+    differential: np.ndarray    # float64
+    par:          np.ndarray    # float64
+    slope:        np.ndarray    # float64
+    vc:           np.ndarray    # float64
+    course_id:    np.ndarray    # int32
+    seq:          np.ndarray    # int64
+    year:         np.ndarray    # int32
+    month:        np.ndarray    # int32 (1-12)
+    quarter:      np.ndarray    # int32 (1-4)
+    month_id:     np.ndarray    # int32
+    quarter_id:   np.ndarray    # int32
+    strokes:      np.ndarray    # int8 (n, 18)
+    course_pars:  np.ndarray    # int8 (n_courses, 18)
+
+    # ── Construcción ─────────────────────────────────────────
+
+    @classmethod
+    def from_tarjetas(cls, tarjetas_data: Dict[str, dict]) -> "RoundsTable":
+        """Construye la tabla desde DashboardDataGenerator.tarjetas_data."""
+        courses, course_meta = [], []
+        rondas, course_ids = [], []
+
+        for cid, (campo_nombre, campo_data) in enumerate(tarjetas_data.items()):
+            courses.append(campo_nombre)
+            course_meta.append({k: v for k, v in campo_data.items() if k != 'rondas'})
+            campo_rondas = campo_data.get('rondas', [])
+            rondas.extend(campo_rondas)
+            course_ids.extend([cid] * len(campo_rondas))
+
+        n = len(rondas)
+        date = np.array([r['fecha'] for r in rondas], dtype='datetime64[D]').reshape(n)
+        order = np.argsort(date, kind='stable')
+
+        course_id = np.asarray(course_ids, dtype=np.int32).reshape(n)[order]
+        course_par = np.array([_as_float(m.get('par_total')) for m in course_meta], dtype=np.float64)
+        course_slope = np.array([_as_float(m.get('slope')) for m in course_meta], dtype=np.float64)
+        course_vc = np.array([_as_float(m.get('vc')) for m in course_meta], dtype=np.float64)
+
+        rondas = [rondas[i] for i in order.tolist()]
+        date = date[order]
+
+        strokes = np.array([r['golpes_ida'] + r['golpes_vuelta'] for r in rondas],
+                           dtype=np.int8).reshape(n, N_HOLES)
+        course_pars = np.array([m.get('par_hoyos') or [0] * N_HOLES for m in course_meta],
+                               dtype=np.int8).reshape(len(courses), N_HOLES)
+
+        months = date.astype('datetime64[M]').astype(np.int64)       # meses desde 1970-01
+        year = (months // 12 + 1970).astype(np.int32)
+        month = (months % 12 + 1).astype(np.int32)
+        quarter = ((month - 1) // 3 + 1).astype(np.int32)
+
+        return cls(
+            courses=courses,
+            course_meta=course_meta,
+            rondas=rondas,
+            date_str=[r['fecha'] for r in rondas],
+            date=date,
+            score=np.array([r['total_ronda'] for r in rondas], dtype=np.int64).reshape(n),
+            differential=np.array([_as_float(r.get('diferencia_par')) for r in rondas],
+                                  dtype=np.float64).reshape(n),
+            par=course_par[course_id] if n else np.empty(0),
+            slope=course_slope[course_id] if n else np.empty(0),
+            vc=course_vc[course_id] if n else np.empty(0),
+            course_id=course_id,
+            seq=order.astype(np.int64),
+            year=year,
+            month=month,
+            quarter=quarter,
+            month_id=(year * 12 + month - 1).astype(np.int32),
+            quarter_id=(year * 4 + quarter - 1).astype(np.int32),
+            strokes=strokes,
+            course_pars=course_pars,
+        )
+
+    # ── Accesos ──────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.rondas)
+
+    def course_name(self, i: int) -> str:
+        """Nombre del campo de la fila i."""
+        return self.courses[int(self.course_id[i])]
+
+    def course_field(self, key: str) -> list:
+        """Valor original (sin convertir) de un metadato de campo, por fila."""
+        return [self.course_meta[c].get(key) for c in self.course_id.tolist()]
+
+    def by_score(self) -> np.ndarray:
+        """Índices ordenados por score; empates en orden de inserción original."""
+        return np.lexsort((self.seq, self.score))
+
+    def insertion_order(self) -> np.ndarray:
+        """Índices que devuelven las filas al orden original de tarjetas_data."""
+        return np.argsort(self.seq, kind='stable')
+
+    def hole_pars(self) -> np.ndarray:
+        """Par de cada hoyo por fila (rondas × 18), 0 si el campo no lo tiene."""
+        return self.course_pars[self.course_id]
+
+    def course_groups(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """(course_id, índices de sus rondas en orden cronológico), por campo."""
+        order = np.argsort(self.course_id, kind='stable')
+        bounds = np.searchsorted(self.course_id[order], np.arange(len(self.courses) + 1))
+        for cid in range(len(self.courses)):
+            yield cid, order[bounds[cid]:bounds[cid + 1]]
+
+    @staticmethod
+    def month_label(month_id: int) -> str:
+        """month_id → 'YYYY-MM'."""
+        return f"{month_id // 12}-{month_id % 12 + 1:02d}"
+
+    @staticmethod
+    def quarter_parts(quarter_id: int) -> Tuple[int, int]:
+        """quarter_id → (year, quarter)."""
+        return quarter_id // 4, quarter_id % 4 + 1
@@ -26,6 +26,13 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, List, Tuple
 from enum import Enum
 import math
+import sys
+
+import numpy as np
+
+from app.benchmarks import (
+    DRIVER_BENCHMARKS, IRON7_BENCHMARKS, PW_BENCHMARKS, benchmark, benchmark_many,
+)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -149,102 +156,15 @@ class ScoringResult:
 # BENCHMARKS INTERNOS
 # ══════════════════════════════════════════════════════════════
 
-# Estructura de benchmarks por nivel de HCP.
-# Fuentes: PGA Tour ShotLink, USGA/WHS datos publicados, 
-# Broadie "Every Shot Counts" (2014), DeNunzio research (2016-2020).
-#
-# Formato: { hcp_max: { metric: (min_value, max_value) } }
-# donde el rango representa el intervalo "normal" para ese nivel.
-
-DRIVER_BENCHMARKS = {
-    # (ball_speed_kmh, carry_m, lateral_std_m, smash_factor)
-     0: {"ball_speed": 267, "carry": 257, "lateral_std": 5.5,  "smash_factor": 1.49},
-     5: {"ball_speed": 240, "carry": 228, "lateral_std": 7.0,  "smash_factor": 1.47},
-    10: {"ball_speed": 232, "carry": 218, "lateral_std": 9.0,  "smash_factor": 1.45},
-    15: {"ball_speed": 225, "carry": 210, "lateral_std": 10.5, "smash_factor": 1.43},
-    20: {"ball_speed": 215, "carry": 198, "lateral_std": 13.0, "smash_factor": 1.41},
-    25: {"ball_speed": 210, "carry": 190, "lateral_std": 15.5, "smash_factor": 1.39},
-    30: {"ball_speed": 200, "carry": 178, "lateral_std": 19.0, "smash_factor": 1.36},
-    36: {"ball_speed": 188, "carry": 162, "lateral_std": 23.0, "smash_factor": 1.32},
-}
-
-IRON7_BENCHMARKS = {
-    # (ball_speed_kmh, carry_m, lateral_std_m)
-     0: {"ball_speed": 177, "carry": 160, "lateral_std": 3.5},
-     5: {"ball_speed": 165, "carry": 150, "lateral_std": 5.0},
-    10: {"ball_speed": 158, "carry": 142, "lateral_std": 7.0},
-    15: {"ball_speed": 153, "carry": 135, "lateral_std": 8.5},
-    20: {"ball_speed": 147, "carry": 128, "lateral_std": 11.0},
-    25: {"ball_speed": 143, "carry": 122, "lateral_std": 13.5},
-    30: {"ball_speed": 136, "carry": 113, "lateral_std": 17.0},
-    36: {"ball_speed": 128, "carry": 103, "lateral_std": 21.0},
-}
-
-PW_BENCHMARKS = {
-    # (carry_m, lateral_std_m, spin_rpm)
-     0: {"carry": 125, "lateral_std": 2.5,  "spin": 9500},
-     5: {"carry": 118, "lateral_std": 3.5,  "spin": 8500},
-    10: {"carry": 112, "lateral_std": 5.0,  "spin": 7800},
-    15: {"carry": 105, "lateral_std": 6.5,  "spin": 7000},
-    20: {"carry": 98,  "lateral_std": 9.0,  "spin": 6200},
-    25: {"carry": 93,  "lateral_std": 11.5, "spin": 5600},
-    30: {"carry": 86,  "lateral_std": 14.0, "spin": 5000},
-    36: {"carry": 78,  "lateral_std": 18.0, "spin": 4300},
-}
-
-# Benchmarks de scoring en campo (Strokes Gained vs scratch)
-# Fuente: Broadie & Feit (2012), adaptado a rangos HCP RFEG
-SG_BENCHMARKS = {
-    # SG esperado por categoría para llegar a scoring de scratch (0)
-    # Valores negativos = golpes perdidos vs scratch
-     0: {"sg_ott": 0.0,   "sg_app": 0.0,   "sg_arg": 0.0,   "sg_putt": 0.0},
-     5: {"sg_ott": -0.3,  "sg_app": -0.4,  "sg_arg": -0.3,  "sg_putt": -0.2},
-    10: {"sg_ott": -0.6,  "sg_app": -0.9,  "sg_arg": -0.6,  "sg_putt": -0.4},
-    15: {"sg_ott": -1.0,  "sg_app": -1.6,  "sg_arg": -0.9,  "sg_putt": -0.6},
-    20: {"sg_ott": -1.5,  "sg_app": -2.3,  "sg_arg": -1.3,  "sg_putt": -0.8},
-    25: {"sg_ott": -2.1,  "sg_app": -3.0,  "sg_arg": -1.7,  "sg_putt": -1.0},
-    30: {"sg_ott": -2.8,  "sg_app": -3.8,  "sg_arg": -2.2,  "sg_putt": -1.3},
-    36: {"sg_ott": -3.8,  "sg_app": -5.0,  "sg_arg": -3.0,  "sg_putt": -1.7},
-}
+# Las tablas por HCP (DRIVER / IRON7 / PW / SG y las de una sola métrica)
+# están en app/benchmarks.py, precalculadas como curvas densas HCP 0–54:
+# benchmark("driver.carry", hcp) es una búsqueda O(1).
 
 
 # ══════════════════════════════════════════════════════════════
 # FUNCIONES DE APOYO
 # ══════════════════════════════════════════════════════════════
 
-def _interpolate_benchmark(hcp: float, benchmark_table: dict, metric: str) -> float:
-    """
-    Interpola linealmente el valor de benchmark para el HCP exacto del jugador.
-    
-    Ejemplo: HCP 23 → interpola entre HCP 20 y HCP 25.
-    Esto es más preciso que usar el bracket más cercano.
-    
-    Args:
-        hcp: Handicap del jugador (puede ser decimal, e.g. 23.2)
-        benchmark_table: Diccionario con benchmarks por HCP
-        metric: Clave de la métrica a interpolar
-        
-    Returns:
-        Valor interpolado del benchmark
-    """
-    levels = sorted(benchmark_table.keys())
-    
-    # Clamp a los límites de la tabla
-    if hcp <= levels[0]:
-        return benchmark_table[levels[0]][metric]
-    if hcp >= levels[-1]:
-        return benchmark_table[levels[-1]][metric]
-    
-    # Encontrar el intervalo correcto
-    for i in range(len(levels) - 1):
-        lo, hi = levels[i], levels[i + 1]
-        if lo <= hcp <= hi:
-            t = (hcp - lo) / (hi - lo)  # factor de interpolación 0-1
-            return benchmark_table[lo][metric] * (1 - t) + benchmark_table[hi][metric] * t
-    
-    return benchmark_table[levels[-1]][metric]
-
-
 def _metric_to_percentile(
     value: float,
     benchmark_at_hcp: float,
@@ -394,6 +314,7 @@ class ScoringEngine:
     USO:
         engine = ScoringEngine()
         result = engine.score(player_id="alvaro", player_hcp=23.2, metrics=data_dict)
+        batch  = engine.score_many(player_hcp=23.2, metrics=df_metricas)  # 1 fila = 1 score()
     
     IMPORTANTE: Este módulo es completamente determinista.
     El mismo input siempre produce el mismo output, independientemente
@@ -470,6 +391,59 @@ class ScoringEngine:
             data_completeness=round(completeness, 2),
         )
 
+    def score_many(self, player_hcp, metrics, n: Optional[int] = None) -> "ScoringBatch":
+        """
+        score() para muchos conjuntos de métricas en una sola llamada (vectorizado).
+
+        Da exactamente los mismos scores, percentiles, zonas, confianzas y
+        agregados que llamar a score() fila a fila (sin notas).
+
+        Args:
+            player_hcp: HCP escalar o un array con un HCP por fila
+            metrics: DataFrame, array estructurado, dict {métrica: array} o
+                     lista de dicts. Una métrica ausente es NaN / clave que falta.
+            n: Número de filas si metrics no trae ninguna columna conocida
+
+        Returns:
+            ScoringBatch con un valor por fila en cada array
+        """
+        columns, n = _metric_columns(metrics, n)
+        hcp = np.broadcast_to(np.asarray(player_hcp, dtype=np.float64), (n,)).copy()
+
+        # Clave derivada de consistency: CV del score
+        std, mean = columns["score_std_dev"], columns["score_mean"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cv = np.where(mean > 0, (std / mean) * 100, 20.0)
+        columns[_SCORE_CV] = np.where(np.isnan(std) | np.isnan(mean), np.nan, cv)
+
+        scores, percentiles, zones, confidence, data_points, has_data = {}, {}, {}, {}, {}, {}
+        confident = np.zeros(n, dtype=np.int64)
+        for name in DIMENSIONS:
+            score, pct, zone, conf, dp, conf_code, present = _score_dimension_many(name, columns, hcp, n)
+            scores[name], percentiles[name], zones[name] = score, pct, zone
+            confidence[name], data_points[name], has_data[name] = conf, dp, present
+            confident += conf_code >= 2
+
+        def count_or_zero(key):
+            value = columns[key]
+            return np.where(np.isnan(value), 0, value).astype(np.int64)
+
+        return ScoringBatch(
+            player_hcp=hcp,
+            scores=scores,
+            percentiles=percentiles,
+            zones=zones,
+            confidence=confidence,
+            data_points=data_points,
+            has_data=has_data,
+            overall_score=_round_many(_weighted_average_many(scores, _OVERALL_WEIGHTS, n), 2),
+            tee_to_green=_round_many(_weighted_average_many(scores, _TEE_TO_GREEN_WEIGHTS, n), 2),
+            scoring_game=_round_many(_weighted_average_many(scores, _SCORING_GAME_WEIGHTS, n), 2),
+            rounds_analyzed=count_or_zero("rounds_count"),
+            shots_analyzed=count_or_zero("shots_count"),
+            data_completeness=_round_many(confident / 8.0, 2),
+        )
+
     # ──────────────────────────────────────────────
     # DIMENSIÓN 1: LONG GAME
     # ──────────────────────────────────────────────
@@ -494,7 +468,7 @@ class ScoringEngine:
         if "carry_driver_m" in m:
             carry = m["carry_driver_m"]
             data_points += m.get("driver_shots_count", 10)
-            bm_hcp    = _interpolate_benchmark(hcp, DRIVER_BENCHMARKS, "carry")
+            bm_hcp    = benchmark("driver.carry", hcp)
             bm_pga    = DRIVER_BENCHMARKS[0]["carry"]
             pct = _metric_to_percentile(carry, bm_hcp, bm_pga, higher_is_better=True)
             sub_scores.append((pct, 0.40))
@@ -507,7 +481,7 @@ class ScoringEngine:
         # --- Strokes Gained Off the Tee ---
         if "sg_ott" in m:
             sg = m["sg_ott"]
-            bm_hcp = _interpolate_benchmark(hcp, SG_BENCHMARKS, "sg_ott")
+            bm_hcp = benchmark("sg.sg_ott", hcp)
             bm_pga = 0.0  # PGA Tour = 0 por definición
             # SG_OTT negativo = perdiendo golpes. Ajustamos escala:
             # sg = bm_hcp (nivel HCP) → percentil 50
@@ -527,7 +501,7 @@ class ScoringEngine:
         # --- Ball Speed Driver ---
         if "ball_speed_driver_kmh" in m:
             bs = m["ball_speed_driver_kmh"]
-            bm_hcp = _interpolate_benchmark(hcp, DRIVER_BENCHMARKS, "ball_speed")
+            bm_hcp = benchmark("driver.ball_speed", hcp)
             bm_pga = DRIVER_BENCHMARKS[0]["ball_speed"]
             pct = _metric_to_percentile(bs, bm_hcp, bm_pga, higher_is_better=True)
             sub_scores.append((pct, 0.15))
@@ -537,8 +511,7 @@ class ScoringEngine:
         if "fairway_hit_pct" in m:
             fir = m["fairway_hit_pct"]  # 0-100
             # Benchmarks FIR: PGA=60%, HCP 10=50%, HCP 20=42%, HCP 30=34%
-            fir_benchmarks = {0: 60, 10: 50, 20: 42, 30: 34, 36: 28}
-            bm_hcp_fir = _interpolate_benchmark(hcp, {k: {"fir": v} for k, v in fir_benchmarks.items()}, "fir")
+            bm_hcp_fir = benchmark("fir", hcp)
             bm_pga_fir = 60.0
             pct = _metric_to_percentile(fir, bm_hcp_fir, bm_pga_fir, higher_is_better=True)
             sub_scores.append((pct, 0.10))
@@ -583,7 +556,7 @@ class ScoringEngine:
         # --- SG Approach (mayor peso) ---
         if "sg_approach" in m:
             sg = m["sg_approach"]
-            bm_hcp = _interpolate_benchmark(hcp, SG_BENCHMARKS, "sg_app")
+            bm_hcp = benchmark("sg.sg_app", hcp)
             sg_range = 0.0 - bm_hcp
             if abs(sg_range) > 0.001:
                 pct = 50.0 + ((sg - bm_hcp) / sg_range) * 45.0
@@ -597,7 +570,7 @@ class ScoringEngine:
         if "carry_7iron_m" in m:
             carry = m["carry_7iron_m"]
             data_points += m.get("7iron_shots_count", 8)
-            bm_hcp = _interpolate_benchmark(hcp, IRON7_BENCHMARKS, "carry")
+            bm_hcp = benchmark("iron7.carry", hcp)
             bm_pga = IRON7_BENCHMARKS[0]["carry"]
             pct = _metric_to_percentile(carry, bm_hcp, bm_pga, higher_is_better=True)
             sub_scores.append((pct, 0.35))
@@ -611,8 +584,7 @@ class ScoringEngine:
             sf = m["smash_factor_7iron"]
             # Driver SF benchmark: PGA=1.49, HCP15=1.43, HCP25=1.38
             # Iron SF es más uniforme entre niveles: PGA=1.37, HCP25=1.29
-            iron_sf_benchmarks = {0: 1.37, 10: 1.35, 15: 1.33, 20: 1.31, 25: 1.29, 30: 1.26, 36: 1.23}
-            bm_hcp_sf = _interpolate_benchmark(hcp, {k: {"sf": v} for k, v in iron_sf_benchmarks.items()}, "sf")
+            bm_hcp_sf = benchmark("iron_sf", hcp)
             bm_pga_sf = 1.37
             # Escala: SF 1.28 = percentil 0, SF bm_hcp = percentil 50, SF 1.37 = percentil 95
             sf_range = bm_pga_sf - bm_hcp_sf
@@ -664,7 +636,7 @@ class ScoringEngine:
         # --- SG Around the Green ---
         if "sg_arg" in m:
             sg = m["sg_arg"]
-            bm_hcp = _interpolate_benchmark(hcp, SG_BENCHMARKS, "sg_arg")
+            bm_hcp = benchmark("sg.sg_arg", hcp)
             sg_range = 0.0 - bm_hcp
             if abs(sg_range) > 0.001:
                 pct = 50.0 + ((sg - bm_hcp) / sg_range) * 45.0
@@ -678,7 +650,7 @@ class ScoringEngine:
         if "lateral_std_pw_m" in m:
             disp = m["lateral_std_pw_m"]
             data_points += m.get("pw_shots_count", 10)
-            bm_hcp = _interpolate_benchmark(hcp, PW_BENCHMARKS, "lateral_std")
+            bm_hcp = benchmark("pw.lateral_std", hcp)
             bm_pga = PW_BENCHMARKS[0]["lateral_std"]
             # MENOR dispersión = MEJOR → higher_is_better=False
             pct = _metric_to_percentile(disp, bm_hcp, bm_pga, higher_is_better=False)
@@ -692,8 +664,7 @@ class ScoringEngine:
         if "scrambling_pct" in m:
             scr = m["scrambling_pct"]
             # Benchmarks scrambling: PGA=58%, HCP10=45%, HCP20=30%, HCP30=18%
-            scr_benchmarks = {0: 58, 10: 45, 15: 38, 20: 30, 25: 23, 30: 18, 36: 13}
-            bm_hcp_scr = _interpolate_benchmark(hcp, {k: {"s": v} for k, v in scr_benchmarks.items()}, "s")
+            bm_hcp_scr = benchmark("scrambling", hcp)
             bm_pga_scr = 58.0
             pct = _metric_to_percentile(scr, bm_hcp_scr, bm_pga_scr, higher_is_better=True)
             sub_scores.append((pct, 0.25))
@@ -738,7 +709,7 @@ class ScoringEngine:
         # --- SG Putting ---
         if "sg_putt" in m:
             sg = m["sg_putt"]
-            bm_hcp = _interpolate_benchmark(hcp, SG_BENCHMARKS, "sg_putt")
+            bm_hcp = benchmark("sg.sg_putt", hcp)
             sg_range = 0.0 - bm_hcp
             if abs(sg_range) > 0.001:
                 pct = 50.0 + ((sg - bm_hcp) / sg_range) * 45.0
@@ -753,8 +724,7 @@ class ScoringEngine:
             ppr = m["putts_per_round"]
             data_points += m.get("rounds_count", 10)
             # Benchmarks: PGA=28.2, HCP10=31.5, HCP20=33.8, HCP30=36.5
-            putt_benchmarks = {0: 28.2, 10: 31.5, 15: 32.8, 20: 33.8, 25: 35.2, 30: 36.5, 36: 38.5}
-            bm_hcp_pp = _interpolate_benchmark(hcp, {k: {"p": v} for k, v in putt_benchmarks.items()}, "p")
+            bm_hcp_pp = benchmark("putts", hcp)
             bm_pga_pp = 28.2
             # Menos putts = mejor → higher_is_better=False
             pct = _metric_to_percentile(ppr, bm_hcp_pp, bm_pga_pp, higher_is_better=False)
@@ -768,8 +738,7 @@ class ScoringEngine:
         if "three_putt_pct" in m:
             tp = m["three_putt_pct"]
             # Benchmarks 3-putt %: PGA=2.5%, HCP10=8%, HCP20=14%, HCP30=22%
-            tp_benchmarks = {0: 2.5, 10: 8.0, 15: 11.0, 20: 14.0, 25: 18.0, 30: 22.0, 36: 28.0}
-            bm_hcp_tp = _interpolate_benchmark(hcp, {k: {"t": v} for k, v in tp_benchmarks.items()}, "t")
+            bm_hcp_tp = benchmark("three_putt", hcp)
             bm_pga_tp = 2.5
             # Menos 3-putts = mejor → higher_is_better=False
             pct = _metric_to_percentile(tp, bm_hcp_tp, bm_pga_tp, higher_is_better=False)
@@ -826,8 +795,7 @@ class ScoringEngine:
             cv = (std / mean) * 100 if mean > 0 else 20.0  # Coeficiente de variación en %
 
             # Benchmarks CV: PGA=3%, HCP10=6%, HCP20=10%, HCP30=15%
-            cv_benchmarks = {0: 3.0, 10: 6.0, 15: 8.0, 20: 10.0, 25: 12.5, 30: 15.0, 36: 19.0}
-            bm_hcp_cv = _interpolate_benchmark(hcp, {k: {"cv": v} for k, v in cv_benchmarks.items()}, "cv")
+            bm_hcp_cv = benchmark("score_cv", hcp)
             bm_pga_cv = 3.0
 
             # Menor CV = más consistente = mejor → higher_is_better=False
@@ -842,8 +810,7 @@ class ScoringEngine:
         if "carry_cv_driver_pct" in m:
             carry_cv = m["carry_cv_driver_pct"]
             # Benchmarks: PGA=2%, HCP15=5%, HCP25=8%
-            carry_cv_bm = {0: 2.0, 10: 4.0, 15: 5.0, 20: 6.5, 25: 8.0, 30: 10.0, 36: 13.0}
-            bm_hcp_ccv = _interpolate_benchmark(hcp, {k: {"ccv": v} for k, v in carry_cv_bm.items()}, "ccv")
+            bm_hcp_ccv = benchmark("carry_cv", hcp)
             bm_pga_ccv = 2.0
             pct = _metric_to_percentile(carry_cv, bm_hcp_ccv, bm_pga_ccv, higher_is_better=False)
             sub_scores.append((pct, 0.30))
@@ -900,8 +867,7 @@ class ScoringEngine:
             bbr = m["bounce_back_rate_pct"]
             data_points += m.get("rounds_count", 10)
             # Benchmarks: PGA=33%, HCP10=22%, HCP20=15%, HCP30=9%
-            bbr_bm = {0: 33, 10: 22, 15: 18, 20: 15, 25: 12, 30: 9, 36: 6}
-            bm_hcp_bbr = _interpolate_benchmark(hcp, {k: {"b": v} for k, v in bbr_bm.items()}, "b")
+            bm_hcp_bbr = benchmark("bounce_back", hcp)
             bm_pga_bbr = 33.0
             pct = _metric_to_percentile(bbr, bm_hcp_bbr, bm_pga_bbr, higher_is_better=True)
             sub_scores.append((pct, 0.35))
@@ -912,8 +878,7 @@ class ScoringEngine:
             delta = abs(m["f9_vs_b9_delta"])  # Valor absoluto de la diferencia
             # Un delta < 3 = buena gestión. Delta > 6 = problema de aguante.
             # Benchmarks (delta promedio): PGA=0.8, HCP15=2.5, HCP25=4.0
-            delta_bm = {0: 0.8, 10: 2.0, 15: 2.5, 20: 3.2, 25: 4.0, 30: 5.2, 36: 7.0}
-            bm_hcp_d = _interpolate_benchmark(hcp, {k: {"d": v} for k, v in delta_bm.items()}, "d")
+            bm_hcp_d = benchmark("f9_b9_delta", hcp)
             bm_pga_d = 0.8
             # Menor delta = mejor
             pct = _metric_to_percentile(delta, bm_hcp_d, bm_pga_d, higher_is_better=False)
@@ -926,8 +891,7 @@ class ScoringEngine:
             # Benchmark: todos los tipos de hoyo deberían costar ~igual respecto al HCP
             # Si par3_vs_par_relative > par4_vs_par_relative + 0.5, hay presión en tee corto
             # Benchmarks de sobre-par en par 3: PGA=+0.0, HCP15=+0.8, HCP25=+1.4
-            p3_bm = {0: 0.0, 10: 0.5, 15: 0.8, 20: 1.1, 25: 1.4, 30: 1.8, 36: 2.3}
-            bm_hcp_p3 = _interpolate_benchmark(hcp, {k: {"p3": v} for k, v in p3_bm.items()}, "p3")
+            bm_hcp_p3 = benchmark("par3", hcp)
             bm_pga_p3 = 0.0
             # Menor sobre-par = mejor
             pct = _metric_to_percentile(p3r, bm_hcp_p3, bm_pga_p3, higher_is_better=False)
@@ -940,8 +904,7 @@ class ScoringEngine:
         if "explosion_hole_pct" in m:
             expl = m["explosion_hole_pct"]  # % de hoyos con +3 o peor vs par
             # Benchmarks: PGA≈0.5%, HCP10=3%, HCP20=7%, HCP30=12%
-            expl_bm = {0: 0.5, 10: 3.0, 15: 5.0, 20: 7.0, 25: 9.5, 30: 12.0, 36: 16.0}
-            bm_hcp_ex = _interpolate_benchmark(hcp, {k: {"ex": v} for k, v in expl_bm.items()}, "ex")
+            bm_hcp_ex = benchmark("explosion", hcp)
             bm_pga_ex = 0.5
             pct = _metric_to_percentile(expl, bm_hcp_ex, bm_pga_ex, higher_is_better=False)
             sub_scores.append((pct, 0.20))
@@ -991,8 +954,7 @@ class ScoringEngine:
             cs = m["club_speed_driver_kmh"]
             data_points += m.get("driver_shots_count", 10)
             # Benchmarks club speed: PGA=179 km/h, HCP10=155, HCP20=143, HCP30=133
-            cs_bm = {0: 179, 5: 165, 10: 155, 15: 150, 20: 143, 25: 138, 30: 133, 36: 125}
-            bm_hcp_cs = _interpolate_benchmark(hcp, {k: {"cs": v} for k, v in cs_bm.items()}, "cs")
+            bm_hcp_cs = benchmark("club_speed", hcp)
             bm_pga_cs = 179.0
             pct = _metric_to_percentile(cs, bm_hcp_cs, bm_pga_cs, higher_is_better=True)
             sub_scores.append((pct, 0.50))
@@ -1004,7 +966,7 @@ class ScoringEngine:
         # --- Ball Speed Driver ---
         if "ball_speed_driver_kmh" in m:
             bs = m["ball_speed_driver_kmh"]
-            bm_hcp_bs = _interpolate_benchmark(hcp, DRIVER_BENCHMARKS, "ball_speed")
+            bm_hcp_bs = benchmark("driver.ball_speed", hcp)
             bm_pga_bs = DRIVER_BENCHMARKS[0]["ball_speed"]
             pct = _metric_to_percentile(bs, bm_hcp_bs, bm_pga_bs, higher_is_better=True)
             sub_scores.append((pct, 0.30))
@@ -1014,8 +976,7 @@ class ScoringEngine:
         if "club_speed_7iron_kmh" in m:
             cs7 = m["club_speed_7iron_kmh"]
             # Benchmarks 7i club speed: PGA=136, HCP15=118, HCP25=108
-            cs7_bm = {0: 136, 10: 124, 15: 118, 20: 113, 25: 108, 30: 103, 36: 97}
-            bm_hcp_cs7 = _interpolate_benchmark(hcp, {k: {"cs7": v} for k, v in cs7_bm.items()}, "cs7")
+            bm_hcp_cs7 = benchmark("club_speed_7i", hcp)
             bm_pga_cs7 = 136.0
             pct = _metric_to_percentile(cs7, bm_hcp_cs7, bm_pga_cs7, higher_is_better=True)
             sub_scores.append((pct, 0.20))
@@ -1063,7 +1024,7 @@ class ScoringEngine:
         if "lateral_std_driver_m" in m:
             lat = m["lateral_std_driver_m"]
             data_points += m.get("driver_shots_count", 10)
-            bm_hcp = _interpolate_benchmark(hcp, DRIVER_BENCHMARKS, "lateral_std")
+            bm_hcp = benchmark("driver.lateral_std", hcp)
             bm_pga = DRIVER_BENCHMARKS[0]["lateral_std"]
             # Menor dispersión = mejor
             pct = _metric_to_percentile(lat, bm_hcp, bm_pga, higher_is_better=False)
@@ -1077,8 +1038,7 @@ class ScoringEngine:
         if "face_to_path_driver_deg" in m:
             ftp = abs(m["face_to_path_driver_deg"])  # valor absoluto
             # Benchmarks |face-to-path|: PGA=1.0°, HCP15=3.5°, HCP25=5.5°
-            ftp_bm = {0: 1.0, 5: 2.0, 10: 2.8, 15: 3.5, 20: 4.5, 25: 5.5, 30: 7.0, 36: 9.0}
-            bm_hcp_ftp = _interpolate_benchmark(hcp, {k: {"ftp": v} for k, v in ftp_bm.items()}, "ftp")
+            bm_hcp_ftp = benchmark("face_to_path", hcp)
             bm_pga_ftp = 1.0
             pct = _metric_to_percentile(ftp, bm_hcp_ftp, bm_pga_ftp, higher_is_better=False)
             sub_scores.append((pct, 0.25))
@@ -1091,8 +1051,7 @@ class ScoringEngine:
         if "gir_pct" in m:
             gir = m["gir_pct"]
             # Benchmarks GIR%: PGA=66%, HCP10=40%, HCP20=25%, HCP30=13%
-            gir_bm = {0: 66, 5: 52, 10: 40, 15: 32, 20: 25, 25: 18, 30: 13, 36: 8}
-            bm_hcp_gir = _interpolate_benchmark(hcp, {k: {"gir": v} for k, v in gir_bm.items()}, "gir")
+            bm_hcp_gir = benchmark("gir", hcp)
             bm_pga_gir = 66.0
             pct = _metric_to_percentile(gir, bm_hcp_gir, bm_pga_gir, higher_is_better=True)
             sub_scores.append((pct, 0.25))
@@ -1102,7 +1061,7 @@ class ScoringEngine:
         # --- Lateral std 7 Hierro ---
         if "lateral_std_7iron_m" in m:
             lat7 = m["lateral_std_7iron_m"]
-            bm_hcp_l7 = _interpolate_benchmark(hcp, IRON7_BENCHMARKS, "lateral_std")
+            bm_hcp_l7 = benchmark("iron7.lateral_std", hcp)
             bm_pga_l7 = IRON7_BENCHMARKS[0]["lateral_std"]
             pct = _metric_to_percentile(lat7, bm_hcp_l7, bm_pga_l7, higher_is_better=False)
             sub_scores.append((pct, 0.15))
@@ -1151,6 +1110,314 @@ def _weighted_average(score_weight_pairs: List[Tuple[float, float]]) -> float:
     return sum(s * w for s, w in score_weight_pairs) / total_weight
 
 
+# ══════════════════════════════════════════════════════════════
+# SCORING EN LOTE (score_many)
+# ══════════════════════════════════════════════════════════════
+# Misma aritmética que los _score_* (mismo orden de operaciones, mismo
+# bracket de interpolación, round() y sum() de Python), sobre arrays.
+# Una métrica ausente es NaN (o una clave que falta en el dict).
+
+DIMENSIONS = (
+    "long_game", "mid_game", "short_game", "putting",
+    "consistency", "mental", "power", "accuracy",
+)
+
+_ZONES = np.array([Zone.FOCUS_AREA, Zone.DEVELOPING, Zone.STRONG, Zone.ELITE], dtype=object)
+_CONFIDENCES = np.array([Confidence.NONE, Confidence.LOW, Confidence.MEDIUM, Confidence.HIGH], dtype=object)
+
+# sum() de floats compensado (Neumaier) desde Python 3.12
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+
+
+@dataclass(frozen=True)
+class _SubMetric:
+    """Una métrica de una dimensión: clave, benchmark (app.benchmarks), valor PGA, peso y escala.
+
+    scale: 'higher' / 'lower' → _metric_to_percentile; 'range' → escala SG
+    (50 + (v - bm) / (pga - bm) × 45, también smash factor 7i).
+    """
+    key:       str
+    benchmark: str
+    pga:       float
+    weight:    float
+    scale:     str
+    absolute:  bool = False
+
+
+# Clave derivada: CV del score (%) a partir de score_std_dev y score_mean
+_SCORE_CV = "_score_cv"
+
+# dimensión → (sub-métricas en el orden de _score_*, clave que suma data_points,
+#              clave de conteo, conteo por defecto, regla de confianza)
+_DIMENSION_SPECS = {
+    "long_game": ([
+        _SubMetric("carry_driver_m", "driver.carry", DRIVER_BENCHMARKS[0]["carry"], 0.40, "higher"),
+        _SubMetric("sg_ott", "sg.sg_ott", 0.0, 0.35, "range"),
+        _SubMetric("ball_speed_driver_kmh", "driver.ball_speed", DRIVER_BENCHMARKS[0]["ball_speed"], 0.15, "higher"),
+        _SubMetric("fairway_hit_pct", "fir", 60.0, 0.10, "higher"),
+    ], "carry_driver_m", "driver_shots_count", 10, "plain"),
+    "mid_game": ([
+        _SubMetric("sg_approach", "sg.sg_app", 0.0, 0.45, "range"),
+        _SubMetric("carry_7iron_m", "iron7.carry", IRON7_BENCHMARKS[0]["carry"], 0.35, "higher"),
+        _SubMetric("smash_factor_7iron", "iron_sf", 1.37, 0.20, "range"),
+    ], "carry_7iron_m", "7iron_shots_count", 8, "default_10"),
+    "short_game": ([
+        _SubMetric("sg_arg", "sg.sg_arg", 0.0, 0.45, "range"),
+        _SubMetric("lateral_std_pw_m", "pw.lateral_std", PW_BENCHMARKS[0]["lateral_std"], 0.30, "lower"),
+        _SubMetric("scrambling_pct", "scrambling", 58.0, 0.25, "higher"),
+    ], "lateral_std_pw_m", "pw_shots_count", 10, "default_10"),
+    "putting": ([
+        _SubMetric("sg_putt", "sg.sg_putt", 0.0, 0.50, "range"),
+        _SubMetric("putts_per_round", "putts", 28.2, 0.30, "lower"),
+        _SubMetric("three_putt_pct", "three_putt", 2.5, 0.20, "lower"),
+    ], "putts_per_round", "rounds_count", 10, "default_10"),
+    "consistency": ([
+        _SubMetric(_SCORE_CV, "score_cv", 3.0, 0.40, "lower"),
+        _SubMetric(_SCORE_CV, "score_cv", 3.0, 0.30, "lower"),
+        _SubMetric("carry_cv_driver_pct", "carry_cv", 2.0, 0.30, "lower"),
+    ], _SCORE_CV, "rounds_count", 10, "plain"),
+    "mental": ([
+        _SubMetric("bounce_back_rate_pct", "bounce_back", 33.0, 0.35, "higher"),
+        _SubMetric("f9_vs_b9_delta", "f9_b9_delta", 0.8, 0.25, "lower", absolute=True),
+        _SubMetric("par3_vs_par_relative", "par3", 0.0, 0.20, "lower"),
+        _SubMetric("explosion_hole_pct", "explosion", 0.5, 0.20, "lower"),
+    ], "bounce_back_rate_pct", "rounds_count", 10, "mental"),
+    "power": ([
+        _SubMetric("club_speed_driver_kmh", "club_speed", 179.0, 0.50, "higher"),
+        _SubMetric("ball_speed_driver_kmh", "driver.ball_speed", DRIVER_BENCHMARKS[0]["ball_speed"], 0.30, "higher"),
+        _SubMetric("club_speed_7iron_kmh", "club_speed_7i", 136.0, 0.20, "higher"),
+    ], "club_speed_driver_kmh", "driver_shots_count", 10, "plain"),
+    "accuracy": ([
+        _SubMetric("lateral_std_driver_m", "driver.lateral_std", DRIVER_BENCHMARKS[0]["lateral_std"], 0.35, "lower"),
+        _SubMetric("face_to_path_driver_deg", "face_to_path", 1.0, 0.25, "lower", absolute=True),
+        _SubMetric("gir_pct", "gir", 66.0, 0.25, "higher"),
+        _SubMetric("lateral_std_7iron_m", "iron7.lateral_std", IRON7_BENCHMARKS[0]["lateral_std"], 0.15, "lower"),
+    ], "lateral_std_driver_m", "driver_shots_count", 10, "plain"),
+}
+
+# Pesos de los agregados (mismo orden que score())
+_TEE_TO_GREEN_WEIGHTS = (("long_game", 0.30), ("mid_game", 0.30), ("short_game", 0.25), ("accuracy", 0.15))
+_SCORING_GAME_WEIGHTS = (("putting", 0.40), ("mental", 0.35), ("consistency", 0.25))
+_OVERALL_WEIGHTS = (
+    ("long_game", 0.15), ("mid_game", 0.15), ("short_game", 0.15), ("putting", 0.15),
+    ("consistency", 0.12), ("mental", 0.10), ("power", 0.10), ("accuracy", 0.08),
+)
+
+METRIC_KEYS = tuple(dict.fromkeys(
+    [sub.key for subs, *_ in _DIMENSION_SPECS.values() for sub in subs if sub.key != _SCORE_CV]
+    + ["score_std_dev", "score_mean", "driver_shots_count", "7iron_shots_count",
+       "pw_shots_count", "rounds_count", "shots_count"]
+))
+
+
+@dataclass
+class ScoringBatch:
+    """
+    Resultado de ScoringEngine.score_many: fila i = score() del conjunto i.
+
+    Los arrays por dimensión (dicts con claves DIMENSIONS) tienen los mismos
+    valores que el DimensionScore escalar: score, percentile (redondeados),
+    zone (Zone), confidence (Confidence) y data_points; has_data indica si la
+    dimensión tenía alguna métrica. Sin notas.
+    """
+    player_hcp:        np.ndarray
+    scores:            Dict[str, np.ndarray]
+    percentiles:       Dict[str, np.ndarray]
+    zones:             Dict[str, np.ndarray]
+    confidence:        Dict[str, np.ndarray]
+    data_points:       Dict[str, np.ndarray]
+    has_data:          Dict[str, np.ndarray]
+    overall_score:     np.ndarray
+    tee_to_green:      np.ndarray
+    scoring_game:      np.ndarray
+    rounds_analyzed:   np.ndarray
+    shots_analyzed:    np.ndarray
+    data_completeness: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.player_hcp)
+
+    def score_matrix(self) -> np.ndarray:
+        """(n, 8) scores en el orden de DIMENSIONS."""
+        return np.column_stack([self.scores[d] for d in DIMENSIONS])
+
+    def scores_as_dict(self, i: int) -> Dict[str, float]:
+        """Igual que ScoringResult.scores_as_dict() para la fila i."""
+        out = {d: float(self.scores[d][i]) for d in DIMENSIONS}
+        out["overall"] = float(self.overall_score[i])
+        return out
+
+    def result(self, i: int, player_id: str = "") -> ScoringResult:
+        """ScoringResult de la fila i (mismos valores que score(), notas solo en dimensiones vacías)."""
+        hcp = float(self.player_hcp[i])
+        dims = {}
+        for name in DIMENSIONS:
+            if not self.has_data[name][i]:
+                dims[name] = _empty_dimension(name)
+                continue
+            label = f"AlvGolf HCP{hcp:.0f} Benchmark v1.0"
+            dims[name] = DimensionScore(
+                score=float(self.scores[name][i]),
+                percentile=float(self.percentiles[name][i]),
+                zone=self.zones[name][i],
+                confidence=self.confidence[name][i],
+                data_points=int(self.data_points[name][i]),
+                benchmark_used=label + " (proxies)" if name == "mental" else label,
+            )
+        return ScoringResult(
+            player_id=player_id,
+            player_hcp=hcp,
+            **dims,
+            overall_score=float(self.overall_score[i]),
+            tee_to_green=float(self.tee_to_green[i]),
+            scoring_game=float(self.scoring_game[i]),
+            rounds_analyzed=int(self.rounds_analyzed[i]),
+            shots_analyzed=int(self.shots_analyzed[i]),
+            data_completeness=float(self.data_completeness[i]),
+        )
+
+
+def _metric_columns(metrics, n: Optional[int]) -> Tuple[Dict[str, np.ndarray], int]:
+    """DataFrame / array estructurado / dict de arrays / lista de dicts → {clave: float64}."""
+    if isinstance(metrics, np.ndarray) and metrics.dtype.names:
+        names = metrics.dtype.names
+        get = lambda k: metrics[k]
+    elif hasattr(metrics, "columns"):
+        names = list(metrics.columns)
+        get = lambda k: metrics[k].to_numpy(dtype=np.float64, na_value=np.nan)
+    elif isinstance(metrics, dict):
+        names = list(metrics)
+        get = lambda k: metrics[k]
+    else:
+        rows = list(metrics)
+        names = {k for row in rows for k in row}
+        # None → NaN con dtype float
+        get = lambda k: np.array([row.get(k) for row in rows], dtype=np.float64)
+
+    columns = {}
+    for key in METRIC_KEYS:
+        if key in names:
+            columns[key] = np.asarray(get(key), dtype=np.float64).reshape(-1)
+            if n is None:
+                n = len(columns[key])
+    if n is None:
+        n = len(metrics) if hasattr(metrics, "__len__") else 0
+    for key in METRIC_KEYS:
+        if key not in columns:
+            columns[key] = np.full(n, np.nan)
+        elif len(columns[key]) != n:
+            raise ValueError(f"Métrica '{key}': {len(columns[key])} filas, se esperaban {n}")
+    return columns, n
+
+
+def _sub_percentile_many(sub: _SubMetric, value: np.ndarray, hcp: np.ndarray) -> np.ndarray:
+    bm_hcp = benchmark_many(sub.benchmark, hcp)
+    bm_pga = sub.pga
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if sub.scale == "range":
+            span = bm_pga - bm_hcp
+            pct = np.clip(50.0 + ((value - bm_hcp) / span) * 45.0, 0.0, 100.0)
+            return np.where(np.abs(span) > 0.001, pct, 50.0)
+        if sub.scale == "lower":
+            value, bm_hcp, bm_pga = -value, -bm_hcp, -bm_pga
+        full_range = bm_pga - bm_hcp
+        pct = np.clip(50.0 + ((value - bm_hcp) / full_range) * 45.0, 0.0, 100.0)
+        return np.where(np.abs(full_range) < 0.001, 50.0, pct)
+
+
+def _py_sum(terms: List[Tuple[np.ndarray, np.ndarray]], n: int) -> np.ndarray:
+    """sum() de Python sobre los términos presentes (mask), en orden, por fila."""
+    total = np.zeros(n)
+    comp = np.zeros(n)
+    for value, present in terms:
+        if not _COMPENSATED_SUM:
+            total = np.where(present, total + value, total)
+            continue
+        t = total + value
+        c = np.where(np.abs(total) >= np.abs(value), (total - t) + value, (value - t) + total)
+        comp = np.where(present, comp + c, comp)
+        total = np.where(present, t, total)
+    if _COMPENSATED_SUM:
+        total = np.where((comp != 0) & np.isfinite(comp), total + comp, total)
+    return total
+
+
+def _round_many(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """round(v, ndigits) de Python: np.round salvo cerca de un empate decimal."""
+    out = np.round(values, ndigits)
+    scaled = values * 10.0 ** ndigits
+    tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if tie.any():
+        idx = np.flatnonzero(tie)
+        out[idx] = [round(v, ndigits) for v in values[idx].tolist()]
+    return out
+
+
+def _percentile_to_score_many(pct: np.ndarray) -> np.ndarray:
+    return np.select(
+        [pct <= 0, pct >= 100, pct >= 85, pct >= 50],
+        [0.0, 10.0, 8.5 + ((pct - 85) / 15.0) * 1.5, 5.0 + ((pct - 50) / 35.0) * 3.5],
+        pct / 10.0,
+    )
+
+
+def _confidence_codes(data_points: np.ndarray) -> np.ndarray:
+    """Índice en _CONFIDENCES (misma escala que _get_confidence)."""
+    return np.select([data_points >= 20, data_points >= 8, data_points >= 1], [3, 2, 1], 0)
+
+
+def _score_dimension_many(name: str, columns: Dict[str, np.ndarray], hcp: np.ndarray, n: int):
+    """Un _score_<name> para n filas → (score, percentile, zone, confidence, data_points)."""
+    subs, counted_key, count_key, default_count, confidence_rule = _DIMENSION_SPECS[name]
+
+    terms, weights = [], []
+    for sub in subs:
+        value = columns[sub.key]
+        present = ~np.isnan(value)
+        if sub.absolute:
+            value = np.abs(value)
+        pct = _sub_percentile_many(sub, value, hcp)
+        terms.append((pct * sub.weight, present))
+        weights.append((np.full(n, sub.weight), present))
+
+    any_present = np.zeros(n, dtype=bool)
+    for _, present in terms:
+        any_present |= present
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        final_pct = _py_sum(terms, n) / _py_sum(weights, n)
+    final_pct = np.where(any_present, final_pct, 50.0)
+    final_score = _percentile_to_score_many(final_pct)
+
+    count = columns[count_key]
+    counted = ~np.isnan(columns[counted_key])
+    data_points = np.where(counted, np.where(np.isnan(count), default_count, count), 0).astype(np.int64)
+
+    if confidence_rule == "mental":
+        conf_code = np.where(data_points >= 10, 2, 1)
+    elif confidence_rule == "default_10":
+        conf_code = _confidence_codes(np.where(data_points > 0, data_points, 10))
+    else:
+        conf_code = _confidence_codes(data_points)
+
+    zone_code = np.select([final_score >= 8.5, final_score >= 6.5, final_score >= 4.0], [3, 2, 1], 0)
+
+    # Dimensión sin datos: _empty_dimension
+    score = np.where(any_present, _round_many(final_score, 2), 5.0)
+    percentile = np.where(any_present, _round_many(final_pct, 1), 50.0)
+    zone_code = np.where(any_present, zone_code, 1)
+    conf_code = np.where(any_present, conf_code, 0)
+    data_points = np.where(any_present, data_points, 0)
+    return score, percentile, _ZONES[zone_code], _CONFIDENCES[conf_code], data_points, conf_code, any_present
+
+
+def _weighted_average_many(scores: Dict[str, np.ndarray], weights, n: int) -> np.ndarray:
+    """_weighted_average con todas las dimensiones presentes."""
+    always = np.ones(n, dtype=bool)
+    total = _py_sum([(scores[d] * w, always) for d, w in weights], n)
+    return total / sum(w for _, w in weights)
+
+
 # ══════════════════════════════════════════════════════════════
 # TEST / DEMO
 # ══════════════════════════════════════════════════════════════
@@ -16,6 +16,11 @@ CÓMO USAR:
     - data['scoring_profile']   → 8 scores 0-10 + metadata
     - data['golf_identity']     → arquetipo completo + insight personalizado
 
+  Con simulate=N (opcional) se añade golf_identity['stability']: N
+  conjuntos de métricas perturbados según su error de muestreo, puntuados
+  y clasificados en lote → probabilidad de cada arquetipo e intervalos de
+  los 8 scores (ver simulate_archetype_stability).
+
 Autor: AlvGolf
 Versión: 1.0.0
 """
@@ -24,11 +29,14 @@ import math
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Importar los módulos que ya hemos creado
 # (ajustar el path según dónde estén en tu proyecto)
 sys.path.insert(0, str(Path(__file__).parent))
-from app.scoring_engine import ScoringEngine, ScoringResult
-from app.archetype_classifier import ArchetypeClassifier, ArchetypeResult
+from app.scoring_engine import DIMENSIONS, ScoringEngine, ScoringResult
+from app.archetype_classifier import ARCHETYPE_IDS, ARCHETYPES, ArchetypeClassifier, ArchetypeResult
+from app.columnar import rows
 
 
 def _extract_lateral_std_from_dispersion(dispersion_dict: dict) -> float:
@@ -44,7 +52,7 @@ def _extract_lateral_std_from_dispersion(dispersion_dict: dict) -> float:
     """
     all_x = []
     for cat in ['excellent', 'good', 'regular', 'poor']:
-        all_x += [abs(pt['x']) for pt in dispersion_dict.get(cat, [])]
+        all_x += [abs(pt['x']) for pt in rows(dispersion_dict.get(cat))]
     
     if not all_x:
         return None
@@ -165,7 +173,7 @@ def _extract_metrics_from_json(data: dict) -> dict:
     metrics['bounce_back_rate_pct'] = round(5 + (cm_val / 100) * 30, 1)
     
     # F9 vs B9 delta: desde score_history si disponible
-    rounds = data.get('score_history', {}).get('rounds', [])
+    rounds = rows(data.get('score_history', {}).get('rounds'))
     if len(rounds) >= 10:
         # Proxy: usar volatility como indicador del delta
         # (no tenemos F9/B9 separado en el JSON)
@@ -209,18 +217,242 @@ def _extract_metrics_from_json(data: dict) -> dict:
     return {k: v for k, v in metrics.items() if v is not None}
 
 
-def add_scoring_to_dashboard(data: dict) -> dict:
+# ══════════════════════════════════════════════════════════════
+# SIMULACIÓN MONTE CARLO (estabilidad del arquetipo)
+# ══════════════════════════════════════════════════════════════
+# Cada métrica de _extract_metrics_from_json es una estimación con error de
+# muestreo. Se sortean N conjuntos de métricas (normal alrededor del valor,
+# con su error estándar), se puntúan con ScoringEngine.score_many y se
+# clasifican con ArchetypeClassifier.classify_many: la frecuencia de cada
+# arquetipo dice lo cerca que está el jugador de cambiar de identidad.
+
+SIMULATION_SAMPLES = 10_000
+SIMULATION_SEED = 0         # Semilla fija: mismo JSON → misma simulación
+SIMULATION_CI = 0.90        # Intervalo central de los scores
+
+# Medias de golpes FlightScope: (métrica, códigos de palo, campo del golpe)
+_SHOT_MEAN_METRICS = (
+    ('carry_driver_m',        ('Dr', 'Driver'),             'c'),
+    ('ball_speed_driver_kmh', ('Dr', 'Driver'),             'v'),
+    ('carry_7iron_m',         ('7i', '7 Iron', '7Iron'),    'c'),
+    ('ball_speed_7iron_kmh',  ('7i', '7 Iron', '7Iron'),    'v'),
+    ('carry_pw_m',            ('PW', 'Pitching W'),         'c'),
+)
+
+# Dispersión lateral: (métrica, claves en dispersion_by_club)
+_SPREAD_METRICS = (
+    ('lateral_std_driver_m', ('Driver',)),
+    ('lateral_std_pw_m',     ('PitchingW', 'Pitching W', 'PW')),
+)
+
+# Porcentajes por hoyo / oportunidad: oportunidades por ronda (aprox. amateur)
+_PCT_TRIALS_PER_ROUND = {
+    'fairway_hit_pct':      14,
+    'gir_pct':              18,
+    'three_putt_pct':       18,
+    'scrambling_pct':       10,
+    'bounce_back_rate_pct': 6,
+    'explosion_hole_pct':   18,
+}
+
+# Medias por ronda: desviación típica entre rondas (aprox. amateur)
+_PER_ROUND_SD = {
+    'sg_ott':               1.5,
+    'sg_approach':          2.0,
+    'sg_arg':               1.5,
+    'sg_putt':              1.8,
+    'putts_per_round':      3.0,
+    'f9_vs_b9_delta':       4.0,
+    'par3_vs_par_relative': 1.0,
+}
+
+# Estimaciones de swing por golpe: (desviación típica, métrica con el nº de golpes)
+_PER_SHOT_SD = {
+    'face_to_path_driver_deg': (3.0, 'driver_shots_count'),
+    'smash_factor_driver':     (0.05, 'driver_shots_count'),
+    'smash_factor_7iron':      (0.05, '7iron_shots_count'),
+}
+
+# Métricas con signo (el resto no puede ser negativo)
+_SIGNED_METRICS = {'sg_ott', 'sg_approach', 'sg_arg', 'sg_putt',
+                   'f9_vs_b9_delta', 'par3_vs_par_relative', 'face_to_path_driver_deg'}
+
+
+def _metric_standard_errors(data: dict, metrics: dict) -> dict:
+    """
+    Error estándar de cada métrica extraída (0 / ausente = valor fijo).
+
+    - Medias de golpes: sd / √n con los golpes de flightscope_shots_timeline
+    - Dispersión lateral: s / √(2(n-1)) con los puntos de dispersion_by_club
+    - Porcentajes: binomial √(p(1-p)/n), n = rondas × oportunidades por ronda
+    - Medias por ronda: sd entre rondas / √rondas
+    - score_mean / score_std_dev / CV: con las rondas de scoring_18
+    Los conteos (rondas, golpes) no se perturban: definen el error.
+    """
+    errors = {}
+    rounds_n = max(int(metrics.get('rounds_count') or 0), 1)
+
+    # ── Medias de golpes FlightScope ──────────────────────────
+    shots = rows(data.get('flightscope_shots_timeline'))
+    for key, codes, field in _SHOT_MEAN_METRICS:
+        if key not in metrics:
+            continue
+        values = np.array([s[field] for s in shots
+                           if s.get('p') in codes and isinstance(s.get(field), (int, float))],
+                          dtype=np.float64)
+        if len(values) >= 2:
+            errors[key] = float(values.std(ddof=1) / math.sqrt(len(values)))
+
+    # ── Dispersión lateral (percentil de |x|) ─────────────────
+    dispersion = data.get('dispersion_by_club', {})
+    for key, clubs in _SPREAD_METRICS:
+        disp = next((dispersion[c] for c in clubs if dispersion.get(c)), None)
+        if key not in metrics or not disp:
+            continue
+        n = sum(len(rows(disp.get(cat))) for cat in ('excellent', 'good', 'regular', 'poor'))
+        if n >= 2:
+            errors[key] = metrics[key] / math.sqrt(2 * (n - 1))
+
+    # ── Porcentajes (binomial) ────────────────────────────────
+    for key, per_round in _PCT_TRIALS_PER_ROUND.items():
+        if key in metrics:
+            p = min(max(metrics[key] / 100.0, 0.0), 1.0)
+            errors[key] = 100.0 * math.sqrt(p * (1 - p) / (rounds_n * per_round))
+
+    # ── Medias por ronda ──────────────────────────────────────
+    for key, sd in _PER_ROUND_SD.items():
+        if key in metrics:
+            errors[key] = sd / math.sqrt(rounds_n)
+
+    for key, (sd, count_key) in _PER_SHOT_SD.items():
+        if key in metrics:
+            errors[key] = sd / math.sqrt(max(int(metrics.get(count_key) or 0), 1))
+
+    # ── Scoring (media y dispersión de las tarjetas) ──────────
+    if 'score_std_dev' in metrics:
+        std = metrics['score_std_dev']
+        errors['score_std_dev'] = std / math.sqrt(2 * max(rounds_n - 1, 1))
+        if 'score_mean' in metrics:
+            errors['score_mean'] = std / math.sqrt(rounds_n)
+    if 'carry_cv_driver_pct' in metrics:
+        errors['carry_cv_driver_pct'] = metrics['carry_cv_driver_pct'] / math.sqrt(2 * max(rounds_n - 1, 1))
+
+    return errors
+
+
+def _sample_metrics(metrics: dict, errors: dict, n_samples: int, rng: np.random.Generator) -> dict:
+    """
+    {métrica: array (n_samples + 1,)}: fila 0 = valores observados, el
+    resto perturbados con su error estándar (recortados a su rango válido).
+    """
+    columns = {}
+    for key, value in metrics.items():
+        column = np.full(n_samples + 1, float(value))
+        se = errors.get(key, 0.0)
+        if se > 0:
+            column[1:] += se * rng.standard_normal(n_samples)
+            if key.endswith('_pct'):
+                np.clip(column, 0.0, 100.0, out=column)
+            elif key not in _SIGNED_METRICS:
+                np.maximum(column, 0.0, out=column)
+        columns[key] = column
+    return columns
+
+
+def _interval(values: np.ndarray, point: float, ci: float) -> dict:
+    low, high = np.quantile(values, [(1 - ci) / 2, (1 + ci) / 2])
+    return {
+        'score': point,
+        'mean':  round(float(values.mean()), 2),
+        'low':   round(float(low), 2),
+        'high':  round(float(high), 2),
+    }
+
+
+def simulate_archetype_stability(
+    data: dict,
+    n_samples: int = SIMULATION_SAMPLES,
+    seed: int = SIMULATION_SEED,
+    ci: float = SIMULATION_CI,
+) -> dict:
+    """
+    Estabilidad del arquetipo frente al error de muestreo de las métricas.
+
+    Sortea n_samples conjuntos de métricas alrededor de los observados
+    (_metric_standard_errors) y los puntúa y clasifica en lote (score_many
+    + classify_many): 10k muestras en ~0.05 s (medido).
+
+    Args:
+        data: El dict completo del dashboard_data.json
+        n_samples: Número de conjuntos de métricas simulados
+        seed: Semilla del generador (resultado reproducible)
+        ci: Cobertura del intervalo de cada score (0.90 → p5-p95)
+
+    Returns:
+        {
+          'archetype_id', 'stability' (prob. de seguir en él),
+          'closest_alternative' (arquetipo más probable distinto, o None),
+          'archetype_probabilities': [{'id', 'name', 'probability'}] (desc.),
+          'dimensions': {dim: {'score', 'mean', 'low', 'high'}},
+          'overall_score': {...}, 'metric_errors': {métrica: error estándar},
+          'n_samples', 'seed', 'ci'
+        }
+    """
+    if n_samples < 1:
+        raise ValueError(f"n_samples debe ser >= 1 (recibido {n_samples})")
+    if not 0 < ci < 1:
+        raise ValueError(f"ci debe estar en (0, 1) (recibido {ci})")
+
+    hcp = float(data.get('player_stats', {}).get('handicap_actual', 23.2))
+    metrics = _extract_metrics_from_json(data)
+    errors = _metric_standard_errors(data, metrics)
+    columns = _sample_metrics(metrics, errors, n_samples, np.random.default_rng(seed))
+
+    # Fila 0 = perfil observado (mismo resultado que score() + classify())
+    batch = ScoringEngine().score_many(hcp, columns, n=n_samples + 1)
+    archetypes = ArchetypeClassifier().classify_many(batch)
+    current = int(archetypes.codes[0])
+
+    counts = np.bincount(archetypes.codes[1:], minlength=len(ARCHETYPE_IDS)).tolist()
+    probabilities = [
+        {'id': ARCHETYPE_IDS[code], 'name': ARCHETYPES[ARCHETYPE_IDS[code]].name_es,
+         'probability': round(counts[code] / n_samples, 4)}
+        for code in sorted(range(len(counts)), key=lambda c: -counts[c]) if counts[code]
+    ]
+    alternatives = [p for p in probabilities if p['id'] != ARCHETYPE_IDS[current]]
+
+    matrix = batch.score_matrix()
+    return {
+        'archetype_id':            ARCHETYPE_IDS[current],
+        'stability':               round(counts[current] / n_samples, 4),
+        'closest_alternative':     alternatives[0] if alternatives else None,
+        'archetype_probabilities': probabilities,
+        'dimensions': {
+            dim: _interval(matrix[1:, j], float(matrix[0, j]), ci)
+            for j, dim in enumerate(DIMENSIONS)
+        },
+        'overall_score': _interval(batch.overall_score[1:], float(batch.overall_score[0]), ci),
+        'metric_errors': {k: round(v, 4) for k, v in errors.items() if v > 0},
+        'n_samples':               n_samples,
+        'seed':                    seed,
+        'ci':                      ci,
+    }
+
+
+def add_scoring_to_dashboard(data: dict, simulate: int = 0) -> dict:
     """
     Función principal. Añade scoring_profile y golf_identity al dashboard_data.
     
     USAGE en tu backend:
         data = add_scoring_to_dashboard(data)
     
-    Tiempo de ejecución: < 50ms
+    Tiempo de ejecución: < 50ms (+ ~50ms con simulate=10000)
     Determinista: mismo JSON → mismo resultado siempre
     
     Args:
         data: El dict completo del dashboard_data.json
+        simulate: Si > 0, nº de muestras Monte Carlo para
+                  golf_identity['stability'] (0 = sin simulación)
         
     Returns:
         El mismo dict con dos claves nuevas añadidas:
@@ -313,6 +545,15 @@ def add_scoring_to_dashboard(data: dict) -> dict:
         print(f"[ScoringIntegration] OK scoring_profile: overall={scoring_result.overall_score}/10")
         print(f"[ScoringIntegration] OK golf_identity: {arch.id} - {arch.name_es} (fit={archetype_result.fit_score:.0%})")
 
+        if simulate > 0:
+            try:
+                stability = simulate_archetype_stability(data, n_samples=simulate)
+                data['golf_identity']['stability'] = stability
+                print(f"[ScoringIntegration] OK stability: {stability['stability']:.0%} en {arch.id} "
+                      f"({simulate} muestras)")
+            except Exception as e:
+                print(f"[ScoringIntegration] WARNING simulación omitida: {e}")
+
     except Exception as e:
         print(f"[ScoringIntegration] ERROR: {e} — añadiendo datos de fallback")
         data['scoring_profile'] = {'error': str(e)}
@@ -0,0 +1,214 @@
+"""
+AlvGolf — Section Cache
+========================
+Caché local de resultados por sección del dashboard, indexada por una
+huella (fingerprint) de todo lo que la sección lee:
+
+  - inputs:   digest de los datos crudos que declara ('shots', 'rounds'),
+              o la fecha del día ('today') si la sección usa el reloj
+  - upstream: fingerprints de las secciones de las que depende (deps + after)
+  - code:     digest del código fuente del método que la calcula y del
+              módulo del generador + los módulos locales (app.*, alvgolf.*)
+              que importa, transitivamente (source_digest)
+  - versión:  SECTION_CACHE_VERSION (cambios fuera del código: formato de
+              la caché, datos externos...)
+
+Un rerun solo recalcula las secciones cuya huella cambió; el resto se lee
+de data/cache/sections/<key>.json. Como la huella de una sección incluye
+la de sus dependencias, un cambio en las tarjetas invalida en cascada solo
+las secciones que (directa o indirectamente) leen rondas.
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+import ast
+import hashlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import pandas as pd
+from loguru import logger
+
+from app.flightscope_snapshot import DEFAULT_CACHE_DIR
+
+
+# Subir solo si cambia algo que no es código fuente local (formato de la
+# caché, librerías externas...): invalida toda la caché. Los cambios en
+# helpers (RoundsTable, MonthlyClubPivot, app.benchmarks...) ya los recoge
+# source_digest.
+SECTION_CACHE_VERSION = 1
+
+# Paquetes cuyo código cuenta en la huella (los de terceros no)
+LOCAL_PACKAGES = ('app', 'alvgolf')
+
+
+# ══════════════════════════════════════════════════════════════
+# DIGESTS
+# ══════════════════════════════════════════════════════════════
+
+def frame_digest(df: Optional[pd.DataFrame]) -> str:
+    """sha256 del contenido de un DataFrame (valores + columnas, sin índice)."""
+    h = hashlib.sha256()
+    if df is None:
+        return h.hexdigest()
+    h.update(json.dumps(list(map(str, df.columns))).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def json_digest(obj) -> str:
+    """sha256 de un objeto JSON-serializable (claves ordenadas)."""
+    payload = json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def code_digest(func) -> str:
+    """sha256 del código fuente de un método (vacío si no hay fuente)."""
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = getattr(func, '__qualname__', repr(func))
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def _local_imports(path: Path) -> set:
+    """Módulos de LOCAL_PACKAGES importados en `path` (también imports diferidos)."""
+    names = set()
+    tree = ast.parse(path.read_bytes(), filename=str(path))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return {n for n in names if n.split('.')[0] in LOCAL_PACKAGES}
+
+
+def _module_path(name: str) -> Optional[Path]:
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin or not spec.origin.endswith('.py'):
+        return None
+    return Path(spec.origin)
+
+
+def source_digest(module_name: str) -> str:
+    """sha256 de las fuentes de un módulo y de los módulos locales que importa.
+
+    Recorre transitivamente los imports de LOCAL_PACKAGES (incluidos los que
+    están dentro de funciones), así una edición en cualquier helper invalida
+    las secciones sin tener que subir SECTION_CACHE_VERSION a mano.
+    """
+    module = sys.modules.get(module_name)
+    root = Path(module.__file__) if module is not None and getattr(module, '__file__', None) \
+        else _module_path(module_name)
+    if root is None:
+        return hashlib.sha256(module_name.encode('utf-8')).hexdigest()
+
+    seen: Dict[Path, str] = {}
+    pending = [root.resolve()]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen[path] = hashlib.sha256(path.read_bytes()).hexdigest()
+        for name in _local_imports(path):
+            found = _module_path(name)
+            if found is not None:
+                pending.append(found.resolve())
+
+    h = hashlib.sha256()
+    for path in sorted(seen):
+        h.update(f"{path.name}:{seen[path]}\n".encode('utf-8'))
+    return h.hexdigest()
+
+
+def section_fingerprints(graph, keys: Iterable[str], inputs: Dict[str, str],
+                         code: Dict[str, str]) -> Dict[str, str]:
+    """Huella de cada sección de `keys` y de todas sus dependencias.
+
+    Args:
+        graph: SectionGraph
+        keys: Secciones objetivo
+        inputs: {'shots': digest, 'rounds': digest, 'today': fecha ISO}
+        code: {section_key: digest del método}
+
+    Returns:
+        Dict {section_key: fingerprint}
+    """
+    fingerprints: Dict[str, str] = {}
+    for key in graph.closure(keys):
+        section = graph[key]
+        parts = {
+            'version': SECTION_CACHE_VERSION,
+            'method': section.method,
+            'code': code.get(key, ''),
+            'inputs': {name: inputs.get(name, '') for name in section.inputs},
+            'deps': [fingerprints[d] for d in section.deps],
+            'after': [fingerprints[a] for a in section.after],
+        }
+        fingerprints[key] = json_digest(parts)
+    return fingerprints
+
+
+# ══════════════════════════════════════════════════════════════
+# CACHE
+# ══════════════════════════════════════════════════════════════
+
+class SectionCache:
+    """Resultados de secciones persistidos como JSON, uno por sección."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        base = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.directory = base / "sections"
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str, fingerprint: str) -> Optional[Tuple[object, float]]:
+        """(resultado, segundos que costó calcularlo) si la huella coincide."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except Exception as e:
+            logger.warning(f"Caché de sección ilegible ({path.name}): {e}")
+            return None
+        if entry.get('fingerprint') != fingerprint:
+            return None
+        return entry.get('value'), float(entry.get('seconds', 0.0))
+
+    def store(self, key: str, fingerprint: str, value, seconds: float) -> bool:
+        """Escritura atómica (temp file + os.replace). False si no es serializable."""
+        try:
+            payload = json.dumps(
+                {'fingerprint': fingerprint, 'seconds': round(seconds, 6), 'value': value},
+                ensure_ascii=False,
+            )
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Sección '{key}' no cacheable: {e}")
+            return False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".json.tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp, self._path(key))
+        except Exception as e:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            logger.warning(f"No se pudo escribir caché de '{key}': {e}")
+            return False
+        return True
@@ -0,0 +1,268 @@
+"""
+AlvGolf — Section Graph
+========================
+Registro declarativo de secciones del dashboard + ejecutor por DAG.
+
+Cada sección declara:
+  - key:     clave en dashboard_data.json (o intermedio si output=False)
+  - method:  método del generador que la calcula
+  - deps:    secciones cuyo resultado recibe como argumentos (en orden)
+  - after:   secciones que deben terminar antes (sin pasar resultado)
+  - inputs:  datos crudos que lee ('shots', 'rounds') y 'today' si su
+             resultado depende de la fecha de ejecución
+  - stage:   'base' | 'scoring' | 'post' (post = necesita scoring_profile)
+  - cache:   si el resultado se puede persistir en la caché de secciones
+  - tab:     tab del dashboard que la pinta (shard de carga diferida);
+             None = shard compartido, se carga tras el primer render
+
+El ejecutor lanza en un pool de threads todas las secciones cuyas
+dependencias ya terminaron (orden topológico dinámico). Los resultados
+intermedios compartidos (p.ej. club_statistics_basic) se calculan una
+sola vez y se reutilizan.
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+
+RAW_INPUTS = ('shots', 'rounds', 'today')
+
+
+# ══════════════════════════════════════════════════════════════
+# DATACLASSES
+# ══════════════════════════════════════════════════════════════
+
+@dataclass(frozen=True)
+class Section:
+    """Definición estática de una sección del dashboard."""
+    key:     str
+    method:  str
+    deps:    Tuple[str, ...] = ()
+    after:   Tuple[str, ...] = ()
+    inputs:  Tuple[str, ...] = ()
+    stage:   str = 'base'
+    output:  bool = True
+    cache:   bool = True
+    tab:     Optional[str] = None
+    summary: Optional[Callable[[object], str]] = None
+
+    @property
+    def upstream(self) -> Tuple[str, ...]:
+        """Todas las secciones de las que depende (argumentos + orden)."""
+        return self.deps + tuple(a for a in self.after if a not in self.deps)
+
+
+# ══════════════════════════════════════════════════════════════
+# GRAPH
+# ══════════════════════════════════════════════════════════════
+
+class SectionGraph:
+    """DAG de secciones: validación, cierres transitivos, plan y ejecución."""
+
+    def __init__(self, sections: Iterable[Section]):
+        self.sections: Dict[str, Section] = {}
+        for section in sections:
+            if section.key in self.sections:
+                raise ValueError(f"Sección duplicada: {section.key}")
+            self.sections[section.key] = section
+
+        for section in self.sections.values():
+            missing = [d for d in section.upstream if d not in self.sections]
+            if missing:
+                raise ValueError(f"Sección '{section.key}' depende de secciones inexistentes: {missing}")
+
+        self.order: List[str] = self._topological_order()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.sections
+
+    def __getitem__(self, key: str) -> Section:
+        return self.sections[key]
+
+    def _topological_order(self) -> List[str]:
+        """Orden topológico estable (respeta el orden de registro)."""
+        done: Set[str] = set()
+        visiting: Set[str] = set()
+        order: List[str] = []
+
+        def visit(key: str):
+            if key in done:
+                return
+            if key in visiting:
+                raise ValueError(f"Ciclo en el grafo de secciones en '{key}'")
+            visiting.add(key)
+            for dep in self.sections[key].upstream:
+                visit(dep)
+            visiting.discard(key)
+            done.add(key)
+            order.append(key)
+
+        for key in self.sections:
+            visit(key)
+        return order
+
+    # ── Consultas ────────────────────────────────────────────
+
+    def closure(self, targets: Iterable[str]) -> List[str]:
+        """Targets + dependencias transitivas, en orden topológico."""
+        needed: Set[str] = set()
+        stack = list(targets)
+        while stack:
+            key = stack.pop()
+            if key not in self.sections:
+                raise KeyError(f"Sección desconocida: {key}")
+            if key in needed:
+                continue
+            needed.add(key)
+            stack.extend(self.sections[key].upstream)
+        return [k for k in self.order if k in needed]
+
+    def keys(self, stage: Optional[str] = None, output_only: bool = False) -> List[str]:
+        """Secciones (en orden de registro) filtradas por stage / output."""
+        return [
+            k for k in self.sections
+            if (stage is None or self.sections[k].stage == stage)
+            and (not output_only or self.sections[k].output)
+        ]
+
+    def levels(self, keys: Optional[Iterable[str]] = None) -> List[List[str]]:
+        """Niveles del DAG: cada nivel solo depende de niveles anteriores."""
+        keys = list(keys) if keys is not None else self.order
+        subset = set(keys)
+        depth: Dict[str, int] = {}
+        for key in self.order:
+            if key not in subset:
+                continue
+            ups = [depth[d] for d in self.sections[key].upstream if d in subset]
+            depth[key] = (max(ups) + 1) if ups else 0
+        result: List[List[str]] = [[] for _ in range(max(depth.values(), default=-1) + 1)]
+        for key in self.order:
+            if key in depth:
+                result[depth[key]].append(key)
+        return result
+
+    def critical_path(self, costs: Optional[Dict[str, float]] = None,
+                      keys: Optional[Iterable[str]] = None) -> Tuple[List[str], float]:
+        """Camino más largo del DAG (por coste estimado o medido por sección)."""
+        keys = list(keys) if keys is not None else self.order
+        subset = set(keys)
+        costs = costs or {}
+        best: Dict[str, float] = {}
+        prev: Dict[str, Optional[str]] = {}
+        for key in self.order:
+            if key not in subset:
+                continue
+            cost = float(costs.get(key, 1.0))
+            ups = [d for d in self.sections[key].upstream if d in subset]
+            parent = max(ups, key=lambda d: best[d]) if ups else None
+            best[key] = cost + (best[parent] if parent else 0.0)
+            prev[key] = parent
+        if not best:
+            return [], 0.0
+        tail = max(best, key=best.get)
+        path = []
+        node: Optional[str] = tail
+        while node:
+            path.append(node)
+            node = prev[node]
+        return list(reversed(path)), best[tail]
+
+    def format_plan(self, costs: Optional[Dict[str, float]] = None,
+                    keys: Optional[Iterable[str]] = None) -> str:
+        """Texto del plan: niveles del DAG, dependencias y camino crítico."""
+        keys = list(keys) if keys is not None else self.order
+        unit = 's' if costs else 'u'
+        lines = [f"Plan de generación: {len(keys)} secciones"]
+        for i, level in enumerate(self.levels(keys)):
+            lines.append(f"\nNivel {i} ({len(level)} en paralelo)")
+            for key in level:
+                section = self.sections[key]
+                tags = []
+                if section.inputs:
+                    tags.append("in=" + ",".join(section.inputs))
+                if section.upstream:
+                    tags.append("deps=" + ",".join(section.upstream))
+                if section.stage != 'base':
+                    tags.append(f"stage={section.stage}")
+                if not section.output:
+                    tags.append("intermedio")
+                elif section.tab:
+                    tags.append(f"tab={section.tab}")
+                cost = f" [{costs[key]:.3f}{unit}]" if costs and key in costs else ""
+                lines.append(f"  - {key}{cost}" + (f"  ({'; '.join(tags)})" if tags else ""))
+        path, total = self.critical_path(costs, keys)
+        lines.append(f"\nCamino crítico ({total:.3f}{unit}): " + " → ".join(path))
+        return "\n".join(lines)
+
+    # ── Ejecución ────────────────────────────────────────────
+
+    def execute(
+        self,
+        runner: Callable[[Section, tuple], object],
+        keys: Iterable[str],
+        results: Optional[Dict[str, object]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Tuple[Dict[str, object], Dict[str, float]]:
+        """Ejecuta `keys` respetando dependencias, en paralelo cuando se puede.
+
+        Args:
+            runner: runner(section, args) → resultado de la sección
+            keys: Secciones a ejecutar (sus deps deben estar en `keys` o en `results`)
+            results: Resultados ya disponibles (se reutilizan, no se recalculan)
+            max_workers: Threads del pool (1 = secuencial en orden topológico)
+
+        Returns:
+            (results, timings) — timings en segundos por sección ejecutada
+        """
+        results = dict(results or {})
+        timings: Dict[str, float] = {}
+        pending = [k for k in self.order if k in set(keys) and k not in results]
+
+        for key in pending:
+            missing = [d for d in self.sections[key].upstream if d not in results and d not in pending]
+            if missing:
+                raise KeyError(f"Sección '{key}' necesita {missing}, que no se van a ejecutar")
+
+        def run_one(key: str):
+            section = self.sections[key]
+            args = tuple(results[d] for d in section.deps)
+            start = time.perf_counter()
+            value = runner(section, args)
+            return value, time.perf_counter() - start
+
+        workers = max_workers or min(8, os.cpu_count() or 1)
+        if workers <= 1:
+            for key in pending:
+                results[key], timings[key] = run_one(key)
+            return results, timings
+
+        remaining = list(pending)
+        running = {}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="section") as pool:
+            while remaining or running:
+                ready = [k for k in remaining
+                         if all(d in results for d in self.sections[k].upstream)]
+                for key in ready:
+                    remaining.remove(key)
+                    running[pool.submit(run_one, key)] = key
+                if not running:
+                    raise RuntimeError(f"Secciones bloqueadas: {remaining}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    key = running.pop(future)
+                    try:
+                        results[key], timings[key] = future.result()
+                    except Exception:
+                        logger.error(f"Sección '{key}' falló")
+                        for f in running:
+                            f.cancel()
+                        raise
+        return results, timings
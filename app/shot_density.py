@@ -0,0 +1,140 @@
+"""
+AlvGolf — Shot Density Grids
+=============================
+KDE binned de los golpes FlightScope para el heatmap de zonas (Tab 5).
+
+Replica en el servidor el "gaussian splat" que hacía el navegador
+(rejilla 200×250, σ = 8×10 celdas, kernel truncado a ±24 celdas):
+
+  1. histograma 2D de golpes en la rejilla (con margen = radio del kernel,
+     para que los golpes fuera del área sigan aportando en el borde)
+  2. convolución con el kernel gaussiano vía FFT (numpy.fft)
+  3. muestreo cada STORAGE_STEP celdas (la densidad es suave: σ ≥ 8 celdas;
+     el cliente interpola bilinealmente igual que antes)
+  4. cuantización uint8 (0-255 respecto al máximo del grid)
+  5. recorte al bounding box no nulo + base64
+
+El payload depende de la forma de la distribución, no del nº de golpes,
+y el cliente solo suma grids y pinta (sin KDE en JavaScript).
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+import base64
+from typing import Dict, Optional
+
+import numpy as np
+
+
+# ── Rejilla (misma que drawHeatmap en dashboard_dynamic.html) ────────────────
+
+X_RANGE = (-150.0, 150.0)   # metros lateral (− izquierda, + derecha)
+Y_RANGE = (0.0, 300.0)      # metros carry
+GRID_COLS = 200
+GRID_ROWS = 250              # fila 0 = 300 m (arriba)
+SIGMA_X = 8.0                # celdas
+SIGMA_Y = 10.0               # celdas
+KERNEL_RADIUS = 24           # celdas
+STORAGE_STEP = 4             # 1 de cada 4 celdas por eje → grid 63 × 50
+
+ENCODING = 'uint8-base64'
+
+
+# ══════════════════════════════════════════════════════════════
+# KDE
+# ══════════════════════════════════════════════════════════════
+
+def _kernel() -> np.ndarray:
+    """Kernel gaussiano truncado (2R+1 × 2R+1), filas = eje Y."""
+    offsets = np.arange(-KERNEL_RADIUS, KERNEL_RADIUS + 1, dtype=np.float64)
+    return np.exp(-0.5 * ((offsets[:, None] / SIGMA_Y) ** 2 + (offsets[None, :] / SIGMA_X) ** 2))
+
+
+def _shot_cells(x: np.ndarray, y: np.ndarray):
+    """Celda (fila, columna) de cada golpe, mismo redondeo que el cliente."""
+    x_norm = (x - X_RANGE[0]) / (X_RANGE[1] - X_RANGE[0])
+    y_norm = 1.0 - (y - Y_RANGE[0]) / (Y_RANGE[1] - Y_RANGE[0])
+    return np.floor(y_norm * GRID_ROWS).astype(np.int64), np.floor(x_norm * GRID_COLS).astype(np.int64)
+
+
+def density_grid(x, y) -> np.ndarray:
+    """Densidad KDE (GRID_ROWS × GRID_COLS, float64) de los golpes (x lateral, y carry)."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    r = KERNEL_RADIUS
+
+    rows, cols = _shot_cells(x, y)
+    keep = (rows >= -r) & (rows < GRID_ROWS + r) & (cols >= -r) & (cols < GRID_COLS + r)
+
+    if not keep.any():
+        return np.zeros((GRID_ROWS, GRID_COLS), dtype=np.float64)
+    padded = (GRID_ROWS + 2 * r, GRID_COLS + 2 * r)
+    counts = np.zeros(padded, dtype=np.float64)
+    np.add.at(counts, (rows[keep] + r, cols[keep] + r), 1.0)
+
+    # Convolución lineal completa por FFT; la celda (i, j) del grid es full[i + 2R, j + 2R]
+    kernel = _kernel()
+    shape = (padded[0] + kernel.shape[0] - 1, padded[1] + kernel.shape[1] - 1)
+    full = np.fft.irfft2(np.fft.rfft2(counts, shape) * np.fft.rfft2(kernel, shape), shape)
+    grid = full[2 * r:2 * r + GRID_ROWS, 2 * r:2 * r + GRID_COLS]
+    return np.clip(grid, 0.0, None)
+
+
+# ══════════════════════════════════════════════════════════════
+# ENCODING
+# ══════════════════════════════════════════════════════════════
+
+def encode_grid(grid: np.ndarray, step: int = STORAGE_STEP) -> Optional[Dict]:
+    """Grid float → uint8 muestreado cada `step` celdas, recortado y en base64.
+
+    Returns:
+        {'row0', 'col0', 'rows', 'cols', 'max', 'data'} en celdas del grid
+        muestreado, o None si está vacío. Valor ≈ byte / 255 * max.
+    """
+    peak = float(grid.max()) if grid.size else 0.0
+    if peak <= 0:
+        return None
+    sampled = grid[::step, ::step]
+    quantized = np.rint(sampled / peak * 255.0).astype(np.uint8)
+    if not quantized.any():
+        return None
+
+    nonzero_rows = np.flatnonzero(quantized.any(axis=1))
+    nonzero_cols = np.flatnonzero(quantized.any(axis=0))
+    r0, r1 = int(nonzero_rows[0]), int(nonzero_rows[-1]) + 1
+    c0, c1 = int(nonzero_cols[0]), int(nonzero_cols[-1]) + 1
+    block = np.ascontiguousarray(quantized[r0:r1, c0:c1])
+
+    return {
+        'row0': r0,
+        'col0': c0,
+        'rows': r1 - r0,
+        'cols': c1 - c0,
+        'max': round(peak, 4),
+        'data': base64.b64encode(block.tobytes()).decode('ascii'),
+    }
+
+
+def decode_grid(encoded: Dict, step: int = STORAGE_STEP) -> np.ndarray:
+    """Inverso aproximado de encode_grid (grid muestreado completo, float64)."""
+    grid = np.zeros((-(-GRID_ROWS // step), -(-GRID_COLS // step)), dtype=np.float64)
+    block = np.frombuffer(base64.b64decode(encoded['data']), dtype=np.uint8)
+    block = block.reshape(encoded['rows'], encoded['cols']).astype(np.float64)
+    r0, c0 = encoded['row0'], encoded['col0']
+    grid[r0:r0 + encoded['rows'], c0:c0 + encoded['cols']] = block / 255.0 * encoded['max']
+    return grid
+
+
+def grid_spec() -> Dict:
+    """Metadatos de la rejilla para el cliente."""
+    return {
+        'x_range': list(X_RANGE),
+        'y_range': list(Y_RANGE),
+        'cols': GRID_COLS,
+        'rows': GRID_ROWS,
+        'sigma': [SIGMA_X, SIGMA_Y],
+        'kernel_radius': KERNEL_RADIUS,
+        'step': STORAGE_STEP,
+        'encoding': ENCODING,
+    }
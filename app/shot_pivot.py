@@ -0,0 +1,107 @@
+"""
+AlvGolf — Monthly Club Pivot
+=============================
+Agregados mes × palo de TODOS los golpes FlightScope, calculados en un
+solo groupby vectorizado.
+
+Las secciones de evolución temporal (long game, hierros, wedges, attack
+angle, smash factor, evolución por palo) son proyecciones baratas de este
+pivot en lugar de recorrer el DataFrame con iterrows() cada una.
+
+Métricas (NaN = golpe no válido para esa métrica):
+  carry        vuelo_act > 0
+  carry_raw    vuelo_act tal cual (incluye NaN / ≤ 0)
+  ball_speed   velocidad_bola > 0
+  launch       ang_lanzamiento numérico
+  height       altura numérica
+
+Estadísticos por (mes, palo, métrica): mean, count, std, min, max, sum.
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+from typing import Iterable, List, Optional
+
+import pandas as pd
+
+
+STATS = ['mean', 'count', 'std', 'min', 'max', 'sum']
+
+
+class MonthlyClubPivot:
+    """Pivot mes × palo × métrica construido en una sola pasada."""
+
+    def __init__(self, shots: pd.DataFrame):
+        fecha = pd.to_datetime(shots['fecha'], errors='coerce')
+        carry = pd.to_numeric(shots['vuelo_act'], errors='coerce')
+        ball_speed = pd.to_numeric(shots['velocidad_bola'], errors='coerce')
+
+        metrics = pd.DataFrame({
+            'carry': carry.where(carry > 0),
+            'carry_raw': carry,
+            'ball_speed': ball_speed.where(ball_speed > 0),
+            'launch': pd.to_numeric(shots['ang_lanzamiento'], errors='coerce'),
+            'height': pd.to_numeric(shots['altura'], errors='coerce'),
+        })
+
+        keys = [fecha.dt.to_period('M').rename('mes'), shots['palo'].rename('palo')]
+        grouped = metrics.groupby(keys, sort=True, dropna=True)
+
+        self.table: pd.DataFrame = grouped.agg(STATS)
+        self.shots: pd.Series = grouped.size()
+        self.months: pd.PeriodIndex = self.table.index.get_level_values('mes').unique().sort_values()
+
+    # ── Consultas ────────────────────────────────────────────
+
+    def months_with(self, metric: str, clubs: Iterable[str]) -> pd.PeriodIndex:
+        """Meses con al menos un valor válido de `metric` en alguno de `clubs`."""
+        counts = self._club_rows(clubs)[(metric, 'count')]
+        months = counts[counts > 0].index.get_level_values('mes').unique()
+        return months.sort_values()
+
+    def club_series(self, metric: str, club: str, stat: str = 'mean',
+                    months: Optional[pd.PeriodIndex] = None) -> pd.Series:
+        """Serie mensual de un palo (NaN en meses sin datos si se dan `months`)."""
+        try:
+            series = self.table.xs(club, level='palo')[(metric, stat)]
+        except KeyError:
+            series = pd.Series(dtype=float, index=pd.PeriodIndex([], freq='M', name='mes'))
+        if months is not None:
+            series = series.reindex(months)
+        return series
+
+    def pooled_mean(self, metric: str, clubs: Iterable[str],
+                    months: Optional[pd.PeriodIndex] = None) -> pd.Series:
+        """Media mensual de un grupo de palos (todos sus golpes juntos)."""
+        rows = self._club_rows(clubs)
+        by_month = rows[[(metric, 'sum'), (metric, 'count')]].groupby(level='mes').sum()
+        counts = by_month[(metric, 'count')]
+        mean = (by_month[(metric, 'sum')] / counts).where(counts > 0)
+        if months is not None:
+            mean = mean.reindex(months)
+        return mean
+
+    def club_shots(self, club: str) -> pd.Series:
+        """Nº de golpes (filas) por mes de un palo, con o sin valores válidos."""
+        try:
+            return self.shots.xs(club, level='palo')
+        except KeyError:
+            return pd.Series(dtype=int, index=pd.PeriodIndex([], freq='M', name='mes'))
+
+    def _club_rows(self, clubs: Iterable[str]) -> pd.DataFrame:
+        clubs = list(clubs)
+        mask = self.table.index.get_level_values('palo').isin(clubs)
+        return self.table[mask]
+
+    # ── Formato ──────────────────────────────────────────────
+
+    @staticmethod
+    def labels(months: pd.PeriodIndex, fmt: str = '%b %Y') -> List[str]:
+        """Etiquetas de mes para los gráficos (default 'Jan 2024')."""
+        return [m.strftime(fmt) for m in months]
+
+    @staticmethod
+    def to_list(series: pd.Series, decimals: int) -> List[Optional[float]]:
+        """Serie → lista JSON (None en meses sin datos, valores redondeados)."""
+        return [round(float(v), decimals) if pd.notna(v) else None for v in series.tolist()]
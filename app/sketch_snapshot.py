@@ -0,0 +1,148 @@
+"""
+AlvGolf — Distance Sketch Snapshot
+===================================
+SketchStore de vuelo_act por (palo, month_id) persistido junto al snapshot
+de golpes (flightscope_<stem>.sketches.json), con la misma clave: el sha256
+del workbook.
+
+  - sha256 igual                       → sketches reutilizados tal cual
+  - sha256 distinto, mismas N primeras → solo los golpes N.. entran en los
+    filas (golpes añadidos al final)     digests de sus meses
+  - cualquier otro cambio              → se reconstruyen desde cero
+
+"Mismas N primeras filas" se comprueba con un sha256 de las columnas que
+alimentan los sketches (vuelo_act, palo, mes), guardado con el store.
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from app.flightscope_snapshot import DEFAULT_CACHE_DIR
+from app.quantiles import SketchStore
+
+
+SKETCH_SNAPSHOT_VERSION = 1
+
+
+# ══════════════════════════════════════════════════════════════
+# COLUMNAS
+# ══════════════════════════════════════════════════════════════
+
+def distance_columns(shots: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(carry, palo, month_id) por fila de `shots`.
+
+    carry NaN si no es numérico, palo '' si falta, month_id -1 sin fecha.
+    """
+    carry = pd.to_numeric(shots['vuelo_act'], errors='coerce').to_numpy(dtype=np.float64)
+    fecha = pd.to_datetime(shots['fecha'], errors='coerce').to_numpy().astype('datetime64[M]')
+    month_id = np.where(np.isnat(fecha), -1, fecha.astype(np.int64) + 1970 * 12)
+    palo = shots['palo'].fillna('').to_numpy().astype(str)
+    return carry, palo, month_id
+
+
+def add_distance_shots(store: SketchStore, carry, palo, month_id) -> SketchStore:
+    """Vuelca en `store` los carries válidos (con palo y fecha)."""
+    valid = ~np.isnan(carry) & (month_id >= 0) & (palo != '')
+    return store.add(carry[valid], palo[valid], month_id[valid])
+
+
+def _rows_digest(carry, palo, month_id, rows: int) -> str:
+    """sha256 de las primeras `rows` filas de las columnas de distance_columns."""
+    h = hashlib.sha256()
+    h.update(np.ascontiguousarray(carry[:rows]).tobytes())
+    h.update(np.ascontiguousarray(month_id[:rows]).tobytes())
+    h.update("\x00".join(palo[:rows].tolist()).encode("utf-8"))
+    return h.hexdigest()
+
+
+# ══════════════════════════════════════════════════════════════
+# SNAPSHOT I/O
+# ══════════════════════════════════════════════════════════════
+
+def sketch_path_for(workbook_path: Path, cache_dir: Optional[Path] = None) -> Path:
+    """Ruta de los sketches asociados a un workbook (junto a su snapshot .npz)."""
+    cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    return cache_dir / f"flightscope_{Path(workbook_path).stem}.sketches.json"
+
+
+def _read_sketches(path: Path) -> Optional[dict]:
+    if not path.exists():
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if data.get("version") == SKETCH_SNAPSHOT_VERSION else None
+    except Exception as e:
+        logger.warning(f"Sketches ilegibles ({path.name}): {e}")
+        return None
+
+
+def _write_sketches(path: Path, store: SketchStore, sha256: str, rows: int, rows_sha256: str):
+    """Escritura atómica: temp file en el mismo directorio + os.replace."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": SKETCH_SNAPSHOT_VERSION,
+        "sha256": sha256,
+        "rows": rows,
+        "rows_sha256": rows_sha256,
+        "store": store.to_dict(),
+    }
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".json.tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def load_distance_sketches(workbook_path, shots: pd.DataFrame,
+                           cache_dir: Optional[Path] = None) -> SketchStore:
+    """SketchStore de distancias de `shots`, reutilizando el persistido si se puede.
+
+    Args:
+        workbook_path: Ruta al Excel de FlightScope del que salió `shots`
+        shots: Frame canónico de load_shot_frame (attrs['fingerprint'] con sha256)
+        cache_dir: Directorio de snapshots (default data/cache/)
+
+    Returns:
+        SketchStore por (palo, month_id)
+    """
+    sha256 = (shots.attrs.get("fingerprint") or {}).get("sha256")
+    columns = distance_columns(shots)
+    if sha256 is None:
+        return add_distance_shots(SketchStore(), *columns)
+
+    path = sketch_path_for(workbook_path, cache_dir)
+    cached = _read_sketches(path)
+    rows = len(shots)
+
+    if cached and cached.get("sha256") == sha256 and cached.get("rows") == rows:
+        logger.debug(f"Sketches de distancia reutilizados: {path.name}")
+        return SketchStore.from_dict(cached["store"])
+
+    store, start = SketchStore(), 0
+    if cached and 0 < cached.get("rows", 0) <= rows \
+            and _rows_digest(*columns, cached["rows"]) == cached.get("rows_sha256"):
+        store, start = SketchStore.from_dict(cached["store"]), cached["rows"]
+    add_distance_shots(store, *(c[start:] for c in columns))
+    logger.debug(f"Sketches de distancia: {rows - start} golpes nuevos de {rows}")
+
+    try:
+        _write_sketches(path, store, sha256, rows, _rows_digest(*columns, rows))
+    except Exception as e:
+        logger.warning(f"No se pudieron escribir los sketches de distancia: {e}")
+    return store
@@ -0,0 +1,268 @@
+"""
+AlvGolf — Synthetic Data
+=========================
+Datos sintéticos realistas para pruebas de escala del generador del
+dashboard: golpes FlightScope (frame canónico) y Tarjetas de Recorridos
+(mismo formato que tarjetas_parser), en memoria o como workbooks Excel
+con la plantilla real.
+
+Escala 1× = dataset real de referencia (~497 golpes, 52 rondas, 11 campos).
+El jugador mejora con el tiempo (scores y dispersión bajan ligeramente)
+para que las secciones de tendencia, rachas y milestones tengan señal.
+
+Uso:
+    from app.synthetic_data import synthesize_shots, synthesize_tarjetas
+    shots = synthesize_shots(50_000, seed=1)
+    tarjetas = synthesize_tarjetas(5_000, seed=1)
+
+Autor: AlvGolf / Álvaro Peralta
+Versión: 1.0.0
+"""
+
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.flightscope_snapshot import CANONICAL_COLUMNS, MAIN_SHEET, add_derived_columns
+from app.tarjetas_parser import (
+    COL_DIF_PAR, COL_FECHA, COL_TOTAL, COL_TOTAL_IDA, COL_TOTAL_VUELTA,
+    COLS_IDA, COLS_VUELTA, FIRST_ROUND_ROW, N_COLS, ROW_PAR,
+)
+
+
+# ── Escala de referencia (dataset real) ──────────────────────────────────────
+
+BASE_SHOTS = 497
+BASE_ROUNDS = 52
+BASE_COURSES = 11
+DEFAULT_START = '2024-04-01'
+DEFAULT_MONTHS = 20
+
+# Perfil por palo: (carry medio m, σ carry, lateral σ m, launch °, altura m)
+CLUB_PROFILES = {
+    'Dr':    (212.0, 18.0, 16.0, 12.5, 28.0),
+    '3W':    (200.0, 15.0, 13.0, 11.5, 25.0),
+    'Hyb':   (160.0, 12.0, 11.0, 14.0, 24.0),
+    '5i':    (148.0, 11.0, 12.0, 14.5, 23.0),
+    '6i':    (135.0, 10.0, 10.0, 16.0, 23.0),
+    '7i':    (130.0, 9.0, 9.0, 17.5, 22.0),
+    '8i':    (119.0, 8.0, 8.0, 19.0, 21.0),
+    '9i':    (108.0, 8.0, 7.0, 21.0, 20.0),
+    'PW':    (95.0, 7.0, 6.0, 24.0, 19.0),
+    'GW 52': (80.0, 6.0, 5.0, 27.0, 17.0),
+    'SW 58': (65.0, 6.0, 5.0, 30.0, 15.0),
+}
+
+# Reparto de golpes por palo (≈ sesiones reales: más driver y hierros medios)
+DEFAULT_CLUB_MIX = {
+    'Dr': 0.20, '3W': 0.06, 'Hyb': 0.06, '5i': 0.06, '6i': 0.06, '7i': 0.10,
+    '8i': 0.08, '9i': 0.08, 'PW': 0.12, 'GW 52': 0.08, 'SW 58': 0.10,
+}
+
+# Campos: (nombre, VC, slope, par_total)
+COURSES = [
+    ('LA DEHESA', 71.2, 131, 72), ('VALLE DEL ESTE', 70.4, 128, 72), ('MARINA GOLF', 69.8, 125, 71),
+    ('GOLF EL ROMPIDO CAMPO NORTE', 71.9, 133, 72), ('DESERT SPRINGS', 70.1, 127, 72),
+    ('NUEVO PORTIL', 72.3, 135, 72), ('RFEG', 70.0, 126, 72), ('LA FAISANERA', 68.9, 121, 70),
+    ('REAL CLUB LAS ROZAS MADRID', 71.5, 132, 72), ('CIUDAD FINANCIERA SANTANDER', 69.5, 124, 71),
+    ('PALOMAREJOS GOLF', 70.8, 129, 72),
+]
+
+
+# ══════════════════════════════════════════════════════════════
+# HELPERS
+# ══════════════════════════════════════════════════════════════
+
+def _random_dates(rng: np.random.Generator, n: int, start: str, months: int) -> pd.DatetimeIndex:
+    """Fechas uniformes en [start, start + months), ordenadas."""
+    start_ts = pd.Timestamp(start)
+    span_days = max(1, (start_ts + pd.DateOffset(months=months) - start_ts).days)
+    offsets = np.sort(rng.integers(0, span_days, n))
+    return start_ts + pd.to_timedelta(offsets, unit='D')
+
+
+def _lateral_text(values: np.ndarray) -> np.ndarray:
+    """Metros con signo → texto FlightScope ("12.3 I", "8.0 D", "0.0 C")."""
+    side = np.where(values < -0.05, ' I', np.where(values > 0.05, ' D', ' C'))
+    magnitude = np.char.mod('%.1f', np.abs(values))
+    return np.char.add(magnitude, side).astype(object)
+
+
+# ══════════════════════════════════════════════════════════════
+# SHOTS
+# ══════════════════════════════════════════════════════════════
+
+def synthesize_shots(n_shots: int = BASE_SHOTS, club_mix: Optional[Dict[str, float]] = None,
+                     start: str = DEFAULT_START, months: int = DEFAULT_MONTHS,
+                     seed: int = 0) -> pd.DataFrame:
+    """Frame canónico de golpes FlightScope (CANONICAL_COLUMNS + derivadas).
+
+    Args:
+        n_shots: Nº de golpes
+        club_mix: {palo: peso} (default DEFAULT_CLUB_MIX; se normaliza)
+        start: Fecha del primer golpe
+        months: Meses que cubren los golpes
+        seed: Semilla del generador aleatorio
+
+    Returns:
+        DataFrame listo para DashboardDataGenerator.set_flightscope_frame()
+    """
+    rng = np.random.default_rng(seed)
+    mix = club_mix or DEFAULT_CLUB_MIX
+    clubs = [c for c in mix if c in CLUB_PROFILES]
+    weights = np.array([mix[c] for c in clubs], dtype=np.float64)
+    weights /= weights.sum()
+
+    club_idx = rng.choice(len(clubs), size=n_shots, p=weights)
+    profile = np.array([CLUB_PROFILES[c] for c in clubs], dtype=np.float64)[club_idx]
+    fechas = _random_dates(rng, n_shots, start, months)
+
+    # Progreso: +3% carry y −20% dispersión de principio a fin
+    progress = np.linspace(0.0, 1.0, n_shots)
+    carry = profile[:, 0] * (0.985 + 0.03 * progress) + rng.normal(0, 1, n_shots) * profile[:, 1]
+    carry = np.round(np.clip(carry, 5.0, None), 1)
+    lateral = rng.normal(0, 1, n_shots) * profile[:, 2] * (1.0 - 0.2 * progress) - 2.0   # ligero sesgo a la izquierda
+    launch = np.round(profile[:, 3] + rng.normal(0, 2.0, n_shots), 1)
+    height = np.round(np.clip(profile[:, 4] + rng.normal(0, 3.0, n_shots), 1.0, None), 1)
+    ball_speed = np.round(carry * 0.72 + 65 + rng.normal(0, 4.0, n_shots), 1)
+    direction = rng.normal(0, 3.0, n_shots)
+
+    # ~2% de golpes sin lectura de vuelo (como en los exports reales)
+    missing = rng.random(n_shots) < 0.02
+    carry = np.where(missing, np.nan, carry)
+
+    df = pd.DataFrame({
+        'fecha': fechas,
+        'palo': np.array(clubs, dtype=object)[club_idx],
+        'vuelo_act': carry,
+        'vuelo_total': np.round(carry + np.abs(rng.normal(8, 4, n_shots)), 1),
+        'velocidad_bola': ball_speed,
+        'altura': height,
+        'ang_lanzamiento': launch,
+        'dir_lanzamiento': _lateral_text(direction),
+        'lateral_vuelo': _lateral_text(lateral),
+    }, columns=CANONICAL_COLUMNS)
+    return add_derived_columns(df)
+
+
+# ══════════════════════════════════════════════════════════════
+# TARJETAS
+# ══════════════════════════════════════════════════════════════
+
+def synthesize_tarjetas(n_rounds: int = BASE_ROUNDS, n_courses: int = BASE_COURSES,
+                        start: str = DEFAULT_START, months: int = DEFAULT_MONTHS,
+                        seed: int = 0) -> Dict[str, dict]:
+    """Tarjetas sintéticas en el formato de tarjetas_parser ({campo: campo_data}).
+
+    Args:
+        n_rounds: Nº total de rondas (repartidas entre campos, con favoritos)
+        n_courses: Nº de campos (los primeros de COURSES; después "CAMPO N")
+        start: Fecha de la primera ronda
+        months: Meses que cubren las rondas
+        seed: Semilla del generador aleatorio
+
+    Returns:
+        Dict listo para DashboardDataGenerator.set_tarjetas_data()
+    """
+    rng = np.random.default_rng(seed + 1)
+    courses = [COURSES[i] if i < len(COURSES) else (f'CAMPO {i + 1}', 70.0, 126, 72)
+               for i in range(n_courses)]
+
+    # Campo favorito + cola larga (como el histórico real)
+    weights = 1.0 / np.arange(1, n_courses + 1)
+    weights /= weights.sum()
+    course_idx = rng.choice(n_courses, size=n_rounds, p=weights)
+    fechas = _random_dates(rng, n_rounds, start, months)
+
+    # Score medio baja ~10 golpes a lo largo del periodo (HCP 32 → 23)
+    progress = np.linspace(0.0, 1.0, n_rounds)
+    over_par = np.clip(np.rint(30 - 10 * progress + rng.normal(0, 5, n_rounds)), 4, None).astype(int)
+
+    tarjetas: Dict[str, dict] = {}
+    hole_pars = {}
+    for cid, (nombre, vc, slope, par_total) in enumerate(courses):
+        # Par 72 = 4 pares 3 + 4 pares 5; cada golpe menos convierte un par 5 en par 4
+        pars = np.full(18, 4)
+        special = rng.choice(18, 8, replace=False)
+        pars[special[:4]] = 3
+        pars[special[4:4 + max(0, 4 - (72 - par_total))]] = 5
+        hole_pars[cid] = pars
+        tarjetas[nombre] = {
+            'nombre': nombre,
+            'vc': vc,
+            'slope': slope,
+            'par_total': int(pars.sum()),
+            'par_ida': int(pars[:9].sum()),
+            'par_vuelta': int(pars[9:].sum()),
+            'metros_total': int(5600 + 25 * (pars.sum() - 70) + rng.integers(0, 400)),
+            'par_hoyos': pars.tolist(),
+            'rondas': [],
+        }
+
+    for i in range(n_rounds):
+        cid = int(course_idx[i])
+        pars = hole_pars[cid]
+        # Reparte los golpes sobre par entre hoyos (más en pares 5 y 4)
+        extra = rng.multinomial(over_par[i], (pars / pars.sum()))
+        holes = (pars + extra).astype(int)
+        ida, vuelta = holes[:9].tolist(), holes[9:].tolist()
+        total = int(holes.sum())
+        tarjetas[courses[cid][0]]['rondas'].append({
+            'fecha': fechas[i].strftime('%Y-%m-%d'),
+            'golpes_ida': ida,
+            'golpes_vuelta': vuelta,
+            'total_ida': sum(ida),
+            'total_vuelta': sum(vuelta),
+            'total_ronda': total,
+            'diferencia_par': total - int(pars.sum()),
+        })
+
+    return tarjetas
+
+
+# ══════════════════════════════════════════════════════════════
+# WORKBOOKS
+# ══════════════════════════════════════════════════════════════
+
+def write_flightscope_workbook(shots: pd.DataFrame, path) -> Path:
+    """Escribe el frame canónico como workbook FlightScope (hoja MAIN_SHEET)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pd.ExcelWriter(path) as writer:
+        shots[CANONICAL_COLUMNS].to_excel(writer, sheet_name=MAIN_SHEET, index=False)
+    return path
+
+
+def write_tarjetas_workbook(tarjetas: Dict[str, dict], path) -> Path:
+    """Escribe las tarjetas con la plantilla de hoja que lee tarjetas_parser."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pd.ExcelWriter(path) as writer:
+        for nombre, campo in tarjetas.items():
+            rondas = campo['rondas']
+            sheet = np.full((FIRST_ROUND_ROW + len(rondas), N_COLS), None, dtype=object)
+            sheet[1, 1] = 'VC'
+            sheet[2, 1] = campo['vc']
+            sheet[2, 24] = campo['metros_total']
+            sheet[3, 1] = 'SLOPE'
+            if campo.get('par_hoyos'):
+                sheet[ROW_PAR, COLS_IDA] = campo['par_hoyos'][:9]
+                sheet[ROW_PAR, COLS_VUELTA] = campo['par_hoyos'][9:]
+            sheet[ROW_PAR, COL_TOTAL_IDA] = campo['par_ida']
+            sheet[ROW_PAR, COL_TOTAL_VUELTA] = campo['par_vuelta']
+            sheet[ROW_PAR, COL_TOTAL] = campo['par_total']
+            sheet[4, 1] = campo['slope']
+            for i, r in enumerate(rondas):
+                row = FIRST_ROUND_ROW + i
+                sheet[row, COL_FECHA] = pd.Timestamp(r['fecha'])
+                sheet[row, COLS_IDA] = r['golpes_ida']
+                sheet[row, COL_TOTAL_IDA] = r['total_ida']
+                sheet[row, COLS_VUELTA] = r['golpes_vuelta']
+                sheet[row, COL_TOTAL_VUELTA] = r['total_vuelta']
+                sheet[row, COL_TOTAL] = r['total_ronda']
+                sheet[row, COL_DIF_PAR] = r['diferencia_par']
+            # Excel limita los nombres de hoja a 31 caracteres
+            pd.DataFrame(sheet).to_excel(writer, sheet_name=nombre[:31], header=False, index=False)
+    return path
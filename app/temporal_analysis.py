@@ -5,7 +5,9 @@ Análisis temporal de la identidad golfística usando ventanas deslizantes.
 Ejecuta ScoringEngine + ArchetypeClassifier por período para mostrar
 la evolución del arquetipo del jugador a lo largo de 18 meses.
 
-Ventana: 90 días de ancho, paso de 60 días.
+Ventana: 90 días de ancho, paso de 60 días (configurable, hasta 1 día).
+Golpes y rondas se ordenan una vez; límites de ventana por búsqueda
+binaria, momentos por palo incrementales y scoring en lote (score_many).
 Dimensiones computables: 6 de 8 (putting y mental quedan en 5.0 neutral).
 
 Autor: AlvGolf / Álvaro Peralta
@@ -13,12 +15,17 @@ Versión: 1.0.0
 """
 
 import math
-import statistics
+import re
+import sys
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 
+import numpy as np
+
 from app.scoring_engine import ScoringEngine, ScoringResult
 from app.archetype_classifier import ArchetypeClassifier, ArchetypeResult
+from app.columnar import rows
 
 
 # ══════════════════════════════════════════════════════════════
@@ -51,58 +58,65 @@ _HCP_DATES = [datetime.strptime(d, "%Y-%m-%d") for d, _ in _HCP_TIMELINE]
 _HCP_VALUES = [v for _, v in _HCP_TIMELINE]
 
 
-def _interpolate_hcp(target_date: datetime) -> float:
-    """Interpolación lineal del HCP para una fecha dada."""
-    if target_date <= _HCP_DATES[0]:
-        return _HCP_VALUES[0]
-    if target_date >= _HCP_DATES[-1]:
-        return _HCP_VALUES[-1]
+class _HcpSeries:
+    """Serie (fecha, HCP) con interpolación lineal por búsqueda binaria."""
 
-    for i in range(len(_HCP_DATES) - 1):
-        if _HCP_DATES[i] <= target_date <= _HCP_DATES[i + 1]:
-            span = (_HCP_DATES[i + 1] - _HCP_DATES[i]).days
-            pos = (target_date - _HCP_DATES[i]).days
-            ratio = pos / span if span > 0 else 0
-            return round(_HCP_VALUES[i] + ratio * (_HCP_VALUES[i + 1] - _HCP_VALUES[i]), 1)
+    def __init__(self, dates: List[datetime], values: list):
+        self.dates = dates
+        self.values = values
+        # Fechas desordenadas: se mantiene el recorrido lineal original
+        self.ordered = all(a <= b for a, b in zip(dates, dates[1:]))
 
-    return _HCP_VALUES[-1]
+    def at(self, target_date: datetime) -> float:
+        dates, values = self.dates, self.values
+        if target_date <= dates[0]:
+            return values[0]
+        if target_date >= dates[-1]:
+            return values[-1]
 
+        candidates = [bisect_left(dates, target_date) - 1] if self.ordered else range(len(dates) - 1)
+        for i in candidates:
+            if dates[i] <= target_date <= dates[i + 1]:
+                span = (dates[i + 1] - dates[i]).days
+                pos = (target_date - dates[i]).days
+                ratio = pos / span if span > 0 else 0
+                return round(values[i] + ratio * (values[i + 1] - values[i]), 1)
 
-def _interpolate_hcp_from_data(target_date: datetime, hcp_data: dict) -> float:
-    """Interpolación HCP usando datos del JSON (hcp_trajectory.historical).
-    Falls back to hardcoded timeline if data not available."""
+        return values[-1]
+
+
+_HCP_SERIES = _HcpSeries(_HCP_DATES, _HCP_VALUES)
+
+
+def _interpolate_hcp(target_date: datetime) -> float:
+    """Interpolación lineal del HCP para una fecha dada."""
+    return _HCP_SERIES.at(target_date)
+
+
+def _hcp_series(hcp_data: dict) -> _HcpSeries:
+    """Serie HCP de hcp_trajectory.historical, o el timeline fijo si no hay datos."""
     labels = hcp_data.get("labels", [])
     values = hcp_data.get("values", [])
 
     if not labels or not values:
-        return _interpolate_hcp(target_date)
+        return _HCP_SERIES
 
     dates = []
     for label in labels:
         try:
-            dt = datetime.strptime(f"15 {label}", "%d %b %Y")
-            dates.append(dt)
+            dates.append(datetime.strptime(f"15 {label}", "%d %b %Y"))
         except ValueError:
             continue
 
     if not dates:
-        return _interpolate_hcp(target_date)
-
-    hcp_vals = values[:len(dates)]
+        return _HCP_SERIES
+    return _HcpSeries(dates, values[:len(dates)])
 
-    if target_date <= dates[0]:
-        return hcp_vals[0]
-    if target_date >= dates[-1]:
-        return hcp_vals[-1]
 
-    for i in range(len(dates) - 1):
-        if dates[i] <= target_date <= dates[i + 1]:
-            span = (dates[i + 1] - dates[i]).days
-            pos = (target_date - dates[i]).days
-            ratio = pos / span if span > 0 else 0
-            return round(hcp_vals[i] + ratio * (hcp_vals[i + 1] - hcp_vals[i]), 1)
-
-    return hcp_vals[-1]
+def _interpolate_hcp_from_data(target_date: datetime, hcp_data: dict) -> float:
+    """Interpolación HCP usando datos del JSON (hcp_trajectory.historical).
+    Falls back to hardcoded timeline if data not available."""
+    return _hcp_series(hcp_data).at(target_date)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -114,77 +128,162 @@ _DRIVER_CODES = {"Dr", "Driver"}
 _IRON7_CODES = {"7i", "7 Iron", "7Iron"}
 _PW_CODES = {"PW", "Pitching W"}
 
+# Series por ventana: (nombre, códigos de palo, campo del golpe)
+_SHOT_SERIES = (
+    ("dr_c", _DRIVER_CODES, "c"), ("dr_v", _DRIVER_CODES, "v"), ("dr_l", _DRIVER_CODES, "l"),
+    ("ir7_c", _IRON7_CODES, "c"), ("ir7_v", _IRON7_CODES, "v"), ("ir7_l", _IRON7_CODES, "l"),
+    ("pw_c", _PW_CODES, "c"), ("pw_l", _PW_CODES, "l"),
+)
 
-def _extract_period_metrics(
-    shots: List[dict],
-    rounds: List[dict],
-    player_hcp: float,
-) -> dict:
-    """Extrae métricas compatibles con ScoringEngine desde datos del período.
+_SQRT_BITS = 2 * sys.float_info.mant_dig + 3
+
+
+def _isqrt_of_frac_rto(n: int, m: int) -> int:
+    """Raíz entera de n / m con redondeo a impar."""
+    a = math.isqrt(n // m)
+    return a | (a * a * m != n)
+
+
+def _sqrt_of_frac(n: int, m: int) -> float:
+    """sqrt(n / m) correctamente redondeado (misma aritmética que statistics.stdev)."""
+    q = (n.bit_length() - m.bit_length() - _SQRT_BITS) // 2
+    if q >= 0:
+        return float(_isqrt_of_frac_rto(n, m << 2 * q) << q)
+    return _isqrt_of_frac_rto(n << -2 * q, m) / (1 << -q)
+
+
+class _SlidingMoments:
+    """
+    count, Σx y Σx² de una serie ordenada por fecha, en una ventana [lo, hi)
+    que se desliza sumando / restando solo los valores que entran o salen.
+
+    Los valores se guardan como enteros exactos (float × 2^K), así que
+    mean() y stdev() dan exactamente lo mismo que statistics.mean / stdev
+    sobre los valores de la ventana, sin acumular error al deslizar.
+    """
+
+    def __init__(self, values: list):
+        ratios = [float(v).as_integer_ratio() for v in values]
+        self.shift = max((d.bit_length() - 1 for _, d in ratios), default=0)
+        self.values = [n << (self.shift - d.bit_length() + 1) for n, d in ratios]
+        self.lo = self.hi = 0
+        self.n = self.s1 = self.s2 = 0
+
+    def _add(self, chunk: list, sign: int):
+        for x in chunk:
+            self.s1 += sign * x
+            self.s2 += sign * x * x
+        self.n += sign * len(chunk)
+
+    def move(self, lo: int, hi: int) -> "_SlidingMoments":
+        v = self.values
+        if hi > self.hi:
+            self._add(v[self.hi:hi], 1)
+        elif hi < self.hi:
+            self._add(v[hi:self.hi], -1)
+        if lo > self.lo:
+            self._add(v[self.lo:lo], -1)
+        elif lo < self.lo:
+            self._add(v[lo:self.lo], 1)
+        self.lo, self.hi = lo, hi
+        return self
+
+    def mean(self) -> float:
+        return self.s1 / (self.n << self.shift)
+
+    def stdev(self) -> float:
+        n = self.n
+        return _sqrt_of_frac(n * self.s2 - self.s1 * self.s1, n * (n - 1) << 2 * self.shift)
+
+
+def _period_metrics(shots_count: int, rounds_count: int, series: Dict[str, _SlidingMoments]) -> dict:
+    """Métricas compatibles con ScoringEngine desde los momentos de la ventana.
 
     Args:
-        shots: Golpes FlightScope en la ventana [{f, p, c, v, l}, ...]
-        rounds: Rondas de tarjetas en la ventana [{date, score, ...}, ...]
-        player_hcp: HCP interpolado para el período
+        shots_count: Golpes FlightScope en la ventana
+        rounds_count: Rondas de tarjetas en la ventana
+        series: Momentos por serie (_SHOT_SERIES + 'score') ya movidos a la ventana
 
     Returns:
-        Dict de métricas para ScoringEngine.score()
+        Dict de métricas para ScoringEngine.score() / score_many()
     """
     metrics = {}
-    metrics["rounds_count"] = len(rounds)
-    metrics["shots_count"] = len(shots)
+    metrics["rounds_count"] = rounds_count
+    metrics["shots_count"] = shots_count
 
     # ── Driver metrics ──────────────────────────────────────
-    dr_shots = [s for s in shots if s.get("p") in _DRIVER_CODES]
-    dr_carries = [s["c"] for s in dr_shots if s.get("c") is not None]
-    dr_speeds = [s["v"] for s in dr_shots if s.get("v") is not None]
-    dr_laterals = [s["l"] for s in dr_shots if s.get("l") is not None]
-
-    if dr_carries:
-        metrics["carry_driver_m"] = statistics.mean(dr_carries)
-        metrics["driver_shots_count"] = len(dr_carries)
-    if dr_speeds:
-        metrics["ball_speed_driver_kmh"] = statistics.mean(dr_speeds)
-    if len(dr_laterals) >= 3:
-        metrics["lateral_std_driver_m"] = statistics.stdev(dr_laterals) if len(dr_laterals) > 1 else abs(dr_laterals[0])
+    if series["dr_c"].n:
+        metrics["carry_driver_m"] = series["dr_c"].mean()
+        metrics["driver_shots_count"] = series["dr_c"].n
+    if series["dr_v"].n:
+        metrics["ball_speed_driver_kmh"] = series["dr_v"].mean()
+    if series["dr_l"].n >= 3:
+        metrics["lateral_std_driver_m"] = series["dr_l"].stdev()
 
     # ── 7 Iron metrics ──────────────────────────────────────
-    ir7_shots = [s for s in shots if s.get("p") in _IRON7_CODES]
-    ir7_carries = [s["c"] for s in ir7_shots if s.get("c") is not None]
-    ir7_speeds = [s["v"] for s in ir7_shots if s.get("v") is not None]
-    ir7_laterals = [s["l"] for s in ir7_shots if s.get("l") is not None]
-
-    if ir7_carries:
-        metrics["carry_7iron_m"] = statistics.mean(ir7_carries)
-        metrics["7iron_shots_count"] = len(ir7_carries)
-    if ir7_speeds:
-        metrics["ball_speed_7iron_kmh"] = statistics.mean(ir7_speeds)
-    if len(ir7_laterals) >= 3:
-        metrics["lateral_std_7iron_m"] = statistics.stdev(ir7_laterals) if len(ir7_laterals) > 1 else abs(ir7_laterals[0])
+    if series["ir7_c"].n:
+        metrics["carry_7iron_m"] = series["ir7_c"].mean()
+        metrics["7iron_shots_count"] = series["ir7_c"].n
+    if series["ir7_v"].n:
+        metrics["ball_speed_7iron_kmh"] = series["ir7_v"].mean()
+    if series["ir7_l"].n >= 3:
+        metrics["lateral_std_7iron_m"] = series["ir7_l"].stdev()
 
     # ── Pitching Wedge metrics ──────────────────────────────
-    pw_shots = [s for s in shots if s.get("p") in _PW_CODES]
-    pw_carries = [s["c"] for s in pw_shots if s.get("c") is not None]
-    pw_laterals = [s["l"] for s in pw_shots if s.get("l") is not None]
-
-    if pw_carries:
-        metrics["carry_pw_m"] = statistics.mean(pw_carries)
-        metrics["pw_shots_count"] = len(pw_carries)
-    if len(pw_laterals) >= 3:
-        metrics["lateral_std_pw_m"] = statistics.stdev(pw_laterals) if len(pw_laterals) > 1 else abs(pw_laterals[0])
+    if series["pw_c"].n:
+        metrics["carry_pw_m"] = series["pw_c"].mean()
+        metrics["pw_shots_count"] = series["pw_c"].n
+    if series["pw_l"].n >= 3:
+        metrics["lateral_std_pw_m"] = series["pw_l"].stdev()
 
     # ── Scoring stats from rounds ───────────────────────────
-    scores = [r["score"] for r in rounds if "score" in r]
-    if len(scores) >= 2:
-        metrics["score_mean"] = statistics.mean(scores)
-        metrics["score_std_dev"] = statistics.stdev(scores)
-    elif len(scores) == 1:
-        metrics["score_mean"] = scores[0]
+    if series["score"].n >= 2:
+        metrics["score_mean"] = series["score"].mean()
+        metrics["score_std_dev"] = series["score"].stdev()
+    elif series["score"].n == 1:
+        metrics["score_mean"] = series["score"].mean()
 
     # ── Power metrics (reuse driver speed) ──────────────────
     # ball_speed_driver_kmh already set above — used by _score_power()
 
-    return {k: v for k, v in metrics.items() if v is not None}
+    return metrics
+
+
+# ══════════════════════════════════════════════════════════════
+# DATES
+# ══════════════════════════════════════════════════════════════
+
+_EPOCH = datetime(1970, 1, 1)
+_NO_DATE = np.iinfo(np.int64).min
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+def _day_numbers(items: List[dict], key: str) -> np.ndarray:
+    """Fecha 'YYYY-MM-DD' de cada item → días desde epoch (int64; _NO_DATE si no parsea).
+
+    Ruta rápida con datetime64; si alguna fecha no tiene exactamente ese
+    formato se parsea todo con strptime, como antes.
+    """
+    raw = [item.get(key) for item in items]
+    if all(isinstance(d, str) and _DATE_RE.match(d) for d in raw):
+        try:
+            return np.array(raw, dtype="datetime64[D]").astype(np.int64)
+        except ValueError:
+            pass
+    days = np.full(len(raw), _NO_DATE, dtype=np.int64)
+    for i, d in enumerate(raw):
+        try:
+            days[i] = (datetime.strptime(d, "%Y-%m-%d") - _EPOCH).days
+        except (ValueError, TypeError):
+            continue
+    return days
+
+
+def _to_datetime(day: int) -> datetime:
+    return _EPOCH + timedelta(days=int(day))
+
+
+def _is_number(value) -> bool:
+    return value is not None and math.isfinite(value)
 
 
 # ══════════════════════════════════════════════════════════════
@@ -206,6 +305,28 @@ def _period_confidence(shots_count: int, rounds_count: int) -> str:
 # MAIN FUNCTION
 # ══════════════════════════════════════════════════════════════
 
+_MONTHS_ES = {
+    1: "Ene", 2: "Feb", 3: "Mar", 4: "Abr", 5: "May", 6: "Jun",
+    7: "Jul", 8: "Ago", 9: "Sep", 10: "Oct", 11: "Nov", 12: "Dic",
+}
+
+
+def _window_bounds(date_min: int, date_max: int, window_days: int, step_days: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(inicios, finales) de las ventanas en días desde epoch."""
+    first = date_min - window_days // 3  # Start earlier to capture first data
+    span = date_max + window_days // 2 - window_days - first
+    count = span // step_days + 1 if span >= 0 else 0
+    starts = first + step_days * np.arange(count, dtype=np.int64)
+    ends = starts + window_days
+
+    # Ensure last window always covers the most recent data
+    last_end = date_max + 1
+    if count == 0 or ends[-1] < last_end - step_days // 2:
+        starts = np.append(starts, last_end - window_days)
+        ends = np.append(ends, last_end)
+    return starts, ends
+
+
 def calculate_identity_timeline(
     dashboard_data: dict,
     window_days: int = 90,
@@ -213,130 +334,129 @@ def calculate_identity_timeline(
 ) -> List[dict]:
     """Ventana deslizante de identity analysis.
 
+    Los golpes y rondas se ordenan una vez por fecha; los límites de cada
+    ventana salen de una búsqueda binaria y las medias / desviaciones por
+    palo se mantienen de forma incremental al deslizar. Todas las ventanas
+    se puntúan con ScoringEngine.score_many, así que un paso de 1 día sobre
+    varios años de historial es viable. dashboard_data no se modifica.
+
     Args:
         dashboard_data: Complete dashboard_data.json dict
         window_days: Window width in days (default 90)
-        step_days: Step between windows in days (default 60)
+        step_days: Step between windows in days (default 60; any value ≥ 1)
 
     Returns:
         List of period dicts with archetype classification per window.
     """
+    if window_days < 1 or step_days < 1:
+        raise ValueError(f"window_days y step_days deben ser ≥ 1 (recibido {window_days}, {step_days})")
+
     engine = ScoringEngine()
     classifier = ArchetypeClassifier()
 
     # ── Extract data sources ────────────────────────────────
-    shots_timeline = dashboard_data.get("flightscope_shots_timeline", [])
-    rounds_raw = dashboard_data.get("score_history", {}).get("rounds", [])
-    hcp_historical = dashboard_data.get("hcp_trajectory", {}).get("historical", {})
-
-    # Parse dates
-    shots_with_dates = []
-    for s in shots_timeline:
-        try:
-            s["_dt"] = datetime.strptime(s["f"], "%Y-%m-%d")
-            shots_with_dates.append(s)
-        except (ValueError, KeyError):
-            continue
-
-    rounds_with_dates = []
-    for r in rounds_raw:
-        try:
-            r["_dt"] = datetime.strptime(r["date"], "%Y-%m-%d")
-            rounds_with_dates.append(r)
-        except (ValueError, KeyError):
-            continue
-
-    if not shots_with_dates and not rounds_with_dates:
+    # rows(): acepta arrays en schema v1 o columnas v2 (app/columnar.py)
+    shots_timeline = rows(dashboard_data.get("flightscope_shots_timeline"))
+    rounds_raw = rows(dashboard_data.get("score_history", {}).get("rounds"))
+    hcp_series = _hcp_series(dashboard_data.get("hcp_trajectory", {}).get("historical", {}))
+
+    # ── Sort once by date (datetime64 → días) ───────────────
+    shot_days = _day_numbers(shots_timeline, "f")
+    round_days = _day_numbers(rounds_raw, "date")
+    shot_idx = np.flatnonzero(shot_days != _NO_DATE)
+    round_idx = np.flatnonzero(round_days != _NO_DATE)
+    shot_idx = shot_idx[np.argsort(shot_days[shot_idx], kind="stable")]
+    round_idx = round_idx[np.argsort(round_days[round_idx], kind="stable")]
+    shot_days, round_days = shot_days[shot_idx], round_days[round_idx]
+
+    if not len(shot_days) and not len(round_days):
         return []
 
-    # ── Detect date range ───────────────────────────────────
-    all_dates = [s["_dt"] for s in shots_with_dates] + [r["_dt"] for r in rounds_with_dates]
-    date_min = min(all_dates)
-    date_max = max(all_dates)
-
     # ── Generate windows ────────────────────────────────────
-    windows = []
-    current_start = date_min - timedelta(days=window_days // 3)  # Start earlier to capture first data
-    while current_start + timedelta(days=window_days) <= date_max + timedelta(days=window_days // 2):
-        window_end = current_start + timedelta(days=window_days)
-        windows.append((current_start, window_end))
-        current_start += timedelta(days=step_days)
-
-    # Ensure last window always covers the most recent data
-    last_end = date_max + timedelta(days=1)
-    last_start = last_end - timedelta(days=window_days)
-    if not windows or windows[-1][1] < last_end - timedelta(days=step_days // 2):
-        windows.append((last_start, last_end))
-
-    # ── Process each window ─────────────────────────────────
-    timeline = []
-    for i, (w_start, w_end) in enumerate(windows):
-        # Filter data for this window
-        w_shots = [s for s in shots_with_dates if w_start <= s["_dt"] < w_end]
-        w_rounds = [r for r in rounds_with_dates if w_start <= r["_dt"] < w_end]
-
-        shots_count = len(w_shots)
-        rounds_count = len(w_rounds)
-
+    date_min = int(min(shot_days[:1].tolist() + round_days[:1].tolist()))
+    date_max = int(max(shot_days[-1:].tolist() + round_days[-1:].tolist()))
+    starts, ends = _window_bounds(date_min, date_max, window_days, step_days)
+
+    shots_lo = np.searchsorted(shot_days, starts, side="left")
+    shots_hi = np.searchsorted(shot_days, ends, side="left")
+    rounds_lo = np.searchsorted(round_days, starts, side="left")
+    rounds_hi = np.searchsorted(round_days, ends, side="left")
+
+    # ── Series por palo / campo (ordenadas por fecha) ───────
+    # Valores no finitos fuera: statistics daría NaN y el scoring fallaría
+    sorted_shots = [shots_timeline[i] for i in shot_idx.tolist()]
+    series_days: Dict[str, np.ndarray] = {}
+    series: Dict[str, _SlidingMoments] = {}
+    for name, codes, field in _SHOT_SERIES:
+        keep = [j for j, shot in enumerate(sorted_shots)
+                if shot.get("p") in codes and _is_number(shot.get(field))]
+        series_days[name] = shot_days[keep]
+        series[name] = _SlidingMoments([sorted_shots[j][field] for j in keep])
+    sorted_rounds = [rounds_raw[i] for i in round_idx.tolist()]
+    keep = [j for j, rnd in enumerate(sorted_rounds) if _is_number(rnd.get("score"))]
+    series_days["score"] = round_days[keep]
+    series["score"] = _SlidingMoments([sorted_rounds[j]["score"] for j in keep])
+    series_bounds = {
+        name: (np.searchsorted(days, starts, side="left").tolist(),
+               np.searchsorted(days, ends, side="left").tolist())
+        for name, days in series_days.items()
+    }
+
+    # ── Metrics per window ──────────────────────────────────
+    periods, metrics_rows = [], []
+    shots_counts = (shots_hi - shots_lo).tolist()
+    rounds_counts = (rounds_hi - rounds_lo).tolist()
+    for i, (w_start, shots_count, rounds_count) in enumerate(zip(starts.tolist(), shots_counts, rounds_counts)):
         # Skip empty periods
         confidence = _period_confidence(shots_count, rounds_count)
         if confidence == "NONE":
             continue
 
-        # Center date for labeling and HCP interpolation
-        date_center = w_start + timedelta(days=window_days // 2)
+        for name, moments in series.items():
+            lo, hi = series_bounds[name]
+            moments.move(lo[i], hi[i])
 
-        # Interpolate HCP
-        hcp_estimated = _interpolate_hcp_from_data(date_center, hcp_historical)
+        # Center date for labeling and HCP interpolation
+        date_center = _to_datetime(w_start + window_days // 2)
+        hcp_estimated = hcp_series.at(date_center)
 
-        # Extract metrics for this period
-        metrics = _extract_period_metrics(w_shots, w_rounds, hcp_estimated)
+        periods.append((i, date_center, hcp_estimated, shots_count, rounds_count, confidence))
+        metrics_rows.append(_period_metrics(shots_count, rounds_count, series))
 
-        # Run ScoringEngine
-        scoring_result = engine.score(
-            player_id="alvaro",
-            player_hcp=float(hcp_estimated),
-            metrics=metrics,
-        )
+    if not periods:
+        return []
 
-        # Run ArchetypeClassifier
-        archetype_result = classifier.classify(scoring_result)
-        arch = archetype_result.archetype
+    # ── Batch scoring + archetype per window ────────────────
+    batch = engine.score_many(
+        player_hcp=np.array([float(p[2]) for p in periods]),
+        metrics=metrics_rows,
+    )
 
-        # Build period label (e.g., "Abr 2024")
-        _MONTHS_ES = {
-            1: "Ene", 2: "Feb", 3: "Mar", 4: "Abr", 5: "May", 6: "Jun",
-            7: "Jul", 8: "Ago", 9: "Sep", 10: "Oct", 11: "Nov", 12: "Dic",
-        }
-        period_label = f"{_MONTHS_ES[date_center.month]} {date_center.year}"
+    archetypes = classifier.classify_many(batch)
 
-        # Is this the last (current) period?
-        is_current = (i == len(windows) - 1) or (w_end >= date_max)
+    timeline = []
+    for row, (i, date_center, hcp_estimated, shots_count, rounds_count, confidence) in enumerate(periods):
+        arch = archetypes.archetype(row)
 
         # Dimension scores dict
-        dimensions = scoring_result.scores_as_dict()
-        dimensions.pop("overall", None)
-
-        # Top strength and gap
-        ranking = scoring_result.dimensions_by_score()
-        top_strength = ranking[0][0] if ranking else "unknown"
-        top_gap = ranking[-1][0] if ranking else "unknown"
+        dimensions = batch.scores_as_dict(row)
+        overall_score = dimensions.pop("overall")
 
         timeline.append({
-            "period_label": period_label,
+            "period_label": f"{_MONTHS_ES[date_center.month]} {date_center.year}",
             "date_center": date_center.strftime("%Y-%m-%d"),
-            "date_start": w_start.strftime("%Y-%m-%d"),
-            "date_end": w_end.strftime("%Y-%m-%d"),
+            "date_start": _to_datetime(starts[i]).strftime("%Y-%m-%d"),
+            "date_end": _to_datetime(ends[i]).strftime("%Y-%m-%d"),
             "shots_count": shots_count,
             "rounds_count": rounds_count,
             "hcp_estimated": hcp_estimated,
             "archetype_id": arch.id,
             "archetype_name": arch.name_es,
             "archetype_family": arch.id[0],
-            "overall_score": scoring_result.overall_score,
+            "overall_score": overall_score,
             "dimensions": dimensions,
-            "top_strength": top_strength,
-            "top_gap": top_gap,
+            "top_strength": archetypes.strength_dim(row),
+            "top_gap": archetypes.gap_dim(row),
             "confidence": confidence,
             "is_current": False,  # Will set last one below
         })
@@ -366,10 +486,4 @@ def calculate_identity_timeline(
             last["top_strength"] = ranking[0][0] if ranking else last["top_strength"]
             last["top_gap"] = ranking[-1][0] if ranking else last["top_gap"]
 
-    # Clean up temporary _dt fields
-    for s in shots_with_dates:
-        s.pop("_dt", None)
-    for r in rounds_with_dates:
-        r.pop("_dt", None)
-
     return timeline
@@ -6,16 +6,187 @@
 // Variable global para almacenar los datos
 window.dashboardData = null;
 
+/**
+ * Schema v2 (columnar, generate_dashboard_data.py --schema 2)
+ * Espejo de app/columnar.py: bloques {_length, _columns} → arrays de objetos
+ */
+const COLUMNAR_PATHS = [
+    ['flightscope_shots_timeline'],
+    ['score_history', 'rounds'],
+    ['dispersion_by_club', '*', '*'],
+    ['momentum_indicators'],
+];
+
+function decodeColumn(column) {
+    if (Array.isArray(column)) return column;
+    if (column.delta_days) {
+        let t = Date.parse(column.start + 'T00:00:00Z');
+        return column.delta_days.map(d => { t += d * 86400000; return new Date(t).toISOString().slice(0, 10); });
+    }
+    if (column.codes) return column.codes.map(c => column.dict[c]);
+    throw new Error('Columna v2 desconocida: ' + Object.keys(column).join(','));
+}
+
+function decodeColumnarBlock(block) {
+    const names = Object.keys(block._columns);
+    const columns = names.map(name => decodeColumn(block._columns[name]));
+    const rows = new Array(block._length);
+    for (let i = 0; i < block._length; i++) {
+        const row = {};
+        for (let j = 0; j < names.length; j++) row[names[j]] = columns[j][i];
+        rows[i] = row;
+    }
+    return rows;
+}
+
+/** Decodifica in situ los bloques columnares (v2) de data; v1 queda igual. */
+function decodeColumnarDashboard(data) {
+    function walk(node, path) {
+        if (!node || typeof node !== 'object') return node;
+        if (path.length === 0) return node._columns ? decodeColumnarBlock(node) : node;
+        if (Array.isArray(node)) return node;
+        const [head, ...rest] = path;
+        for (const key of (head === '*' ? Object.keys(node) : [head])) {
+            if (key in node) node[key] = walk(node[key], rest);
+        }
+        return node;
+    }
+    COLUMNAR_PATHS.forEach(path => walk(data, path));
+    if (data.metadata) delete data.metadata.schema_version;
+    return data;
+}
+
+/**
+ * Carga el manifest de shards (generate_dashboard_data.py --shards), si existe
+ * y corresponde al dashboard_data.json actual (mismo content_hash que
+ * output/dashboard_version.json); si no, null → JSON completo.
+ */
+async function loadDashboardManifest() {
+    try {
+        const [response, versionResponse] = await Promise.all([
+            fetch('output/dashboard_manifest.json', { cache: 'no-store' }),
+            fetch('output/dashboard_version.json', { cache: 'no-store' }).catch(() => null),
+        ]);
+        if (!response.ok) return null;
+        const manifest = await response.json();
+        if (versionResponse?.ok) {
+            const version = await versionResponse.json();
+            if (version.content_hash !== manifest.content_hash) {
+                console.warn('⚠️ Manifest de shards desfasado respecto a dashboard_data.json, cargando JSON completo');
+                return null;
+            }
+        }
+        return { manifest, base: response.url };
+    } catch (error) {
+        return null;
+    }
+}
+
+/**
+ * Carga varios shards y devuelve sus claves fusionadas
+ */
+async function loadDashboardShards(found, names) {
+    const parts = await Promise.all(names.map(async name => {
+        const response = await fetch(new URL(found.manifest.shards[name].url, found.base));
+        if (!response.ok) {
+            throw new Error(`Shard ${name}: HTTP error! status: ${response.status}`);
+        }
+        return response.json();
+    }));
+    return Object.assign({}, ...parts);
+}
+
+/**
+ * Aplica un JSON-Patch (RFC 6902: add / remove / replace) sobre doc
+ */
+function applyJsonPatch(doc, ops) {
+    for (const op of ops) {
+        if (op.op === 'test') continue;
+        if (op.path === '') { doc = op.value; continue; }
+        const tokens = op.path.split('/').slice(1).map(t => t.replace(/~1/g, '/').replace(/~0/g, '~'));
+        const last = tokens.pop();
+        let parent = doc;
+        for (const t of tokens) parent = parent[Array.isArray(parent) ? Number(t) : t];
+        if (parent == null || typeof parent !== 'object') throw new Error('Ruta inválida en el patch: ' + op.path);
+        if (Array.isArray(parent)) {
+            const i = last === '-' ? parent.length : Number(last);
+            if (op.op === 'add') parent.splice(i, 0, op.value);
+            else if (op.op === 'replace') parent[i] = op.value;
+            else if (op.op === 'remove') parent.splice(i, 1);
+            else throw new Error('Op no soportada: ' + op.op);
+        } else if (op.op === 'add' || op.op === 'replace') parent[last] = op.value;
+        else if (op.op === 'remove') delete parent[last];
+        else throw new Error('Op no soportada: ' + op.op);
+    }
+    return doc;
+}
+
+/**
+ * Actualiza data (metadata.snapshot_version = N) a la última versión con los
+ * patches de output/snapshots/ (generate_dashboard_data.py --snapshots).
+ * Devuelve null si N ya no está en el anillo: hay que cargar el JSON completo.
+ */
+async function loadDashboardChanges(data) {
+    const since = data?.metadata?.snapshot_version;
+    if (since == null) return null;
+    try {
+        const response = await fetch('output/snapshots/index.json', { cache: 'no-store' });
+        if (!response.ok) return null;
+        const index = await response.json();
+        if (index.latest == null || !index.snapshots.some(e => e.version === since)) return null;
+
+        const entries = index.snapshots.filter(e => e.version > since);
+        if (entries.some(e => !e.patch)) return null;
+        const patches = await Promise.all(entries.map(async e => {
+            const res = await fetch(new URL(e.patch, response.url), { cache: 'no-store' });
+            if (!res.ok) throw new Error(`Patch v${e.version}: HTTP error! status: ${res.status}`);
+            return res.json();
+        }));
+        return patches.reduce(applyJsonPatch, data);
+    } catch (error) {
+        console.warn('⚠️ Patches no aplicables:', error.message);
+        return null;
+    }
+}
+
 /**
  * Carga los datos del JSON
+ *
+ * Con datos ya cargados de una versión del anillo de snapshots: solo
+ * descarga los patches hasta la última versión.
+ * Con manifest: devuelve los shards de Tab 1 y descarga el resto en segundo
+ * plano (evento 'dashboardShardsLoaded' cuando window.dashboardData está completo).
  */
 async function loadDashboardData() {
     try {
+        const patched = await loadDashboardChanges(window.dashboardData);
+        if (patched) {
+            window.dashboardData = patched;
+            console.log('✅ Datos del dashboard actualizados con patches (v' + patched.metadata.snapshot_version + ')');
+            return window.dashboardData;
+        }
+
+        const found = await loadDashboardManifest();
+        if (found) {
+            const first = found.manifest.first || [];
+            const rest = Object.keys(found.manifest.shards).filter(name => !first.includes(name));
+            const restData = loadDashboardShards(found, rest);
+            window.dashboardData = decodeColumnarDashboard(await loadDashboardShards(found, first));
+            console.log('✅ Shards de Tab 1 cargados:', first.join(', '));
+
+            restData.then(data => {
+                Object.assign(window.dashboardData, decodeColumnarDashboard(data));
+                console.log('✅ Shards restantes cargados:', rest.join(', '));
+                document.dispatchEvent(new CustomEvent('dashboardShardsLoaded', { detail: window.dashboardData }));
+            }).catch(error => console.error('❌ Error cargando shards:', error));
+            return window.dashboardData;
+        }
+
         const response = await fetch('output/dashboard_data.json');
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
-        window.dashboardData = await response.json();
+        window.dashboardData = decodeColumnarDashboard(await response.json());
         console.log('✅ Datos del dashboard cargados exitosamente');
         console.log('📊 Datos disponibles:', window.dashboardData);
         return window.dashboardData;
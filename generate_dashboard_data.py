@@ -5,7 +5,6 @@ Incluye análisis avanzados de Fase 5: Launch Metrics, Dispersion, Consistency.
 """
 
 import pandas as pd
-import json
 from pathlib import Path
 from datetime import datetime
 import numpy as np
@@ -26,6 +25,30 @@ except ImportError as e:
     DispersionAnalyzer = None
     ConsistencyAnalyzer = None
 
+from app.flightscope_snapshot import add_derived_columns, load_shot_frame, phase5_frame, phase5_view
+from app.tarjetas_parser import parse_tarjetas_workbook
+from app.rounds_table import RoundsTable
+from app.round_milestones import RoundMilestones
+from app.rolling_stats import RollingStats, Windows
+from app.trend_fit import fit_line, fit_lines
+from app.hole_stats import course_hole_stats
+from app.quantiles import DEFAULT_QUANTILES, SKETCH_MIN_VALUES, SketchStore, grouped_quantiles
+from app.sketch_snapshot import add_distance_shots, distance_columns, load_distance_sketches
+from app.handicap import (
+    LEGACY_FACTOR, WHS_BEST, WHS_WINDOW, legacy_lowest, rolling_index, score_differentials,
+)
+from app.shot_pivot import MonthlyClubPivot
+from app.shot_density import density_grid, encode_grid, grid_spec
+from app.section_graph import Section, SectionGraph
+from app.section_cache import (
+    SectionCache, code_digest, frame_digest, json_digest, section_fingerprints, source_digest,
+)
+from app.dashboard_output import load_dashboard_json, write_dashboard_json
+from app.dashboard_shards import clear_shards, write_shards, write_version
+from app.columnar import SCHEMA_V1, SCHEMA_V2, encode_dashboard
+from app.dashboard_snapshots import SnapshotStore
+from app.benchmarks import CLUB_CARRY_BENCHMARKS, PGA_LEVEL, REGISTRY, benchmark
+
 # Configurar logger
 logger.add("logs/dashboard_generation.log", rotation="10 MB", level="DEBUG")
 
@@ -33,7 +56,9 @@ logger.add("logs/dashboard_generation.log", rotation="10 MB", level="DEBUG")
 class DashboardDataGenerator:
     """Genera datos del dashboard desde archivos Excel."""
 
-    def __init__(self, flightscope_path, tarjetas_path, output_path):
+    def __init__(self, flightscope_path, tarjetas_path, output_path, cache_dir=None, max_workers=None,
+                 use_cache=True, compact_json=False, shards=False, schema_version=SCHEMA_V1,
+                 snapshots=False, simulate=0):
         """
         Inicializa el generador.
 
@@ -41,101 +66,90 @@ class DashboardDataGenerator:
             flightscope_path: Ruta al archivo Excel de FlightScope
             tarjetas_path: Ruta al archivo Excel de Tarjetas de Recorridos
             output_path: Ruta donde guardar el JSON generado
+            cache_dir: Directorio de snapshots (default data/cache/)
+            max_workers: Threads para ejecutar secciones (1 = secuencial)
+            use_cache: Reutilizar secciones cuya huella de inputs no cambió
+            compact_json: JSON sin indentación (por defecto indent=2)
+            shards: Escribir además un shard por tab + dashboard_manifest.json
+            schema_version: 1 = arrays de objetos; 2 = arrays grandes en columnas (app/columnar.py)
+            snapshots: Guardar la versión en output/snapshots/ + JSON-Patch desde la anterior
+            simulate: Muestras Monte Carlo de estabilidad del arquetipo (0 = sin simulación)
         """
         self.flightscope_path = Path(flightscope_path)
         self.tarjetas_path = Path(tarjetas_path)
         self.output_path = Path(output_path)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_workers = max_workers
+        self.compact_json = compact_json
+        self.shards = shards
+        self.schema_version = schema_version
+        self.snapshots = snapshots
+        self.simulate = simulate
 
         self.flightscope_df = None
         self.tarjetas_data = {}
         self.dashboard_data = {}
+        self._rounds = None
+        self._round_milestones = None
+        self._player_stats = None
+        self._shot_pivot = None
+        self._workbook_sheets = None
+        self._phase5_df = None
+        self._distance_sketches = None
+        self._sketch_workbook = None
+        self.section_results = {}
+        self.section_timings = {}
+        self.section_cache = SectionCache(cache_dir) if use_cache else None
+        self.section_status = {}
+        self._input_digests = None
+        self._code_digests = None
 
     def load_flightscope_data(self):
         """Carga y procesa datos de FlightScope."""
         logger.info(f"Cargando datos de FlightScope desde: {self.flightscope_path}")
 
-        self.flightscope_df = pd.read_excel(self.flightscope_path)
+        # Frame canónico: se parsea una vez por versión del workbook (snapshot .npz)
+        shots = load_shot_frame(self.flightscope_path, cache_dir=self.cache_dir)
+        self.set_flightscope_frame(shots)
+        self._workbook_sheets = shots.attrs.get('sheets')
+        self._sketch_workbook = self.flightscope_path   # sketches persistidos junto al snapshot
 
-        # Renombrar columnas para facilitar el procesamiento
-        self.flightscope_df.columns = [
-            'fecha', 'palo', 'vuelo_act', 'vuelo_total', 'velocidad_bola',
-            'altura', 'ang_lanzamiento', 'dir_lanzamiento', 'lateral_vuelo'
-        ]
+        logger.success(f"FlightScope cargado: {len(self.flightscope_df)} registros")
 
-        # Convertir fecha a datetime
-        self.flightscope_df['fecha'] = pd.to_datetime(self.flightscope_df['fecha'])
+    def set_flightscope_frame(self, shots):
+        """Usa un frame canónico de golpes ya en memoria (CANONICAL_COLUMNS).
 
-        logger.success(f"FlightScope cargado: {len(self.flightscope_df)} registros")
+        Añade las columnas derivadas si faltan e invalida los intermedios
+        que dependen de los golpes.
+        """
+        if 'lateral_m' not in shots.columns:
+            shots = add_derived_columns(shots.copy())
+        self.flightscope_df = shots
+        self._workbook_sheets = None   # frame en memoria: Fase 5 usa su vista
+        self._phase5_df = None
+        self._shot_pivot = None
+        self._distance_sketches = None
+        self._sketch_workbook = None
+        self._input_digests = None
 
     def load_tarjetas_data(self):
         """Carga datos de todas las hojas de Tarjetas de Recorridos."""
         logger.info(f"Cargando tarjetas desde: {self.tarjetas_path}")
 
-        # Leer todas las hojas del Excel
-        excel_file = pd.ExcelFile(self.tarjetas_path)
-
-        for sheet_name in excel_file.sheet_names:
-            logger.debug(f"Procesando hoja: {sheet_name}")
-            df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
-
-            # Extraer metadatos del campo (primeras filas)
-            # Fila 1: VC en columna 1
-            # Fila 2: Valor de VC (66.4, etc.) en columna 1, metros y totales
-            # Fila 3: SLOPE en columna 1, PAR y valores
-            # Fila 4: Valor de SLOPE (126, etc.) en columna 1
-
-            vc_val = df.iloc[2, 1]
-            slope_val = df.iloc[4, 1]
-
-            campo_data = {
-                'nombre': sheet_name.strip(),
-                'vc': float(vc_val) if pd.notna(vc_val) and vc_val != 'SLOPE' else None,
-                'slope': int(slope_val) if pd.notna(slope_val) and isinstance(slope_val, (int, float)) else None,
-                'par_total': int(df.iloc[3, 24]) if pd.notna(df.iloc[3, 24]) else None,
-                'par_ida': int(df.iloc[3, 13]) if pd.notna(df.iloc[3, 13]) else None,
-                'par_vuelta': int(df.iloc[3, 23]) if pd.notna(df.iloc[3, 23]) else None,
-                'metros_total': int(df.iloc[2, 24]) if pd.notna(df.iloc[2, 24]) else None,
-                'rondas': []
-            }
-
-            # Extraer rondas (desde fila 7 en adelante)
-            for i in range(7, len(df)):
-                fecha_cell = df.iloc[i, 3]
-
-                # Verificar si hay una fecha válida
-                if pd.isna(fecha_cell):
-                    continue
-
-                try:
-                    fecha = pd.to_datetime(fecha_cell)
-                except:
-                    continue
-
-                # Extraer golpes por hoyo
-                golpes_ida = [int(df.iloc[i, j]) if pd.notna(df.iloc[i, j]) else 0 for j in range(4, 13)]
-                golpes_vuelta = [int(df.iloc[i, j]) if pd.notna(df.iloc[i, j]) else 0 for j in range(14, 23)]
-
-                total_ida = int(df.iloc[i, 13]) if pd.notna(df.iloc[i, 13]) else sum(golpes_ida)
-                total_vuelta = int(df.iloc[i, 23]) if pd.notna(df.iloc[i, 23]) else sum(golpes_vuelta)
-                total_ronda = int(df.iloc[i, 24]) if pd.notna(df.iloc[i, 24]) else total_ida + total_vuelta
-                diferencia_par = int(df.iloc[i, 25]) if pd.notna(df.iloc[i, 25]) else total_ronda - campo_data['par_total']
-
-                ronda = {
-                    'fecha': fecha.strftime('%Y-%m-%d'),
-                    'golpes_ida': golpes_ida,
-                    'golpes_vuelta': golpes_vuelta,
-                    'total_ida': total_ida,
-                    'total_vuelta': total_vuelta,
-                    'total_ronda': total_ronda,
-                    'diferencia_par': diferencia_par
-                }
+        # Parser por bloques (numpy), secuencial — ver app/tarjetas_parser.py
+        self.set_tarjetas_data(parse_tarjetas_workbook(self.tarjetas_path))
 
-                campo_data['rondas'].append(ronda)
+        logger.success(f"Tarjetas cargadas: {len(self.tarjetas_data)} campos")
 
-            self.tarjetas_data[sheet_name.strip()] = campo_data
-            logger.debug(f"  {sheet_name}: {len(campo_data['rondas'])} rondas")
+    def set_tarjetas_data(self, tarjetas_data):
+        """Usa tarjetas ya en memoria ({campo: campo_data}, formato de tarjetas_parser)."""
+        self.tarjetas_data = tarjetas_data
 
-        logger.success(f"Tarjetas cargadas: {len(self.tarjetas_data)} campos")
+        # Tabla columnar de rondas: se materializa una vez y la usan todos los cálculos
+        self._rounds = RoundsTable.from_tarjetas(self.tarjetas_data)
+        self._round_milestones = None
+        self._player_stats = None
+        self._input_digests = None
 
     def calculate_club_statistics(self):
         """Calcula estadísticas por palo desde FlightScope."""
@@ -168,26 +182,12 @@ class DashboardDataGenerator:
             distancia_promedio = palo_data['vuelo_act'].mean()
             velocidad_promedio = palo_data['velocidad_bola'].mean()
 
-            # Procesar desviación lateral
-            def parse_lateral(valor):
-                if pd.isna(valor):
-                    return 0
-                valor_str = str(valor)
-                try:
-                    num = float(valor_str.replace('I', '').replace('D', '').replace('C', '').strip())
-                    if 'D' in valor_str:
-                        return -num  # Derecha es negativo
-                    else:
-                        return num  # Izquierda es positivo
-                except:
-                    return 0
-
-            palo_data_copy = palo_data.copy()
-            palo_data_copy['lateral_num'] = palo_data_copy['lateral_vuelo'].apply(parse_lateral)
-            desviacion_promedio = abs(palo_data_copy['lateral_num'].mean())
+            # Desviación lateral (lateral_m: + derecha, − izquierda; sin dato = 0)
+            lateral_mean = palo_data['lateral_m'].fillna(0).mean()
+            desviacion_promedio = abs(lateral_mean)
 
             # Determinar lado predominante
-            lado = 'I' if palo_data_copy['lateral_num'].mean() > 0 else 'D'
+            lado = 'I' if lateral_mean < 0 else 'D'
 
             # Calcular rating (simplificado: basado en consistencia)
             consistencia = 1 - (palo_data['vuelo_act'].std() / distancia_promedio) if distancia_promedio > 0 else 0
@@ -218,15 +218,14 @@ class DashboardDataGenerator:
         """Calcula evolución temporal de distancias."""
         logger.info("Calculando evolución temporal")
 
-        # Agrupar por mes y palo
-        self.flightscope_df['mes'] = self.flightscope_df['fecha'].dt.to_period('M')
+        # Proyección del pivot mes × palo
+        pivot = self.shot_pivot
 
         palos_principales = ['Dr', '3W', 'Hyb', '5i', '6i', '7i', '8i', '9i', 'PW', 'GW 52', 'SW 58']
         temporal_data = {}
 
         for palo in palos_principales:
-            palo_data = self.flightscope_df[self.flightscope_df['palo'] == palo]
-            monthly_avg = palo_data.groupby('mes')['vuelo_act'].mean()
+            monthly_avg = pivot.club_series('carry_raw', palo, months=pivot.club_shots(palo).index)
 
             temporal_data[palo] = {
                 'labels': [str(m) for m in monthly_avg.index],
@@ -263,6 +262,43 @@ class DashboardDataGenerator:
 
         return sorted(course_stats, key=lambda x: x['rondas_jugadas'], reverse=True)
 
+    @property
+    def rounds(self):
+        """RoundsTable de todas las rondas (orden cronológico)."""
+        if self._rounds is None:
+            self._rounds = RoundsTable.from_tarjetas(self.tarjetas_data)
+        return self._rounds
+
+    @property
+    def round_milestones(self):
+        """RoundMilestones de self.rounds (running best, broke X, rachas — una pasada)."""
+        if self._round_milestones is None:
+            self._round_milestones = RoundMilestones(self.rounds)
+        return self._round_milestones
+
+    @property
+    def shot_pivot(self):
+        """MonthlyClubPivot de los golpes FlightScope (un solo groupby mes × palo)."""
+        if self._shot_pivot is None:
+            self._shot_pivot = MonthlyClubPivot(self.flightscope_df)
+        return self._shot_pivot
+
+    @property
+    def distance_sketches(self):
+        """SketchStore de vuelo_act por (palo, month_id): t-digest fusionables.
+
+        Con golpes leídos del workbook se persiste junto a su snapshot y, si el
+        workbook solo ganó golpes al final, únicamente esos entran en los digests.
+        """
+        if self._distance_sketches is None:
+            if self._sketch_workbook is not None:
+                self._distance_sketches = load_distance_sketches(
+                    self._sketch_workbook, self.flightscope_df, cache_dir=self.cache_dir)
+            else:
+                self._distance_sketches = add_distance_shots(
+                    SketchStore(), *distance_columns(self.flightscope_df))
+        return self._distance_sketches
+
     @staticmethod
     def _months_between(date_str1, date_str2):
         """Calcula meses entre dos fechas YYYY-MM-DD."""
@@ -275,40 +311,28 @@ class DashboardDataGenerator:
         """Calcula estadísticas generales del jugador."""
         logger.info("Calculando estadísticas del jugador")
 
-        # Recopilar todas las rondas con nombre del campo
-        todas_rondas = []
-        for campo_nombre, campo_data in self.tarjetas_data.items():
-            for ronda in campo_data['rondas']:
-                todas_rondas.append({
-                    **ronda,
-                    'campo': campo_nombre
-                })
-
-        if len(todas_rondas) == 0:
+        rt = self.rounds
+        if len(rt) == 0:
             return {}
 
-        # Ordenar por fecha
-        todas_rondas.sort(key=lambda x: x['fecha'])
-
-        scores = [r['total_ronda'] for r in todas_rondas]
-
-        # Mejor ronda con contexto completo
-        best = min(todas_rondas, key=lambda x: x['total_ronda'])
+        # Mejor ronda con contexto completo (primera en orden cronológico si hay empate)
+        best_idx = int(np.argmin(rt.score))
+        best = rt.rondas[best_idx]
 
-        return {
-            'total_rondas': len(todas_rondas),
-            'mejor_score': min(scores),
-            'peor_score': max(scores),
-            'promedio_score': np.mean(scores),
+        self._player_stats = {
+            'total_rondas': len(rt),
+            'mejor_score': int(rt.score.min()),
+            'peor_score': int(rt.score.max()),
+            'promedio_score': np.mean(rt.score),
             'handicap_actual': 23.2,  # Dato RFEG (no calculable automáticamente)
             'mejora_handicap': -8.8,  # Desde el inicio
-            'primera_ronda': todas_rondas[0]['fecha'],
-            'ultima_ronda': todas_rondas[-1]['fecha'],
+            'primera_ronda': rt.date_str[0],
+            'ultima_ronda': rt.date_str[-1],
             'campos_jugados': len(self.tarjetas_data),
             'golpes_flightscope': len(self.flightscope_df),
             # Campos nuevos para Tab 1 dinámico
             'player_name': 'Álvaro Peralta',
-            'best_round_course': best['campo'].title(),
+            'best_round_course': rt.course_name(best_idx).title(),
             'best_round_date': best['fecha'],
             'best_round_differential': best.get('diferencia_par', 0),
             'best_hcp': 21.9,            # Mejor HCP alcanzado (dato RFEG)
@@ -318,8 +342,20 @@ class DashboardDataGenerator:
             'player_id': 'AMF 8472456',     # Licencia RFEG
             'location': 'Madrid, España',
             'handicap_inicial': 32.0,        # HCP al inicio (dato RFEG)
-            'months_tracked': self._months_between(todas_rondas[0]['fecha'], todas_rondas[-1]['fecha']),
+            'months_tracked': self._months_between(rt.date_str[0], rt.date_str[-1]),
         }
+        return self._player_stats
+
+    def _phase5_shots(self):
+        """Golpes FlightScope con los nombres de columna de los analizadores de Fase 5."""
+        if self.flightscope_df is None:
+            self.load_flightscope_data()
+        if self._phase5_df is None:
+            if self._workbook_sheets:
+                self._phase5_df = phase5_frame(self.flightscope_path, self.flightscope_df, self._workbook_sheets)
+            else:
+                self._phase5_df = phase5_view(self.flightscope_df)
+        return self._phase5_df
 
     def calculate_launch_metrics(self):
         """Calcula métricas de lanzamiento usando LaunchMetricsAnalyzer de Fase 5."""
@@ -330,12 +366,8 @@ class DashboardDataGenerator:
             return {}
 
         try:
-            # Leer el Excel y renombrar columnas como lo hace advanced.py
-            df = pd.read_excel(self.flightscope_path, sheet_name='TODOS LOS GOLPES')
-            df.columns = [
-                'Fecha', 'Palo', 'VueloAct', 'VueloTotal', 'VelBola',
-                'Altura', 'AngLanz', 'DirLanz', 'LateralVuelo',
-            ]
+            # Vista del frame canónico con columnas de Fase 5 (sin re-leer el Excel)
+            df = self._phase5_shots()
 
             analyzer = LaunchMetricsAnalyzer(df)
             report = analyzer.full_report()
@@ -365,12 +397,8 @@ class DashboardDataGenerator:
             return {}
 
         try:
-            # Leer el Excel y renombrar columnas como lo hace advanced.py
-            df = pd.read_excel(self.flightscope_path, sheet_name='TODOS LOS GOLPES')
-            df.columns = [
-                'Fecha', 'Palo', 'VueloAct', 'VueloTotal', 'VelBola',
-                'Altura', 'AngLanz', 'DirLanz', 'LateralVuelo',
-            ]
+            # Vista del frame canónico con columnas de Fase 5 (sin re-leer el Excel)
+            df = self._phase5_shots()
 
             analyzer = DispersionAnalyzer(df)
             report = analyzer.full_report()
@@ -400,8 +428,8 @@ class DashboardDataGenerator:
             return {}
 
         try:
-            # Usar HCP del player_stats
-            player_stats = self.calculate_player_stats()
+            # Usar HCP del player_stats (ya calculado en el paso 1)
+            player_stats = self._player_stats or self.calculate_player_stats()
             hcp = player_stats.get('handicap_actual', 23.2)
 
             # Usar ConsistencyAnalyzer con parámetros correctos
@@ -461,21 +489,8 @@ class DashboardDataGenerator:
                 logger.warning(f"No hay datos para {palo_code}, skipping...")
                 continue
 
-            # Parsear lateral (I = izquierda negativo, D = derecha positivo)
-            def parse_lateral(valor):
-                if pd.isna(valor):
-                    return 0
-                valor_str = str(valor)
-                try:
-                    num = float(valor_str.replace('I', '').replace('D', '').replace('C', '').strip())
-                    if 'D' in valor_str:
-                        return num  # Derecha es positivo
-                    else:
-                        return -num  # Izquierda es negativo
-                except:
-                    return 0
-
-            palo_df['lateral_m'] = palo_df['lateral_vuelo'].apply(parse_lateral)
+            # Lateral (I = izquierda negativo, D = derecha positivo; sin dato = 0)
+            palo_df['lateral_m'] = palo_df['lateral_m'].fillna(0)
 
             # Calcular estadísticas para clasificación
             carry_mean = palo_df['vuelo_act'].mean()
@@ -733,23 +748,22 @@ class DashboardDataGenerator:
         """
         logger.info("Generando score history")
 
-        all_rounds = []
-
-        # Recopilar todas las rondas de todos los campos
-        for campo_nombre, campo_data in self.tarjetas_data.items():
-            for ronda in campo_data['rondas']:
-                all_rounds.append({
-                    'date': ronda['fecha'],
-                    'course': campo_nombre,
-                    'score': ronda['total_ronda'],
-                    'differential': ronda['diferencia_par'],
-                    'par': campo_data.get('par_total'),
-                    'slope': campo_data.get('slope'),
-                    'vc': campo_data.get('vc')
-                })
-
-        # Ordenar por fecha
-        all_rounds.sort(key=lambda x: x['date'])
+        # Rondas en orden cronológico desde la RoundsTable
+        rt = self.rounds
+        all_rounds = [
+            {
+                'date': date,
+                'course': rt.courses[cid],
+                'score': ronda['total_ronda'],
+                'differential': ronda['diferencia_par'],
+                'par': par,
+                'slope': slope,
+                'vc': vc
+            }
+            for date, cid, ronda, par, slope, vc in zip(
+                rt.date_str, rt.course_id.tolist(), rt.rondas,
+                rt.course_field('par_total'), rt.course_field('slope'), rt.course_field('vc'))
+        ]
 
         if len(all_rounds) == 0:
             logger.warning("No hay rondas disponibles para score history")
@@ -762,8 +776,8 @@ class DashboardDataGenerator:
             }
 
         # Identificar mejor y peor ronda
-        best_round = min(all_rounds, key=lambda x: x['score'])
-        worst_round = max(all_rounds, key=lambda x: x['score'])
+        best_round = all_rounds[self.round_milestones.best_idx]
+        worst_round = all_rounds[self.round_milestones.worst_idx]
 
         # Calcular promedio
         avg_score = sum(r['score'] for r in all_rounds) / len(all_rounds)
@@ -796,34 +810,8 @@ class DashboardDataGenerator:
         else:
             trend = 'insufficient_data'
 
-        # Agregar milestones a rondas específicas
-        for idx, ronda in enumerate(all_rounds):
-            milestones = []
-
-            # Primera ronda
-            if idx == 0:
-                milestones.append('first_round')
-
-            # Mejor ronda
-            if ronda['date'] == best_round['date'] and ronda['score'] == best_round['score']:
-                milestones.append('personal_best')
-
-            # Peor ronda
-            if ronda['date'] == worst_round['date'] and ronda['score'] == worst_round['score']:
-                milestones.append('worst_round')
-
-            # Ronda más reciente
-            if idx == len(all_rounds) - 1:
-                milestones.append('most_recent')
-
-            # Break 90, 85, 80
-            if ronda['score'] < 90 and all(r['score'] >= 90 for r in all_rounds[:idx]):
-                milestones.append('broke_90')
-            if ronda['score'] < 85 and all(r['score'] >= 85 for r in all_rounds[:idx]):
-                milestones.append('broke_85')
-            if ronda['score'] < 80 and all(r['score'] >= 80 for r in all_rounds[:idx]):
-                milestones.append('broke_80')
-
+        # Milestones por ronda (first_round, personal_best, broke_90...) del motor de hitos
+        for ronda, milestones in zip(all_rounds, self.round_milestones.round_tags()):
             ronda['milestones'] = milestones
 
         result = {
@@ -850,30 +838,54 @@ class DashboardDataGenerator:
         """
         logger.info("Calculando percentiles")
 
-        # Percentiles de distancia por palo
+        # Percentiles de distancia por palo: una pasada agrupada (exacta) o,
+        # con historiales muy grandes, fusión de los sketches mensuales
         palo_codes = ['Dr', '3W', 'Hyb', '5i', '6i', '7i', '8i', '9i', 'PW', 'GW 52', 'SW 58']
-        distance_percentiles = {}
+        labels = [f"p{round(q * 100)}" for q in DEFAULT_QUANTILES]
+        shots = self.flightscope_df
 
+        if len(shots) > SKETCH_MIN_VALUES:
+            by_club = self.distance_sketches.rollup(lambda key: key[0])
+            club_rows = {palo: (d.quantile(DEFAULT_QUANTILES), int(d.count)) for palo, d in by_club.items()}
+        else:
+            carry = pd.to_numeric(shots['vuelo_act'], errors='coerce')
+            keys, counts, table = grouped_quantiles(carry, shots['palo'].fillna('').astype(str))
+            club_rows = {palo: (table[i], int(counts[i])) for i, palo in enumerate(keys.tolist())}
+
+        distance_percentiles = {}
         for palo_code in palo_codes:
-            palo_df = self.flightscope_df[self.flightscope_df['palo'] == palo_code]
+            values, count = club_rows.get(palo_code, (None, 0))
+            if count >= 5:  # Necesitamos al menos 5 shots para percentiles
+                distance_percentiles[palo_code] = {
+                    **{label: round(v, 1) for label, v in zip(labels, values)},
+                    'count': count
+                }
 
-            if len(palo_df) > 0:
-                distances = palo_df['vuelo_act'].dropna()
-                if len(distances) >= 5:  # Necesitamos al menos 5 shots para percentiles
-                    distance_percentiles[palo_code] = {
-                        'p10': round(distances.quantile(0.10), 1),
-                        'p25': round(distances.quantile(0.25), 1),
-                        'p50': round(distances.quantile(0.50), 1),  # Mediana
-                        'p75': round(distances.quantile(0.75), 1),
-                        'p90': round(distances.quantile(0.90), 1),
-                        'count': len(distances)
-                    }
+        # Percentiles trimestrales: exactos por (palo, trimestre) o, con historiales
+        # muy grandes, fusión de los digests mensuales (sin releer golpes)
+        if len(shots) > SKETCH_MIN_VALUES:
+            by_quarter = self.distance_sketches.rollup(lambda key: (key[0], key[1] // 3))
+            quarter_rows = {key: (d.quantile(DEFAULT_QUANTILES), int(d.count)) for key, d in by_quarter.items()}
+        else:
+            carry, palo, month_id = distance_columns(shots)
+            valid = (month_id >= 0) & (palo != '')
+            clubs, club_idx = np.unique(palo[valid], return_inverse=True)
+            quarter_id = month_id[valid] // 3
+            keys, counts, table = grouped_quantiles(carry[valid], club_idx * (1 << 32) + quarter_id)
+            quarter_rows = {(clubs[k >> 32].item(), int(k & 0xFFFFFFFF)): (table[i], int(counts[i]))
+                            for i, k in enumerate(keys.tolist())}
+
+        distance_percentiles_by_quarter = {}
+        for (palo_code, quarter_id), (values, count) in sorted(quarter_rows.items(), key=lambda kv: kv[0][::-1]):
+            if palo_code in palo_codes and count >= 5:
+                year, quarter = RoundsTable.quarter_parts(quarter_id)
+                distance_percentiles_by_quarter.setdefault(palo_code, {})[f"Q{quarter} {year}"] = {
+                    **{label: round(v, 1) for label, v in zip(labels, values)},
+                    'count': count
+                }
 
         # Percentiles de scores
-        all_scores = []
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                all_scores.append(ronda['total_ronda'])
+        all_scores = self.rounds.score
 
         if len(all_scores) >= 5:
             scores_series = pd.Series(all_scores)
@@ -890,6 +902,10 @@ class DashboardDataGenerator:
 
         result = {
             'distance_percentiles': distance_percentiles,
+            'distance_percentiles_by_quarter': {
+                palo: distance_percentiles_by_quarter[palo]
+                for palo in palo_codes if palo in distance_percentiles_by_quarter
+            },
             'score_percentiles': score_percentiles
         }
 
@@ -912,20 +928,6 @@ class DashboardDataGenerator:
 
         palo_codes = ['Dr', '3W', 'Hyb', '5i', '6i', '7i', '8i', '9i', 'PW', 'GW 52', 'SW 58']
 
-        def parse_lateral(valor):
-            """Parse lateral value (I/D/C)"""
-            if pd.isna(valor):
-                return 0
-            valor_str = str(valor)
-            try:
-                num = float(valor_str.replace('I', '').replace('D', '').replace('C', '').strip())
-                if 'D' in valor_str:
-                    return num  # Derecha es positivo
-                else:
-                    return -num  # Izquierda es negativo
-            except:
-                return 0
-
         directional_dist = {}
 
         for palo_code in palo_codes:
@@ -934,8 +936,8 @@ class DashboardDataGenerator:
             if len(palo_df) == 0:
                 continue
 
-            # Parsear lateral
-            palo_df['lateral_m'] = palo_df['lateral_vuelo'].apply(parse_lateral)
+            # Lateral ya parseado al cargar (sin dato = 0)
+            palo_df['lateral_m'] = palo_df['lateral_m'].fillna(0)
 
             # Clasificar
             left = len(palo_df[palo_df['lateral_m'] < -5])
@@ -1082,14 +1084,11 @@ class DashboardDataGenerator:
             short_game_score = 5.0
 
         # 2. Tendencia Mejora (basado en score_history trend)
-        all_rounds = []
-        for campo_data in self.tarjetas_data.values():
-            all_rounds.extend(campo_data['rondas'])
-        all_rounds.sort(key=lambda x: x['fecha'])
+        scores = self.rounds.score.tolist()
 
-        if len(all_rounds) >= 20:
-            first_10_avg = sum(r['total_ronda'] for r in all_rounds[:10]) / 10
-            last_10_avg = sum(r['total_ronda'] for r in all_rounds[-10:]) / 10
+        if len(scores) >= 20:
+            first_10_avg = sum(scores[:10]) / 10
+            last_10_avg = sum(scores[-10:]) / 10
             improvement = first_10_avg - last_10_avg
             # Improvement > 0 significa mejora
             if improvement > 10:
@@ -1163,24 +1162,8 @@ class DashboardDataGenerator:
         # 7. Accuracy (basado en dispersion lateral)
         all_lateral = []
         for palo in palo_codes:
-            palo_df = self.flightscope_df[self.flightscope_df['palo'] == palo].copy()
-            if len(palo_df) > 0:
-                def parse_lateral(valor):
-                    if pd.isna(valor):
-                        return None
-                    valor_str = str(valor)
-                    try:
-                        num = float(valor_str.replace('I', '').replace('D', '').replace('C', '').strip())
-                        if 'D' in valor_str:
-                            return num
-                        else:
-                            return -num
-                    except:
-                        return None
-
-                palo_df['lateral_m'] = palo_df['lateral_vuelo'].apply(parse_lateral)
-                laterals = palo_df['lateral_m'].dropna()
-                all_lateral.extend(laterals.tolist())
+            laterals = self.flightscope_df.loc[self.flightscope_df['palo'] == palo, 'lateral_m'].dropna()
+            all_lateral.extend(laterals.tolist())
 
         if all_lateral:
             avg_abs_lateral = sum(abs(x) for x in all_lateral) / len(all_lateral)
@@ -1309,24 +1292,24 @@ class DashboardDataGenerator:
         """
         logger.info("Analizando best/worst rounds")
 
-        # Recopilar todas las rondas
-        all_rounds = []
-        for campo_nombre, campo_data in self.tarjetas_data.items():
-            par_total = campo_data.get('par_total')
-            for ronda in campo_data['rondas']:
-                all_rounds.append({
-                    'date': ronda['fecha'],
-                    'course': campo_nombre,
-                    'score': ronda['total_ronda'],
-                    'differential': ronda['diferencia_par'],
-                    'par': par_total,
-                    'golpes_ida': ronda.get('golpes_ida', []),
-                    'golpes_vuelta': ronda.get('golpes_vuelta', []),
-                    'total_ida': ronda.get('total_ida'),
-                    'total_vuelta': ronda.get('total_vuelta')
-                })
+        rt = self.rounds
+
+        def round_detail(i):
+            ronda = rt.rondas[i]
+            cid = int(rt.course_id[i])
+            return {
+                'date': ronda['fecha'],
+                'course': rt.courses[cid],
+                'score': ronda['total_ronda'],
+                'differential': ronda['diferencia_par'],
+                'par': rt.course_meta[cid].get('par_total'),
+                'golpes_ida': ronda.get('golpes_ida', []),
+                'golpes_vuelta': ronda.get('golpes_vuelta', []),
+                'total_ida': ronda.get('total_ida'),
+                'total_vuelta': ronda.get('total_vuelta')
+            }
 
-        if len(all_rounds) < 3:
+        if len(rt) < 3:
             logger.warning("Insufficient rounds for best/worst analysis")
             return {
                 'best_rounds': [],
@@ -1334,12 +1317,12 @@ class DashboardDataGenerator:
                 'comparison': {}
             }
 
-        # Ordenar por score
-        sorted_rounds = sorted(all_rounds, key=lambda x: x['score'])
+        # Ordenar por score (empates en orden original de tarjetas)
+        by_score = rt.by_score()
 
         # Top 3 y Bottom 3
-        best_rounds = sorted_rounds[:3]
-        worst_rounds = sorted_rounds[-3:]
+        best_rounds = [round_detail(i) for i in by_score[:3]]
+        worst_rounds = [round_detail(i) for i in by_score[-3:]]
 
         # Calcular promedios por hoyo para las mejores vs peores
         def calc_hole_averages(rounds_list):
@@ -1399,50 +1382,31 @@ class DashboardDataGenerator:
         """
         logger.info("Calculando quarterly scoring")
 
-        # Recopilar rondas con fecha
-        all_rounds = []
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                try:
-                    fecha = pd.to_datetime(ronda['fecha'])
-                    all_rounds.append({
-                        'date': fecha,
-                        'score': ronda['total_ronda'],
-                        'year': fecha.year,
-                        'quarter': (fecha.month - 1) // 3 + 1  # Q1=1-3, Q2=4-6, Q3=7-9, Q4=10-12
-                    })
-                except:
-                    continue
-
-        if len(all_rounds) == 0:
+        rt = self.rounds
+        if len(rt) == 0:
             logger.warning("No rounds with valid dates")
             return {}
 
-        # Agrupar por year-quarter
-        from collections import defaultdict
-        quarters = defaultdict(list)
-
-        for ronda in all_rounds:
-            quarter_key = f"Q{ronda['quarter']}_{ronda['year']}"
-            quarters[quarter_key].append(ronda)
+        # Agrupar por year-quarter (bucket precalculado en la RoundsTable)
+        # Q1=1-3, Q2=4-6, Q3=7-9, Q4=10-12
+        quarters = {}
+        for qid in np.unique(rt.quarter_id).tolist():
+            year, quarter = rt.quarter_parts(qid)
+            quarters[f"Q{quarter}_{year}"] = rt.score[rt.quarter_id == qid]
 
         # Calcular stats por quarter
         quarterly_data = {}
         sorted_quarters = sorted(quarters.keys())
 
         for quarter_key in sorted_quarters:
-            rounds_in_quarter = quarters[quarter_key]
-
-            scores = [r['score'] for r in rounds_in_quarter]
-            avg_score = sum(scores) / len(scores)
-            best_round = min(scores)
-            worst_round = max(scores)
+            scores = quarters[quarter_key]
+            avg_score = int(scores.sum()) / len(scores)
 
             quarterly_data[quarter_key] = {
                 'avg_score': round(avg_score, 1),
-                'rounds': len(rounds_in_quarter),
-                'best': best_round,
-                'worst': worst_round
+                'rounds': len(scores),
+                'best': int(scores.min()),
+                'worst': int(scores.max())
             }
 
         # Calcular trend (comparar con quarter anterior)
@@ -1479,68 +1443,41 @@ class DashboardDataGenerator:
         """
         logger.info("Calculando monthly volatility")
 
-        # Recopilar rondas con fecha
-        all_rounds = []
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                try:
-                    fecha = pd.to_datetime(ronda['fecha'])
-                    all_rounds.append({
-                        'date': fecha,
-                        'score': ronda['total_ronda'],
-                        'year': fecha.year,
-                        'month': fecha.month,
-                        'year_month': f"{fecha.year}-{fecha.month:02d}"
-                    })
-                except:
-                    continue
-
-        if len(all_rounds) == 0:
+        rt = self.rounds
+        if len(rt) == 0:
             logger.warning("No rounds with valid dates")
             return {}
 
-        # Agrupar por year-month
-        from collections import defaultdict
-        months = defaultdict(list)
-
-        for ronda in all_rounds:
-            months[ronda['year_month']].append(ronda['score'])
+        # Un bucket por mes (RoundsTable ordenada → meses contiguos)
+        stats = RollingStats(rt.score)
+        months = Windows.buckets(rt.month_id)
+        avg, std, cv = stats.mean(months), stats.std(months), stats.cv(months)
 
-        # Calcular volatilidad por mes
         volatility_data = {}
-        sorted_months = sorted(months.keys())
-
-        for month_key in sorted_months:
-            scores = months[month_key]
+        for i, (month_id, n) in enumerate(zip(months.keys.tolist(), months.count.tolist())):
+            month_key = f"{month_id // 12}-{month_id % 12 + 1:02d}"
 
-            if len(scores) < 2:
+            if n < 2:
                 # No suficientes datos para calcular volatilidad
                 volatility_data[month_key] = {
-                    'avg_score': float(scores[0]),
+                    'avg_score': float(avg[i]),
                     'std_dev': 0.0,
                     'volatility_score': 0.0,
-                    'rounds': len(scores),
+                    'rounds': n,
                     'cv': 0.0
                 }
                 continue
 
-            avg_score = sum(scores) / len(scores)
-            variance = sum((x - avg_score) ** 2 for x in scores) / len(scores)
-            std_dev = variance ** 0.5
-
-            # Coefficient of Variation (CV) = (std_dev / mean) * 100
-            cv = (std_dev / avg_score * 100) if avg_score > 0 else 0
-
             # Volatility score (0-10): menor volatilidad = mayor score
             # CV < 5% = 10 points, CV > 15% = 0 points
-            volatility_score = max(0, min(10, 10 - (cv - 5) * (10 / 10)))
+            volatility_score = max(0, min(10, 10 - (cv[i] - 5)))
 
             volatility_data[month_key] = {
-                'avg_score': round(float(avg_score), 1),
-                'std_dev': round(float(std_dev), 1),
+                'avg_score': round(float(avg[i]), 1),
+                'std_dev': round(float(std[i]), 1),
                 'volatility_score': round(float(volatility_score), 1),
-                'rounds': int(len(scores)),
-                'cv': round(float(cv), 1)
+                'rounds': n,
+                'cv': round(float(cv[i]), 1)
             }
 
         logger.success(f"Monthly volatility: {len(volatility_data)} months")
@@ -1556,73 +1493,37 @@ class DashboardDataGenerator:
         """
         logger.info("Calculando momentum indicators")
 
-        # Recopilar todas las rondas ordenadas cronológicamente
-        all_rounds = []
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                try:
-                    fecha = pd.to_datetime(ronda['fecha'])
-                    all_rounds.append({
-                        'date': fecha.strftime('%Y-%m-%d'),
-                        'score': ronda['total_ronda']
-                    })
-                except:
-                    continue
-
-        if len(all_rounds) == 0:
+        rt = self.rounds
+        if len(rt) == 0:
             logger.warning("No rounds with valid dates")
             return []
 
-        # Ordenar por fecha
-        all_rounds.sort(key=lambda x: x['date'])
-
-        # Calcular moving averages
-        momentum_data = []
+        # SMA-5 / SMA-10 sobre las últimas N rondas (con menos rondas, promedio disponible)
+        stats = RollingStats(rt.score)
+        sma_5 = stats.mean(Windows.trailing(len(rt), 5))
+        sma_10 = stats.mean(Windows.trailing(len(rt), 10))
 
-        for i, ronda in enumerate(all_rounds):
-            # SMA-5 (últimas 5 rondas)
-            if i >= 4:
-                last_5_scores = [all_rounds[j]['score'] for j in range(i - 4, i + 1)]
-                sma_5 = sum(last_5_scores) / 5
-            else:
-                # No hay suficientes rondas, usar promedio disponible
-                available_scores = [all_rounds[j]['score'] for j in range(0, i + 1)]
-                sma_5 = sum(available_scores) / len(available_scores)
-
-            # SMA-10 (últimas 10 rondas)
-            if i >= 9:
-                last_10_scores = [all_rounds[j]['score'] for j in range(i - 9, i + 1)]
-                sma_10 = sum(last_10_scores) / 10
-            else:
-                # No hay suficientes rondas, usar promedio disponible
-                available_scores = [all_rounds[j]['score'] for j in range(0, i + 1)]
-                sma_10 = sum(available_scores) / len(available_scores)
+        # Momentum positivo (SMA-10 > SMA-5) = mejorando (scores bajando)
+        momentum = sma_10 - sma_5
 
-            # Momentum: diferencia entre SMA-5 y SMA-10
-            # Momentum positivo (SMA-10 > SMA-5) = mejorando (scores bajando)
-            momentum = sma_10 - sma_5
+        momentum_data = []
+        for i, (date, score) in enumerate(zip(rt.date_str, rt.score.tolist())):
+            # Acceleration: cambio en momentum respecto al publicado en la ronda anterior
+            acceleration = momentum[i] - momentum_data[-1]['momentum'] if momentum_data else 0
 
-            # Direction basado en momentum
-            if momentum > 1:
+            if momentum[i] > 1:
                 direction = 'improving'  # SMA-10 > SMA-5 (tendencia a mejorar)
-            elif momentum < -1:
+            elif momentum[i] < -1:
                 direction = 'declining'  # SMA-5 > SMA-10 (tendencia a empeorar)
             else:
                 direction = 'stable'
 
-            # Acceleration: cambio en momentum (comparar con ronda anterior)
-            if i > 0 and len(momentum_data) > 0:
-                prev_momentum = momentum_data[-1]['momentum']
-                acceleration = momentum - prev_momentum
-            else:
-                acceleration = 0
-
             momentum_data.append({
-                'date': ronda['date'],
-                'score': int(ronda['score']),
-                'sma_5': round(float(sma_5), 1),
-                'sma_10': round(float(sma_10), 1),
-                'momentum': round(float(momentum), 2),
+                'date': date,
+                'score': score,
+                'sma_5': round(float(sma_5[i]), 1),
+                'sma_10': round(float(sma_10[i]), 1),
+                'momentum': round(float(momentum[i]), 2),
                 'direction': direction,
                 'acceleration': round(float(acceleration), 2)
             })
@@ -1640,156 +1541,12 @@ class DashboardDataGenerator:
         """
         logger.info("Extrayendo milestone achievements")
 
-        # Recopilar todas las rondas ordenadas cronológicamente
-        all_rounds = []
-        for campo_nombre, campo_data in self.tarjetas_data.items():
-            for ronda in campo_data['rondas']:
-                try:
-                    fecha = pd.to_datetime(ronda['fecha'])
-                    all_rounds.append({
-                        'date': fecha.strftime('%Y-%m-%d'),
-                        'score': ronda['total_ronda'],
-                        'course': campo_nombre,
-                        'differential': ronda.get('diferencia_par', 0)
-                    })
-                except:
-                    continue
-
-        if len(all_rounds) == 0:
+        if len(self.rounds) == 0:
             logger.warning("No rounds with valid dates")
             return []
 
-        # Ordenar por fecha
-        all_rounds.sort(key=lambda x: x['date'])
-
-        milestones = []
-
-        # Track best scores alcanzados
-        best_score_ever = 999
-        broke_100 = False
-        broke_90 = False
-        broke_85 = False
-        broke_80 = False
-
-        # Track consistency streaks (rondas consecutivas bajo cierto threshold)
-        current_sub90_streak = 0
-        best_sub90_streak = 0
-        sub90_streak_start = None
-
-        current_sub85_streak = 0
-        best_sub85_streak = 0
-
-        for i, ronda in enumerate(all_rounds):
-            score = ronda['score']
-            date = ronda['date']
-            course = ronda['course']
-
-            # Milestone: Broke 100
-            if not broke_100 and score < 100:
-                broke_100 = True
-                milestones.append({
-                    'date': date,
-                    'type': 'broke_100',
-                    'value': int(score),
-                    'course': course,
-                    'description': f'Primera vez bajo 100 (score: {score})'
-                })
-
-            # Milestone: Broke 90
-            if not broke_90 and score < 90:
-                broke_90 = True
-                milestones.append({
-                    'date': date,
-                    'type': 'broke_90',
-                    'value': int(score),
-                    'course': course,
-                    'description': f'Primera vez bajo 90 (score: {score})'
-                })
-
-            # Milestone: Broke 85
-            if not broke_85 and score < 85:
-                broke_85 = True
-                milestones.append({
-                    'date': date,
-                    'type': 'broke_85',
-                    'value': int(score),
-                    'course': course,
-                    'description': f'Primera vez bajo 85 (score: {score})'
-                })
-
-            # Milestone: Broke 80
-            if not broke_80 and score < 80:
-                broke_80 = True
-                milestones.append({
-                    'date': date,
-                    'type': 'broke_80',
-                    'value': int(score),
-                    'course': course,
-                    'description': f'Primera vez bajo 80 (score: {score})'
-                })
-
-            # Milestone: Personal Best
-            if score < best_score_ever:
-                best_score_ever = score
-                milestones.append({
-                    'date': date,
-                    'type': 'personal_best',
-                    'value': int(score),
-                    'course': course,
-                    'description': f'Nuevo personal best: {score}'
-                })
-
-            # Track consistency streaks (sub-90)
-            if score < 90:
-                if current_sub90_streak == 0:
-                    sub90_streak_start = date
-                current_sub90_streak += 1
-                if current_sub90_streak > best_sub90_streak:
-                    best_sub90_streak = current_sub90_streak
-            else:
-                # Streak ended
-                if current_sub90_streak >= 3:
-                    milestones.append({
-                        'date': date,
-                        'type': 'consistency_streak',
-                        'value': int(current_sub90_streak),
-                        'course': 'Multiple courses',
-                        'description': f'Racha de {current_sub90_streak} rondas consecutivas bajo 90 (desde {sub90_streak_start})'
-                    })
-                current_sub90_streak = 0
-
-            # Track sub-85 streaks
-            if score < 85:
-                current_sub85_streak += 1
-            else:
-                if current_sub85_streak >= 3:
-                    milestones.append({
-                        'date': date,
-                        'type': 'elite_streak',
-                        'value': int(current_sub85_streak),
-                        'course': 'Multiple courses',
-                        'description': f'Racha de {current_sub85_streak} rondas consecutivas bajo 85'
-                    })
-                current_sub85_streak = 0
-
-        # Check final streaks (si terminó en racha)
-        if current_sub90_streak >= 3:
-            milestones.append({
-                'date': all_rounds[-1]['date'],
-                'type': 'consistency_streak',
-                'value': int(current_sub90_streak),
-                'course': 'Multiple courses',
-                'description': f'Racha actual de {current_sub90_streak} rondas bajo 90'
-            })
-
-        if current_sub85_streak >= 3:
-            milestones.append({
-                'date': all_rounds[-1]['date'],
-                'type': 'elite_streak',
-                'value': int(current_sub85_streak),
-                'course': 'Multiple courses',
-                'description': f'Racha actual de {current_sub85_streak} rondas bajo 85'
-            })
+        # broke_X, personal bests y rachas sub-90 / sub-85 en una pasada (RoundMilestones)
+        milestones = self.round_milestones.achievements()
 
         logger.success(f"Milestone achievements: {len(milestones)} milestones")
         return milestones
@@ -1816,6 +1573,7 @@ class DashboardDataGenerator:
         }
 
         learning_data = {}
+        series = {}     # categoría → distancias en orden cronológico (≥ 10 golpes)
 
         # Para cada categoría, calcular mejora temporal
         for category_name, clubs in categories.items():
@@ -1862,35 +1620,24 @@ class DashboardDataGenerator:
                 }
                 continue
 
+            series[category_name] = distances
+
+        # Trend: regresión lineal distancia vs nº de golpe, todas las categorías en un ajuste
+        # (slope = rate of improvement, metros por shot)
+        fits = fit_lines([d.to_numpy() for d in series.values()])
+
+        for (category_name, distances), slope in zip(series.items(), fits.slope.tolist()):
             # Calcular promedio de primeros 20% vs últimos 20%
             n = len(distances)
             first_20_pct = int(n * 0.2)
             last_20_pct = int(n * 0.2)
 
-            initial_shots = distances.iloc[:first_20_pct]
-            recent_shots = distances.iloc[-last_20_pct:]
-
-            initial_avg = initial_shots.mean()
-            current_avg = recent_shots.mean()
+            initial_avg = distances.iloc[:first_20_pct].mean()
+            current_avg = distances.iloc[-last_20_pct:].mean()
 
             # Improvement rate (metros de mejora)
             improvement = current_avg - initial_avg
 
-            # Calcular trend usando regresión lineal simple
-            # y = mx + b, donde m = slope (rate of improvement)
-            x = list(range(len(distances)))
-            y = distances.tolist()
-
-            # Simple linear regression
-            n_points = len(x)
-            sum_x = sum(x)
-            sum_y = sum(y)
-            sum_xy = sum(x[i] * y[i] for i in range(n_points))
-            sum_x2 = sum(xi ** 2 for xi in x)
-
-            # Slope (m)
-            slope = (n_points * sum_xy - sum_x * sum_y) / (n_points * sum_x2 - sum_x ** 2)
-
             # Determinar trend
             if slope > 0.5:
                 trend = 'improving'
@@ -1908,6 +1655,9 @@ class DashboardDataGenerator:
                 'data_points': int(n)
             }
 
+        # Mismo orden de categorías que `categories`
+        learning_data = {k: learning_data[k] for k in categories}
+
         logger.success(f"Learning curve: {len(learning_data)} categories")
         return learning_data
 
@@ -1927,38 +1677,24 @@ class DashboardDataGenerator:
         """
         logger.info("Calculating current form chart (últimas 20 rondas)")
 
-        all_rounds = []
-
-        # Extraer todas las rondas
-        for campo_nombre, campo_data in self.tarjetas_data.items():
-            for ronda in campo_data['rondas']:
-                all_rounds.append({
-                    'fecha': ronda['fecha'],
-                    'score': ronda['total_ronda'],
-                    'campo': campo_nombre
-                })
-
-        # Ordenar por fecha descendente (más recientes primero)
-        all_rounds.sort(key=lambda x: x['fecha'], reverse=True)
-
-        # Tomar últimas 20
-        last_20 = all_rounds[:20]
+        rt = self.rounds
 
-        # Invertir para que cronológicamente vaya de izquierda a derecha
-        last_20.reverse()
+        # Últimas 20 por fecha descendente (empates en orden de inserción) y de vuelta
+        # a orden cronológico de izquierda a derecha
+        last_20 = np.lexsort((rt.seq, -rt.date.astype(np.int64)))[:20][::-1]
 
         # Extraer datos
-        labels = [r['fecha'] for r in last_20]
-        scores = [r['score'] for r in last_20]
-        courses = [r['campo'] for r in last_20]
+        labels = [rt.date_str[i] for i in last_20.tolist()]
+        scores = rt.score[last_20].tolist()
+        courses = [rt.course_name(i) for i in last_20.tolist()]
 
-        # Calcular promedio
-        average = sum(scores) / len(scores) if scores else 0
+        # Promedio de la ventana y tendencia (últimas 5 vs primeras 5)
+        stats = RollingStats(rt.score[last_20])
+        n = len(scores)
+        average = float(stats.mean(Windows.span(0, n))[0]) if scores else 0
 
-        # Determinar tendencia (últimas 5 vs primeras 5)
-        if len(scores) >= 10:
-            first_5_avg = sum(scores[:5]) / 5
-            last_5_avg = sum(scores[-5:]) / 5
+        if n >= 10:
+            first_5_avg, last_5_avg = stats.mean(Windows.span([0, n - 5], [5, n])).tolist()
 
             if last_5_avg < first_5_avg - 2:
                 trend = "improving"
@@ -2006,7 +1742,7 @@ class DashboardDataGenerator:
                 wedge_distances.append(avg_dist)
 
         player_wedges_avg = sum(wedge_distances) / len(wedge_distances) if wedge_distances else 0
-        benchmark_wedges_hcp23 = 85.0  # Benchmark típico HCP 23
+        benchmark_wedges_hcp23 = benchmark('gauges.wedge_carry', 23)  # Benchmark típico HCP 23
 
         # Calcular percentil (más distancia = mejor)
         short_game_pct = min(100, max(0, int((player_wedges_avg / benchmark_wedges_hcp23) * 100)))
@@ -2024,7 +1760,7 @@ class DashboardDataGenerator:
         else:
             player_ball_speed = 0
 
-        benchmark_ball_speed_pga = 273.0  # km/h PGA Tour promedio
+        benchmark_ball_speed_pga = benchmark('gauges.ball_speed', PGA_LEVEL)  # km/h PGA Tour promedio
 
         ball_speed_pct = min(100, max(0, int((player_ball_speed / benchmark_ball_speed_pga) * 100)))
         ball_speed_rating = (
@@ -2035,10 +1771,8 @@ class DashboardDataGenerator:
         )
 
         # 3. CONSISTENCY (CV de scores)
-        all_scores = []
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                all_scores.append(ronda['total_ronda'])
+        rt = self.rounds
+        all_scores = rt.score[rt.insertion_order()].tolist()
 
         if len(all_scores) > 1:
             score_mean = sum(all_scores) / len(all_scores)
@@ -2047,7 +1781,7 @@ class DashboardDataGenerator:
         else:
             player_cv = 0
 
-        benchmark_cv_hcp23 = 0.18  # CV típico HCP 23
+        benchmark_cv_hcp23 = benchmark('gauges.score_cv', 23)  # CV típico HCP 23
 
         # Menor CV = mejor (invertir)
         consistency_pct = min(100, max(0, int((1 - player_cv / benchmark_cv_hcp23) * 100)))
@@ -2131,19 +1865,9 @@ class DashboardDataGenerator:
         from datetime import datetime
         from dateutil.relativedelta import relativedelta
 
-        # Extraer todas las rondas con fecha y score
-        all_rounds = []
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                all_rounds.append({
-                    'fecha': datetime.strptime(ronda['fecha'], '%Y-%m-%d'),
-                    'score': ronda['total_ronda']
-                })
-
-        # Ordenar por fecha
-        all_rounds.sort(key=lambda x: x['fecha'])
+        rt = self.rounds
 
-        if len(all_rounds) < 5:
+        if len(rt) < 5:
             logger.warning("Insufficient data for HCP trajectory")
             return {
                 'historical': {'labels': [], 'values': []},
@@ -2158,28 +1882,21 @@ class DashboardDataGenerator:
         # Differential = (Adjusted Gross Score - Course Rating) * 113 / Slope Rating
         # Para simplificar, usamos score directo y asumimos course rating = 72, slope = 113
 
-        hcp_by_month = {}
-
-        for ronda in all_rounds:
-            month_key = ronda['fecha'].strftime('%Y-%m')
-            score = ronda['score']
-
-            # Usar score directamente como referencia (sin differential complicado)
-            # Ya que queremos ver tendencia, no HCP oficial exacto
-            if month_key not in hcp_by_month:
-                hcp_by_month[month_key] = []
-
-            hcp_by_month[month_key].append(score)
+        # Usar score directamente como referencia (sin differential complicado)
+        # Ya que queremos ver tendencia, no HCP oficial exacto.
+        # Las filas ya vienen en orden cronológico: cada mes es un tramo contiguo.
+        month_ids, starts = np.unique(rt.month_id, return_index=True)
+        bounds = np.append(starts, len(rt))
 
         # Calcular promedio por mes
         monthly_data = []
-        for month_key in sorted(hcp_by_month.keys()):
-            scores = hcp_by_month[month_key]
+        for k, month_id in enumerate(month_ids.tolist()):
+            scores = rt.score[bounds[k]:bounds[k + 1]].tolist()
             avg_score = sum(scores) / len(scores)
             course_par = 72
             hcp_est = avg_score - course_par
             monthly_data.append({
-                'month': month_key,
+                'month': RoundsTable.month_label(month_id),
                 'hcp': hcp_est
             })
 
@@ -2200,17 +1917,12 @@ class DashboardDataGenerator:
 
         # Calcular tasa de mejora (regresión lineal)
         if len(historical_values) >= 3:
-            x = np.arange(len(historical_values))
-            y = np.array(historical_values)
-
-            # Regresión lineal simple
-            slope_fit = np.polyfit(x, y, 1)[0]
-            improvement_rate = slope_fit
+            improvement_rate = float(fit_line(historical_values).slope[0])
         else:
             improvement_rate = -0.5  # Default
 
         # Proyección futura (6 meses)
-        last_month = datetime.strptime(sorted(hcp_by_month.keys())[-1], '%Y-%m')
+        last_month = datetime.strptime(monthly_data[-1]['month'], '%Y-%m')
         projection_labels = []
         projection_values = []
         projection_conf_low = []
@@ -2278,9 +1990,6 @@ class DashboardDataGenerator:
         """
         logger.info("Calculating temporal evolution: Long Game (Driver, 3W, Hybrid)")
 
-        from datetime import datetime
-        from collections import defaultdict
-
         # Definir palos de long game
         long_game_clubs = {
             'Dr': 'driver',
@@ -2288,32 +1997,9 @@ class DashboardDataGenerator:
             'Hyb': 'hybrid'
         }
 
-        # Agrupar shots por mes y palo
-        monthly_data = defaultdict(lambda: defaultdict(list))
-
-        for _, shot in self.flightscope_df.iterrows():
-            # Verificar que existe fecha
-            if pd.isna(shot['fecha']):
-                continue
-
-            palo = shot['palo']
-            if palo not in long_game_clubs:
-                continue
-
-            # Extraer mes
-            try:
-                fecha = pd.to_datetime(shot['fecha'])
-                month_key = fecha.strftime('%Y-%m')
-            except:
-                continue
-
-            # Obtener distancia
-            distance = shot['vuelo_act']
-            if pd.notna(distance) and distance > 0:
-                monthly_data[month_key][palo].append(distance)
-
-        # Promediar por mes
-        sorted_months = sorted(monthly_data.keys())
+        # Meses con distancia válida (> 0) en algún palo del grupo — pivot mes × palo
+        pivot = self.shot_pivot
+        sorted_months = pivot.months_with('carry', long_game_clubs)
 
         if len(sorted_months) == 0:
             logger.warning("No data available for temporal long game")
@@ -2325,28 +2011,13 @@ class DashboardDataGenerator:
             }
 
         # Formatear labels (MMM YYYY)
-        labels = []
-        for month in sorted_months:
-            try:
-                fecha = datetime.strptime(month, '%Y-%m')
-                labels.append(fecha.strftime('%b %Y'))
-            except:
-                labels.append(month)
+        labels = pivot.labels(sorted_months)
 
-        # Calcular promedios por palo
+        # Promedios por palo (None para meses sin datos: mantiene continuidad del gráfico)
         result = {'labels': labels}
 
         for palo_code, palo_name in long_game_clubs.items():
-            palo_values = []
-            for month in sorted_months:
-                distances = monthly_data[month].get(palo_code, [])
-                if distances:
-                    avg_dist = sum(distances) / len(distances)
-                    palo_values.append(round(avg_dist, 1))
-                else:
-                    # None para meses sin datos (mantiene continuidad del gráfico)
-                    palo_values.append(None)
-
+            palo_values = pivot.to_list(pivot.club_series('carry', palo_code, months=sorted_months), 1)
             result[palo_name] = palo_values
 
         # Calcular estadísticas
@@ -2380,9 +2051,6 @@ class DashboardDataGenerator:
         """
         logger.info("Calculating temporal evolution: Irons (5i-9i)")
 
-        from datetime import datetime
-        from collections import defaultdict
-
         # Definir hierros
         irons_clubs = {
             '5i': 'iron_5',
@@ -2392,32 +2060,9 @@ class DashboardDataGenerator:
             '9i': 'iron_9'
         }
 
-        # Agrupar shots por mes y palo
-        monthly_data = defaultdict(lambda: defaultdict(list))
-
-        for _, shot in self.flightscope_df.iterrows():
-            # Verificar que existe fecha
-            if pd.isna(shot['fecha']):
-                continue
-
-            palo = shot['palo']
-            if palo not in irons_clubs:
-                continue
-
-            # Extraer mes
-            try:
-                fecha = pd.to_datetime(shot['fecha'])
-                month_key = fecha.strftime('%Y-%m')
-            except:
-                continue
-
-            # Obtener distancia
-            distance = shot['vuelo_act']
-            if pd.notna(distance) and distance > 0:
-                monthly_data[month_key][palo].append(distance)
-
-        # Promediar por mes
-        sorted_months = sorted(monthly_data.keys())
+        # Meses con distancia válida (> 0) en algún palo del grupo — pivot mes × palo
+        pivot = self.shot_pivot
+        sorted_months = pivot.months_with('carry', irons_clubs)
 
         if len(sorted_months) == 0:
             logger.warning("No data available for irons evolution")
@@ -2431,28 +2076,13 @@ class DashboardDataGenerator:
             }
 
         # Formatear labels (MMM YYYY)
-        labels = []
-        for month in sorted_months:
-            try:
-                fecha = datetime.strptime(month, '%Y-%m')
-                labels.append(fecha.strftime('%b %Y'))
-            except:
-                labels.append(month)
+        labels = pivot.labels(sorted_months)
 
-        # Calcular promedios por palo
+        # Promedios por palo (None para meses sin datos: mantiene continuidad del gráfico)
         result = {'labels': labels}
 
         for palo_code, palo_name in irons_clubs.items():
-            palo_values = []
-            for month in sorted_months:
-                distances = monthly_data[month].get(palo_code, [])
-                if distances:
-                    avg_dist = sum(distances) / len(distances)
-                    palo_values.append(round(avg_dist, 1))
-                else:
-                    # None para meses sin datos
-                    palo_values.append(None)
-
+            palo_values = pivot.to_list(pivot.club_series('carry', palo_code, months=sorted_months), 1)
             result[palo_name] = palo_values
 
         # Calcular estadísticas
@@ -2488,9 +2118,6 @@ class DashboardDataGenerator:
         """
         logger.info("Calculating temporal evolution: Wedges (PW, GW, SW)")
 
-        from datetime import datetime
-        from collections import defaultdict
-
         # Definir wedges
         wedges_clubs = {
             'PW': 'pitching_wedge',
@@ -2498,32 +2125,9 @@ class DashboardDataGenerator:
             'SW 58': 'sand_wedge'
         }
 
-        # Agrupar shots por mes y palo
-        monthly_data = defaultdict(lambda: defaultdict(list))
-
-        for _, shot in self.flightscope_df.iterrows():
-            # Verificar que existe fecha
-            if pd.isna(shot['fecha']):
-                continue
-
-            palo = shot['palo']
-            if palo not in wedges_clubs:
-                continue
-
-            # Extraer mes
-            try:
-                fecha = pd.to_datetime(shot['fecha'])
-                month_key = fecha.strftime('%Y-%m')
-            except:
-                continue
-
-            # Obtener distancia
-            distance = shot['vuelo_act']
-            if pd.notna(distance) and distance > 0:
-                monthly_data[month_key][palo].append(distance)
-
-        # Promediar por mes
-        sorted_months = sorted(monthly_data.keys())
+        # Meses con distancia válida (> 0) en algún palo del grupo — pivot mes × palo
+        pivot = self.shot_pivot
+        sorted_months = pivot.months_with('carry', wedges_clubs)
 
         if len(sorted_months) == 0:
             logger.warning("No data available for wedges evolution")
@@ -2535,28 +2139,13 @@ class DashboardDataGenerator:
             }
 
         # Formatear labels (MMM YYYY)
-        labels = []
-        for month in sorted_months:
-            try:
-                fecha = datetime.strptime(month, '%Y-%m')
-                labels.append(fecha.strftime('%b %Y'))
-            except:
-                labels.append(month)
+        labels = pivot.labels(sorted_months)
 
-        # Calcular promedios por palo
+        # Promedios por palo (None para meses sin datos: mantiene continuidad del gráfico)
         result = {'labels': labels}
 
         for palo_code, palo_name in wedges_clubs.items():
-            palo_values = []
-            for month in sorted_months:
-                distances = monthly_data[month].get(palo_code, [])
-                if distances:
-                    avg_dist = sum(distances) / len(distances)
-                    palo_values.append(round(avg_dist, 1))
-                else:
-                    # None para meses sin datos
-                    palo_values.append(None)
-
+            palo_values = pivot.to_list(pivot.club_series('carry', palo_code, months=sorted_months), 1)
             result[palo_name] = palo_values
 
         # Calcular estadísticas
@@ -2586,46 +2175,12 @@ class DashboardDataGenerator:
         """
         logger.info("Calculating temporal evolution: Attack Angle")
 
-        from datetime import datetime
-        from collections import defaultdict
-
-        # Agrupar shots por mes
-        monthly_data = defaultdict(list)
-
-        for _, shot in self.flightscope_df.iterrows():
-            # Verificar que existe fecha
-            if pd.isna(shot['fecha']):
-                continue
-
-            # Solo analizar Driver (el más relevante para attack angle)
-            palo = shot['palo']
-            if palo != 'Dr':
-                continue
-
-            # Extraer mes
-            try:
-                fecha = pd.to_datetime(shot['fecha'])
-                month_key = fecha.strftime('%Y-%m')
-            except:
-                continue
-
-            # Calcular attack angle estimado
-            # Basado en launch angle y spin
-            # Attack angle típico driver: -5° a +5° (negativo = descending, positivo = ascending)
-            # Estimación: attack_angle ≈ launch_angle - 10° (aproximación)
-            launch_angle = shot['ang_lanzamiento']
-            if pd.notna(launch_angle):
-                try:
-                    # Convertir a float explícitamente
-                    launch_angle_float = float(launch_angle)
-                    # Estimación simple: attack angle suele ser ~10° menor que launch angle
-                    attack_angle_est = launch_angle_float - 10.0
-                    monthly_data[month_key].append(attack_angle_est)
-                except (ValueError, TypeError):
-                    continue
-
-        # Promediar por mes
-        sorted_months = sorted(monthly_data.keys())
+        # Solo Driver (el más relevante para attack angle) — pivot mes × palo
+        # Attack angle típico driver: -5° a +5° (negativo = descending, positivo = ascending)
+        # Estimación simple: attack angle suele ser ~10° menor que launch angle
+        pivot = self.shot_pivot
+        sorted_months = pivot.months_with('launch', ['Dr'])
+        attack_series = pivot.club_series('launch', 'Dr', months=sorted_months) - 10.0
 
         if len(sorted_months) == 0:
             logger.warning("No data available for attack angle evolution")
@@ -2635,22 +2190,8 @@ class DashboardDataGenerator:
             }
 
         # Formatear labels (MMM YYYY)
-        labels = []
-        attack_angles = []
-
-        for month in sorted_months:
-            try:
-                fecha = datetime.strptime(month, '%Y-%m')
-                labels.append(fecha.strftime('%b %Y'))
-            except:
-                labels.append(month)
-
-            angles = monthly_data[month]
-            if angles:
-                avg_angle = sum(angles) / len(angles)
-                attack_angles.append(round(avg_angle, 1))
-            else:
-                attack_angles.append(None)
+        labels = pivot.labels(sorted_months)
+        attack_angles = pivot.to_list(attack_series, 1)
 
         # Calcular estadísticas
         valid_angles = [a for a in attack_angles if a is not None]
@@ -2688,9 +2229,6 @@ class DashboardDataGenerator:
         """
         logger.info("Calculating temporal evolution: Smash Factor by category")
 
-        from datetime import datetime
-        from collections import defaultdict
-
         # Definir categorías de palos
         categories = {
             'driver': ['Dr'],
@@ -2699,63 +2237,19 @@ class DashboardDataGenerator:
             'wedges': ['PW', 'GW 52', 'SW 58']
         }
 
-        # Agrupar shots por mes y categoría
-        monthly_data = defaultdict(lambda: defaultdict(list))
-
-        for _, shot in self.flightscope_df.iterrows():
-            # Verificar que existe fecha
-            if pd.isna(shot['fecha']):
-                continue
-
-            palo = shot['palo']
-
-            # Determinar categoría del palo
-            category = None
-            for cat_name, cat_clubs in categories.items():
-                if palo in cat_clubs:
-                    category = cat_name
-                    break
-
-            if category is None:
-                continue
-
-            # Extraer mes
-            try:
-                fecha = pd.to_datetime(shot['fecha'])
-                month_key = fecha.strftime('%Y-%m')
-            except:
-                continue
-
-            # Obtener velocidad de bola (km/h)
-            ball_speed = shot['velocidad_bola']
-            if pd.notna(ball_speed) and ball_speed > 0:
-                try:
-                    ball_speed_float = float(ball_speed)
-
-                    # Estimar club speed basado en smash factor típico
-                    # Smash Factor = Ball Speed / Club Speed
-                    # Club Speed = Ball Speed / Smash Factor típico
-                    typical_smash = {
-                        'driver': 1.45,
-                        'woods': 1.40,
-                        'irons': 1.35,
-                        'wedges': 1.30
-                    }[category]
-
-                    # Estimamos club speed
-                    est_club_speed = ball_speed_float / typical_smash
-
-                    # Calculamos smash factor real (puede variar del típico)
-                    # En este caso usamos el típico como base, pero podríamos
-                    # calcular variaciones si tuviéramos más datos
-                    smash_factor = ball_speed_float / est_club_speed
-
-                    monthly_data[month_key][category].append(smash_factor)
-                except (ValueError, TypeError):
-                    continue
+        # Smash Factor = Ball Speed / Club Speed. Sin club speed medido se estima
+        # Club Speed = Ball Speed / Smash Factor típico de la categoría
+        typical_smash = {
+            'driver': 1.45,
+            'woods': 1.40,
+            'irons': 1.35,
+            'wedges': 1.30
+        }
 
-        # Promediar por mes
-        sorted_months = sorted(monthly_data.keys())
+        # Meses con velocidad de bola válida (> 0) en alguna categoría — pivot mes × palo
+        pivot = self.shot_pivot
+        all_clubs = [club for clubs in categories.values() for club in clubs]
+        sorted_months = pivot.months_with('ball_speed', all_clubs)
 
         if len(sorted_months) == 0:
             logger.warning("No data available for smash factor evolution")
@@ -2768,29 +2262,15 @@ class DashboardDataGenerator:
             }
 
         # Formatear labels (MMM YYYY)
-        labels = []
-        for month in sorted_months:
-            try:
-                fecha = datetime.strptime(month, '%Y-%m')
-                labels.append(fecha.strftime('%b %Y'))
-            except:
-                labels.append(month)
+        labels = pivot.labels(sorted_months)
 
-        # Calcular promedios por categoría
+        # Calcular promedios por categoría (None para meses sin datos)
         result = {'labels': labels}
 
         for category in ['driver', 'woods', 'irons', 'wedges']:
-            category_values = []
-            for month in sorted_months:
-                smash_factors = monthly_data[month].get(category, [])
-                if smash_factors:
-                    avg_smash = sum(smash_factors) / len(smash_factors)
-                    category_values.append(round(avg_smash, 2))
-                else:
-                    # None para meses sin datos
-                    category_values.append(None)
-
-            result[category] = category_values
+            ball_speed = pivot.pooled_mean('ball_speed', categories[category], months=sorted_months)
+            est_club_speed = ball_speed / typical_smash[category]
+            result[category] = pivot.to_list(ball_speed / est_club_speed, 2)
 
         # Calcular estadísticas
         driver_values = [v for v in result['driver'] if v is not None]
@@ -2830,23 +2310,19 @@ class DashboardDataGenerator:
 
         campo_performance = {}
 
-        # Iterar sobre cada campo en tarjetas_data
-        for campo_nombre, campo_data in self.tarjetas_data.items():
-            rondas = campo_data.get('rondas', [])
-
-            if not rondas:
+        # Iterar sobre cada campo (grupos de la RoundsTable)
+        rt = self.rounds
+        for cid, idx in rt.course_groups():
+            if len(idx) == 0:
                 continue
 
-            # Extraer todos los scores del campo
-            scores = [ronda['total_ronda'] for ronda in rondas if 'total_ronda' in ronda]
-
-            if not scores:
-                continue
+            scores = rt.score[idx]
+            campo_nombre = rt.courses[cid]
 
             # Calcular estadísticas
-            best_score = min(scores)
-            worst_score = max(scores)
-            average_score = sum(scores) / len(scores)
+            best_score = int(scores.min())
+            worst_score = int(scores.max())
+            average_score = int(scores.sum()) / len(scores)
             rounds_count = len(scores)
 
             campo_performance[campo_nombre] = {
@@ -2971,61 +2447,24 @@ class DashboardDataGenerator:
         # Usa fórmula WHS: mejores 8 de últimos 20 diferenciales × 0.96
         logger.info("Using estimated HCP data (WHS formula, no official PDF found)")
 
-        all_rounds = []
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                all_rounds.append({
-                    'fecha': ronda['fecha'],
-                    'score': ronda['total_ronda']
-                })
+        rt = self.rounds
 
-        all_rounds.sort(key=lambda x: x['fecha'])
-
-        if len(all_rounds) < 5:
+        if len(rt) < 5:
             return {
                 'labels': [],
                 'values': [],
                 'source': 'estimated'
             }
 
-        course_rating = 72
-        slope = 113
+        # Diferenciales en orden cronológico (CR 72 / slope 113 estándar) y
+        # HCP rolling tras cada ronda (best 8 of last 20 × 0.96)
+        differentials = score_differentials(rt.score)
+        hcp = rolling_index(differentials, lowest=legacy_lowest, factor=LEGACY_FACTOR)
 
-        # Calcular diferenciales en orden cronológico
-        round_diffs = []
-        for ronda in all_rounds:
-            try:
-                fecha = datetime.strptime(ronda['fecha'], '%Y-%m-%d')
-            except:
-                continue
-            differential = (ronda['score'] - course_rating) * 113 / slope
-            round_diffs.append({'fecha': fecha, 'diff': differential})
-
-        # Calcular HCP rolling al final de cada mes (WHS: best 8 of last 20 × 0.96)
-        labels = []
-        values = []
-        seen_months = set()
-
-        for i, entry in enumerate(round_diffs):
-            month_key = entry['fecha'].strftime('%Y-%m')
-            # Solo registrar el último valor de cada mes
-            if month_key in seen_months:
-                # Actualizar el valor para este mes (última ronda del mes)
-                available = [d['diff'] for d in round_diffs[:i + 1]]
-                last_20 = available[-20:]
-                n_best = min(8, len(last_20))
-                best_n = sorted(last_20)[:n_best]
-                hcp = (sum(best_n) / len(best_n)) * 0.96
-                values[-1] = round(hcp, 1)
-            else:
-                seen_months.add(month_key)
-                available = [d['diff'] for d in round_diffs[:i + 1]]
-                last_20 = available[-20:]
-                n_best = min(8, len(last_20))
-                best_n = sorted(last_20)[:n_best]
-                hcp = (sum(best_n) / len(best_n)) * 0.96
-                labels.append(entry['fecha'].strftime('%b %Y'))
-                values.append(round(hcp, 1))
+        # Último valor de cada mes
+        months = Windows.buckets(rt.month_id)
+        labels = [datetime(m // 12, m % 12 + 1, 1).strftime('%b %Y') for m in months.keys.tolist()]
+        values = [round(v, 1) for v in hcp[months.end - 1].tolist()]
 
         logger.success(f"HCP evolution RFEG: {len(labels)} months (WHS estimated), "
                        f"range={min(values)}-{max(values)}")
@@ -3036,6 +2475,44 @@ class DashboardDataGenerator:
             'source': 'estimated_whs'
         }
 
+    def calculate_hcp_index_timeline(self):
+        """
+        Handicap Index estimado tras CADA ronda (WHS 2020).
+
+        Diferenciales con el course rating / slope de cada campo (estándar
+        72 / 113 si faltan) y media de los mejores de los últimos 20 según la
+        tabla WHS (3 rondas → mejor 1 − 2.0 ... 20 → mejores 8).
+
+        Returns:
+            dict: {
+                'dates': ['2024-04-06', ...],
+                'differentials': [24.1, ...],
+                'index': [None, None, 22.1, ...],   # None hasta 3 rondas
+                'current': 21.4,
+                'low': 19.8,
+                'course_adjusted': 48               # rondas con CR/slope del campo
+            }
+        """
+        logger.info("Calculating HCP index timeline (WHS, per round)")
+
+        rt = self.rounds
+        differentials = score_differentials(rt.score, rt.vc, rt.slope)
+        index = rolling_index(differentials)
+
+        valid = ~np.isnan(index)
+        result = {
+            'dates': list(rt.date_str),
+            'differentials': [round(d, 1) for d in differentials.tolist()],
+            'index': [round(v, 1) if ok else None for v, ok in zip(index.tolist(), valid.tolist())],
+            'current': round(float(index[valid][-1]), 1) if valid.any() else None,
+            'low': round(float(index[valid].min()), 1) if valid.any() else None,
+            'course_adjusted': int((~np.isnan(rt.vc) & ~np.isnan(rt.slope)).sum()),
+            'method': f'WHS best {WHS_BEST} of {WHS_WINDOW}'
+        }
+
+        logger.success(f"HCP index timeline: {len(rt)} rounds, current={result['current']}, low={result['low']}")
+        return result
+
     def calculate_scoring_zones_by_course(self):
         """
         Calcula distribución de scoring por campo (birdies, pars, bogeys, etc).
@@ -3054,69 +2531,19 @@ class DashboardDataGenerator:
                     'total_holes': 250,
                     'birdie_rate': 0.8,  # %
                     'par_rate': 18.0,
-                    'bogey_rate': 48.0
+                    'bogey_rate': 48.0,
+                    'double_plus_rate': 15.0,
+                    'front_nine': {rounds, avg_strokes, avg_over_par},
+                    'back_nine': {rounds, avg_strokes, avg_over_par},
+                    'holes': {par: [18], avg_strokes: [18], avg_over_par: [18]},
+                    'difficulty_rank': [7, 12, ...]   # hoyos, más difícil primero
                 }
             }
         """
         logger.info("Calculating scoring zones by course")
 
-        scoring_zones = {}
-
-        for campo_nombre, campo_data in self.tarjetas_data.items():
-            rondas = campo_data.get('rondas', [])
-
-            if not rondas:
-                continue
-
-            # Contadores
-            birdies = 0
-            pars = 0
-            bogeys = 0
-            double_bogeys = 0
-            triple_plus = 0
-            total_holes = 0
-
-            # Analizar cada ronda
-            for ronda in rondas:
-                hoyos = ronda.get('hoyos', [])
-
-                for hoyo in hoyos:
-                    if 'score' not in hoyo or 'par' not in hoyo:
-                        continue
-
-                    score = hoyo['score']
-                    par = hoyo['par']
-                    diff = score - par
-
-                    total_holes += 1
-
-                    if diff <= -1:  # Birdie or better
-                        birdies += 1
-                    elif diff == 0:  # Par
-                        pars += 1
-                    elif diff == 1:  # Bogey
-                        bogeys += 1
-                    elif diff == 2:  # Double bogey
-                        double_bogeys += 1
-                    else:  # Triple or worse
-                        triple_plus += 1
-
-            if total_holes == 0:
-                continue
-
-            # Calcular porcentajes
-            scoring_zones[campo_nombre] = {
-                'birdies': birdies,
-                'pars': pars,
-                'bogeys': bogeys,
-                'double_bogeys': double_bogeys,
-                'triple_plus': triple_plus,
-                'total_holes': total_holes,
-                'birdie_rate': round((birdies / total_holes) * 100, 1),
-                'par_rate': round((pars / total_holes) * 100, 1),
-                'bogey_rate': round((bogeys / total_holes) * 100, 1),
-                'double_plus_rate': round(((double_bogeys + triple_plus) / total_holes) * 100, 1)
-            }
+        # Matriz rondas × 18 vs par por hoyo de cada campo, todos los campos a la vez
+        scoring_zones = course_hole_stats(self.rounds)
 
         logger.success(f"Scoring zones: {len(scoring_zones)} campos analizados, "
                        f"total holes={sum(z['total_holes'] for z in scoring_zones.values())}")
@@ -3143,48 +2570,28 @@ class DashboardDataGenerator:
         """
         logger.info("Calculating volatility index by quarter")
 
-        from datetime import datetime
-        from collections import defaultdict
-        import math
+        rt = self.rounds
 
-        quarterly_data = defaultdict(list)
-
-        # Agrupar rondas por quarter
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                try:
-                    fecha = datetime.strptime(ronda['fecha'], '%Y-%m-%d')
-                    year = fecha.year
-                    quarter = (fecha.month - 1) // 3 + 1
-                    quarter_key = f"Q{quarter} {year}"
-                except:
-                    continue
+        # Un bucket por trimestre (RoundsTable ordenada → trimestres contiguos)
+        stats = RollingStats(rt.score)
+        quarters = Windows.buckets(rt.quarter_id, min_periods=2)
+        avg, std, cv = stats.mean(quarters), stats.std(quarters), stats.cv(quarters)
 
-                score = ronda['total_ronda']
-                quarterly_data[quarter_key].append(score)
-
-        # Calcular métricas por quarter
         volatility_index = []
-
-        for quarter_key in sorted(quarterly_data.keys()):
-            scores = quarterly_data[quarter_key]
-
-            if len(scores) < 2:
+        for i, quarter_id in enumerate(quarters.keys.tolist()):
+            if not quarters.valid[i]:
                 continue
-
-            avg_score = sum(scores) / len(scores)
-            variance = sum((s - avg_score) ** 2 for s in scores) / len(scores)
-            std_dev = math.sqrt(variance)
-            cv = (std_dev / avg_score * 100) if avg_score > 0 else 0
-
             volatility_index.append({
-                'quarter': quarter_key,
-                'avg_score': round(avg_score, 1),
-                'std_dev': round(std_dev, 1),
-                'coefficient_variation': round(cv, 1),
-                'rounds': len(scores)
+                'quarter': f"Q{quarter_id % 4 + 1} {quarter_id // 4}",
+                'avg_score': round(float(avg[i]), 1),
+                'std_dev': round(float(std[i]), 1),
+                'coefficient_variation': round(float(cv[i]), 1),
+                'rounds': int(quarters.count[i])
             })
 
+        # Mismo orden que antes: por etiqueta 'Qn YYYY'
+        volatility_index.sort(key=lambda q: q['quarter'])
+
         logger.success(f"Volatility index: {len(volatility_index)} quarters analyzed")
 
         return volatility_index
@@ -3211,46 +2618,29 @@ class DashboardDataGenerator:
         logger.info("Calculating estado forma (form status) - last 12 months")
 
         from datetime import datetime, timedelta
-        from collections import defaultdict
 
         # Calcular fecha límite (últimos 12 meses)
         today = datetime.now()
         twelve_months_ago = today - timedelta(days=365)
 
-        # Agrupar rondas por mes
-        monthly_data = defaultdict(list)
-        all_scores = []
-
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                try:
-                    fecha = datetime.strptime(ronda['fecha'], '%Y-%m-%d')
-
-                    # Solo últimos 12 meses
-                    if fecha < twelve_months_ago:
-                        continue
-
-                    month_key = fecha.strftime('%Y-%m')
-                    score = ronda['total_ronda']
-
-                    monthly_data[month_key].append(score)
-                    all_scores.append(score)
-                except:
-                    continue
-
-        if not all_scores:
+        # Rondas de los últimos 12 meses = sufijo de la RoundsTable (ordenada por fecha)
+        rt = self.rounds
+        first = int(np.searchsorted(rt.date, np.datetime64(twelve_months_ago), side='left'))
+        if first >= len(rt):
             logger.warning("No data for estado forma")
             return []
 
-        # Baseline: promedio total
-        baseline = sum(all_scores) / len(all_scores)
+        stats = RollingStats(rt.score[first:])
+        baseline = float(stats.mean(Windows.span(0, len(stats)))[0])
 
         # Calcular estado por mes
+        months = Windows.buckets(rt.month_id[first:])
+        monthly_avg = stats.mean(months)
+
         estado_forma = []
 
-        for month_key in sorted(monthly_data.keys()):
-            scores = monthly_data[month_key]
-            avg_score = sum(scores) / len(scores)
+        for i, month_id in enumerate(months.keys.tolist()):
+            avg_score = float(monthly_avg[i])
             vs_baseline = avg_score - baseline
 
             # Determinar estado
@@ -3263,16 +2653,12 @@ class DashboardDataGenerator:
             else:
                 form = "poor"
 
-            try:
-                fecha = datetime.strptime(month_key, '%Y-%m')
-                month_label = fecha.strftime('%b %Y')
-            except:
-                month_label = month_key
+            month_label = datetime(month_id // 12, month_id % 12 + 1, 1).strftime('%b %Y')
 
             estado_forma.append({
                 'month': month_label,
                 'avg_score': round(avg_score, 1),
-                'rounds': len(scores),
+                'rounds': int(months.count[i]),
                 'vs_baseline': round(vs_baseline, 1),
                 'form': form
             })
@@ -3308,10 +2694,8 @@ class DashboardDataGenerator:
         from collections import defaultdict
 
         # Extraer todos los scores
-        all_scores = []
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                all_scores.append(ronda['total_ronda'])
+        rt = self.rounds
+        all_scores = rt.score[rt.insertion_order()].tolist()
 
         if len(all_scores) < 10:
             logger.warning("Insufficient data for HCP curve position")
@@ -3403,20 +2787,12 @@ class DashboardDataGenerator:
         """
         logger.info("Calculating differential distribution")
 
-        # Course rating y slope estándar
-        course_rating = 72
-        slope = 113
-
-        differentials = []
+        # Differential = (Score - Course Rating) * 113 / Slope Rating, con CR 72 / slope 113
+        # estándar, en el orden de las tarjetas
+        rt = self.rounds
+        differentials = score_differentials(rt.score[rt.insertion_order()])
 
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                score = ronda['total_ronda']
-                # Differential = (Score - Course Rating) * 113 / Slope Rating
-                differential = ((score - course_rating) * 113 / slope)
-                differentials.append(differential)
-
-        if not differentials:
+        if not len(differentials):
             logger.warning("No data for differential distribution")
             return {
                 'differentials': [],
@@ -3425,24 +2801,19 @@ class DashboardDataGenerator:
             }
 
         # Clasificar differentials
-        distribution = {
-            'excellent': sum(1 for d in differentials if d < 15),
-            'good': sum(1 for d in differentials if 15 <= d < 20),
-            'average': sum(1 for d in differentials if 20 <= d < 25),
-            'poor': sum(1 for d in differentials if 25 <= d < 30),
-            'very_poor': sum(1 for d in differentials if d >= 30)
-        }
+        bands = np.searchsorted([15, 20, 25, 30], differentials, side='right')
+        counts = np.bincount(bands, minlength=5).tolist()
+        distribution = dict(zip(['excellent', 'good', 'average', 'poor', 'very_poor'], counts))
 
         # Estadísticas
-        differentials_sorted = sorted(differentials)
-        n = len(differentials_sorted)
-        median = differentials_sorted[n // 2] if n > 0 else 0
+        n = len(differentials)
+        median = float(np.sort(differentials)[n // 2])
 
         stats = {
-            'mean': round(sum(differentials) / n, 1) if n > 0 else 0,
+            'mean': round(sum(differentials.tolist()) / n, 1),
             'median': round(median, 1),
-            'best': round(min(differentials), 1) if differentials else 0,
-            'worst': round(max(differentials), 1) if differentials else 0,
+            'best': round(float(differentials.min()), 1),
+            'worst': round(float(differentials.max()), 1),
             'total_rounds': n
         }
 
@@ -3450,7 +2821,7 @@ class DashboardDataGenerator:
                        f"mean={stats['mean']}, median={stats['median']}")
 
         return {
-            'differentials': [round(d, 1) for d in differentials],
+            'differentials': [round(d, 1) for d in differentials.tolist()],
             'distribution': distribution,
             'stats': stats
         }
@@ -3475,21 +2846,10 @@ class DashboardDataGenerator:
         from datetime import datetime, timedelta
         import math
 
-        # Extraer rondas con fecha
-        rounds_with_date = []
+        # Rondas con fecha, ya en orden cronológico (RoundsTable)
+        rt = self.rounds
 
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                try:
-                    fecha = datetime.strptime(ronda['fecha'], '%Y-%m-%d')
-                    rounds_with_date.append({
-                        'fecha': fecha,
-                        'score': ronda['total_ronda']
-                    })
-                except:
-                    continue
-
-        if len(rounds_with_date) < 10:
+        if len(rt) < 10:
             logger.warning("Insufficient data for prediction model")
             return {
                 'predicted_score': 0,
@@ -3498,43 +2858,20 @@ class DashboardDataGenerator:
                 'model_accuracy': 0
             }
 
-        # Ordenar por fecha
-        rounds_with_date.sort(key=lambda x: x['fecha'])
-
         # Tomar últimas 20 rondas para predicción
-        recent_rounds = rounds_with_date[-20:]
-
-        # Preparar datos para regresión
-        n = len(recent_rounds)
-        x_values = list(range(n))  # 0, 1, 2, ..., n-1
-        y_values = [r['score'] for r in recent_rounds]
+        y_values = rt.score[-20:].tolist()
 
-        # Calcular regresión lineal simple
-        x_mean = sum(x_values) / n
-        y_mean = sum(y_values) / n
-
-        numerator = sum((x_values[i] - x_mean) * (y_values[i] - y_mean) for i in range(n))
-        denominator = sum((x_values[i] - x_mean) ** 2 for i in range(n))
-
-        if denominator == 0:
-            slope = 0
-        else:
-            slope = numerator / denominator
-
-        intercept = y_mean - slope * x_mean
+        # Regresión lineal score vs índice de ronda (0, 1, ..., n-1)
+        n = len(y_values)
+        fit = fit_line(y_values)
+        slope = float(fit.slope[0])
 
         # Predecir próximo score (x = n)
-        predicted_score = slope * n + intercept
-
-        # Calcular R² (model accuracy)
-        y_pred = [slope * x + intercept for x in x_values]
-        ss_res = sum((y_values[i] - y_pred[i]) ** 2 for i in range(n))
-        ss_tot = sum((y_values[i] - y_mean) ** 2 for i in range(n))
-
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+        predicted_score = float(fit.predict(n)[0])
 
-        # Calcular std error
-        std_error = math.sqrt(ss_res / (n - 2)) if n > 2 else 5
+        # R² (model accuracy) y std error de los residuos
+        r_squared = float(fit.r2[0])
+        std_error = float(fit.resid_std[0]) if n > 2 else 5
 
         # Banda de confianza 95% (±1.96 * std_error)
         confidence_range = [
@@ -3584,23 +2921,13 @@ class DashboardDataGenerator:
         """
         logger.info("Calculating ROI practice (practice frequency vs improvement)")
 
-        from datetime import datetime
-        from collections import defaultdict
-
-        # Agrupar rondas por quarter
-        quarterly_data = defaultdict(list)
-
-        for campo_data in self.tarjetas_data.values():
-            for ronda in campo_data['rondas']:
-                try:
-                    fecha = datetime.strptime(ronda['fecha'], '%Y-%m-%d')
-                    year = fecha.year
-                    quarter = (fecha.month - 1) // 3 + 1
-                    quarter_key = f"Q{quarter} {year}"
-
-                    quarterly_data[quarter_key].append(ronda['total_ronda'])
-                except:
-                    continue
+        # Agrupar rondas por quarter. Las claves 'Q{q} {año}' se recorren en orden
+        # de texto (trimestre antes que año), como siempre ha salido este análisis.
+        rt = self.rounds
+        quarterly_data = {}
+        for quarter_id in np.unique(rt.quarter_id).tolist():
+            year, quarter = RoundsTable.quarter_parts(quarter_id)
+            quarterly_data[f"Q{quarter} {year}"] = rt.score[rt.quarter_id == quarter_id].tolist()
 
         if len(quarterly_data) < 3:
             logger.warning("Insufficient data for ROI practice")
@@ -3645,18 +2972,7 @@ class DashboardDataGenerator:
         scores_list = [q['avg_score'] for q in analysis]
 
         if len(rounds_list) > 2:
-            n = len(rounds_list)
-            r_mean = sum(rounds_list) / n
-            s_mean = sum(scores_list) / n
-
-            numerator = sum((rounds_list[i] - r_mean) * (scores_list[i] - s_mean) for i in range(n))
-            denom_r = sum((rounds_list[i] - r_mean) ** 2 for i in range(n))
-            denom_s = sum((scores_list[i] - s_mean) ** 2 for i in range(n))
-
-            if denom_r > 0 and denom_s > 0:
-                correlation = numerator / (denom_r ** 0.5 * denom_s ** 0.5)
-            else:
-                correlation = 0
+            correlation = float(fit_line(scores_list, rounds_list).correlation[0])
         else:
             correlation = 0
 
@@ -3685,18 +3001,19 @@ class DashboardDataGenerator:
         """
         TASK 11.1: Genera heat map de zonas de caída de shots.
 
-        Analiza donde caen los shots (scatter plot con densidad) para
-        visualizar patrones de dispersión y zonas más frecuentes.
+        Analiza donde caen los shots (KDE binned en servidor, ver
+        app/shot_density.py) para visualizar patrones de dispersión y zonas
+        más frecuentes. El tamaño no crece con el nº de golpes.
 
         Returns:
             dict: {
+                'grid': {x_range, y_range, cols, rows, sigma, kernel_radius, step, encoding},
+                'all': {'row0', 'col0', 'rows', 'cols', 'max', 'data'},   # todos los palos
                 'zones': [
                     {
                         'club': str,
-                        'shots': [
-                            {'x': float, 'y': float, 'distance': float},
-                            ...
-                        ]
+                        'count': int,
+                        'density': {'row0', 'col0', 'rows', 'cols', 'max', 'data'}
                     },
                     ...
                 ],
@@ -3717,6 +3034,7 @@ class DashboardDataGenerator:
 
         zones = []
         total_shots = 0
+        all_grid = None
         density_counts = {
             'center': 0,
             'left': 0,
@@ -3728,61 +3046,35 @@ class DashboardDataGenerator:
         # Agrupar por club
         club_groups = self.flightscope_df.groupby('palo')
 
-        # Procesar cada club
+        # Procesar cada club (lateral_m: metros con signo, + = derecha, - = izquierda)
         for club, club_df in club_groups:
-            shot_points = []
-
-            for _, row in club_df.iterrows():
-                try:
-                    # Extraer coordenadas (desviación lateral y carry distance)
-                    lateral = row['lateral_vuelo']  # meters, + = derecha, - = izquierda
-                    carry = row['vuelo_act']  # meters (carry distance)
-
-                    # Convertir a float con manejo de errores
-                    carry_val = float(carry) if pd.notna(carry) and str(carry).replace('.', '', 1).replace('-', '', 1).isdigit() else None
-                    if carry_val is None or carry_val <= 0:
-                        continue
-
-                    lateral_val = 0
-                    if pd.notna(lateral):
-                        lateral_str = str(lateral).replace(',', '.').replace('D', '').replace('I', '').strip()
-                        try:
-                            lateral_val = float(lateral_str)
-                        except:
-                            lateral_val = 0
-
-                    shot_points.append({
-                        'x': lateral_val,
-                        'y': carry_val,
-                        'distance': carry_val
-                    })
-
-                    total_shots += 1
-
-                    # Clasificar en zonas de densidad
-                    if abs(lateral_val) <= 5:  # Centro: ±5m
-                        density_counts['center'] += 1
-                    elif lateral_val < -5:  # Izquierda
-                        density_counts['left'] += 1
-                    elif lateral_val > 5:  # Derecha
-                        density_counts['right'] += 1
-                except Exception as e:
-                    # Skip invalid rows
-                    continue
-
-            # Clasificar por longitud después de procesar todos los shots del club
-            if shot_points:
-                avg_carry = sum(s['distance'] for s in shot_points) / len(shot_points)
-                for shot in shot_points:
-                    if shot['distance'] < avg_carry * 0.95:  # Corto
-                        density_counts['short'] += 1
-                    elif shot['distance'] > avg_carry * 1.05:  # Largo
-                        density_counts['long'] += 1
-
-                zones.append({
-                    'club': club,
-                    'shots': shot_points
-                })
+            carry = pd.to_numeric(club_df['vuelo_act'], errors='coerce')
+            valid = carry > 0
+            carry_arr = carry[valid].to_numpy(dtype=float)
+            lateral_arr = club_df['lateral_m'][valid].fillna(0).to_numpy(dtype=float)
+            if len(carry_arr) == 0:
+                continue
+            total_shots += len(carry_arr)
+
+            # Clasificar en zonas de densidad (centro: ±5m)
+            density_counts['center'] += int((np.abs(lateral_arr) <= 5).sum())
+            density_counts['left'] += int((lateral_arr < -5).sum())
+            density_counts['right'] += int((lateral_arr > 5).sum())
+
+            # Clasificar por longitud respecto al carry medio del club
+            avg_carry = sum(carry_arr.tolist()) / len(carry_arr)
+            density_counts['short'] += int((carry_arr < avg_carry * 0.95).sum())
+            density_counts['long'] += int((carry_arr > avg_carry * 1.05).sum())
+
+            # KDE del club (los grids son aditivos: "all" = suma de clubs)
+            grid = density_grid(lateral_arr, carry_arr)
+            all_grid = grid if all_grid is None else all_grid + grid
+
+            zones.append({
+                'club': club,
+                'count': len(carry_arr),
+                'density': encode_grid(grid)
+            })
 
         # Calcular porcentajes de densidad
         density_map = {}
@@ -3797,6 +3089,8 @@ class DashboardDataGenerator:
                        f"center={density_map.get('center', {}).get('percentage', 0)}%")
 
         return {
+            'grid': grid_spec(),
+            'all': encode_grid(all_grid) if all_grid is not None else None,
             'zones': zones,
             'density_map': density_map
         }
@@ -4147,19 +3441,14 @@ class DashboardDataGenerator:
         """
         logger.info("Calculating club distance comparison vs benchmarks")
 
-        # Benchmarks estándar (metros de carry promedio)
+        # Benchmarks estándar (metros de carry promedio, app.benchmarks)
         benchmarks = {
-            'Driver': {'pga': 280, 'hcp15': 225, 'hcp23': 200},
-            '3W': {'pga': 255, 'hcp15': 210, 'hcp23': 185},
-            'Hybrid': {'pga': 225, 'hcp15': 190, 'hcp23': 170},
-            '5i': {'pga': 195, 'hcp15': 170, 'hcp23': 155},
-            '6i': {'pga': 185, 'hcp15': 160, 'hcp23': 145},
-            '7i': {'pga': 170, 'hcp15': 150, 'hcp23': 135},
-            '8i': {'pga': 160, 'hcp15': 140, 'hcp23': 125},
-            '9i': {'pga': 145, 'hcp15': 130, 'hcp23': 115},
-            'PW': {'pga': 130, 'hcp15': 120, 'hcp23': 105},
-            'GW': {'pga': 110, 'hcp15': 100, 'hcp23': 90},
-            'SW': {'pga': 90, 'hcp15': 80, 'hcp23': 70}
+            club: {
+                'pga': benchmark(f'club_carry.{club}', PGA_LEVEL),
+                'hcp15': benchmark(f'club_carry.{club}', 15),
+                'hcp23': benchmark(f'club_carry.{club}', 23),
+            }
+            for club in CLUB_CARRY_BENCHMARKS
         }
 
         clubs_comparison = []
@@ -4399,7 +3688,7 @@ class DashboardDataGenerator:
             {
                 'category': 'Off the Tee (Driving)',
                 'player_avg': 32.5,     # Strokes per round
-                'hcp15_benchmark': 30.0,
+                'hcp15_benchmark': benchmark('strokes_per_round.off_the_tee', 15),
                 'strokes_gained': -2.5,  # Perdiendo 2.5 strokes vs HCP 15
                 'percentile': 35,
                 'rating': 'poor'
@@ -4407,7 +3696,7 @@ class DashboardDataGenerator:
             {
                 'category': 'Approach Shots',
                 'player_avg': 26.8,
-                'hcp15_benchmark': 25.0,
+                'hcp15_benchmark': benchmark('strokes_per_round.approach', 15),
                 'strokes_gained': -1.8,
                 'percentile': 40,
                 'rating': 'poor'
@@ -4415,7 +3704,7 @@ class DashboardDataGenerator:
             {
                 'category': 'Short Game',
                 'player_avg': 19.2,
-                'hcp15_benchmark': 21.0,
+                'hcp15_benchmark': benchmark('strokes_per_round.short_game', 15),
                 'strokes_gained': +1.8,  # Ganando 1.8 strokes (fortaleza!)
                 'percentile': 75,
                 'rating': 'excellent'
@@ -4423,7 +3712,7 @@ class DashboardDataGenerator:
             {
                 'category': 'Putting',
                 'player_avg': 31.5,
-                'hcp15_benchmark': 31.0,
+                'hcp15_benchmark': benchmark('strokes_per_round.putting', 15),
                 'strokes_gained': -0.5,
                 'percentile': 48,
                 'rating': 'average'
@@ -4431,7 +3720,7 @@ class DashboardDataGenerator:
             {
                 'category': 'Around the Green',
                 'player_avg': 8.2,
-                'hcp15_benchmark': 9.5,
+                'hcp15_benchmark': benchmark('strokes_per_round.around_the_green', 15),
                 'strokes_gained': +1.3,  # Ganando strokes
                 'percentile': 70,
                 'rating': 'good'
@@ -4439,7 +3728,7 @@ class DashboardDataGenerator:
             {
                 'category': 'Tee to Green',
                 'player_avg': 59.3,
-                'hcp15_benchmark': 55.0,
+                'hcp15_benchmark': benchmark('strokes_per_round.tee_to_green', 15),
                 'strokes_gained': -4.3,
                 'percentile': 32,
                 'rating': 'poor'
@@ -4875,14 +4164,17 @@ class DashboardDataGenerator:
         if len(rounds) < 2:
             return {'average': 0, 'best': 0, 'rounds': [], 'count': 0, 'streak_text': 'SIN DATOS', 'trend': 'no_data'}
 
+        # Últimas 5 rondas vs las 5 anteriores
+        n = len(rounds)
         last5 = rounds[-5:]
-        avg = round(sum(r['score'] for r in last5) / len(last5), 1)
-        best = min(r['score'] for r in last5)
+        stats = RollingStats(np.array([r['score'] for r in rounds], dtype=np.int64))
+        recent = Windows.span(max(n - 5, 0), n)
+        avg = round(float(stats.mean(recent)[0]), 1)
+        best = int(stats.min(recent)[0])
 
         # Trend: compare last 5 avg vs previous 5 avg
-        if len(rounds) >= 10:
-            prev5 = rounds[-10:-5]
-            prev_avg = sum(r['score'] for r in prev5) / len(prev5)
+        if n >= 10:
+            prev_avg = float(stats.mean(Windows.span(n - 10, n - 5))[0])
             if avg < prev_avg - 2:
                 trend = 'improving'
                 streak_text = 'EN RACHA'
@@ -4907,37 +4199,15 @@ class DashboardDataGenerator:
         logger.success(f"Form summary: avg={avg}, best={best}, trend={trend}")
         return result
 
-    def calculate_scoring_streaks(self, score_history, player_stats):
+    def calculate_scoring_streaks(self, player_stats):
         """Calcula rachas de rondas consecutivas bajo score esperado (par + hcp)."""
         logger.info("Calculando scoring streaks")
-        rounds = score_history.get('rounds', [])
         hcp = player_stats.get('handicap_actual', 23.2)
 
-        best_streak = 0
-        current_streak = 0
-        total_streaks = 0
-        in_streak = False
-
-        for r in rounds:
-            par = r.get('par', 72)
-            expected = par + hcp
-            if r['score'] <= expected:
-                current_streak += 1
-                if current_streak >= 2 and not in_streak:
-                    in_streak = True
-                if current_streak > best_streak:
-                    best_streak = current_streak
-            else:
-                if in_streak:
-                    total_streaks += 1
-                    in_streak = False
-                current_streak = 0
-
-        if in_streak:
-            total_streaks += 1
-
-        result = {'best': best_streak, 'total': total_streaks, 'current': current_streak}
-        logger.success(f"Scoring streaks: best={best_streak}, total={total_streaks}, current={current_streak}")
+        par = np.where(np.isnan(self.rounds.par), 72.0, self.rounds.par)
+        milestones = self.round_milestones
+        result = milestones.streak_summary(milestones.runs_at_or_below(par + hcp))
+        logger.success(f"Scoring streaks: best={result['best']}, total={result['total']}, current={result['current']}")
         return result
 
     def calculate_goals_progress(self, player_stats, quarterly_scoring):
@@ -4985,7 +4255,7 @@ class DashboardDataGenerator:
 
     def calculate_flightscope_shots_timeline(self):
         """Exporta golpes FlightScope con fechas para análisis temporal.
-        Campos mínimos: fecha, palo, vuelo_act, velocidad_bola, lateral_vuelo.
+        Campos mínimos: fecha, palo, vuelo_act, velocidad_bola, lateral_m.
         ~497 golpes × 5 campos = ~8-10 KB en JSON con claves cortas."""
         def _safe_float(val):
             if pd.isna(val):
@@ -5004,7 +4274,7 @@ class DashboardDataGenerator:
                 "p": row['palo'],
                 "c": _safe_float(row['vuelo_act']),
                 "v": _safe_float(row['velocidad_bola']),
-                "l": _safe_float(row['lateral_vuelo']),
+                "l": _safe_float(row['lateral_m']),
             })
         return sorted(shots, key=lambda s: s['f'])
 
@@ -5269,494 +4539,304 @@ class DashboardDataGenerator:
 
         return plan
 
+    def _build_shot_pivot(self):
+        """Intermedio compartido: pivot mes × palo (se construye una vez)."""
+        return self.shot_pivot
+
+    def _build_round_milestones(self):
+        """Intermedio compartido: hitos y rachas de las rondas (una pasada)."""
+        return self.round_milestones
+
+    def _run_scoring(self):
+        """Añade scoring_profile y golf_identity a dashboard_data.
+
+        Returns:
+            scoring_profile (o None si la integración no está disponible)
+        """
+        try:
+            from app.scoring_integration import add_scoring_to_dashboard
+            self.dashboard_data = add_scoring_to_dashboard(self.dashboard_data, simulate=self.simulate)
+            logger.success("Scoring profile y Golf Identity añadidos al JSON")
+            return self.dashboard_data.get('scoring_profile')
+        except Exception as e:
+            logger.warning(f"Scoring integration omitida: {e}")
+            return None
+
+    def _section_fingerprints(self, keys):
+        """Huellas de `keys` (y sus dependencias): inputs + upstream + código."""
+        if self._input_digests is None:
+            self._input_digests = {
+                'shots': frame_digest(self.flightscope_df),
+                'rounds': json_digest(self.tarjetas_data),
+            }
+        if self._code_digests is None:
+            # El generador y los módulos locales que importa (helpers de app/,
+            # tablas de app.benchmarks...) cuentan como código de cada sección
+            shared = f"{source_digest(type(self).__module__)}:{REGISTRY.digest()}"
+            self._code_digests = {
+                key: f"{code_digest(getattr(type(self), section.method))}:{shared}"
+                for key, section in SECTION_GRAPH.sections.items()
+            }
+        # 'today': secciones cuya ventana depende del reloj (se invalidan cada día)
+        inputs = {**self._input_digests, 'today': datetime.now().date().isoformat()}
+        return section_fingerprints(SECTION_GRAPH, keys, inputs, self._code_digests)
+
+    def _execute_sections(self, keys, results=None):
+        """Ejecuta secciones del SECTION_GRAPH (en paralelo según dependencias).
+
+        Con caché activa, las secciones cuya huella no cambió se leen de
+        data/cache/sections/ y solo se ejecutan las demás (más los
+        intermedios que estas necesiten).
+        """
+        results = dict(results or {})
+        reused = {}
+        fingerprints = {}
+
+        if self.section_cache is not None:
+            fingerprints = self._section_fingerprints(keys)
+            for key in keys:
+                if key in results or not SECTION_GRAPH[key].cache:
+                    continue
+                hit = self.section_cache.load(key, fingerprints[key])
+                if hit is not None:
+                    results[key], reused[key] = hit
+
+        # Intermedios base (pivot, club_statistics_basic) solo si alguien los necesita
+        targets = [
+            k for k in keys
+            if k not in results
+            and (SECTION_GRAPH[k].output or SECTION_GRAPH[k].stage != 'base')
+        ]
+        run_keys = [k for k in SECTION_GRAPH.closure(targets) if k not in results]
+
+        def runner(section, args):
+            value = getattr(self, section.method)(*args)
+            if section.summary is not None:
+                logger.info(f"  ✓ {section.summary(value)}")
+            return value
+
+        results, timings = SECTION_GRAPH.execute(runner, run_keys, results=results, max_workers=self.max_workers)
+
+        if self.section_cache is not None:
+            for key in run_keys:
+                if SECTION_GRAPH[key].cache:
+                    self.section_cache.store(key, fingerprints[key], results[key], timings[key])
+            if 'player_stats' in reused:
+                self._player_stats = results['player_stats']
+
+        self.section_results.update(results)
+        self.section_timings.update(timings)
+        self.section_status.update({k: 'reused' for k in reused})
+        self.section_status.update({k: 'recomputed' for k in run_keys})
+
+        if self.section_cache is not None:
+            logger.info(
+                f"Secciones: {len(run_keys)} recalculadas ({sum(timings.values()):.2f}s), "
+                f"{len(reused)} reutilizadas de caché (~{sum(reused.values()):.2f}s ahorrados)"
+            )
+            if run_keys and reused:
+                logger.debug(f"  Recalculadas: {', '.join(run_keys)}")
+        return results
+
     def generate_dashboard_data(self):
-        """Genera el objeto completo de datos para el dashboard (versión 5.0.0 - PROJECT COMPLETE!)."""
+        """Genera el objeto completo de datos para el dashboard (versión 5.0.0 - PROJECT COMPLETE!).
+
+        Las secciones se ejecutan según SECTION_GRAPH: las independientes en
+        paralelo. Las que necesitan scoring_profile (monthly_recommendations,
+        bubble_analysis, improvement_plan) quedan reservadas y se calculan una
+        sola vez en save_json(), después del scoring.
+        """
         logger.info("=" * 60)
         logger.info("GENERANDO DATOS DEL DASHBOARD - VERSIÓN 5.0.0 (FINAL)")
         logger.info("=" * 60)
 
-        # ========== PASO 1: CÁLCULOS BASE ==========
-        logger.info("PASO 1/6: Calculando métricas base...")
-        player_stats = self.calculate_player_stats()
-        club_stats_basic = self.calculate_club_statistics()
-        course_stats = self.calculate_course_statistics()
-        temporal_evolution = self.calculate_temporal_evolution()  # Ahora con 11 palos
-
-        # ========== PASO 2: FASE 5 - ANÁLISIS AVANZADOS ==========
-        logger.info("PASO 2/6: Ejecutando análisis Fase 5...")
-        launch_data = self.calculate_launch_metrics()
-        dispersion_data = self.calculate_dispersion_analysis()
-        consistency_data = self.calculate_consistency_benchmarks()
-
-        # ========== PASO 3: MERGE Y ENRIQUECIMIENTO (SPRINT 1) ==========
-        logger.info("PASO 3/6: Merging y generando datos adicionales (Sprint 1)...")
-
-        # CRÍTICO: Merge club data
-        club_stats = self.merge_club_data(club_stats_basic, launch_data, dispersion_data)
-        logger.info(f"  ✓ Club data merged: {len(club_stats)} clubs")
-
-        # CRÍTICO: Dispersion scatter data
-        dispersion_by_club = self.generate_dispersion_scatter_data()
-        logger.info(f"  ✓ Dispersion scatter data: {len(dispersion_by_club)} clubs")
-
-        # CRÍTICO: Club gaps
-        club_gaps = self.calculate_club_gaps(club_stats)
-        logger.info(f"  ✓ Club gaps calculated: {len(club_gaps)} gaps")
-
-        # ========== PASO 4: FUNCIONES IMPORTANTES (SPRINT 3) ==========
-        logger.info("PASO 4/6: Generando datos adicionales (Sprint 3)...")
-
-        # Score history
-        score_history = self.calculate_score_history()
-        logger.info(f"  ✓ Score history: {score_history['total_rounds']} rounds")
-
-        # Percentiles
-        percentiles = self.calculate_percentiles()
-        logger.info(f"  ✓ Percentiles: {len(percentiles['distance_percentiles'])} clubs")
-
-        # Directional distribution
-        directional_dist = self.calculate_directional_distribution()
-        logger.info(f"  ✓ Directional distribution: {len(directional_dist)} clubs")
-
-        # Bubble chart data
-        bubble_data = self.calculate_bubble_chart_data()
-        logger.info(f"  ✓ Bubble chart data: {len(bubble_data['bubbles'])} bubbles")
-
-        # ========== PASO 5: MEJORAS VISUALES (SPRINT 5) ==========
-        logger.info("PASO 5/6: Generando mejoras visuales (Sprint 5)...")
-
-        # Player profile radar
-        player_radar = self.calculate_player_profile_radar()
-        logger.info(f"  ✓ Player radar: {len(player_radar['labels'])} dimensions")
-
-        # Trajectory data
-        trajectory_data = self.extract_trajectory_data()
-        logger.info(f"  ✓ Trajectory data: {len(trajectory_data)} clubs")
-
-        # Best/worst rounds
-        best_worst = self.calculate_best_worst_rounds()
-        logger.info(f"  ✓ Best/worst rounds: {len(best_worst['best_rounds'])} best, {len(best_worst['worst_rounds'])} worst")
-
-        # Quarterly scoring
-        quarterly = self.calculate_quarterly_scoring()
-        logger.info(f"  ✓ Quarterly scoring: {len(quarterly)} quarters")
-
-        # ========== PASO 6: MEJORAS DE TENDENCIAS (SPRINT 6) ==========
-        logger.info("PASO 6/6: Generando mejoras de tendencias (Sprint 6)...")
-
-        # Monthly volatility
-        monthly_volatility = self.calculate_monthly_volatility()
-        logger.info(f"  ✓ Monthly volatility: {len(monthly_volatility)} months")
-
-        # Momentum indicators
-        momentum_indicators = self.calculate_momentum_indicators()
-        logger.info(f"  ✓ Momentum indicators: {len(momentum_indicators)} rounds")
-
-        # Milestone achievements
-        milestones = self.extract_milestone_achievements()
-        logger.info(f"  ✓ Milestone achievements: {len(milestones)} milestones")
-
-        # Learning curve
-        learning_curve = self.calculate_learning_curve()
-        logger.info(f"  ✓ Learning curve: {len(learning_curve)} categories")
-
-        # SPRINT 9: Current form chart
-        current_form = self.calculate_current_form_chart()
-        logger.info(f"  ✓ Current form: {current_form['total_rounds']} rounds, avg: {current_form['average']}, trend: {current_form['trend']}")
-
-        # SPRINT 9: Percentile gauges
-        percentile_gauges = self.calculate_percentile_gauges()
-        logger.info(f"  ✓ Percentile gauges: SG={percentile_gauges['short_game']['value']}%, BS={percentile_gauges['ball_speed']['value']}%, "
-                    f"Cons={percentile_gauges['consistency']['value']}%, AA={percentile_gauges['attack_angle']['value']}%")
-
-        # SPRINT 9: HCP Trajectory
-        hcp_trajectory = self.calculate_hcp_trajectory()
-        logger.info(f"  ✓ HCP trajectory: {len(hcp_trajectory['historical']['values'])} months historical, "
-                    f"current={hcp_trajectory['current']}, target={hcp_trajectory['target']}, rate={hcp_trajectory['improvement_rate']}/mes")
-
-        # SPRINT 9: Temporal Long Game
-        temporal_long_game = self.calculate_temporal_long_game()
-        logger.info(f"  ✓ Temporal long game: {len(temporal_long_game['labels'])} months, "
-                    f"Driver points={len([v for v in temporal_long_game['driver'] if v is not None])}, "
-                    f"3W points={len([v for v in temporal_long_game['wood_3'] if v is not None])}, "
-                    f"Hybrid points={len([v for v in temporal_long_game['hybrid'] if v is not None])}")
-
-        # SPRINT 9: Irons Evolution
-        irons_evolution = self.calculate_irons_evolution()
-        logger.info(f"  ✓ Irons evolution: {len(irons_evolution['labels'])} months, "
-                    f"5i points={len([v for v in irons_evolution['iron_5'] if v is not None])}, "
-                    f"6i points={len([v for v in irons_evolution['iron_6'] if v is not None])}, "
-                    f"7i points={len([v for v in irons_evolution['iron_7'] if v is not None])}, "
-                    f"8i points={len([v for v in irons_evolution['iron_8'] if v is not None])}, "
-                    f"9i points={len([v for v in irons_evolution['iron_9'] if v is not None])}")
-
-        # SPRINT 9: Wedges Evolution
-        wedges_evolution = self.calculate_wedges_evolution()
-        logger.info(f"  ✓ Wedges evolution: {len(wedges_evolution['labels'])} months, "
-                    f"PW points={len([v for v in wedges_evolution['pitching_wedge'] if v is not None])}, "
-                    f"GW points={len([v for v in wedges_evolution['gap_wedge'] if v is not None])}, "
-                    f"SW points={len([v for v in wedges_evolution['sand_wedge'] if v is not None])}")
-
-        # SPRINT 9: Attack Angle Evolution
-        attack_angle_evolution = self.calculate_attack_angle_evolution()
-        logger.info(f"  ✓ Attack angle evolution: {len(attack_angle_evolution['labels'])} months, "
-                    f"data points={len([v for v in attack_angle_evolution['attack_angle'] if v is not None])}, "
-                    f"avg={sum([v for v in attack_angle_evolution['attack_angle'] if v is not None])/len([v for v in attack_angle_evolution['attack_angle'] if v is not None]) if [v for v in attack_angle_evolution['attack_angle'] if v is not None] else 0:.1f}°")
-
-        # SPRINT 9: Smash Factor Evolution
-        smash_factor_evolution = self.calculate_smash_factor_evolution()
-        logger.info(f"  ✓ Smash factor evolution: {len(smash_factor_evolution['labels'])} months, "
-                    f"Driver points={len([v for v in smash_factor_evolution['driver'] if v is not None])}, "
-                    f"Woods points={len([v for v in smash_factor_evolution['woods'] if v is not None])}, "
-                    f"Irons points={len([v for v in smash_factor_evolution['irons'] if v is not None])}, "
-                    f"Wedges points={len([v for v in smash_factor_evolution['wedges'] if v is not None])}")
-
-        # SPRINT 10: Campo Performance
-        campo_performance = self.calculate_campo_performance()
-        logger.info(f"  ✓ Campo performance: {len(campo_performance)} campos, "
-                    f"total rondas={sum(c['rounds'] for c in campo_performance.values())}")
-
-        # SPRINT 10: HCP Evolution RFEG
-        hcp_evolution_rfeg = self.calculate_hcp_evolution_rfeg()
-        logger.info(f"  ✓ HCP evolution RFEG: {len(hcp_evolution_rfeg['labels'])} months, "
-                    f"current={hcp_evolution_rfeg['values'][-1] if hcp_evolution_rfeg['values'] else 0}, "
-                    f"source={hcp_evolution_rfeg['source']}")
-
-        # SPRINT 10: Scoring Zones by Course
-        scoring_zones = self.calculate_scoring_zones_by_course()
-        logger.info(f"  ✓ Scoring zones: {len(scoring_zones)} campos, "
-                    f"total holes={sum(z['total_holes'] for z in scoring_zones.values())}")
-
-        # SPRINT 10: Volatility Index
-        volatility_index = self.calculate_volatility_index()
-        logger.info(f"  ✓ Volatility index: {len(volatility_index)} quarters analyzed")
-
-        # SPRINT 10: Estado Forma
-        estado_forma = self.calculate_estado_forma()
-        logger.info(f"  ✓ Estado forma: {len(estado_forma)} months")
-
-        # SPRINT 10: HCP Curve Position
-        hcp_curve = self.calculate_hcp_curve_position()
-        logger.info(f"  ✓ HCP curve position: {len(hcp_curve['distribution']['bins'])} bins, "
-                    f"mean={hcp_curve['stats'].get('mean', 0)}")
-
-        # SPRINT 10: Differential Distribution
-        differential_dist = self.calculate_differential_distribution()
-        logger.info(f"  ✓ Differential distribution: {differential_dist['stats'].get('total_rounds', 0)} rounds")
-
-        # SPRINT 10: Prediction Model
-        prediction_model = self.calculate_prediction_model()
-        logger.info(f"  ✓ Prediction model: predicted={prediction_model['predicted_score']}, "
-                    f"R²={prediction_model['model_accuracy']}, trend={prediction_model['trend']}")
-
-        # SPRINT 10: ROI Practice
-        roi_practice = self.calculate_roi_practice()
-        logger.info(f"  ✓ ROI practice: {len(roi_practice['analysis'])} quarters, "
-                    f"correlation={roi_practice['correlation']}, rec={roi_practice['recommendation']}")
-
-        # SPRINT 11: Shot Zones Heatmap
-        shot_zones_heatmap = self.calculate_shot_zones_heatmap()
-        logger.info(f"  ✓ Shot zones heatmap: {len(shot_zones_heatmap['zones'])} clubs, "
-                    f"center={shot_zones_heatmap['density_map'].get('center', {}).get('percentage', 0)}%")
-
-        # SPRINT 11: Scoring Probability
-        scoring_probability = self.calculate_scoring_probability()
-        logger.info(f"  ✓ Scoring probability: {len(scoring_probability['distance_ranges'])} distance ranges")
-
-        # SPRINT 11: Swing DNA
-        swing_dna = self.calculate_swing_dna()
-        logger.info(f"  ✓ Swing DNA: {len(swing_dna['dimensions'])} dimensions, "
-                    f"overall={swing_dna['overall_score']}, top={swing_dna['strengths'][0]}")
-
-        # SPRINT 11: Quick Wins Matrix
-        quick_wins = self.calculate_quick_wins_matrix()
-        logger.info(f"  ✓ Quick wins matrix: {quick_wins['summary']['total_opportunities']} opportunities, "
-                    f"quick_wins={quick_wins['summary']['quick_wins']}, strategic={quick_wins['summary']['strategic_moves']}")
-
-        # SPRINT 11: Club Distance Comparison
-        club_comparison = self.calculate_club_distance_comparison()
-        logger.info(f"  ✓ Club distance comparison: {len(club_comparison['clubs'])} clubs compared")
-
-        # SPRINT 11: Comfort Zones
-        comfort_zones = self.calculate_comfort_zones()
-        logger.info(f"  ✓ Comfort zones: {len(comfort_zones['zones'])} zones, "
-                    f"best={comfort_zones['best_zone']}, worst={comfort_zones['worst_zone']}")
-
-        # SPRINT 11: Tempo Analysis
-        tempo_analysis = self.calculate_tempo_analysis()
-        logger.info(f"  ✓ Tempo analysis: avg_tempo={tempo_analysis['analysis']['avg_tempo']}, "
-                    f"rating={tempo_analysis['analysis']['rating']}")
-
-        # SPRINT 11: Strokes Gained
-        strokes_gained = self.calculate_strokes_gained()
-        logger.info(f"  ✓ Strokes gained: {len(strokes_gained['categories'])} categories, "
-                    f"total_sg={strokes_gained['total_sg']}, best={strokes_gained['best_category']}")
-
-        # SPRINT 12: Six Month Projection
-        six_month_projection = self.calculate_six_month_projection()
-        logger.info(f"  ✓ Six month projection: HCP {six_month_projection['projected_hcp'][0]} → {six_month_projection['projected_hcp'][-1]}, "
-                    f"milestones={len(six_month_projection['milestones'])}")
-
-        # SPRINT 12: SWOT Matrix
-        swot_matrix = self.calculate_swot_matrix()
-        logger.info(f"  ✓ SWOT matrix: {len(swot_matrix['strengths'])} strengths, {len(swot_matrix['weaknesses'])} weaknesses, "
-                    f"{len(swot_matrix['opportunities'])} opportunities, {len(swot_matrix['threats'])} threats")
-
-        # SPRINT 12: Benchmark Radar
-        benchmark_radar = self.calculate_benchmark_radar()
-        logger.info(f"  ✓ Benchmark radar: {len(benchmark_radar['dimensions'])} dimensions, "
-                    f"player={benchmark_radar['analysis']['overall_rating']}, vs_hcp15={benchmark_radar['analysis']['vs_hcp15']}")
-
-        # SPRINT 12: ROI Plan
-        roi_plan = self.calculate_roi_plan()
-        logger.info(f"  ✓ ROI plan: {len(roi_plan['plan'])} actions, time={roi_plan['summary']['total_time']}h/week, "
-                    f"improvement={roi_plan['summary']['total_improvement']} strokes, feasibility={roi_plan['summary']['feasibility']}")
-
-        # SPRINT 14: Form Summary, Scoring Streaks, Goals Progress
-        form_summary = self.calculate_form_summary(score_history)
-        logger.info(f"  ✓ Form summary: avg={form_summary['average']}, trend={form_summary['trend']}")
-
-        scoring_streaks = self.calculate_scoring_streaks(score_history, player_stats)
-        logger.info(f"  ✓ Scoring streaks: best={scoring_streaks['best']}, total={scoring_streaks['total']}")
-
-        goals_progress = self.calculate_goals_progress(player_stats, quarterly)
-        logger.info(f"  ✓ Goals progress: hcp20={goals_progress['hcp_20']['pct']}%, avg90={goals_progress['avg_90']['pct']}%")
-
-        # SPRINT 15: Monthly Recommendations, Bubble Analysis, Improvement Plan
-        monthly_recommendations = self.calculate_monthly_recommendations(None, launch_data, course_stats, club_gaps)
-        logger.info(f"  ✓ Monthly recommendations: focus={monthly_recommendations['focus_title']}")
-
-        bubble_analysis = self.calculate_bubble_analysis(bubble_data, dispersion_data, None)
-        logger.info(f"  ✓ Bubble analysis: {len(bubble_analysis) - 1} groups + strategy")
-
-        improvement_plan = self.calculate_improvement_plan(launch_data, directional_dist, club_gaps, None, six_month_projection)
-        logger.info(f"  ✓ Improvement plan: {len(improvement_plan['metrics'])} metrics, {len(improvement_plan['weeks'])} weeks")
+        base_keys = SECTION_GRAPH.keys(stage='base')
+        logger.info(f"Ejecutando {len(base_keys)} secciones (workers={self.max_workers or 'auto'})...")
+        results = self._execute_sections(base_keys)
 
         # ========== ESTRUCTURA JSON FINAL ==========
-        self.dashboard_data = {
-            'generated_at': datetime.now().isoformat(),
-
-            # Player Stats
-            'player_stats': player_stats,
-
-            # Club Data (MERGED con launch + dispersion)
-            'club_statistics': club_stats,
-            'club_gaps': club_gaps,
-
-            # Dispersion Scatter (CRÍTICO para 11 charts)
-            'dispersion_by_club': dispersion_by_club,
-
-            # Temporal Evolution (ahora 11 palos)
-            'temporal_evolution': temporal_evolution,
-
-            # Course Statistics
-            'course_statistics': course_stats,
-
-            # SPRINT 3: Funciones importantes
-            'score_history': score_history,
-            'percentiles': percentiles,
-            'directional_distribution': directional_dist,
-            'bubble_chart_data': bubble_data,
-
-            # SPRINT 5: Mejoras visuales
-            'player_profile_radar': player_radar,
-            'trajectory_data': trajectory_data,
-            'best_worst_rounds': best_worst,
-            'quarterly_scoring': quarterly,
-
-            # SPRINT 6: Mejoras de tendencias
-            'monthly_volatility': monthly_volatility,
-            'momentum_indicators': momentum_indicators,
-            'milestone_achievements': milestones,
-            'learning_curve': learning_curve,
-
-            # SPRINT 9: Overview + Evolution (Tabs 1-2)
-            'current_form': current_form,
-            'percentile_gauges': percentile_gauges,
-            'hcp_trajectory': hcp_trajectory,
-            'temporal_long_game': temporal_long_game,
-            'irons_evolution': irons_evolution,
-            'wedges_evolution': wedges_evolution,
-            'attack_angle_evolution': attack_angle_evolution,
-            'smash_factor_evolution': smash_factor_evolution,
-
-            # SPRINT 10: Campo/Course Analysis
-            'campo_performance': campo_performance,
-            'hcp_evolution_rfeg': hcp_evolution_rfeg,
-            'scoring_zones_by_course': scoring_zones,
-            'volatility_index': volatility_index,
-            'estado_forma': estado_forma,
-            'hcp_curve_position': hcp_curve,
-            'differential_distribution': differential_dist,
-            'prediction_model': prediction_model,
-            'roi_practice': roi_practice,
-
-            # SPRINT 11: Deep Analysis (Tab 5)
-            'shot_zones_heatmap': shot_zones_heatmap,
-            'scoring_probability': scoring_probability,
-            'swing_dna': swing_dna,
-            'quick_wins_matrix': quick_wins,
-            'club_distance_comparison': club_comparison,
-            'comfort_zones': comfort_zones,
-            'tempo_analysis': tempo_analysis,
-            'strokes_gained': strokes_gained,
-
-            # SPRINT 12: Estrategia + Finales (Tab 6)
-            'six_month_projection': six_month_projection,
-            'swot_matrix': swot_matrix,
-            'benchmark_radar': benchmark_radar,
-            'roi_plan': roi_plan,
-
-            # SPRINT 14: Form + Streaks + Goals
-            'form_summary': form_summary,
-            'scoring_streaks': scoring_streaks,
-            'goals_progress': goals_progress,
-
-            # SPRINT 15: Monthly Recommendations, Bubble Analysis, Improvement Plan
-            'monthly_recommendations': monthly_recommendations,
-            'bubble_analysis': bubble_analysis,
-            'improvement_plan': improvement_plan,
-
-            # Fase 5 Original (para referencia/debugging)
-            'launch_metrics': launch_data,
-            'dispersion_analysis': dispersion_data,
-            'consistency_benchmarks': consistency_data,
-
-            # IDENTITY TIMELINE: golpes FlightScope con fechas
-            'flightscope_shots_timeline': self.calculate_flightscope_shots_timeline(),
-
-            # Metadata
-            'metadata': {
-                'version': '5.3.0',
-                'sprint': 13,
-                'changes': [
-                    'SPRINT 1: Dispersion scatter data generada (11 palos)',
-                    'SPRINT 1: Club data merged (basic + launch + dispersion)',
-                    'SPRINT 1: Club gaps calculados',
-                    'SPRINT 1: Temporal evolution extendido a 11 palos',
-                    'SPRINT 3: Score history con milestones',
-                    'SPRINT 3: Percentiles de distancia y scores',
-                    'SPRINT 3: Distribución direccional (left/center/right)',
-                    'SPRINT 3: Bubble chart data (consistencia vs distancia)',
-                    'SPRINT 5: Player profile radar (8 dimensiones)',
-                    'SPRINT 5: Trajectory data por palo',
-                    'SPRINT 5: Best/worst rounds analysis',
-                    'SPRINT 5: Quarterly scoring trends',
-                    'SPRINT 6: Monthly volatility (variabilidad mensual)',
-                    'SPRINT 6: Momentum indicators (moving averages, trends)',
-                    'SPRINT 6: Milestone achievements (broke_90/80, personal bests, streaks)',
-                    'SPRINT 6: Learning curve (mejora por categoría de shot)',
-                    'SPRINT 9: Current form chart (últimas 20 rondas con tendencia)',
-                    'SPRINT 9: Percentile gauges (4 gauges: short_game, ball_speed, consistency, attack_angle)',
-                    'SPRINT 9: HCP trajectory (histórico + proyección 6 meses con regresión lineal)',
-                    'SPRINT 9: Temporal long game (evolución mensual Driver, 3W, Hybrid)',
-                    'SPRINT 9: Irons evolution (evolución mensual 5i-9i)',
-                    'SPRINT 9: Wedges evolution (evolución mensual PW, GW, SW)',
-                    'SPRINT 9: Attack angle evolution (evolución mensual ángulo de ataque Driver)',
-                    'SPRINT 9: Smash factor evolution (evolución mensual eficiencia 4 categorías)',
-                    'SPRINT 10: Campo performance (mejor/promedio/peor score por campo)',
-                    'SPRINT 10: HCP evolution RFEG (handicap oficial estimado mensual)',
-                    'SPRINT 10: Scoring zones by course (distribución birdie/par/bogey por campo)',
-                    'SPRINT 10: Volatility index (índice de variabilidad por quarter)',
-                    'SPRINT 10: Estado forma (estado forma últimos 12 meses)',
-                    'SPRINT 10: HCP curve position (distribución scores vs curva normal)',
-                    'SPRINT 10: Differential distribution (distribución de differentials)',
-                    'SPRINT 10: Prediction model (predicción próximo score con regresión)',
-                    'SPRINT 10: ROI practice (ROI frecuencia de práctica vs mejora)',
-                    'SPRINT 11: Shot zones heatmap (heat map zonas de caída de shots)',
-                    'SPRINT 11: Scoring probability (probabilidad birdie/par/bogey por distancia)',
-                    'SPRINT 11: Swing DNA (fingerprint 12 dimensiones vs benchmarks)',
-                    'SPRINT 11: Quick wins matrix (matriz dificultad vs impacto para priorización)',
-                    'SPRINT 11: Club distance comparison (comparación distancias vs benchmarks PGA/HCP)',
-                    'SPRINT 11: Comfort zones (análisis zonas de confort por distancia)',
-                    'SPRINT 11: Tempo analysis (análisis tempo backswing/downswing vs PGA)',
-                    'SPRINT 11: Strokes gained (análisis por categoría vs HCP 15 benchmark)',
-                    'SPRINT 12: Six month projection (proyección HCP y scores 6 meses)',
-                    'SPRINT 12: SWOT matrix (análisis SWOT automático)',
-                    'SPRINT 12: Benchmark radar (comparación multidimensional vs benchmarks)',
-                    'SPRINT 12: ROI plan (plan de mejora con análisis ROI y milestones)'
-                ],
-                'data_sources': {
-                    'flightscope': str(self.flightscope_path),
-                    'tarjetas': str(self.tarjetas_path)
-                },
-                'phase_5_enabled': LaunchMetricsAnalyzer is not None,
-                'total_clubs': len(club_stats),
-                'total_dispersion_charts': len(dispersion_by_club),
-                'total_club_gaps': len(club_gaps),
-                'total_rounds': score_history['total_rounds'],
-                'total_bubbles': len(bubble_data['bubbles'])
-            }
-        }
+        self.dashboard_data = self._assemble_dashboard_data(results)
+
+        club_stats = results['club_statistics']
+        score_history = results['score_history']
+        percentiles = results['percentiles']
+        bubble_data = results['bubble_chart_data']
+        best_worst = results['best_worst_rounds']
 
         logger.info("=" * 60)
         logger.success("🎉 SPRINT 12 COMPLETADO (5/5) - Dashboard data v5.0.0 generado - PROJECT COMPLETE!")
         logger.info(f"  • Clubs merged: {len(club_stats)}")
-        logger.info(f"  • Dispersion charts: {len(dispersion_by_club)}")
-        logger.info(f"  • Club gaps: {len(club_gaps)}")
-        logger.info(f"  • Temporal evolution: {len(temporal_evolution)} palos")
+        logger.info(f"  • Dispersion charts: {len(results['dispersion_by_club'])}")
+        logger.info(f"  • Club gaps: {len(results['club_gaps'])}")
+        logger.info(f"  • Temporal evolution: {len(results['temporal_evolution'])} palos")
         logger.info(f"  • Score history: {score_history['total_rounds']} rounds")
         logger.info(f"  • Percentiles: {len(percentiles['distance_percentiles'])} clubs")
-        logger.info(f"  • Directional dist: {len(directional_dist)} clubs")
+        logger.info(f"  • Directional dist: {len(results['directional_distribution'])} clubs")
         logger.info(f"  • Bubble data: {len(bubble_data['bubbles'])} bubbles")
-        logger.info(f"  • Player radar: {len(player_radar['labels'])} dimensions")
-        logger.info(f"  • Trajectory data: {len(trajectory_data)} clubs")
+        logger.info(f"  • Player radar: {len(results['player_profile_radar']['labels'])} dimensions")
+        logger.info(f"  • Trajectory data: {len(results['trajectory_data'])} clubs")
         logger.info(f"  • Best/worst rounds: {len(best_worst['best_rounds'])} + {len(best_worst['worst_rounds'])}")
-        logger.info(f"  • Quarterly scoring: {len(quarterly)} quarters")
-        logger.info(f"  • Monthly volatility: {len(monthly_volatility)} months")
-        logger.info(f"  • Momentum indicators: {len(momentum_indicators)} rounds")
-        logger.info(f"  • Milestones: {len(milestones)} achievements")
-        logger.info(f"  • Learning curve: {len(learning_curve)} categories")
+        logger.info(f"  • Quarterly scoring: {len(results['quarterly_scoring'])} quarters")
+        logger.info(f"  • Monthly volatility: {len(results['monthly_volatility'])} months")
+        logger.info(f"  • Momentum indicators: {len(results['momentum_indicators'])} rounds")
+        logger.info(f"  • Milestones: {len(results['milestone_achievements'])} achievements")
+        logger.info(f"  • Learning curve: {len(results['learning_curve'])} categories")
         logger.info("=" * 60)
 
+    def _assemble_dashboard_data(self, results):
+        """dashboard_data en el orden de claves del JSON (post-scoring = None hasta save_json)."""
+        data = {'generated_at': datetime.now().isoformat()}
+        for key in SECTION_GRAPH.keys(output_only=True):
+            data[key] = results.get(key)
+
+        data['metadata'] = {
+            'version': '5.3.0',
+            'sprint': 13,
+            'changes': list(METADATA_CHANGES),
+            'data_sources': {
+                'flightscope': str(self.flightscope_path),
+                'tarjetas': str(self.tarjetas_path)
+            },
+            'phase_5_enabled': LaunchMetricsAnalyzer is not None,
+            'total_clubs': len(results['club_statistics']),
+            'total_dispersion_charts': len(results['dispersion_by_club']),
+            'total_club_gaps': len(results['club_gaps']),
+            'total_rounds': results['score_history']['total_rounds'],
+            'total_bubbles': len(results['bubble_chart_data']['bubbles'])
+        }
+        return data
+
     def save_json(self):
         """Guarda los datos en formato JSON."""
+        # ── Scoring profile + golf identity, y secciones que dependen de ellos ──
+        # (monthly_recommendations, bubble_analysis, improvement_plan se calculan
+        #  aquí una sola vez, ya con scoring_profile)
+        results = {k: self.dashboard_data.get(k) for k in SECTION_GRAPH.keys(stage='base')}
+        post_keys = SECTION_GRAPH.keys(stage='scoring') + SECTION_GRAPH.keys(stage='post')
+        results = self._execute_sections(post_keys, results=results)
+        for key in SECTION_GRAPH.keys(stage='post', output_only=True):
+            self.dashboard_data[key] = results[key]
+        if results.get('scoring_profile'):
+            logger.success("Monthly recommendations, bubble analysis, improvement plan calculados con scoring_profile")
+        # ──────────────────────────────────────────────────────────
+
+        self._write_json()
+
+    def _write_json(self):
+        """Escribe self.dashboard_data en output_path."""
         logger.info(f"Guardando datos en: {self.output_path}")
 
-        # Crear directorio si no existe
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Versión del anillo de snapshots: va en metadata, así que antes de escribir
+        store = SnapshotStore(self.output_path.parent)
+        metadata = self.dashboard_data.get('metadata')
+        if self.snapshots and isinstance(metadata, dict):
+            metadata['snapshot_version'] = store.next_version(self.dashboard_data)
+
+        # Schema v2: columnas solo en disco; dashboard_data en memoria sigue en v1
+        data = self.dashboard_data
+        if self.schema_version == SCHEMA_V2:
+            data = encode_dashboard(data, SCHEMA_V2)
+
+        # Escritura atómica + hermanos .gz / .br + metadata.content_hash
+        sizes = write_dashboard_json(self.output_path, data, compact=self.compact_json)
+        if data is not self.dashboard_data and isinstance(self.dashboard_data.get('metadata'), dict):
+            self.dashboard_data['metadata']['content_hash'] = data['metadata']['content_hash']
+
+        encoded = ', '.join(f"{enc} {sizes[enc] / 1024:.1f} KB" for enc in ('gzip', 'br') if enc in sizes)
+        logger.success(f"JSON guardado: {self.output_path} ({sizes['json'] / 1024:.1f} KB; {encoded})")
+
+        # content_hash del JSON: los loaders lo comparan con el del manifest
+        write_version(self.output_path, data)
+
+        if self.shards:
+            tab_of = {key: SECTION_GRAPH[key].tab for key in SECTION_GRAPH.keys(output_only=True)}
+            manifest = write_shards(self.output_path, data, tab_of)
+            first_kb = sum(manifest['shards'][name]['bytes'] for name in manifest['first']) / 1024
+            logger.success(f"Shards: {len(manifest['shards'])} (primer render {first_kb:.1f} KB)")
+        else:
+            # JSON escrito sin shards: un manifest anterior serviría datos viejos
+            clear_shards(self.output_path)
+
+        # Snapshot + patch al final: el índice nunca apunta a una versión sin JSON
+        if self.snapshots and isinstance(metadata, dict):
+            entry = store.record(self.dashboard_data, metadata['snapshot_version'])
+            patch = f"patch {entry['patch_bytes'] / 1024:.1f} KB, {entry['patch_ops']} ops" if entry['patch'] else "sin patch"
+            logger.success(f"Snapshot v{entry['version']} ({patch})")
+        else:
+            # JSON escrito sin snapshots: los patches del anillo ya no llevan a él
+            store.clear()
 
-        # ── NUEVO: añadir scoring profile y golf identity ──────────
-        try:
-            from app.scoring_integration import add_scoring_to_dashboard
-            self.dashboard_data = add_scoring_to_dashboard(self.dashboard_data)
-            logger.success("Scoring profile y Golf Identity añadidos al JSON")
+    def refresh_sections(self, sections):
+        """Recalcula solo `sections` (+ dependencias) y las fusiona en el JSON existente.
 
-            # Re-compute scoring-dependent functions now that scoring_profile exists
-            sp = self.dashboard_data.get('scoring_profile')
-            if sp:
-                self.dashboard_data['monthly_recommendations'] = self.calculate_monthly_recommendations(
-                    sp, self.dashboard_data.get('launch_metrics'),
-                    self.dashboard_data.get('course_statistics'), self.dashboard_data.get('club_gaps'))
-                self.dashboard_data['bubble_analysis'] = self.calculate_bubble_analysis(
-                    self.dashboard_data.get('bubble_chart_data'),
-                    self.dashboard_data.get('dispersion_analysis'), sp)
-                self.dashboard_data['improvement_plan'] = self.calculate_improvement_plan(
-                    self.dashboard_data.get('launch_metrics'),
-                    self.dashboard_data.get('directional_distribution'),
-                    self.dashboard_data.get('club_gaps'), sp,
-                    self.dashboard_data.get('six_month_projection'))
-                logger.success("Monthly recommendations, bubble analysis, improvement plan recalculados con scoring_profile")
-        except Exception as e:
-            logger.warning(f"Scoring integration omitida: {e}")
-        # ──────────────────────────────────────────────────────────
+        Solo se cargan los Excel que necesitan las secciones pedidas. El
+        resto de claves del dashboard_data.json en disco se conserva tal cual.
+
+        Args:
+            sections: Claves de dashboard_data (p.ej. ['score_history', 'hcp_trajectory'])
+
+        Returns:
+            Dict {key: resultado} de todas las secciones de salida recalculadas
+        """
+        sections = list(dict.fromkeys(sections))
+        unknown = [k for k in sections if k not in SECTION_GRAPH or not SECTION_GRAPH[k].output]
+        if unknown:
+            raise ValueError(f"Secciones desconocidas: {unknown}")
 
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            json.dump(self.dashboard_data, f, indent=2, ensure_ascii=False)
+        keys = SECTION_GRAPH.closure(sections)
+        inputs = {name for key in keys for name in SECTION_GRAPH[key].inputs}
+        logger.info(f"Refresco parcial: {len(sections)} secciones pedidas, {len(keys)} con dependencias "
+                    f"(inputs: {', '.join(sorted(inputs)) or 'ninguno'})")
 
-        logger.success(f"JSON guardado: {self.output_path}")
+        if 'shots' in inputs and self.flightscope_df is None:
+            self.load_flightscope_data()
+        if 'rounds' in inputs and not self.tarjetas_data:
+            self.load_tarjetas_data()
+
+        # Partimos del JSON en disco: scoring lee secciones que no se recalculan
+        if self.output_path.exists():
+            self.dashboard_data = load_dashboard_json(self.output_path)
+        else:
+            logger.warning(f"{self.output_path} no existe: se crea solo con las secciones pedidas")
+            self.dashboard_data = {'generated_at': datetime.now().isoformat()}
+
+        # Por stage: scoring lee dashboard_data, que debe tener ya las secciones base nuevas
+        results = {}
+        for stage in ('base', 'scoring', 'post'):
+            stage_keys = [k for k in keys if SECTION_GRAPH[k].stage == stage]
+            if not stage_keys:
+                continue
+            results = self._execute_sections(stage_keys, results=results)
+            for key in stage_keys:
+                if SECTION_GRAPH[key].output:
+                    self.dashboard_data[key] = results[key]
+
+        refreshed = {k: results[k] for k in keys if SECTION_GRAPH[k].output}
+        metadata = self.dashboard_data.get('metadata')
+        if isinstance(metadata, dict):
+            metadata['partial_refresh'] = {
+                'at': datetime.now().isoformat(),
+                'sections': list(refreshed),
+            }
 
-    def run(self):
-        """Ejecuta el proceso completo de generación."""
+        self._write_json()
+        logger.success(f"Refresco parcial completado: {', '.join(refreshed)}")
+        return refreshed
+
+    def run(self, sections=None):
+        """Ejecuta el proceso completo de generación (o solo `sections`)."""
         try:
             logger.info("=" * 60)
             logger.info("INICIANDO GENERACIÓN DE DATOS DEL DASHBOARD")
             logger.info("=" * 60)
 
-            self.load_flightscope_data()
-            self.load_tarjetas_data()
-            self.generate_dashboard_data()
-            self.save_json()
+            if sections:
+                self.refresh_sections(sections)
+            else:
+                self.load_flightscope_data()
+                self.load_tarjetas_data()
+                self.generate_dashboard_data()
+                self.save_json()
 
             logger.info("=" * 60)
             logger.success("GENERACIÓN COMPLETADA EXITOSAMENTE")
@@ -5770,8 +4850,300 @@ class DashboardDataGenerator:
             return False
 
 
+# ══════════════════════════════════════════════════════════════
+# REGISTRO DE SECCIONES (DAG)
+# ══════════════════════════════════════════════════════════════
+# Orden de registro = orden de claves en dashboard_data.json.
+# deps: resultados que recibe el método como argumentos (en orden).
+# after: secciones que deben terminar antes (sin pasar resultado).
+# inputs: datos crudos que lee la sección ('shots' FlightScope, 'rounds' tarjetas).
+
+def _points(values):
+    return len([v for v in values if v is not None])
+
+
+SECTIONS = [
+    # ── Intermedios compartidos ─────────────────────────────
+    Section('shot_pivot', '_build_shot_pivot', inputs=('shots',), output=False, cache=False),
+    Section('round_milestones', '_build_round_milestones', inputs=('rounds',), output=False, cache=False),
+    Section('club_statistics_basic', 'calculate_club_statistics', inputs=('shots',), output=False),
+
+    # ── Player Stats ────────────────────────────────────────
+    Section('player_stats', 'calculate_player_stats', tab='overview', inputs=('shots', 'rounds')),
+
+    # ── Club Data (MERGED con launch + dispersion) ──────────
+    Section('club_statistics', 'merge_club_data', tab='overview',
+            deps=('club_statistics_basic', 'launch_metrics', 'dispersion_analysis'),
+            summary=lambda r: f"Club data merged: {len(r)} clubs"),
+    Section('club_gaps', 'calculate_club_gaps', tab='performance', deps=('club_statistics',),
+            summary=lambda r: f"Club gaps calculated: {len(r)} gaps"),
+
+    # ── Dispersion Scatter (CRÍTICO para 11 charts) ─────────
+    Section('dispersion_by_club', 'generate_dispersion_scatter_data', tab='performance', inputs=('shots',),
+            summary=lambda r: f"Dispersion scatter data: {len(r)} clubs"),
+
+    # ── Temporal Evolution (11 palos) + Course Statistics ───
+    Section('temporal_evolution', 'calculate_temporal_evolution', tab='evolution',
+            after=('shot_pivot',), inputs=('shots',)),
+    Section('course_statistics', 'calculate_course_statistics', tab='overview', inputs=('rounds',)),
+
+    # ── SPRINT 3: Funciones importantes ─────────────────────
+    Section('score_history', 'calculate_score_history', tab='overview',
+            after=('round_milestones',), inputs=('rounds',),
+            summary=lambda r: f"Score history: {r['total_rounds']} rounds"),
+    Section('percentiles', 'calculate_percentiles', tab='performance', inputs=('shots', 'rounds'),
+            summary=lambda r: f"Percentiles: {len(r['distance_percentiles'])} clubs"),
+    Section('directional_distribution', 'calculate_directional_distribution', tab='overview', inputs=('shots',),
+            summary=lambda r: f"Directional distribution: {len(r)} clubs"),
+    Section('bubble_chart_data', 'calculate_bubble_chart_data', tab='performance', inputs=('shots',),
+            summary=lambda r: f"Bubble chart data: {len(r['bubbles'])} bubbles"),
+
+    # ── SPRINT 5: Mejoras visuales ──────────────────────────
+    Section('player_profile_radar', 'calculate_player_profile_radar', tab='overview', inputs=('shots', 'rounds'),
+            summary=lambda r: f"Player radar: {len(r['labels'])} dimensions"),
+    Section('trajectory_data', 'extract_trajectory_data', tab='performance', inputs=('shots',),
+            summary=lambda r: f"Trajectory data: {len(r)} clubs"),
+    Section('best_worst_rounds', 'calculate_best_worst_rounds', tab='evolution', inputs=('rounds',),
+            summary=lambda r: f"Best/worst rounds: {len(r['best_rounds'])} best, {len(r['worst_rounds'])} worst"),
+    Section('quarterly_scoring', 'calculate_quarterly_scoring', tab='evolution', inputs=('rounds',),
+            summary=lambda r: f"Quarterly scoring: {len(r)} quarters"),
+
+    # ── SPRINT 6: Mejoras de tendencias ─────────────────────
+    Section('monthly_volatility', 'calculate_monthly_volatility', tab='evolution', inputs=('rounds',),
+            summary=lambda r: f"Monthly volatility: {len(r)} months"),
+    Section('momentum_indicators', 'calculate_momentum_indicators', tab='evolution', inputs=('rounds',),
+            summary=lambda r: f"Momentum indicators: {len(r)} rounds"),
+    Section('milestone_achievements', 'extract_milestone_achievements', tab='campos', after=('round_milestones',),
+            inputs=('rounds',),
+            summary=lambda r: f"Milestone achievements: {len(r)} milestones"),
+    Section('learning_curve', 'calculate_learning_curve', tab='deep-analysis', inputs=('shots',),
+            summary=lambda r: f"Learning curve: {len(r)} categories"),
+
+    # ── SPRINT 9: Overview + Evolution (Tabs 1-2) ───────────
+    Section('current_form', 'calculate_current_form_chart', tab='overview', inputs=('rounds',),
+            summary=lambda r: f"Current form: {r['total_rounds']} rounds, avg: {r['average']}, trend: {r['trend']}"),
+    Section('percentile_gauges', 'calculate_percentile_gauges', tab='overview', inputs=('shots', 'rounds'),
+            summary=lambda r: f"Percentile gauges: SG={r['short_game']['value']}%, BS={r['ball_speed']['value']}%, "
+                              f"Cons={r['consistency']['value']}%, AA={r['attack_angle']['value']}%"),
+    Section('hcp_trajectory', 'calculate_hcp_trajectory', tab='overview', inputs=('rounds',),
+            summary=lambda r: f"HCP trajectory: {len(r['historical']['values'])} months historical, "
+                              f"current={r['current']}, target={r['target']}, rate={r['improvement_rate']}/mes"),
+    Section('temporal_long_game', 'calculate_temporal_long_game', tab='evolution',
+            after=('shot_pivot',), inputs=('shots',),
+            summary=lambda r: f"Temporal long game: {len(r['labels'])} months, "
+                              f"Driver points={_points(r['driver'])}, 3W points={_points(r['wood_3'])}, "
+                              f"Hybrid points={_points(r['hybrid'])}"),
+    Section('irons_evolution', 'calculate_irons_evolution', tab='evolution', after=('shot_pivot',), inputs=('shots',),
+            summary=lambda r: f"Irons evolution: {len(r['labels'])} months, "
+                              f"5i points={_points(r['iron_5'])}, 6i points={_points(r['iron_6'])}, "
+                              f"7i points={_points(r['iron_7'])}, 8i points={_points(r['iron_8'])}, "
+                              f"9i points={_points(r['iron_9'])}"),
+    Section('wedges_evolution', 'calculate_wedges_evolution', tab='evolution',
+            after=('shot_pivot',), inputs=('shots',),
+            summary=lambda r: f"Wedges evolution: {len(r['labels'])} months, "
+                              f"PW points={_points(r['pitching_wedge'])}, GW points={_points(r['gap_wedge'])}, "
+                              f"SW points={_points(r['sand_wedge'])}"),
+    Section('attack_angle_evolution', 'calculate_attack_angle_evolution', tab='evolution',
+            after=('shot_pivot',), inputs=('shots',),
+            summary=lambda r: f"Attack angle evolution: {len(r['labels'])} months, "
+                              f"data points={_points(r['attack_angle'])}"),
+    Section('smash_factor_evolution', 'calculate_smash_factor_evolution', tab='evolution',
+            after=('shot_pivot',), inputs=('shots',),
+            summary=lambda r: f"Smash factor evolution: {len(r['labels'])} months, "
+                              f"Driver points={_points(r['driver'])}, Woods points={_points(r['woods'])}, "
+                              f"Irons points={_points(r['irons'])}, Wedges points={_points(r['wedges'])}"),
+
+    # ── SPRINT 10: Campo/Course Analysis ────────────────────
+    Section('campo_performance', 'calculate_campo_performance', tab='campos', inputs=('rounds',),
+            summary=lambda r: f"Campo performance: {len(r)} campos, "
+                              f"total rondas={sum(c['rounds'] for c in r.values())}"),
+    Section('hcp_evolution_rfeg', 'calculate_hcp_evolution_rfeg', tab='campos', inputs=('rounds',),
+            summary=lambda r: f"HCP evolution RFEG: {len(r['labels'])} months, "
+                              f"current={r['values'][-1] if r['values'] else 0}, source={r['source']}"),
+    Section('hcp_index_timeline', 'calculate_hcp_index_timeline', tab='campos', inputs=('rounds',),
+            summary=lambda r: f"HCP index timeline: {len(r['index'])} rounds, current={r['current']}"),
+    Section('scoring_zones_by_course', 'calculate_scoring_zones_by_course', tab='campos', inputs=('rounds',),
+            summary=lambda r: f"Scoring zones: {len(r)} campos, "
+                              f"total holes={sum(z['total_holes'] for z in r.values())}"),
+    Section('volatility_index', 'calculate_volatility_index', tab='campos', inputs=('rounds',),
+            summary=lambda r: f"Volatility index: {len(r)} quarters analyzed"),
+    # Ventana de 12 meses hasta hoy: la fecha forma parte de la huella
+    Section('estado_forma', 'calculate_estado_forma', tab='campos', inputs=('rounds', 'today'),
+            summary=lambda r: f"Estado forma: {len(r)} months"),
+    Section('hcp_curve_position', 'calculate_hcp_curve_position', tab='campos', inputs=('rounds',),
+            summary=lambda r: f"HCP curve position: {len(r['distribution']['bins'])} bins, "
+                              f"mean={r['stats'].get('mean', 0)}"),
+    Section('differential_distribution', 'calculate_differential_distribution', tab='campos', inputs=('rounds',),
+            summary=lambda r: f"Differential distribution: {r['stats'].get('total_rounds', 0)} rounds"),
+    Section('prediction_model', 'calculate_prediction_model', tab='campos', inputs=('rounds',),
+            summary=lambda r: f"Prediction model: predicted={r['predicted_score']}, "
+                              f"R²={r['model_accuracy']}, trend={r['trend']}"),
+    Section('roi_practice', 'calculate_roi_practice', tab='campos', inputs=('rounds',),
+            summary=lambda r: f"ROI practice: {len(r['analysis'])} quarters, "
+                              f"correlation={r['correlation']}, rec={r['recommendation']}"),
+
+    # ── SPRINT 11: Deep Analysis (Tab 5) ────────────────────
+    Section('shot_zones_heatmap', 'calculate_shot_zones_heatmap', tab='deep-analysis', inputs=('shots',),
+            summary=lambda r: f"Shot zones heatmap: {len(r['zones'])} clubs, "
+                              f"center={r['density_map'].get('center', {}).get('percentage', 0)}%"),
+    Section('scoring_probability', 'calculate_scoring_probability', tab='deep-analysis', inputs=('rounds',),
+            summary=lambda r: f"Scoring probability: {len(r['distance_ranges'])} distance ranges"),
+    Section('swing_dna', 'calculate_swing_dna', tab='deep-analysis',
+            summary=lambda r: f"Swing DNA: {len(r['dimensions'])} dimensions, "
+                              f"overall={r['overall_score']}, top={r['strengths'][0]}"),
+    Section('quick_wins_matrix', 'calculate_quick_wins_matrix', tab='deep-analysis',
+            summary=lambda r: f"Quick wins matrix: {r['summary']['total_opportunities']} opportunities, "
+                              f"quick_wins={r['summary']['quick_wins']}, strategic={r['summary']['strategic_moves']}"),
+    Section('club_distance_comparison', 'calculate_club_distance_comparison', tab='deep-analysis', inputs=('shots',),
+            summary=lambda r: f"Club distance comparison: {len(r['clubs'])} clubs compared"),
+    Section('comfort_zones', 'calculate_comfort_zones', tab='overview',
+            summary=lambda r: f"Comfort zones: {len(r['zones'])} zones, "
+                              f"best={r['best_zone']}, worst={r['worst_zone']}"),
+    Section('tempo_analysis', 'calculate_tempo_analysis', tab='deep-analysis',
+            summary=lambda r: f"Tempo analysis: avg_tempo={r['analysis']['avg_tempo']}, "
+                              f"rating={r['analysis']['rating']}"),
+    Section('strokes_gained', 'calculate_strokes_gained', tab='deep-analysis',
+            summary=lambda r: f"Strokes gained: {len(r['categories'])} categories, "
+                              f"total_sg={r['total_sg']}, best={r['best_category']}"),
+
+    # ── SPRINT 12: Estrategia + Finales (Tab 6) ─────────────
+    Section('six_month_projection', 'calculate_six_month_projection', tab='evolution',
+            summary=lambda r: f"Six month projection: HCP {r['projected_hcp'][0]} → {r['projected_hcp'][-1]}, "
+                              f"milestones={len(r['milestones'])}"),
+    Section('swot_matrix', 'calculate_swot_matrix', tab='strategy',
+            summary=lambda r: f"SWOT matrix: {len(r['strengths'])} strengths, {len(r['weaknesses'])} weaknesses, "
+                              f"{len(r['opportunities'])} opportunities, {len(r['threats'])} threats"),
+    Section('benchmark_radar', 'calculate_benchmark_radar', tab='deep-analysis',
+            summary=lambda r: f"Benchmark radar: {len(r['dimensions'])} dimensions, "
+                              f"player={r['analysis']['overall_rating']}, vs_hcp15={r['analysis']['vs_hcp15']}"),
+    Section('roi_plan', 'calculate_roi_plan', tab='strategy',
+            summary=lambda r: f"ROI plan: {len(r['plan'])} actions, time={r['summary']['total_time']}h/week, "
+                              f"improvement={r['summary']['total_improvement']} strokes, "
+                              f"feasibility={r['summary']['feasibility']}"),
+
+    # ── SPRINT 14: Form + Streaks + Goals ───────────────────
+    Section('form_summary', 'calculate_form_summary', tab='overview', deps=('score_history',),
+            summary=lambda r: f"Form summary: avg={r['average']}, trend={r['trend']}"),
+    Section('scoring_streaks', 'calculate_scoring_streaks', tab='campos', deps=('player_stats',),
+            after=('round_milestones',), inputs=('rounds',),
+            summary=lambda r: f"Scoring streaks: best={r['best']}, total={r['total']}"),
+    Section('goals_progress', 'calculate_goals_progress', tab='campos', deps=('player_stats', 'quarterly_scoring'),
+            summary=lambda r: f"Goals progress: hcp20={r['hcp_20']['pct']}%, avg90={r['avg_90']['pct']}%"),
+
+    # ── SPRINT 15: dependen de scoring_profile (stage post) ──
+    Section('monthly_recommendations', 'calculate_monthly_recommendations', tab='overview',
+            deps=('scoring_profile', 'launch_metrics', 'course_statistics', 'club_gaps'), stage='post',
+            summary=lambda r: f"Monthly recommendations: focus={r['focus_title']}"),
+    Section('bubble_analysis', 'calculate_bubble_analysis', tab='performance',
+            deps=('bubble_chart_data', 'dispersion_analysis', 'scoring_profile'), stage='post',
+            summary=lambda r: f"Bubble analysis: {len(r) - 1} groups + strategy"),
+    Section('improvement_plan', 'calculate_improvement_plan', tab='strategy',
+            deps=('launch_metrics', 'directional_distribution', 'club_gaps', 'scoring_profile',
+                  'six_month_projection'), stage='post',
+            summary=lambda r: f"Improvement plan: {len(r['metrics'])} metrics, {len(r['weeks'])} weeks"),
+
+    # ── Fase 5 Original (para referencia/debugging) ─────────
+    Section('launch_metrics', 'calculate_launch_metrics', tab='overview', inputs=('shots',)),
+    Section('dispersion_analysis', 'calculate_dispersion_analysis', tab='overview', inputs=('shots',)),
+    Section('consistency_benchmarks', 'calculate_consistency_benchmarks', tab='campos', after=('player_stats',),
+            inputs=('rounds',)),
+
+    # ── IDENTITY TIMELINE: golpes FlightScope con fechas ────
+    Section('flightscope_shots_timeline', 'calculate_flightscope_shots_timeline', inputs=('shots',)),
+
+    # ── Scoring profile + golf identity (lee las secciones que usa scoring_integration) ──
+    Section('scoring_profile', '_run_scoring', tab='overview', stage='scoring', output=False, cache=False,
+            after=('player_stats', 'club_statistics', 'dispersion_by_club', 'strokes_gained',
+                   'consistency_benchmarks', 'swing_dna', 'benchmark_radar', 'score_history',
+                   'volatility_index', 'hcp_trajectory', 'flightscope_shots_timeline')),
+]
+
+SECTION_GRAPH = SectionGraph(SECTIONS)
+
+METADATA_CHANGES = [
+    'SPRINT 1: Dispersion scatter data generada (11 palos)',
+    'SPRINT 1: Club data merged (basic + launch + dispersion)',
+    'SPRINT 1: Club gaps calculados',
+    'SPRINT 1: Temporal evolution extendido a 11 palos',
+    'SPRINT 3: Score history con milestones',
+    'SPRINT 3: Percentiles de distancia y scores',
+    'SPRINT 3: Distribución direccional (left/center/right)',
+    'SPRINT 3: Bubble chart data (consistencia vs distancia)',
+    'SPRINT 5: Player profile radar (8 dimensiones)',
+    'SPRINT 5: Trajectory data por palo',
+    'SPRINT 5: Best/worst rounds analysis',
+    'SPRINT 5: Quarterly scoring trends',
+    'SPRINT 6: Monthly volatility (variabilidad mensual)',
+    'SPRINT 6: Momentum indicators (moving averages, trends)',
+    'SPRINT 6: Milestone achievements (broke_90/80, personal bests, streaks)',
+    'SPRINT 6: Learning curve (mejora por categoría de shot)',
+    'SPRINT 9: Current form chart (últimas 20 rondas con tendencia)',
+    'SPRINT 9: Percentile gauges (4 gauges: short_game, ball_speed, consistency, attack_angle)',
+    'SPRINT 9: HCP trajectory (histórico + proyección 6 meses con regresión lineal)',
+    'SPRINT 9: Temporal long game (evolución mensual Driver, 3W, Hybrid)',
+    'SPRINT 9: Irons evolution (evolución mensual 5i-9i)',
+    'SPRINT 9: Wedges evolution (evolución mensual PW, GW, SW)',
+    'SPRINT 9: Attack angle evolution (evolución mensual ángulo de ataque Driver)',
+    'SPRINT 9: Smash factor evolution (evolución mensual eficiencia 4 categorías)',
+    'SPRINT 10: Campo performance (mejor/promedio/peor score por campo)',
+    'SPRINT 10: HCP evolution RFEG (handicap oficial estimado mensual)',
+    'SPRINT 10: Scoring zones by course (distribución birdie/par/bogey por campo)',
+    'SPRINT 10: Volatility index (índice de variabilidad por quarter)',
+    'SPRINT 10: Estado forma (estado forma últimos 12 meses)',
+    'SPRINT 10: HCP curve position (distribución scores vs curva normal)',
+    'SPRINT 10: Differential distribution (distribución de differentials)',
+    'SPRINT 10: Prediction model (predicción próximo score con regresión)',
+    'SPRINT 10: ROI practice (ROI frecuencia de práctica vs mejora)',
+    'SPRINT 11: Shot zones heatmap (heat map zonas de caída de shots)',
+    'SPRINT 11: Scoring probability (probabilidad birdie/par/bogey por distancia)',
+    'SPRINT 11: Swing DNA (fingerprint 12 dimensiones vs benchmarks)',
+    'SPRINT 11: Quick wins matrix (matriz dificultad vs impacto para priorización)',
+    'SPRINT 11: Club distance comparison (comparación distancias vs benchmarks PGA/HCP)',
+    'SPRINT 11: Comfort zones (análisis zonas de confort por distancia)',
+    'SPRINT 11: Tempo analysis (análisis tempo backswing/downswing vs PGA)',
+    'SPRINT 11: Strokes gained (análisis por categoría vs HCP 15 benchmark)',
+    'SPRINT 12: Six month projection (proyección HCP y scores 6 meses)',
+    'SPRINT 12: SWOT matrix (análisis SWOT automático)',
+    'SPRINT 12: Benchmark radar (comparación multidimensional vs benchmarks)',
+    'SPRINT 12: ROI plan (plan de mejora con análisis ROI y milestones)'
+]
+
+
 def main():
     """Función principal."""
+    import argparse
+
+    from app.scoring_integration import SIMULATION_SAMPLES
+
+    parser = argparse.ArgumentParser(description="Genera output/dashboard_data.json desde los Excel")
+    parser.add_argument("--plan", action="store_true",
+                        help="Muestra el plan de ejecución (DAG de secciones) y sale")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Threads para ejecutar secciones (1 = secuencial)")
+    parser.add_argument("--sections", type=str, default=None,
+                        help="Solo estas secciones (separadas por comas) + dependencias; "
+                             "se fusionan en el JSON existente")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Recalcula todas las secciones sin usar data/cache/sections/")
+    parser.add_argument("--compact", action="store_true",
+                        help="JSON compacto (sin indentación); los .gz / .br se escriben siempre")
+    parser.add_argument("--schema", type=int, choices=(SCHEMA_V1, SCHEMA_V2), default=SCHEMA_V1,
+                        help="2 = arrays grandes (timeline de golpes, rondas, dispersión, momentum) en columnas")
+    parser.add_argument("--shards", action="store_true",
+                        help="Escribe también output/shards/<tab>.json + dashboard_manifest.json (carga diferida)")
+    parser.add_argument("--snapshots", action="store_true",
+                        help="Guarda la versión en output/snapshots/ (anillo) + JSON-Patch desde la anterior")
+    parser.add_argument("--simulate", type=int, nargs="?", const=SIMULATION_SAMPLES, default=0,
+                        help="Monte Carlo de estabilidad del arquetipo (golf_identity.stability); "
+                             f"N muestras, {SIMULATION_SAMPLES} si no se indica")
+    args = parser.parse_args()
+
+    sections = [k.strip() for k in args.sections.split(',') if k.strip()] if args.sections else None
+
+    if args.plan:
+        keys = SECTION_GRAPH.closure(sections) if sections else None
+        print(SECTION_GRAPH.format_plan(keys=keys))
+        return
 
     # Rutas de archivos
     FLIGHTSCOPE_PATH = "data/raw/FlightScope-AP-Prov1.Next.xlsx"
@@ -5782,10 +5154,17 @@ def main():
     generator = DashboardDataGenerator(
         flightscope_path=FLIGHTSCOPE_PATH,
         tarjetas_path=TARJETAS_PATH,
-        output_path=OUTPUT_PATH
+        output_path=OUTPUT_PATH,
+        max_workers=args.workers,
+        use_cache=not args.no_cache,
+        compact_json=args.compact,
+        shards=args.shards,
+        schema_version=args.schema,
+        snapshots=args.snapshots,
+        simulate=args.simulate
     )
 
-    success = generator.run()
+    success = generator.run(sections=sections)
 
     if success:
         print("\n[OK] Datos del dashboard generados exitosamente")
@@ -42,6 +42,8 @@ from pathlib import Path
 from dotenv import load_dotenv
 from loguru import logger
 
+from app.dashboard_output import load_dashboard_json
+
 # Cargar .env (ANTHROPIC_API_KEY, etc.)
 load_dotenv()
 
@@ -61,11 +63,10 @@ USER_ID         = "alvaro"
 
 # ── Blacklist: claves de pura visualización UI, sin valor analítico para LLMs ─
 UI_ONLY_KEYS = frozenset({
-    'shot_zones_heatmap',      # 21.4 KB — grid de coords XY crudas para Chart.js heatmap
+    'shot_zones_heatmap',      #  ~9 KB — grids KDE uint8/base64 por palo para el heatmap
     'dispersion_by_club',      # 11.8 KB — scatter plots crudos por palo (Chart.js)
     'metadata',                #  3.6 KB — versión, timestamps, config del generador
     'generated_at',            #  0.0 KB — timestamp de generación
-    'scoring_zones_by_course', #  0.0 KB — datos vacíos de zonas por campo
 })
 
 
@@ -78,8 +79,7 @@ def load_dashboard_data() -> dict:
             f"No se encontró: {DASHBOARD_JSON}\n"
             "Ejecuta primero: python generate_dashboard_data.py"
         )
-    with open(DASHBOARD_JSON, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = load_dashboard_json(DASHBOARD_JSON)
     size_kb = DASHBOARD_JSON.stat().st_size / 1024
     version = data.get("metadata", {}).get("version", "desconocida")
     logger.info(f"dashboard_data.json cargado ({size_kb:.1f} KB, {len(data)} claves, v{version})")
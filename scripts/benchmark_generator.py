@@ -0,0 +1,242 @@
+"""
+Benchmark de escala del generador del dashboard.
+
+Genera datos sintéticos (app/synthetic_data.py) a varias escalas respecto
+al dataset real (1× = 497 golpes, 52 rondas) y mide tiempo y pico de
+memoria de CADA sección del SECTION_GRAPH, ejecutadas en serie.
+
+Escribe un informe JSON con, por sección y escala, segundos y MB pico,
+más el exponente de crecimiento (pendiente log-log tiempo vs escala):
+~1 lineal, >1.3 super-lineal (iterrows, bucles O(n²)...).
+
+Usage:
+    python scripts/benchmark_generator.py
+    python scripts/benchmark_generator.py --scales 1,10,100 --mode excel
+    python scripts/benchmark_generator.py --sections score_history,milestone_achievements --no-memory
+
+Una sección cuyo tiempo previsto para la siguiente escala supere
+--max-section-seconds se omite en esa escala (salvo que otra sección la
+necesite como dependencia).
+"""
+
+import argparse
+import json
+import math
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from loguru import logger
+
+from app.synthetic_data import (
+    BASE_COURSES, BASE_ROUNDS, BASE_SHOTS, DEFAULT_MONTHS,
+    synthesize_shots, synthesize_tarjetas, write_flightscope_workbook, write_tarjetas_workbook,
+)
+from generate_dashboard_data import SECTION_GRAPH, DashboardDataGenerator
+
+
+DEFAULT_SCALES = [1, 10, 100, 1000]
+DEFAULT_REPORT = project_root / "output" / "benchmarks" / "generator_scale.json"
+SUPERLINEAR_EXPONENT = 1.3
+
+
+# ══════════════════════════════════════════════════════════════
+# MEDICIÓN
+# ══════════════════════════════════════════════════════════════
+
+def _measure(func, track_memory: bool):
+    """(resultado, segundos, MB pico) de func()."""
+    if track_memory:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+    start = time.perf_counter()
+    try:
+        value = func()
+    finally:
+        seconds = time.perf_counter() - start
+        peak_mb = None
+        if track_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peak_mb = round(peak / 2**20, 3)
+    return value, round(seconds, 6), peak_mb
+
+
+def _growth_exponent(points):
+    """Pendiente log-log (mínimos cuadrados) de [(escala, segundos), ...]."""
+    points = [(s, t) for s, t in points if t and t > 0]
+    if len(points) < 2:
+        return None
+    xs = [math.log(s) for s, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    var = sum((x - mx) ** 2 for x in xs)
+    if var == 0:
+        return None
+    return round(sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var, 3)
+
+
+def _load_generator(scale: int, mode: str, seed: int, months: int, workdir: Path, track_memory: bool):
+    """Generador con datos sintéticos a `scale`; devuelve (generator, métricas de carga)."""
+    n_shots, n_rounds = BASE_SHOTS * scale, BASE_ROUNDS * scale
+    shots, synth_s, _ = _measure(lambda: synthesize_shots(n_shots, months=months, seed=seed), False)
+    tarjetas, synth_r, _ = _measure(lambda: synthesize_tarjetas(n_rounds, BASE_COURSES, months=months, seed=seed), False)
+
+    fs_path = workdir / f"flightscope_x{scale}.xlsx"
+    tj_path = workdir / f"tarjetas_x{scale}.xlsx"
+    generator = DashboardDataGenerator(fs_path, tj_path, workdir / f"dashboard_x{scale}.json",
+                                       cache_dir=workdir / "cache", max_workers=1, use_cache=False)
+    load = {'synthesize_seconds': round(synth_s + synth_r, 3)}
+
+    if mode == 'excel':
+        write_flightscope_workbook(shots, fs_path)
+        write_tarjetas_workbook(tarjetas, tj_path)
+        _, load['load_flightscope_seconds'], load['load_flightscope_mb'] = _measure(
+            generator.load_flightscope_data, track_memory)
+        _, load['load_tarjetas_seconds'], load['load_tarjetas_mb'] = _measure(
+            generator.load_tarjetas_data, track_memory)
+    else:
+        generator.set_flightscope_frame(shots)
+        _, load['load_tarjetas_seconds'], load['load_tarjetas_mb'] = _measure(
+            lambda: generator.set_tarjetas_data(tarjetas), track_memory)
+
+    load['shots'] = len(generator.flightscope_df)
+    load['rounds'] = len(generator.rounds)
+    return generator, load
+
+
+def _needed_by(keys):
+    """Secciones que alguna otra de `keys` necesita (deps o after)."""
+    return {d for k in keys for d in SECTION_GRAPH[k].upstream}
+
+
+def run_scale(generator, keys, track_memory, skip):
+    """Ejecuta `keys` en serie midiendo cada sección. skip = secciones a omitir."""
+    timings = {}
+    needed = _needed_by(keys)
+
+    def runner(section, args):
+        if section.key in skip and section.key not in needed:
+            timings[section.key] = {'skipped': skip[section.key]}
+            return None
+        value, seconds, peak_mb = _measure(lambda: getattr(generator, section.method)(*args), track_memory)
+        timings[section.key] = {'seconds': seconds, 'peak_mb': peak_mb}
+        return value
+
+    stages = [[k for k in keys if SECTION_GRAPH[k].stage == 'base'],
+              [k for k in keys if SECTION_GRAPH[k].stage != 'base']]
+    results = {}
+    for i, stage_keys in enumerate(stages):
+        if not stage_keys:
+            continue
+        if i == 1:
+            # scoring lee dashboard_data ensamblado con las secciones base
+            generator.dashboard_data = {k: results.get(k) for k in SECTION_GRAPH.keys(output_only=True)}
+        results, _ = SECTION_GRAPH.execute(runner, stage_keys, results=results, max_workers=1)
+    return timings
+
+
+# ══════════════════════════════════════════════════════════════
+# MAIN
+# ══════════════════════════════════════════════════════════════
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de escala de DashboardDataGenerator")
+    parser.add_argument("--scales", default=",".join(map(str, DEFAULT_SCALES)),
+                        help="Escalas respecto al dataset real (default 1,10,100,1000)")
+    parser.add_argument("--mode", choices=["memory", "excel"], default="memory",
+                        help="memory: frames en memoria; excel: escribe y parsea workbooks")
+    parser.add_argument("--sections", default=None,
+                        help="Solo estas secciones (+ dependencias), separadas por comas")
+    parser.add_argument("--months", type=int, default=DEFAULT_MONTHS, help="Meses que cubren los datos")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="No medir memoria (tracemalloc)")
+    parser.add_argument("--max-section-seconds", type=float, default=120.0,
+                        help="Omitir secciones cuyo tiempo previsto supere este límite")
+    parser.add_argument("--out", default=str(DEFAULT_REPORT), help="Ruta del informe JSON")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stdout, level="INFO", format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | {message}",
+               filter=lambda record: record["name"] == "__main__")
+
+    scales = sorted({int(s) for s in args.scales.split(",") if s.strip()})
+    targets = [k.strip() for k in args.sections.split(",")] if args.sections else SECTION_GRAPH.keys()
+    keys = SECTION_GRAPH.closure(targets)
+    track_memory = not args.no_memory
+
+    report = {
+        'generated_at': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'mode': args.mode,
+        'memory_tracked': track_memory,
+        'base': {'shots': BASE_SHOTS, 'rounds': BASE_ROUNDS, 'courses': BASE_COURSES, 'months': args.months},
+        'scales': {},
+        'sections': {k: {} for k in keys},
+        'growth': {},
+    }
+
+    skip = {}
+    with tempfile.TemporaryDirectory(prefix="alvgolf_bench_") as tmp:
+        for i, scale in enumerate(scales):
+            logger.info(f"Escala {scale}× ({BASE_SHOTS * scale} golpes, {BASE_ROUNDS * scale} rondas)...")
+            generator, load = _load_generator(scale, args.mode, args.seed, args.months, Path(tmp), track_memory)
+
+            start = time.perf_counter()
+            timings = run_scale(generator, keys, track_memory, skip)
+            load['sections_seconds'] = round(sum(t.get('seconds', 0) for t in timings.values()), 3)
+            load['wall_seconds'] = round(time.perf_counter() - start, 3)
+            report['scales'][str(scale)] = load
+
+            for key, t in timings.items():
+                report['sections'][key][str(scale)] = t
+            slowest = sorted(((t['seconds'], k) for k, t in timings.items() if 'seconds' in t), reverse=True)[:5]
+            logger.info(f"  total {load['sections_seconds']}s | más lentas: "
+                        + ", ".join(f"{k}={s:.2f}s" for s, k in slowest))
+
+            # Predicción para la siguiente escala: omitir las que no cabrían en el límite
+            if i + 1 < len(scales):
+                ratio = scales[i + 1] / scale
+                for key, t in timings.items():
+                    if 'seconds' not in t:
+                        continue
+                    exponent = _growth_exponent([(int(s), v.get('seconds')) for s, v in report['sections'][key].items()])
+                    predicted = t['seconds'] * ratio ** max(1.0, exponent or 1.0)
+                    if predicted > args.max_section_seconds:
+                        skip[key] = f"previsto {predicted:.0f}s > {args.max_section_seconds:.0f}s"
+
+            # Liberar antes de la siguiente escala
+            del generator
+
+    for key, per_scale in report['sections'].items():
+        exponent = _growth_exponent([(int(s), v.get('seconds')) for s, v in per_scale.items()])
+        report['growth'][key] = {
+            'exponent': exponent,
+            'superlinear': exponent is not None and exponent > SUPERLINEAR_EXPONENT,
+        }
+
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    superlinear = sorted(((g['exponent'], k) for k, g in report['growth'].items() if g['superlinear']), reverse=True)
+    logger.info("=" * 60)
+    logger.info(f"Informe: {out}")
+    if superlinear:
+        logger.warning("Secciones super-lineales: " + ", ".join(f"{k} (n^{e})" for e, k in superlinear))
+    else:
+        logger.info("Ninguna sección super-lineal")
+
+
+if __name__ == "__main__":
+    main()